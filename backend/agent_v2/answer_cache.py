@@ -0,0 +1,276 @@
+"""
+Answer cache for agent_v2.
+
+Sits in front of run_agent / run_agent_streaming so repeated customer
+questions skip the scope check, ReAct loop and synthesis entirely.
+
+Lookup:
+1. Exact: normalized query text within the same context bucket
+2. Semantic: cosine similarity of all-MiniLM query embeddings within the
+   same context bucket (same model as vector_tools)
+
+The context bucket is built from the session's discussed parts, a hash of the
+recent conversation, and every identifier in the query (PS, model and
+manufacturer numbers). Keeping identifiers in the bucket key means
+"does PS11752778 fit WDT780SAEM1" can never be answered from
+"does PS11752778 fit WDT780SAEM2", however similar their embeddings are.
+
+Entries expire after a TTL, the least recently used entry is evicted when the
+cache is full, and entries can be invalidated by PS number when part rows change.
+"""
+import logging
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+import numpy as np
+from backend.config import get_settings
+from backend.agent_v2.state import SessionState
+
+logger = logging.getLogger(__name__)
+
+# Tokens containing a digit are identifiers (PS11752778, WDT780SAEM1, W10321304)
+_IDENTIFIER_PATTERN = re.compile(r"\b(?=[A-Z0-9\-]*\d)[A-Z0-9\-]{4,}\b", re.IGNORECASE)
+_PS_PATTERN = re.compile(r"PS\d+", re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    text = query.lower()
+    text = re.sub(r"[^\w\s\-]", " ", text)
+    return " ".join(text.split())
+
+
+def extract_identifiers(query: str) -> tuple[str, ...]:
+    """Extract part/model identifiers from a query (sorted, upper-cased)."""
+    return tuple(sorted({m.upper() for m in _IDENTIFIER_PATTERN.findall(query)}))
+
+
+def context_key(query: str, session: SessionState) -> str:
+    """
+    Build the bucket key for a query in a given session context.
+
+    Follow-up questions ("is it easy to install?") depend on what came before,
+    so the recent conversation is part of the key.
+    """
+    history = "\n".join(
+        f"{m.role}:{m.content}" for m in session.conversation_history[-2:]
+    )
+    raw = "|".join([
+        ",".join(session.all_discussed_parts),
+        hashlib.sha1(history.encode("utf-8")).hexdigest() if history else "",
+        ",".join(extract_identifiers(query)),
+    ])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedAnswer:
+    """A cached agent response plus what's needed to replay it."""
+    response: str
+    parts: list[dict]
+    discussed_parts: list[str]
+    # PS numbers this answer depends on (for invalidation)
+    ps_numbers: set[str] = field(default_factory=set)
+
+
+@dataclass
+class _Entry:
+    bucket: str
+    normalized_query: str
+    answer: CachedAnswer
+    expires_at: float
+    embedding: np.ndarray | None = None
+
+
+class AnswerCache:
+    """In-process LRU + TTL answer cache with exact and semantic lookup."""
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        ttl_seconds: int = 3600,
+        similarity_threshold: float = 0.92,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        # (bucket, normalized_query) -> entry, in LRU order
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        # bucket -> keys in that bucket (for semantic lookup)
+        self._buckets: dict[str, set[tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+
+        self.hits_exact = 0
+        self.hits_semantic = 0
+        self.misses = 0
+
+    # -------------------------------------------------------------------------
+    # Lookup / store
+    # -------------------------------------------------------------------------
+
+    def get(self, query: str, bucket: str) -> CachedAnswer | None:
+        """
+        Look up a cached answer.
+
+        Args:
+            query: The user's query
+            bucket: context_key() of the query and the session *before* this turn
+        """
+        normalized = normalize_query(query)
+        now = time.monotonic()
+
+        with self._lock:
+            key = (bucket, normalized)
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits_exact += 1
+                return entry.answer
+
+            candidates = []
+            for k in list(self._buckets.get(bucket, ())):
+                candidate = self._entries[k]
+                if candidate.expires_at <= now:
+                    self._remove(k)
+                elif candidate.embedding is not None:
+                    candidates.append(candidate)
+
+        # Only pay for an embedding when something could match
+        if candidates:
+            try:
+                query_embedding = _embed(normalized)
+            except Exception as e:
+                logger.warning("Embedding failed, skipping semantic lookup: %s", e)
+                query_embedding = None
+
+        if candidates and query_embedding is not None:
+            matrix = np.stack([c.embedding for c in candidates])
+            scores = matrix @ query_embedding
+            best = int(np.argmax(scores))
+
+            if scores[best] >= self.similarity_threshold:
+                with self._lock:
+                    key = (bucket, candidates[best].normalized_query)
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                        self.hits_semantic += 1
+                        return candidates[best].answer
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, query: str, bucket: str, answer: CachedAnswer) -> None:
+        """Store an answer under the bucket computed before the turn ran."""
+        normalized = normalize_query(query)
+
+        # Everything the answer depends on: PS numbers in the query,
+        # the response and the part cards
+        answer.ps_numbers |= {m.upper() for m in _PS_PATTERN.findall(query)}
+        answer.ps_numbers |= {m.upper() for m in _PS_PATTERN.findall(answer.response)}
+        answer.ps_numbers |= {p["ps_number"] for p in answer.parts if p.get("ps_number")}
+
+        try:
+            embedding = _embed(normalized)
+        except Exception as e:
+            # Exact matching still works without an embedding
+            logger.warning("Embedding failed, storing exact-only: %s", e)
+            embedding = None
+
+        key = (bucket, normalized)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(
+                bucket=bucket,
+                normalized_query=normalized,
+                answer=answer,
+                expires_at=time.monotonic() + self.ttl_seconds,
+                embedding=embedding,
+            )
+            self._buckets.setdefault(bucket, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+
+    def invalidate_parts(self, ps_numbers: list[str] | set[str]) -> int:
+        """
+        Drop every answer that depends on any of the given PS numbers.
+
+        Call this when part rows are (re)loaded or live-scraped.
+
+        Returns:
+            Number of entries removed
+        """
+        targets = {ps.upper() for ps in ps_numbers}
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if entry.answer.ps_numbers & targets
+            ]
+            for key in stale:
+                self._remove(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and size."""
+        lookups = self.hits_exact + self.hits_semantic + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits_exact": self.hits_exact,
+            "hits_semantic": self.hits_semantic,
+            "misses": self.misses,
+            "hit_rate": (self.hits_exact + self.hits_semantic) / lookups if lookups else 0.0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # -------------------------------------------------------------------------
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        bucket_keys = self._buckets.get(entry.bucket)
+        if bucket_keys is not None:
+            bucket_keys.discard(key)
+            if not bucket_keys:
+                del self._buckets[entry.bucket]
+
+
+def _embed(text: str) -> np.ndarray:
+    """Normalized float32 embedding using the shared all-MiniLM model."""
+    from backend.agent_v2.tools.vector_tools import generate_embedding
+
+    vector = np.asarray(generate_embedding(text), dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@lru_cache()
+def get_answer_cache() -> AnswerCache:
+    """Get the process-wide answer cache."""
+    settings = get_settings()
+    return AnswerCache(
+        max_entries=settings.ANSWER_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.ANSWER_CACHE_TTL_SECONDS,
+        similarity_threshold=settings.ANSWER_CACHE_SIMILARITY,
+    )
@@ -0,0 +1,349 @@
+"""
+Pooled headless browsers for live scraping.
+
+Starting Chrome costs several seconds, so scrape_part_live checks a WebDriver
+out of a BrowserPool instead of launching (and quitting) one per call. The
+pool also caps how many browsers run at once.
+
+- size: most browsers alive at once; callers past that wait for a checkout
+- checkout_timeout: how long a caller waits before BrowserPoolTimeout
+- max_pages: a browser is recycled after this many checkouts
+- max_rss_mb: ... or once chromedriver + Chrome use more memory than this
+  (Linux only - read from /proc; 0 disables the check)
+
+A browser is health-checked before it's handed out and after a checkout that
+raised; a dead one is replaced. Browsers start lazily, on the first checkouts.
+
+Async callers use arun(), which waits for a browser without blocking the event
+loop and then runs the blocking WebDriver work on the pool's own threads (one
+per browser), so the event loop never waits on Selenium.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterator
+from backend.config import get_settings
+from backend.metrics import record_span
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPoolTimeout(TimeoutError):
+    """No browser became free within the checkout timeout."""
+
+
+@dataclass
+class _Browser:
+    driver: Any
+    started_at: float
+    pages: int = 0
+
+
+def _process_tree_rss_mb(pid: int) -> float | None:
+    """Resident memory of `pid` and all its descendants, from /proc. None if unavailable."""
+    try:
+        parents: dict[int, int] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # "pid (comm) state ppid ..." - comm may contain spaces
+                    parents[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+    except OSError:
+        return None
+
+    tree, frontier = {pid}, [pid]
+    while frontier:
+        parent = frontier.pop()
+        children = [child for child, ppid in parents.items() if ppid == parent and child not in tree]
+        tree.update(children)
+        frontier.extend(children)
+
+    total_kb = 0
+    for member in tree:
+        try:
+            with open(f"/proc/{member}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+class BrowserPool:
+    """Bounded pool of reusable WebDrivers with health checks and recycling."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 2,
+        max_pages: int = 50,
+        max_rss_mb: float = 1024,
+        checkout_timeout: float = 30.0,
+    ):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: list[_Browser] = []
+        # Browsers alive or starting, idle or checked out
+        self._count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        # One thread per browser: async checkouts never queue behind each other
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="browser")
+
+        self.started = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.recycled: dict[str, int] = {"max_pages": 0, "memory": 0, "unhealthy": 0}
+
+    # -------------------------------------------------------------------------
+    # Callers
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def checkout(self, timeout: float | None = None) -> Iterator[Any]:
+        """Borrow a driver for the duration of the block (blocking)."""
+        deadline = time.monotonic() + (self.checkout_timeout if timeout is None else timeout)
+        with self._checkout_until(deadline) as driver:
+            yield driver
+
+    def run(self, fn: Callable[..., Any], *args, timeout: float | None = None) -> Any:
+        """Call fn(driver, *args) with a borrowed driver (blocking)."""
+        with self.checkout(timeout) as driver:
+            return fn(driver, *args)
+
+    async def arun(self, fn: Callable[..., Any], *args, timeout: float | None = None) -> Any:
+        """
+        Call fn(driver, *args) on a pool thread and await the result.
+
+        The checkout timeout counts from this call. The browser is checked out
+        before any pool thread is involved, so a caller never queues behind
+        scrapes already running.
+        """
+        deadline = time.monotonic() + (self.checkout_timeout if timeout is None else timeout)
+        loop = asyncio.get_running_loop()
+        # _acquire blocks on the pool's condition - wait for it off the event loop
+        acquiring = loop.run_in_executor(None, self._acquire, deadline)
+        try:
+            browser = await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The checkout still completes in its thread; hand the browser back
+            acquiring.add_done_callback(self._release_abandoned)
+            raise
+        # Every pool thread busy means every browser checked out, so holding
+        # one guarantees a free thread. Shielded: once started, the job must
+        # run to return the browser.
+        job = loop.run_in_executor(self._executor, self._run_checked_out, browser, fn, args)
+        return await asyncio.shield(job)
+
+    def close(self) -> None:
+        """Quit idle browsers now; checked-out ones are quit when returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+            self._cond.notify_all()
+        for browser in idle:
+            self._quit(browser)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "alive": self._count,
+            "idle": len(self._idle),
+            "started": self.started,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "recycled": dict(self.recycled),
+        }
+
+    # -------------------------------------------------------------------------
+    # Checkout / return
+    # -------------------------------------------------------------------------
+
+    def _run_checked_out(self, browser: _Browser, fn: Callable[..., Any], args: tuple) -> Any:
+        with self._borrowed(browser) as driver:
+            return fn(driver, *args)
+
+    def _release_abandoned(self, acquiring: asyncio.Future) -> None:
+        """Return a browser checked out for an arun() caller that was cancelled meanwhile."""
+        if acquiring.cancelled() or acquiring.exception() is not None:
+            return
+        browser = acquiring.result()
+        try:
+            # _release talks to the browser - keep it off the event loop
+            self._executor.submit(self._release, browser, False)
+        except RuntimeError:
+            # Executor shut down by close(): the browser just needs quitting
+            self._quit(browser)
+            self._free_slot()
+
+    @contextmanager
+    def _checkout_until(self, deadline: float) -> Iterator[Any]:
+        with self._borrowed(self._acquire(deadline)) as driver:
+            yield driver
+
+    @contextmanager
+    def _borrowed(self, browser: _Browser) -> Iterator[Any]:
+        failed = True
+        try:
+            yield browser.driver
+            failed = False
+        finally:
+            self._release(browser, failed)
+
+    def _acquire(self, deadline: float) -> _Browser:
+        start = time.perf_counter()
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self._idle:
+                    browser = self._idle.pop()
+                    break
+                if self._count < self.size:
+                    # Reserve the slot, start the browser outside the lock
+                    self._count += 1
+                    browser = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise BrowserPoolTimeout(f"No browser free after waiting {time.perf_counter() - start:.1f}s")
+                self._cond.wait(remaining)
+
+        if browser is not None and not self._healthy(browser):
+            logger.info("Replacing unresponsive browser after %d pages", browser.pages)
+            self.recycled["unhealthy"] += 1
+            self._quit(browser)
+            browser = None
+        if browser is None:
+            try:
+                browser = self._start()
+            except Exception:
+                self._free_slot()
+                raise
+
+        self.checkouts += 1
+        record_span("browser", "checkout", time.perf_counter() - start)
+        return browser
+
+    def _release(self, browser: _Browser, failed: bool) -> None:
+        browser.pages += 1
+        reason = None
+        if failed and not self._healthy(browser):
+            reason = "unhealthy"
+        elif self.max_pages and browser.pages >= self.max_pages:
+            reason = "max_pages"
+        elif self.max_rss_mb:
+            rss_mb = self._rss_mb(browser)
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                logger.info("Recycling browser using %.0fMB after %d pages", rss_mb, browser.pages)
+                reason = "memory"
+
+        if reason is None and not self._closed:
+            try:
+                # Drop the page (and its memory/timers) before the next checkout
+                browser.driver.get("about:blank")
+            except Exception:
+                reason = "unhealthy"
+
+        if reason is not None or self._closed:
+            if reason is not None:
+                self.recycled[reason] += 1
+            self._quit(browser)
+            self._free_slot()
+            return
+        with self._cond:
+            self._idle.append(browser)
+            self._cond.notify()
+
+    def _free_slot(self) -> None:
+        with self._cond:
+            self._count -= 1
+            self._cond.notify()
+
+    # -------------------------------------------------------------------------
+    # Browser lifecycle
+    # -------------------------------------------------------------------------
+
+    def _start(self) -> _Browser:
+        start = time.perf_counter()
+        driver = self.factory()
+        seconds = time.perf_counter() - start
+        record_span("browser", "start", seconds)
+        self.started += 1
+        logger.info("Started pooled browser in %.1fs (%d alive)", seconds, self._count)
+        return _Browser(driver=driver, started_at=time.monotonic())
+
+    @staticmethod
+    def _healthy(browser: _Browser) -> bool:
+        """A round trip to the browser - fails fast if Chrome or chromedriver died."""
+        try:
+            browser.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _rss_mb(browser: _Browser) -> float | None:
+        try:
+            pid = browser.driver.service.process.pid
+        except AttributeError:
+            return None
+        return _process_tree_rss_mb(pid)
+
+    @staticmethod
+    def _quit(browser: _Browser) -> None:
+        try:
+            browser.driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting pooled browser: %s", e)
+
+
+def _start_chrome():
+    """Headless Chrome configured for part pages (images and CSS off)."""
+    from scrapers.utils import setup_driver
+
+    return setup_driver(
+        headless=True,
+        use_proxy=False,
+        rotate_user_agent=True,
+        disable_images=True,
+    )
+
+
+@lru_cache()
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool (browsers start on first checkout)."""
+    settings = get_settings()
+    return BrowserPool(
+        _start_chrome,
+        size=settings.BROWSER_POOL_SIZE,
+        max_pages=settings.BROWSER_POOL_MAX_PAGES,
+        max_rss_mb=settings.BROWSER_POOL_MAX_RSS_MB,
+        checkout_timeout=settings.BROWSER_POOL_CHECKOUT_TIMEOUT,
+    )
+
+
+def close_browser_pool() -> None:
+    """Quit pooled browsers (call on shutdown). No-op if the pool was never used."""
+    if get_browser_pool.cache_info().currsize:
+        get_browser_pool().close()
+        get_browser_pool.cache_clear()
@@ -0,0 +1,142 @@
+"""
+Micro-batching embedding service for agent_v2.
+
+SentenceTransformer.encode is far cheaper per text on a batch than called once
+per text, and concurrent chats each need a query embedding at about the same
+time. EmbeddingBatcher collects encode requests from any thread (or event
+loop) into one queue; a worker thread takes the first request, keeps
+collecting for up to `window_ms` or until `max_batch_size` texts are waiting,
+runs a single batched encode and resolves every caller's future.
+
+Knobs (EMBEDDING_BATCH_*):
+- window_ms: the most a request waits for company. 0 adds no latency - the
+  batch is whatever queued up while the previous one was encoding.
+- max_batch_size: caps batch latency under heavy load.
+
+Identical texts in one batch are encoded once. Sync callers block on the
+future; async callers await it without holding the event loop.
+"""
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+import numpy as np
+from backend.metrics import record_span
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """Batches encode requests from concurrent callers into one model call."""
+
+    def __init__(
+        self,
+        encode_batch: Callable[[list[str]], np.ndarray],
+        max_batch_size: int = 32,
+        window_ms: float = 5.0,
+    ):
+        self.encode_batch = encode_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.window = window_ms / 1000
+        self._queue: queue.SimpleQueue[tuple[str, Future] | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+        self.batches = 0
+        self.requests = 0
+        self.largest_batch = 0
+
+    # -------------------------------------------------------------------------
+    # Callers
+    # -------------------------------------------------------------------------
+
+    def submit(self, text: str) -> Future:
+        """Queue `text`; the future resolves to its float32 embedding."""
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str) -> np.ndarray:
+        """Blocking encode through the batcher."""
+        return self.submit(text).result()
+
+    async def aencode(self, text: str) -> np.ndarray:
+        """Encode through the batcher without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def close(self) -> None:
+        """Stop the worker after it finishes the requests already queued."""
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "avg_batch": self.requests / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+        }
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                self._thread.start()
+
+    def _collect(self, first: tuple[str, Future]) -> tuple[list[tuple[str, Future]], bool]:
+        """Gather a batch starting with `first`. Returns (batch, stop requested)."""
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch, stop = self._collect(item)
+
+            # Skip callers that gave up, encode each distinct text once
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            texts = list(dict.fromkeys(text for text, _ in batch))
+            if not texts:
+                continue
+
+            start = time.perf_counter()
+            try:
+                vectors = np.asarray(self.encode_batch(texts), dtype=np.float32)
+            except Exception as e:
+                logger.warning("Batched embedding of %d texts failed: %s", len(texts), e)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            record_span("embedding", "encode_batch", time.perf_counter() - start)
+
+            self.batches += 1
+            self.requests += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            by_text = dict(zip(texts, vectors))
+            for text, future in batch:
+                future.set_result(by_text[text])
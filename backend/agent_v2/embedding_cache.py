@@ -0,0 +1,134 @@
+"""
+Query embedding cache for agent_v2.
+
+The executor often sends the same query to search_qna, search_reviews and
+search_repair_stories in one turn, and customers ask the same questions
+across sessions, so generate_embedding memoizes the encoded vector.
+
+Keys are the normalized query text: lowercased with whitespace collapsed and
+trailing ?/!/. dropped. all-MiniLM-L6-v2 is uncased, so lowercasing doesn't
+change the embedding; the normalized text is what gets encoded, so a cached
+vector is always identical to a fresh one.
+
+Vectors are stored as float32 arrays in an LRU of EMBEDDING_CACHE_MAX_ENTRIES.
+With EMBEDDING_CACHE_PATH set, the cache is loaded from that .npz file on first
+use and saved back on shutdown, so warm restarts don't start cold.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+from backend.config import get_settings
+from backend.metrics import EMBEDDING_CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing ?/!/.: "Easy  to install? " → "easy to install"."""
+    return " ".join(text.lower().split()).rstrip("?!. ")
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of normalized text → float32 embedding, with hit/miss counters."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> np.ndarray | None:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        EMBEDDING_CACHE_LOOKUPS.inc(1, "hit" if vector is not None else "miss")
+        return vector
+
+    def put(self, key: str, vector) -> np.ndarray:
+        """Store `vector` as a read-only float32 array and return it."""
+        vector = np.array(vector, dtype=np.float32)
+        vector.setflags(write=False)
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, path: str | Path) -> int:
+        """Write the cache (LRU order preserved) to an .npz file. Returns the entry count."""
+        with self._lock:
+            keys = list(self._entries)
+            vectors = list(self._entries.values())
+        if not keys:
+            return 0
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a crash mid-save can't leave a truncated file
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, keys=np.array(keys), vectors=np.stack(vectors))
+        tmp.replace(path)
+        return len(keys)
+
+    def load(self, path: str | Path) -> int:
+        """Add entries from a file written by save(). Returns the number loaded."""
+        with np.load(path) as data:
+            keys, vectors = data["keys"], data["vectors"]
+            for key, vector in zip(keys[-self.max_entries:], vectors[-self.max_entries:]):
+                self.put(str(key), vector)
+        return min(len(keys), self.max_entries)
+
+
+@lru_cache()
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache, loading EMBEDDING_CACHE_PATH if it exists."""
+    settings = get_settings()
+    cache = EmbeddingCache(max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES)
+    path = settings.EMBEDDING_CACHE_PATH
+    if path and Path(path).exists():
+        try:
+            logger.info("Loaded %d cached query embeddings from %s", cache.load(path), path)
+        except Exception as e:
+            logger.warning("Could not load embedding cache from %s: %s", path, e)
+    return cache
+
+
+def save_embedding_cache() -> None:
+    """Persist the cache to EMBEDDING_CACHE_PATH (call on shutdown). No-op if unset."""
+    path = get_settings().EMBEDDING_CACHE_PATH
+    if not path:
+        return
+    try:
+        count = get_embedding_cache().save(path)
+        logger.info("Saved %d query embeddings to %s", count, path)
+    except Exception as e:
+        logger.warning("Could not save embedding cache to %s: %s", path, e)
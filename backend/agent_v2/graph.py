@@ -1,30 +1,56 @@
 """
 LangGraph for agent_v2.
 
-Simplified 3-node graph:
-  scope_check → executor → synthesizer
+Simplified graph:
+  scope_check → router → executor → synthesizer
 
-No planner or workers - the executor handles everything via ReAct.
+No planner or workers - the executor handles everything via ReAct. The router
+answers canonical queries (part lookup, price, compatibility) with a fixed
+tool plan and skips the executor.
 """
+import logging
+import asyncio
 from typing import Literal, AsyncGenerator
 from langgraph.graph import StateGraph, END
+from backend.config import get_settings
 from backend.agent_v2.state import AgentState, SessionState
+from backend.agent_v2.runtime import get_runtime
+from backend.agent_v2.progress import ProgressStream
+from backend.agent_v2.prefetch import start_prefetch
+from backend.agent_v2.answer_cache import (
+    AnswerCache,
+    CachedAnswer,
+    context_key,
+    get_answer_cache,
+)
+from backend.agent_v2.nodes.synthesizer import PartMentionScanner
+from backend.agent_v2.templates import stream_chunks
 from backend.agent_v2.nodes import (
     scope_check_node,
     secondary_scope_check_node,
+    router_node,
     executor_node,
     synthesizer_node,
     synthesizer_node_streaming,
 )
 
+logger = logging.getLogger(__name__)
+
 
-def route_after_scope_check(state: AgentState) -> Literal["executor", "end"]:
+def route_after_scope_check(state: AgentState) -> Literal["router", "end"]:
     """Route based on scope check result."""
     if state.is_in_scope:
-        return "executor"
+        return "router"
     return "end"
 
 
+def route_after_router(state: AgentState) -> Literal["executor", "secondary_scope_check"]:
+    """Skip the ReAct executor when the router already ran the tool plan."""
+    if state.fast_path:
+        return "secondary_scope_check"
+    return "executor"
+
+
 def route_after_secondary_scope_check(state: AgentState) -> Literal["synthesizer", "end"]:
     """Route based on secondary scope check result."""
     if state.has_out_of_scope_parts:
@@ -45,7 +71,13 @@ def create_graph() -> StateGraph:
          (out of scope)                  (in scope)
               │                               │
               ▼                               ▼
-             END                          executor
+             END                           router ──────┐
+                                              │          │ (fast path)
+                                              ▼          │
+                                          executor       │
+                                              │          │
+                                              ▼          │
+                                   secondary_scope_check ◄┘
                                               │
                                               ▼
                                          synthesizer
@@ -59,6 +91,7 @@ def create_graph() -> StateGraph:
 
     # Add nodes
     workflow.add_node("scope_check", scope_check_node)
+    workflow.add_node("router", router_node)
     workflow.add_node("executor", executor_node)
     workflow.add_node("secondary_scope_check", secondary_scope_check_node)
     workflow.add_node("synthesizer", synthesizer_node)
@@ -71,11 +104,21 @@ def create_graph() -> StateGraph:
         "scope_check",
         route_after_scope_check,
         {
-            "executor": "executor",
+            "router": "router",
             "end": END,
         }
     )
 
+    # router → executor, or straight to secondary_scope_check on the fast path
+    workflow.add_conditional_edges(
+        "router",
+        route_after_router,
+        {
+            "executor": "executor",
+            "secondary_scope_check": "secondary_scope_check",
+        }
+    )
+
     # executor → secondary_scope_check
     workflow.add_edge("executor", "secondary_scope_check")
 
@@ -95,6 +138,20 @@ def create_graph() -> StateGraph:
     return workflow.compile()
 
 
+def _get_cache() -> AnswerCache | None:
+    """Get the answer cache, or None if disabled."""
+    if get_settings().ANSWER_CACHE_ENABLED:
+        return get_answer_cache()
+    return None
+
+
+def _session_from_cache(session: SessionState, cached: CachedAnswer) -> SessionState:
+    """Apply a cached answer's session changes to a copy of the session."""
+    updated_session = session.model_copy(deep=True)
+    updated_session.all_discussed_parts = list(cached.discussed_parts)
+    return updated_session
+
+
 async def run_agent(
     query: str,
     session: SessionState | None = None,
@@ -109,17 +166,26 @@ async def run_agent(
     Returns:
         Tuple of (response_text, updated_session, parts_list)
     """
-    print(f"\n{'='*60}")
-    print(f"[AGENT V2] NEW QUERY: {query[:50]}{'...' if len(query) > 50 else ''}")
-    print(f"{'='*60}")
+    logger.info("New query: %.80s", query)
 
     current_session = session or SessionState()
 
     # Log session state
     if current_session.all_discussed_parts:
-        print(f"  Session parts: {current_session.all_discussed_parts}")
+        logger.debug("Session parts: %s", current_session.all_discussed_parts)
 
-    graph = create_graph()
+    # Answer cache - keyed on the session as it was *before* this turn
+    cache = _get_cache()
+    cache_bucket = context_key(query, current_session)
+    if cache:
+        cached = await asyncio.to_thread(cache.get, query, cache_bucket)
+        if cached:
+            logger.info("Answer cache hit")
+            updated_session = _session_from_cache(current_session, cached)
+            return cached.response, updated_session, [dict(p) for p in cached.parts]
+
+    # Compiled once per process (see runtime.py)
+    graph = get_runtime().graph
 
     # Initialize state - conversation history comes from session
     initial_state = AgentState(
@@ -128,8 +194,12 @@ async def run_agent(
         conversation_history=current_session.conversation_history,
     )
 
-    # Run the graph
-    result = await graph.ainvoke(initial_state)
+    # Cache miss - start identifier lookups while the scope check runs
+    prefetch = start_prefetch(query, current_session)
+    try:
+        result = await graph.ainvoke(initial_state)
+    finally:
+        prefetch.close()
 
     # Extract results
     response = result.get("final_response", "")
@@ -151,18 +221,49 @@ async def run_agent(
         # If no parts mentioned, clear the list (response was about symptoms, etc.)
         updated_session.all_discussed_parts = []
 
-    print(f"\n[AGENT V2] Response length: {len(response)} chars")
-    print(f"  Session parts after filter: {updated_session.all_discussed_parts}")
-    print(f"{'='*60}\n")
+    if cache and response:
+        await asyncio.to_thread(
+            cache.put, query, cache_bucket,
+            CachedAnswer(
+                response=response,
+                parts=[dict(p) for p in parts],
+                discussed_parts=list(updated_session.all_discussed_parts),
+            ),
+        )
+
+    logger.debug("Session parts after filter: %s", updated_session.all_discussed_parts)
 
     return response, updated_session, parts
 
 
+def _merge_state(state: AgentState, update: dict) -> AgentState:
+    """
+    Apply a node's update to the state.
+
+    model_copy keeps the executor's message objects as they are; a
+    model_dump() round trip would turn them into plain dicts that the
+    synthesizer and extract_parts can't read.
+    """
+    return state.model_copy(update=update)
+
+
+async def _run_tools(state: AgentState) -> AgentState:
+    """Fast-path router, then the ReAct executor if no intent matched."""
+    router_result = await router_node(state)
+    state = _merge_state(state, router_result)
+
+    if not state.fast_path:
+        executor_result = await executor_node(state)
+        state = _merge_state(state, executor_result)
+    return state
+
+
 async def run_agent_streaming(
     query: str,
     session: SessionState | None = None,
-    session_container: dict | None = None
-) -> AsyncGenerator[str, None]:
+    session_container: dict | None = None,
+    emit_events: bool = False,
+) -> AsyncGenerator[str | dict, None]:
     """
     Run the agent graph with streaming response.
 
@@ -173,76 +274,127 @@ async def run_agent_streaming(
         session: Optional session state from previous turns
         session_container: Optional dict to store updated session (key: "session")
                           Use this to retrieve the updated session after streaming.
+        emit_events: Also yield tool progress events while the tools run, as
+                     dicts like {"event": "tool_start", "data": {"tool": ..., "args": ...}}
+                     and {"event": "tool_end", "data": {"tool": ..., "summary": ...}},
+                     and each part card as {"event": "part", "data": {...}} as
+                     soon as the response mentions it. Tokens are always str.
     """
-    print(f"\n{'='*60}")
-    print(f"[AGENT V2] NEW QUERY (streaming): {query[:50]}{'...' if len(query) > 50 else ''}")
-    print(f"{'='*60}")
+    logger.info("New query (streaming): %.80s", query)
 
     current_session = session or SessionState()
 
     # Log session state
     if current_session.all_discussed_parts:
-        print(f"  Session parts: {current_session.all_discussed_parts}")
-
-    # Initialize state
-    current_state = AgentState(
-        user_query=query,
-        session=current_session,
-        conversation_history=current_session.conversation_history,
-    )
-
-    # Step 1: Scope check
-    scope_result = await scope_check_node(current_state)
-    current_state = AgentState(**{**current_state.model_dump(), **scope_result})
-
-    if not current_state.is_in_scope:
-        yield current_state.scope_rejection_message or "I can only help with refrigerator and dishwasher questions."
-        if session_container is not None:
-            session_container["session"] = current_state.session
-        return
-
-    # Step 2: Executor
-    executor_result = await executor_node(current_state)
-    current_state = AgentState(**{**current_state.model_dump(), **executor_result})
-
-    # Step 2.5: Secondary scope check
-    secondary_scope_result = await secondary_scope_check_node(current_state)
-    current_state = AgentState(**{**current_state.model_dump(), **secondary_scope_result})
-
-    if current_state.has_out_of_scope_parts:
-        yield current_state.final_response
+        logger.debug("Session parts: %s", current_session.all_discussed_parts)
+
+    # Answer cache - replay hits through the token stream immediately
+    cache = _get_cache()
+    cache_bucket = context_key(query, current_session)
+    if cache:
+        cached = await asyncio.to_thread(cache.get, query, cache_bucket)
+        if cached:
+            logger.info("Answer cache hit")
+            scanner = PartMentionScanner([dict(p) for p in cached.parts])
+            for chunk in stream_chunks(cached.response):
+                yield chunk
+                if emit_events:
+                    for part in scanner.feed(chunk):
+                        yield {"event": "part", "data": part}
+            if emit_events:
+                for part in scanner.finish():
+                    yield {"event": "part", "data": part}
+            if session_container is not None:
+                session_container["session"] = _session_from_cache(current_session, cached)
+                session_container["parts"] = [dict(p) for p in cached.parts]
+            return
+
+    # Cache miss - start identifier lookups while the scope check runs
+    prefetch = start_prefetch(query, current_session)
+    try:
+        # Initialize state
+        current_state = AgentState(
+            user_query=query,
+            session=current_session,
+            conversation_history=current_session.conversation_history,
+        )
+
+        # Step 1: Scope check
+        scope_result = await scope_check_node(current_state)
+        current_state = _merge_state(current_state, scope_result)
+
+        if not current_state.is_in_scope:
+            yield current_state.scope_rejection_message or "I can only help with refrigerator and dishwasher questions."
+            if session_container is not None:
+                session_container["session"] = current_state.session
+            return
+
+        # Step 2: Fast-path router, then the ReAct executor if no intent matched
+        if emit_events:
+            progress = ProgressStream()
+            tools_task = progress.run(_run_tools(current_state))
+            async for event in progress.events(tools_task):
+                yield event
+            current_state = tools_task.result()
+        else:
+            current_state = await _run_tools(current_state)
+
+        # Step 2.5: Secondary scope check
+        secondary_scope_result = secondary_scope_check_node(current_state)
+        current_state = _merge_state(current_state, secondary_scope_result)
+
+        if current_state.has_out_of_scope_parts:
+            yield current_state.final_response
+            if session_container is not None:
+                session_container["session"] = current_state.session
+            return
+
+        # Extract all parts from executor results
+        from backend.agent_v2.nodes.synthesizer import extract_parts, extract_mentioned_ps_numbers
+        all_parts = extract_parts(current_state)
+
+        # Step 3: Stream the synthesizer and accumulate the full response.
+        # Part cards are sent as soon as their PS number has streamed.
+        full_response = ""
+        scanner = PartMentionScanner(all_parts)
+        async for token in synthesizer_node_streaming(current_state):
+            full_response += token
+            yield token
+            if emit_events:
+                for part in scanner.feed(token):
+                    yield {"event": "part", "data": part}
+        if emit_events:
+            for part in scanner.finish():
+                yield {"event": "part", "data": part}
+
+        # Filter parts to only those mentioned in the response
+        mentioned_ps_numbers = extract_mentioned_ps_numbers(full_response)
+        if mentioned_ps_numbers:
+            parts = [p for p in all_parts if p["ps_number"] in mentioned_ps_numbers]
+            # Also filter session's discussed parts
+            current_state.session.all_discussed_parts = [
+                ps for ps in current_state.session.all_discussed_parts
+                if ps in mentioned_ps_numbers
+            ]
+        else:
+            parts = []
+            current_state.session.all_discussed_parts = []
+
+        if cache and full_response:
+            await asyncio.to_thread(
+                cache.put, query, cache_bucket,
+                CachedAnswer(
+                    response=full_response,
+                    parts=[dict(p) for p in parts],
+                    discussed_parts=list(current_state.session.all_discussed_parts),
+                ),
+            )
+
+        # Store updated session and parts for caller to retrieve
         if session_container is not None:
             session_container["session"] = current_state.session
-        return
-
-    # Extract all parts from executor results
-    from backend.agent_v2.nodes.synthesizer import extract_parts, extract_mentioned_ps_numbers
-    all_parts = extract_parts(current_state)
-
-    # Step 3: Stream the synthesizer and accumulate the full response
-    full_response = ""
-    async for token in synthesizer_node_streaming(current_state):
-        full_response += token
-        yield token
-
-    # Filter parts to only those mentioned in the response
-    mentioned_ps_numbers = extract_mentioned_ps_numbers(full_response)
-    if mentioned_ps_numbers:
-        parts = [p for p in all_parts if p["ps_number"] in mentioned_ps_numbers]
-        # Also filter session's discussed parts
-        current_state.session.all_discussed_parts = [
-            ps for ps in current_state.session.all_discussed_parts
-            if ps in mentioned_ps_numbers
-        ]
-    else:
-        parts = []
-        current_state.session.all_discussed_parts = []
-
-    # Store updated session and parts for caller to retrieve
-    if session_container is not None:
-        session_container["session"] = current_state.session
-        session_container["parts"] = parts
+            session_container["parts"] = parts
 
-    print(f"\n[AGENT V2] Streaming complete")
-    print(f"  Session parts after filter: {current_state.session.all_discussed_parts}")
-    print(f"{'='*60}\n")
+        logger.debug("Streaming complete, session parts after filter: %s", current_state.session.all_discussed_parts)
+    finally:
+        prefetch.close()
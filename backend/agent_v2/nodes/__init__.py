@@ -4,12 +4,14 @@ Nodes for agent_v2 graph.
 from backend.agent_v2.nodes.scope_check import scope_check_node
 from backend.agent_v2.nodes.secondary_scope_check import secondary_scope_check_node
 from backend.agent_v2.nodes.executor import executor_node
+from backend.agent_v2.nodes.router import router_node
 from backend.agent_v2.nodes.synthesizer import synthesizer_node, synthesizer_node_streaming
 
 __all__ = [
     "scope_check_node",
     "secondary_scope_check_node",
     "executor_node",
+    "router_node",
     "synthesizer_node",
     "synthesizer_node_streaming",
 ]
@@ -4,18 +4,51 @@ Executor Node for agent_v2.
 Single ReAct executor that handles all query types.
 The LLM decides which tools to call and in what order.
 """
+import logging
 import json
-from langchain_anthropic import ChatAnthropic
-from langgraph.prebuilt import create_react_agent
-from backend.config import get_settings
-from backend.agent_v2.tools import get_all_tools
 from backend.agent_v2.prompts import format_executor_prompt
+from backend.agent_v2.runtime import get_runtime
 from backend.agent_v2.state import AgentState
 from backend.agent_v2.session import update_session_from_tool_results
+from backend.agent_v2.progress import emit_progress, progress_enabled
+from backend.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+
+def summarize_tool_result(content) -> str:
+    """Short one-line summary of a tool result (for logs and progress events)."""
+    if isinstance(content, str):
+        try:
+            parsed = json.loads(content)
+        except json.JSONDecodeError:
+            return content[:60]
+        if isinstance(parsed, dict):
+            if parsed.get('error'):
+                return f"ERROR: {parsed['error'][:80]}"
+            elif parsed.get('resolved'):
+                return f"resolved -> {parsed.get('ps_number', 'N/A')}"
+            elif parsed.get('compatible') is not None:
+                return f"compatible={parsed['compatible']}"
+            elif parsed.get('ps_number'):
+                return f"part: {parsed.get('part_name', '')[:40]}"
+            else:
+                keys = list(parsed.keys())[:4]
+                return f"dict with keys: {keys}"
+        elif isinstance(parsed, list):
+            return f"list of {len(parsed)} items"
+        else:
+            return str(parsed)[:60]
+    return str(content)[:60]
 
 
 def _log_tool_calls(messages: list) -> None:
     """Log detailed tool call information."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        tool_count = sum(1 for msg in messages if getattr(msg, 'type', None) == 'tool')
+        logger.info("Executor made %d tool calls", tool_count)
+        return
+
     # Build a map of tool_call_id -> (tool_name, args)
     tool_call_map = {}
     for msg in messages:
@@ -42,35 +75,11 @@ def _log_tool_calls(messages: list) -> None:
             args_str = ', '.join(f"{k}={repr(v)[:50]}" for k, v in args.items())
 
             # Parse and summarize result
-            content = msg.content
-            if isinstance(content, str):
-                try:
-                    parsed = json.loads(content)
-                    if isinstance(parsed, dict):
-                        if parsed.get('error'):
-                            result_summary = f"ERROR: {parsed['error'][:80]}"
-                        elif parsed.get('resolved'):
-                            result_summary = f"resolved -> {parsed.get('ps_number', 'N/A')}"
-                        elif parsed.get('compatible') is not None:
-                            result_summary = f"compatible={parsed['compatible']}"
-                        elif parsed.get('ps_number'):
-                            result_summary = f"part: {parsed.get('part_name', '')[:40]}"
-                        else:
-                            keys = list(parsed.keys())[:4]
-                            result_summary = f"dict with keys: {keys}"
-                    elif isinstance(parsed, list):
-                        result_summary = f"list of {len(parsed)} items"
-                    else:
-                        result_summary = str(parsed)[:60]
-                except json.JSONDecodeError:
-                    result_summary = content[:60]
-            else:
-                result_summary = str(content)[:60]
+            result_summary = summarize_tool_result(msg.content)
 
-            print(f"  [TOOL {tool_count}] {tool_name}({args_str})")
-            print(f"           → {result_summary}")
+            logger.debug("tool %d: %s(%s) → %s", tool_count, tool_name, args_str, result_summary)
 
-    print(f"  [EXECUTOR] Made {tool_count} tool calls")
+    logger.info("Executor made %d tool calls", tool_count)
 
 
 def format_session_context(state: AgentState) -> str:
@@ -95,46 +104,17 @@ def format_session_context(state: AgentState) -> str:
     return "\n".join(parts) if parts else "No prior context."
 
 
-async def executor_node(state: AgentState) -> dict:
+async def apply_scrape_fallback(messages: list) -> list:
     """
-    Single ReAct executor - handles all query types.
+    When get_part returns "not found", auto-trigger scrape_part_live.
 
-    The LLM decides which tools to call and in what order based on the
-    workflow patterns in the prompt.
+    Scraped parts are appended to `messages` as tool results for the
+    synthesizer. Shared by the ReAct executor and the fast-path router.
     """
-    settings = get_settings()
-
-    print(f"  [EXECUTOR] Query: {state.user_query[:50]}...")
-
-    llm = ChatAnthropic(
-        model=settings.HAIKU_MODEL,
-        api_key=settings.ANTHROPIC_API_KEY,
-        max_tokens=1024,
-    )
-
-    tools = get_all_tools()
-    print(f"  [EXECUTOR] Loaded {len(tools)} tools")
-
-    # Create the ReAct agent
-    agent = create_react_agent(llm, tools)
-
-    # Format the prompt with session context
-    session_context = format_session_context(state)
-    prompt = format_executor_prompt(state.user_query, session_context)
-
-    # Run the agent
-    result = await agent.ainvoke({"messages": [{"role": "user", "content": prompt}]})
-
-    # Extract tool results and update session
-    messages = result.get("messages", [])
-
-    # Log detailed tool calls
-    _log_tool_calls(messages)
-
-    # === AUTOMATIC SCRAPE FALLBACK ===
-    # When get_part returns "not found", auto-trigger scrape_part_live
     from langchain_core.messages import ToolMessage
 
+    tool_map = get_runtime().tool_map
+
     # Check if scrape was already called by the agent
     scrape_already_called = any(
         hasattr(msg, 'name') and msg.name == 'scrape_part_live'
@@ -165,23 +145,22 @@ async def executor_node(state: AgentState) -> dict:
                         ps_number = data.get('ps_number', '')
 
                         if 'not found' in error_msg and ps_number:
-                            print(f"  [EXECUTOR] Part {ps_number} not in DB → triggering live scrape...")
+                            logger.info("Part %s not in DB → triggering live scrape", ps_number)
 
                             # Get the scrape tool from tool map and invoke it
-                            scrape_tool = None
-                            for tool in tools:
-                                if tool.name == 'scrape_part_live':
-                                    scrape_tool = tool
-                                    break
+                            scrape_tool = tool_map.get('scrape_part_live')
 
                             if scrape_tool:
-                                # Execute live scrape using tool's invoke method
-                                scraped_data = scrape_tool.invoke({"ps_number": ps_number})
+                                # Awaits a pooled browser - Selenium runs on the pool's threads
+                                emit_progress("tool_start", tool="scrape_part_live", args={"ps_number": ps_number})
+                                scraped_data = await scrape_tool.ainvoke({"ps_number": ps_number})
+                                emit_progress("tool_end", tool="scrape_part_live",
+                                              summary=summarize_tool_result(json.dumps(scraped_data)))
 
                                 if scraped_data.get('error'):
-                                    print(f"  [EXECUTOR] Live scrape failed: {scraped_data['error']}")
+                                    logger.warning("Live scrape failed for %s: %s", ps_number, scraped_data["error"])
                                 else:
-                                    print(f"  [EXECUTOR] Live scrape successful!")
+                                    logger.info("Live scrape of %s succeeded", ps_number)
 
                                     # Inject scraped data into messages for synthesizer
                                     scrape_msg = ToolMessage(
@@ -191,16 +170,78 @@ async def executor_node(state: AgentState) -> dict:
                                     )
                                     messages.append(scrape_msg)
 
-                                    # Update result with new messages
-                                    result["messages"] = messages
-                                    print(f"  [EXECUTOR] Added scraped part to results")
+                                    logger.debug("Added scraped part %s to results", ps_number)
                             else:
-                                print(f"  [EXECUTOR] Warning: scrape_part_live tool not found")
-    # === END FALLBACK ===
+                                logger.warning("scrape_part_live tool not found")
+
+    return messages
+
+
+async def run_agent_with_progress(agent, agent_input: dict) -> dict:
+    """
+    Run the ReAct agent via LangGraph's event stream, emitting tool_start /
+    tool_end progress events. Returns the same final state as ainvoke().
+    """
+    root_run_id = None
+    result = None
+    async for event in agent.astream_events(agent_input, version="v2"):
+        kind = event["event"]
+        if root_run_id is None:
+            root_run_id = event["run_id"]
+
+        if kind == "on_tool_start":
+            emit_progress("tool_start", tool=event["name"], args=event["data"].get("input", {}))
+        elif kind == "on_tool_end":
+            output = event["data"].get("output")
+            content = getattr(output, "content", output)
+            emit_progress("tool_end", tool=event["name"], summary=summarize_tool_result(content))
+        elif kind == "on_chain_end" and event["run_id"] == root_run_id:
+            result = event["data"]["output"]
+
+    if result is None:
+        raise RuntimeError("ReAct agent finished without a final state")
+    return result
+
+
+@timed("node", "executor")
+async def executor_node(state: AgentState) -> dict:
+    """
+    Single ReAct executor - handles all query types.
+
+    The LLM decides which tools to call and in what order based on the
+    workflow patterns in the prompt.
+    """
+    runtime = get_runtime()
+
+    logger.debug("Executor query: %.50s", state.user_query)
+
+    # ReAct agent is built once per process (see runtime.py)
+    agent = runtime.react_agent
+
+    # Format the prompt with session context
+    session_context = format_session_context(state)
+    prompt = format_executor_prompt(state.user_query, session_context)
+
+    # Run the agent - streaming tool events when the request is listening
+    agent_input = {"messages": [{"role": "user", "content": prompt}]}
+    if progress_enabled():
+        result = await run_agent_with_progress(agent, agent_input)
+    else:
+        result = await agent.ainvoke(agent_input)
+
+    # Extract tool results and update session
+    messages = result.get("messages", [])
+
+    # Log detailed tool calls
+    _log_tool_calls(messages)
+
+    # When get_part returns "not found", auto-trigger scrape_part_live
+    messages = await apply_scrape_fallback(messages)
+    result["messages"] = messages
 
     # Update session from tool results
     updated_session = update_session_from_tool_results(state.session, messages)
-    print(f"  [EXECUTOR] Discussed parts: {updated_session.all_discussed_parts}")
+    logger.debug("Discussed parts: %s", updated_session.all_discussed_parts)
 
     return {
         "executor_result": result,
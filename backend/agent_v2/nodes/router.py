@@ -0,0 +1,306 @@
+"""
+Fast-path Router Node for agent_v2.
+
+Sits between scope_check and executor. Canonical queries like
+"tell me about PS11752778", "does PS11752778 fit WDT780SAEM1" or "common
+dishwasher problems" always produce the same tool calls, so the ReAct loop's LLM round trips buy nothing.
+
+The router matches the whole query against anchored templates per intent.
+On a match it runs the intent's tool plan directly (concurrently) and emits
+messages in the same shape as the ReAct executor, so the secondary scope
+check and synthesizer work unchanged. Anything else - follow-ups ("does it
+fit?"), multiple parts, extra questions - falls back to the executor.
+
+Per-intent hit rates are tracked in ROUTER_STATS.
+"""
+import logging
+import asyncio
+import json
+import re
+import threading
+from dataclasses import dataclass
+from typing import Callable
+from langchain_core.messages import AIMessage, ToolMessage
+from backend.config import get_settings
+from backend.agent_v2.state import AgentState
+from backend.agent_v2.runtime import get_runtime
+from backend.agent_v2.session import update_session_from_tool_results
+from backend.agent_v2.nodes.executor import apply_scrape_fallback, summarize_tool_result
+from backend.agent_v2.progress import emit_progress
+from backend.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Intent templates
+# =============================================================================
+
+# Placeholders used in templates
+_PS = r"(?:part\s+)?(?:number\s+)?(?:#\s*)?(?P<ps>PS\d+)"
+_MODEL = (
+    r"(?:(?:my|a|the|this)\s+)?(?:(?:refrigerator|fridge|dishwasher)\s+)?"
+    r"(?:model\s+)?(?:(?:number|no\.?|#)\s*)?(?P<model>[A-Z0-9][A-Z0-9\-]{3,})"
+    r"(?:\s+(?:refrigerator|fridge|dishwasher|model))?"
+)
+_APPLIANCE = r"(?:my\s+|a\s+)?(?P<appliance>refrigerator|fridge|dishwasher)s?"
+
+APPLIANCE_TYPES = {"refrigerator": "refrigerator", "fridge": "refrigerator", "dishwasher": "dishwasher"}
+
+
+def _templates(*patterns: str) -> tuple[re.Pattern, ...]:
+    """Compile templates as full-match, case-insensitive patterns."""
+    return tuple(
+        re.compile(p.format(ps=_PS, model=_MODEL, appliance=_APPLIANCE), re.IGNORECASE)
+        for p in patterns
+    )
+
+
+@dataclass(frozen=True)
+class Intent:
+    """A canonical query shape and the tool calls that answer it."""
+    name: str
+    templates: tuple[re.Pattern, ...]
+    plan: Callable[[dict], list[tuple[str, dict]]]
+
+
+INTENTS: list[Intent] = [
+    Intent(
+        name="compatibility",
+        templates=_templates(
+            r"(?:does|will|would|can)\s+{ps}\s+(?:fit|work\s+(?:with|in|on|for)|be\s+compatible\s+with|go\s+(?:in|with))\s+{model}",
+            r"(?:is\s+)?{ps}\s+(?:compatible\s+with|(?:a\s+)?fit\s+for)\s+{model}",
+            r"(?:is|are)\s+{ps}\s+(?:going\s+to\s+)?(?:fit|work\s+with)\s+{model}",
+            r"(?:check\s+)?compatibility\s+(?:of\s+)?{ps}\s+(?:with|and|for)\s+{model}",
+        ),
+        # Part details too, so the answer can name the part and show its card
+        plan=lambda m: [
+            ("get_part", {"ps_number": m["ps"]}),
+            ("check_compatibility", {"ps_number": m["ps"], "model_number": m["model"]}),
+        ],
+    ),
+    Intent(
+        name="compatible_models",
+        templates=_templates(
+            r"(?:what|which)\s+models?\s+(?:does|will|can)\s+{ps}\s+(?:fit|work\s+(?:with|in|on|for))",
+            r"(?:what|which)\s+models?\s+(?:is|are)\s+{ps}\s+compatible\s+with",
+            r"(?:list\s+|show\s+(?:me\s+)?)?(?:the\s+)?compatible\s+models\s+(?:for|of)\s+{ps}",
+        ),
+        plan=lambda m: [
+            ("get_part", {"ps_number": m["ps"]}),
+            ("get_compatible_models", {"ps_number": m["ps"]}),
+        ],
+    ),
+    Intent(
+        name="price_availability",
+        templates=_templates(
+            r"how\s+much\s+(?:is|does|for|are)\s+{ps}(?:\s+cost)?",
+            r"what(?:'s|\s+is)\s+the\s+(?:price|cost)\s+(?:of|for)\s+{ps}",
+            r"(?:price|cost)\s+(?:of|for)\s+{ps}",
+            r"is\s+{ps}\s+(?:in\s+stock|available|still\s+available)",
+            r"(?:do\s+you\s+have|do\s+you\s+carry)\s+{ps}(?:\s+in\s+stock)?",
+        ),
+        plan=lambda m: [("get_part", {"ps_number": m["ps"]})],
+    ),
+    Intent(
+        name="part_lookup",
+        templates=_templates(
+            r"{ps}",
+            r"(?:tell\s+me\s+(?:more\s+)?about|what\s+is|what's|info(?:rmation)?\s+(?:on|about|for)|"
+            r"details\s+(?:on|about|for)|show\s+me|look\s*up|find|search\s+for|get)\s+{ps}",
+            r"{ps}\s+(?:details|info|information)",
+        ),
+        plan=lambda m: [("get_part", {"ps_number": m["ps"]})],
+    ),
+    Intent(
+        name="symptom_list",
+        templates=_templates(
+            r"(?:what\s+are\s+)?(?:the\s+)?(?:most\s+)?common\s+{appliance}\s+(?:problems|issues|symptoms)",
+            r"(?:what\s+are\s+)?(?:the\s+)?(?:most\s+)?common\s+(?:problems|issues|symptoms)\s+(?:with|for|of)\s+{appliance}",
+            r"(?:list\s+|show\s+(?:me\s+)?)?(?:the\s+)?{appliance}\s+(?:problems|issues|symptoms)",
+        ),
+        plan=lambda m: [("get_symptoms", {"appliance_type": APPLIANCE_TYPES[m["appliance"]]})],
+    ),
+]
+
+# Politeness and punctuation that don't change the intent
+_PREFIX = re.compile(r"^(?:(?:hi|hello|hey)[,!.\s]+)?(?:(?:please|can\s+you|could\s+you)\s+)?", re.IGNORECASE)
+_SUFFIX = re.compile(r"(?:[,\s]+(?:please|thanks|thank\s+you))?[\s?.!]*$", re.IGNORECASE)
+
+
+def normalize_for_routing(query: str) -> str:
+    """Trim greetings, politeness and trailing punctuation; collapse whitespace."""
+    text = " ".join(query.split())
+    text = _SUFFIX.sub("", text)
+    text = _PREFIX.sub("", text)
+    return text.strip()
+
+
+def match_intent(query: str) -> tuple[Intent, dict] | None:
+    """
+    Match a query against the intent templates.
+
+    Returns (intent, captured identifiers) or None. A match requires the whole
+    (normalized) query to fit a template, so anything with extra content falls
+    back to the ReAct executor.
+    """
+    text = normalize_for_routing(query)
+    for intent in INTENTS:
+        for template in intent.templates:
+            match = template.fullmatch(text)
+            if not match:
+                continue
+            # Identifiers are stored upper case, appliance types lower case
+            groups = {
+                k: v.lower() if k == "appliance" else v.upper()
+                for k, v in match.groupdict().items() if v
+            }
+            # Model numbers always contain a digit ("my fridge" isn't one)
+            if "model" in groups and not any(c.isdigit() for c in groups["model"]):
+                continue
+            return intent, groups
+    return None
+
+
+# =============================================================================
+# Hit rate tracking
+# =============================================================================
+
+class RouterStats:
+    """Per-intent fast-path counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+        self.hits: dict[str, int] = {intent.name: 0 for intent in INTENTS}
+        # Matched, but the plan failed and the executor ran instead
+        self.failures: dict[str, int] = {intent.name: 0 for intent in INTENTS}
+
+    def record(self, intent: str | None, failed: bool = False) -> None:
+        with self._lock:
+            self.total += 1
+            if intent is None:
+                return
+            if failed:
+                self.failures[intent] += 1
+            else:
+                self.hits[intent] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.total
+            fast = sum(self.hits.values())
+            return {
+                "routed_queries": total,
+                "fast_path_hits": fast,
+                "fast_path_hit_rate": fast / total if total else 0.0,
+                "intents": {
+                    name: {
+                        "hits": self.hits[name],
+                        "failures": self.failures[name],
+                        "hit_rate": self.hits[name] / total if total else 0.0,
+                    }
+                    for name in self.hits
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.total = 0
+            self.hits = dict.fromkeys(self.hits, 0)
+            self.failures = dict.fromkeys(self.failures, 0)
+
+
+ROUTER_STATS = RouterStats()
+
+
+def get_router_stats() -> dict:
+    """Fast-path hit rates overall and per intent."""
+    return ROUTER_STATS.stats()
+
+
+# =============================================================================
+# Node
+# =============================================================================
+
+def _tool_content(result) -> str:
+    """Serialize a tool result the way langgraph's ToolNode does."""
+    if isinstance(result, str):
+        return result
+    try:
+        return json.dumps(result, ensure_ascii=False)
+    except Exception:
+        return str(result)
+
+
+async def run_plan(plan: list[tuple[str, dict]]) -> list:
+    """
+    Run a tool plan concurrently.
+
+    Returns messages shaped like the ReAct executor's: one AI message with the
+    tool calls, then one ToolMessage per call.
+    """
+    tool_map = get_runtime().tool_map
+    tool_calls = [
+        {"name": name, "args": args, "id": f"fast_{i}_{name}", "type": "tool_call"}
+        for i, (name, args) in enumerate(plan)
+    ]
+
+    async def run_call(call: dict):
+        emit_progress("tool_start", tool=call["name"], args=call["args"])
+        result = await tool_map[call["name"]].ainvoke(call["args"])
+        emit_progress("tool_end", tool=call["name"], summary=summarize_tool_result(_tool_content(result)))
+        return result
+
+    results = await asyncio.gather(*(run_call(call) for call in tool_calls))
+
+    messages = [AIMessage(content="", tool_calls=tool_calls)]
+    for call, result in zip(tool_calls, results):
+        messages.append(ToolMessage(
+            content=_tool_content(result),
+            tool_call_id=call["id"],
+            name=call["name"],
+        ))
+    return messages
+
+
+@timed("node", "router")
+async def router_node(state: AgentState) -> dict:
+    """
+    Fast-path router - runs a fixed tool plan for canonical queries.
+
+    Sets fast_path=True and executor_result when it handled the query;
+    otherwise returns fast_path=False and the ReAct executor runs.
+    """
+    if not get_settings().FAST_PATH_ENABLED:
+        return {"fast_path": False, "intent": None}
+
+    matched = match_intent(state.user_query)
+    if matched is None:
+        ROUTER_STATS.record(None)
+        logger.info("No intent matched → ReAct executor")
+        return {"fast_path": False, "intent": None}
+
+    intent, groups = matched
+    plan = intent.plan(groups)
+    logger.info("Intent: %s %s → %s", intent.name, groups, [name for name, _ in plan])
+
+    try:
+        messages = await run_plan(plan)
+    except Exception as e:
+        ROUTER_STATS.record(intent.name, failed=True)
+        logger.warning("Fast-path plan for %s failed (%s) → ReAct executor", intent.name, e)
+        return {"fast_path": False, "intent": intent.name}
+
+    # Same post-processing as the executor
+    messages = await apply_scrape_fallback(messages)
+    updated_session = update_session_from_tool_results(state.session, messages)
+    ROUTER_STATS.record(intent.name)
+    logger.debug("Discussed parts: %s", updated_session.all_discussed_parts)
+
+    return {
+        "fast_path": True,
+        "intent": intent.name,
+        "executor_result": {"messages": messages},
+        "session": updated_session,
+    }
@@ -8,12 +8,15 @@ Uses fast rules first, then falls back to LLM if needed.
 
 Copied from backend/agent/nodes/scope_check.py with updated imports.
 """
+import logging
 import re
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage
-from backend.config import get_settings
 from backend.agent_v2.state import AgentState
+from backend.agent_v2.runtime import get_runtime
 from backend.agent_v2.prompts import SCOPE_CHECK_PROMPT, OUT_OF_SCOPE_RESPONSE
+from backend.metrics import timed
+
+logger = logging.getLogger(__name__)
 
 
 # Keywords that strongly indicate in-scope queries
@@ -74,13 +77,7 @@ def rule_based_scope_check(query: str) -> str | None:
 
 async def llm_scope_check(query: str, conversation_history: list = None) -> str:
     """Use LLM for ambiguous queries, with conversation context."""
-    settings = get_settings()
-
-    llm = ChatAnthropic(
-        model=settings.HAIKU_MODEL,
-        api_key=settings.ANTHROPIC_API_KEY,
-        max_tokens=10,
-    )
+    llm = get_runtime().scope_llm
 
     # Build context from conversation history
     context = ""
@@ -103,6 +100,7 @@ async def llm_scope_check(query: str, conversation_history: list = None) -> str:
     return "OUT_OF_SCOPE"
 
 
+@timed("node", "scope_check")
 async def scope_check_node(state: AgentState) -> dict:
     """
     Scope check node - determines if query is about fridges/dishwashers.
@@ -113,7 +111,7 @@ async def scope_check_node(state: AgentState) -> dict:
     query = state.user_query
     session = state.session
 
-    print(f"  [SCOPE CHECK] Query: {query[:50]}...")
+    logger.debug("Scope check query: %.50s", query)
 
     # Try rules first (fast) - only for clear-cut cases
     result = rule_based_scope_check(query)
@@ -121,11 +119,11 @@ async def scope_check_node(state: AgentState) -> dict:
 
     # Fall back to LLM if unclear - LLM gets conversation context to understand follow-ups
     if result is None:
-        print(f"  [SCOPE CHECK] Rules inconclusive, using LLM")
+        logger.debug("Scope rules inconclusive, using LLM")
         result = await llm_scope_check(query, session.conversation_history)
         method = "llm"
 
-    print(f"  [SCOPE CHECK] Result: {result} (via {method})")
+    logger.info("Scope check: %s (via %s)", result, method)
 
     if result == "IN_SCOPE":
         return {
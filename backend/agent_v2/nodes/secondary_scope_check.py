@@ -12,8 +12,12 @@ Catches cases like:
 For live-scraped parts without appliance_type in DB, the scraper uses LLM to classify
 the appliance type based on part name, description, reviews, and Q&A data.
 """
+import logging
 import json
 from backend.agent_v2.state import AgentState
+from backend.metrics import timed
+
+logger = logging.getLogger(__name__)
 
 
 def parse_tool_content(content: str | dict) -> dict | list | str:
@@ -68,6 +72,7 @@ I can only help with **refrigerator** and **dishwasher** parts and repairs. If y
 I can only help with **refrigerator** and **dishwasher** parts and repairs. If you have questions about fridge or dishwasher parts, I'd be happy to help!"""
 
 
+@timed("node", "secondary_scope_check")
 def secondary_scope_check_node(state: AgentState) -> dict:
     """
     Check if any parts fetched by executor are out-of-scope.
@@ -102,7 +107,7 @@ def secondary_scope_check_node(state: AgentState) -> dict:
         }
 
     messages = state.executor_result.get("messages", [])
-    print(f"  [SECONDARY SCOPE CHECK] Scanning {len(messages)} tool results...")
+    logger.debug("Scanning %d tool results", len(messages))
 
     for msg in messages:
         # Only process tool result messages
@@ -173,7 +178,7 @@ def secondary_scope_check_node(state: AgentState) -> dict:
 
     if unique_out_of_scope:
         appliance_types = [p['appliance_type'] for p in unique_out_of_scope]
-        print(f"  [SECONDARY SCOPE CHECK] REJECTED - found {len(unique_out_of_scope)} out-of-scope parts: {appliance_types}")
+        logger.info("Rejected - found %d out-of-scope parts: %s", len(unique_out_of_scope), appliance_types)
 
         # Remove out-of-scope parts from session's discussed parts
         out_of_scope_ps_numbers = {p['ps_number'] for p in unique_out_of_scope}
@@ -182,7 +187,7 @@ def secondary_scope_check_node(state: AgentState) -> dict:
             ps for ps in updated_session.all_discussed_parts
             if ps not in out_of_scope_ps_numbers
         ]
-        print(f"  [SECONDARY SCOPE CHECK] Removed {len(out_of_scope_ps_numbers)} parts from session")
+        logger.debug("Removed %d parts from session", len(out_of_scope_ps_numbers))
 
         # Build rejection message
         rejection_message = build_rejection_message(unique_out_of_scope)
@@ -194,7 +199,7 @@ def secondary_scope_check_node(state: AgentState) -> dict:
             "session": updated_session,
         }
 
-    print(f"  [SECONDARY SCOPE CHECK] PASSED - all parts are fridge/dishwasher")
+    logger.debug("Passed - all parts are fridge/dishwasher")
     return {
         "has_out_of_scope_parts": False,
         "out_of_scope_parts": [],
@@ -2,15 +2,27 @@
 Synthesizer Node for agent_v2.
 
 Takes executor results and generates the final response.
-Uses Sonnet for higher quality synthesis.
+Uses Sonnet for higher quality synthesis, or a template for fast-path intents
+with well-structured results (see templates.py).
 """
+import logging
 import json
 import re
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage
 from backend.config import get_settings
 from backend.agent_v2.state import AgentState
 from backend.agent_v2.prompts import format_synthesizer_prompt
+from backend.agent_v2.runtime import get_runtime
+from backend.agent_v2.templates import render_template, stream_chunks
+from backend.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+
+# PS followed by any digits (e.g., PS382661, PS8760080, PS11752778)
+PS_MENTION_PATTERN = re.compile(r'PS\d+', re.IGNORECASE)
+# Text at the end of a chunk that may continue into a PS number
+_PARTIAL_PS_PATTERN = re.compile(r'P(?:S\d*)?$', re.IGNORECASE)
 
 
 def extract_mentioned_ps_numbers(response: str) -> set[str]:
@@ -19,12 +31,55 @@ def extract_mentioned_ps_numbers(response: str) -> set[str]:
     Used to filter part cards to only show parts that were actually
     recommended in the response text.
     """
-    # Match PS followed by any digits (e.g., PS382661, PS8760080, PS11752778)
-    pattern = r'PS\d+'
-    matches = re.findall(pattern, response, re.IGNORECASE)
+    matches = PS_MENTION_PATTERN.findall(response)
     return {m.upper() for m in matches}
 
 
+class PartMentionScanner:
+    """
+    Incremental extract_mentioned_ps_numbers over a token stream.
+
+    feed() returns the parts whose PS numbers were completed by a chunk, so
+    part cards can be sent while the text is still streaming. A PS number
+    split across chunks ("PS117" + "52778") is only reported once a non-digit
+    follows it, or at finish(). Each part is reported once; together they are
+    exactly the parts the final extract_mentioned_ps_numbers filter keeps.
+    """
+
+    def __init__(self, parts: list[dict]):
+        self.parts_by_ps = {p["ps_number"].upper(): p for p in parts}
+        self.found: set[str] = set()
+        self._tail = ""
+
+    def _collect(self, text: str, final: bool) -> tuple[list[dict], str]:
+        """Parts for complete PS numbers in `text`, and the text to carry over."""
+        new_parts = []
+        for match in PS_MENTION_PATTERN.finditer(text):
+            if match.end() == len(text) and not final:
+                break  # more digits may follow in the next chunk
+            ps_number = match.group().upper()
+            if ps_number in self.found:
+                continue
+            self.found.add(ps_number)
+            if ps_number in self.parts_by_ps:
+                new_parts.append(self.parts_by_ps[ps_number])
+
+        if final:
+            return new_parts, ""
+        partial = _PARTIAL_PS_PATTERN.search(text)
+        return new_parts, text[partial.start():] if partial else ""
+
+    def feed(self, chunk: str) -> list[dict]:
+        """Scan the next chunk. Returns newly mentioned parts."""
+        new_parts, self._tail = self._collect(self._tail + chunk, final=False)
+        return new_parts
+
+    def finish(self) -> list[dict]:
+        """End of stream - report a PS number the response ended with."""
+        new_parts, self._tail = self._collect(self._tail, final=True)
+        return new_parts
+
+
 def format_conversation_history(state: AgentState) -> str:
     """Format conversation history for context."""
     if not state.conversation_history:
@@ -162,6 +217,7 @@ def format_results(state: AgentState) -> str:
     return "\n".join(parts)
 
 
+@timed("node", "synthesizer")
 async def synthesizer_node(state: AgentState) -> dict:
     """
     Synthesizer node - creates the final response.
@@ -171,33 +227,33 @@ async def synthesizer_node(state: AgentState) -> dict:
     """
     settings = get_settings()
 
-    print(f"  [SYNTHESIZER] Generating response...")
+    logger.debug("Generating response")
 
-    llm = ChatAnthropic(
-        model=settings.SONNET_MODEL,
-        api_key=settings.ANTHROPIC_API_KEY,
-        max_tokens=2048,
-    )
+    response_text = render_template(state)
+    if response_text is not None:
+        logger.info("Synthesizing from template: %s", state.intent)
+    else:
+        llm = get_runtime().synthesizer_llm
 
-    session_context = format_session_context(state)
-    results = format_results(state)
+        session_context = format_session_context(state)
+        results = format_results(state)
 
-    print(f"  [SYNTHESIZER] Using model: {settings.SONNET_MODEL}")
-    print(f"  [SYNTHESIZER] Input data size: {len(results)} chars")
+        logger.debug("Synthesizing with %s from %d chars of tool results", settings.SONNET_MODEL, len(results))
 
-    prompt = format_synthesizer_prompt(
-        query=state.user_query,
-        session_context=session_context,
-        results=results
-    )
+        prompt = format_synthesizer_prompt(
+            query=state.user_query,
+            session_context=session_context,
+            results=results
+        )
 
-    response = await llm.ainvoke([HumanMessage(content=prompt)])
+        response = await llm.ainvoke([HumanMessage(content=prompt)])
+        response_text = response.content
 
     # Extract all parts from tool results
     all_parts = extract_parts(state)
 
     # Filter to only parts mentioned in the response
-    mentioned_ps_numbers = extract_mentioned_ps_numbers(response.content)
+    mentioned_ps_numbers = extract_mentioned_ps_numbers(response_text)
 
     if mentioned_ps_numbers:
         # Only show parts that were explicitly mentioned
@@ -207,15 +263,15 @@ async def synthesizer_node(state: AgentState) -> dict:
         # (response is probably about symptoms, not specific parts)
         parts = []
 
-    print(f"  [SYNTHESIZER] Response length: {len(response.content)} chars")
-    print(f"  [SYNTHESIZER] Part cards: {len(parts)} (filtered from {len(all_parts)} total)")
+    logger.info("Response: %d chars, %d part cards (of %d found)", len(response_text), len(parts), len(all_parts))
 
     return {
-        "final_response": response.content,
+        "final_response": response_text,
         "parts": parts
     }
 
 
+@timed("node", "synthesizer")
 async def synthesizer_node_streaming(state: AgentState):
     """
     Streaming version of synthesizer - yields tokens as they're generated.
@@ -224,19 +280,23 @@ async def synthesizer_node_streaming(state: AgentState):
     """
     settings = get_settings()
 
-    print(f"  [SYNTHESIZER] Streaming response...")
+    logger.debug("Streaming response")
 
-    llm = ChatAnthropic(
-        model=settings.SONNET_MODEL,
-        api_key=settings.ANTHROPIC_API_KEY,
-        max_tokens=2048,
-    )
+    # Template answers stream immediately - no LLM call
+    rendered = render_template(state)
+    if rendered is not None:
+        logger.info("Synthesizing from template: %s", state.intent)
+        for chunk in stream_chunks(rendered):
+            yield chunk
+        logger.info("Streamed %d chars", len(rendered))
+        return
+
+    llm = get_runtime().synthesizer_llm
 
     session_context = format_session_context(state)
     results = format_results(state)
 
-    print(f"  [SYNTHESIZER] Using model: {settings.SONNET_MODEL}")
-    print(f"  [SYNTHESIZER] Input data size: {len(results)} chars")
+    logger.debug("Synthesizing with %s from %d chars of tool results", settings.SONNET_MODEL, len(results))
 
     prompt = format_synthesizer_prompt(
         query=state.user_query,
@@ -250,4 +310,4 @@ async def synthesizer_node_streaming(state: AgentState):
             full_response += chunk.content
             yield chunk.content
 
-    print(f"  [SYNTHESIZER] Streamed {len(full_response)} chars")
+    logger.info("Streamed %d chars", len(full_response))
@@ -0,0 +1,159 @@
+"""
+Entity prefetch for agent_v2.
+
+Queries that name a PS number, manufacturer number or model number almost
+always lead to resolve_part / get_part / resolve_model / check_compatibility
+calls - but only after the scope check and the executor's first LLM turn.
+
+run_agent / run_agent_streaming call start_prefetch() as soon as the answer
+cache misses (a cached answer needs no lookups). It extracts
+identifiers with resolve_part's own patterns, starts those lookups
+concurrently, and binds them to a request-scoped RequestToolCache. When the
+executor later calls one of those tools with the same arguments, it awaits
+the in-flight task instead of issuing a new query.
+
+Usage:
+    prefetch = start_prefetch(query, session)
+    try:
+        ... run the agent ...
+    finally:
+        prefetch.close()
+"""
+import logging
+import re
+from dataclasses import dataclass, field
+from backend.config import get_settings
+from backend.agent_v2.state import SessionState
+from backend.agent_v2.tools.registry import registry, RequestToolCache
+from backend.agent_v2.tools.sql_tools import (
+    PS_NUMBER_PATTERN,
+    MANUFACTURER_NUMBER_PATTERN,
+    MIN_MANUFACTURER_NUMBER_LENGTH,
+)
+
+logger = logging.getLogger(__name__)
+
+# Candidate tokens: runs of letters, digits and dashes (URLs split on / and .)
+_TOKEN_PATTERN = re.compile(r"[A-Z0-9\-]+", re.IGNORECASE)
+
+
+@dataclass
+class Entities:
+    """Identifiers found in a query."""
+    ps_numbers: list[str] = field(default_factory=list)
+    # Manufacturer part numbers and model numbers look the same, so each one
+    # is looked up both ways
+    identifiers: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.ps_numbers or self.identifiers)
+
+
+def extract_entities(query: str) -> Entities:
+    """Extract PS numbers and manufacturer/model numbers from a query."""
+    entities = Entities()
+    for token in _TOKEN_PATTERN.findall(query):
+        token = token.strip("-")
+        # Like resolve_part step 2: a PS number anywhere in the token
+        # (covers URL slugs such as "PS11752778-Whirlpool-Door-Shelf-Bin")
+        ps_match = PS_NUMBER_PATTERN.search(token)
+        if ps_match:
+            ps_number = f"PS{ps_match.group(1)}"
+            if ps_number not in entities.ps_numbers:
+                entities.ps_numbers.append(ps_number)
+            continue
+
+        # Same check as resolve_part step 4, plus "has a digit" so plain
+        # words like "refrigerator" aren't treated as part numbers
+        if (
+            len(token) >= MIN_MANUFACTURER_NUMBER_LENGTH
+            and MANUFACTURER_NUMBER_PATTERN.match(token)
+            and any(c.isdigit() for c in token)
+        ):
+            identifier = token.upper()
+            if identifier not in entities.identifiers:
+                entities.identifiers.append(identifier)
+    return entities
+
+
+def plan_lookups(
+    entities: Entities,
+    session: SessionState | None = None,
+    max_lookups: int = 12,
+) -> list[tuple[str, dict]]:
+    """Tool calls the executor is likely to make for these entities, most likely first."""
+    calls = []
+    for ps_number in entities.ps_numbers:
+        calls.append(("get_part", {"ps_number": ps_number}))
+    for identifier in entities.identifiers:
+        calls.append(("resolve_part", {"input": identifier}))
+        calls.append(("resolve_model", {"input": identifier}))
+
+    # "Does it fit my model?" - pair parts with the identifiers. With no PS
+    # number in the query, the part is usually the one just discussed.
+    ps_numbers = entities.ps_numbers
+    if not ps_numbers and session is not None:
+        ps_numbers = session.all_discussed_parts[-1:]
+    for ps_number in ps_numbers:
+        for identifier in entities.identifiers:
+            calls.append(("check_compatibility", {"ps_number": ps_number, "model_number": identifier}))
+
+    return calls[:max_lookups]
+
+
+class RequestPrefetch:
+    """Handle for one request's prefetched lookups."""
+
+    def __init__(self, request_cache: RequestToolCache | None = None):
+        self.request_cache = request_cache
+        self._token = None
+
+    def activate(self) -> None:
+        """Bind the prefetched results in the current context (e.g. inside an SSE generator)."""
+        if self.request_cache is not None:
+            self._token = registry.bind_request_cache(self.request_cache)
+
+    def close(self) -> None:
+        """Cancel unused lookups and unbind. Safe to call more than once."""
+        if self.request_cache is None:
+            return
+        started = len(self.request_cache)
+        logger.debug("Used %d of %d prefetched lookups", self.request_cache.hits, started)
+        self.request_cache.cancel()
+        if self._token is not None:
+            try:
+                registry.reset_request_cache(self._token)
+            except ValueError:
+                # Closed from a different context than activate() - nothing to reset
+                pass
+            self._token = None
+        self.request_cache = None
+
+
+def start_prefetch(query: str, session: SessionState | None = None) -> RequestPrefetch:
+    """
+    Start lookups for the identifiers in `query` and bind them to the current context.
+
+    Must be called from a running event loop. Returns an inactive handle when
+    prefetch is disabled or there is nothing to look up.
+    """
+    settings = get_settings()
+    if not settings.PREFETCH_ENABLED:
+        return RequestPrefetch()
+
+    entities = extract_entities(query)
+    if not entities:
+        return RequestPrefetch()
+
+    request_cache = RequestToolCache()
+    for name, kwargs in plan_lookups(entities, session, settings.PREFETCH_MAX_LOOKUPS):
+        registry.prefetch(request_cache, name, **kwargs)
+
+    if not len(request_cache):
+        return RequestPrefetch()
+
+    logger.debug("Started %d lookups for %s", len(request_cache),
+                 entities.ps_numbers + entities.identifiers)
+    prefetch = RequestPrefetch(request_cache)
+    prefetch.activate()
+    return prefetch
@@ -0,0 +1,69 @@
+"""
+Tool progress events for agent_v2.
+
+The executor and the fast-path router report each tool call as it starts and
+finishes via emit_progress(). Events go to the sink bound for the current
+request, so nodes don't need to know whether anyone is listening - with no
+sink bound (run_agent, scripts) emit_progress() is a no-op.
+
+run_agent_streaming uses ProgressStream to run the tool phase as a task and
+yield its events while it runs:
+
+    stream = ProgressStream()
+    task = stream.run(run_tools(state))
+    async for event in stream.events(task):
+        yield event                      # {"event": "tool_start", "data": {...}}
+    state = task.result()
+"""
+import asyncio
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Callable, Coroutine
+
+# Per-request sink; tasks created while it is bound inherit it
+_progress_sink: ContextVar[Callable[[dict], None] | None] = ContextVar("progress_sink", default=None)
+
+
+def progress_enabled() -> bool:
+    """Whether anyone is listening for progress in the current context."""
+    return _progress_sink.get() is not None
+
+
+def emit_progress(event: str, **data) -> None:
+    """Report a progress event (e.g. "tool_start") to the current request's sink."""
+    sink = _progress_sink.get()
+    if sink is not None:
+        sink({"event": event, "data": data})
+
+
+class ProgressStream:
+    """Collects progress events from a task and yields them as they arrive."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue[dict] = asyncio.Queue()
+
+    def run(self, coro: Coroutine) -> asyncio.Task:
+        """Start `coro` as a task that reports its progress to this stream."""
+        token = _progress_sink.set(self.queue.put_nowait)
+        try:
+            return asyncio.create_task(coro)
+        finally:
+            _progress_sink.reset(token)
+
+    async def events(self, task: asyncio.Task) -> AsyncGenerator[dict, Any]:
+        """
+        Yield events until `task` finishes. The task's result (or exception)
+        is left for the caller; the task is cancelled if the consumer stops early.
+        """
+        try:
+            while not task.done():
+                get = asyncio.ensure_future(self.queue.get())
+                await asyncio.wait({task, get}, return_when=asyncio.FIRST_COMPLETED)
+                if get.done():
+                    yield get.result()
+                else:
+                    get.cancel()
+            while not self.queue.empty():
+                yield self.queue.get_nowait()
+        finally:
+            if not task.done():
+                task.cancel()
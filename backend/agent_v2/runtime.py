@@ -0,0 +1,94 @@
+"""
+Process-level runtime for agent_v2.
+
+Holds everything that is the same for every request and expensive to build:
+- LLM clients (each ChatAnthropic keeps its own keep-alive HTTP connection pool,
+  and reports call latency and token counts to backend.metrics)
+- The ReAct agent bound to the registered tools
+- The compiled LangGraph
+
+Built once in the FastAPI lifespan via init_runtime(). get_runtime() builds it
+lazily on first use so scripts that call run_agent() directly still work.
+"""
+from langchain_anthropic import ChatAnthropic
+from langgraph.prebuilt import create_react_agent
+from backend.config import get_settings
+from backend.agent_v2.tools import get_all_tools
+from backend.metrics import LLMMetricsHandler
+
+
+class AgentRuntime:
+    """Compiled graph, bound ReAct agent and shared LLM clients."""
+
+    def __init__(self):
+        settings = get_settings()
+
+        # Haiku for the ReAct loop
+        self.executor_llm = ChatAnthropic(
+            model=settings.HAIKU_MODEL,
+            api_key=settings.ANTHROPIC_API_KEY,
+            max_tokens=1024,
+            callbacks=[LLMMetricsHandler("executor", settings.HAIKU_MODEL)],
+        )
+
+        # Haiku for ambiguous scope checks (single-word answer)
+        self.scope_llm = ChatAnthropic(
+            model=settings.HAIKU_MODEL,
+            api_key=settings.ANTHROPIC_API_KEY,
+            max_tokens=10,
+            callbacks=[LLMMetricsHandler("scope", settings.HAIKU_MODEL)],
+        )
+
+        # Sonnet for the final response
+        self.synthesizer_llm = ChatAnthropic(
+            model=settings.SONNET_MODEL,
+            api_key=settings.ANTHROPIC_API_KEY,
+            max_tokens=2048,
+            callbacks=[LLMMetricsHandler("synthesizer", settings.SONNET_MODEL)],
+        )
+
+        # Tool schemas are bound once here instead of on every turn
+        self.tools = get_all_tools()
+        self.tool_map = {t.name: t for t in self.tools}
+        self.react_agent = create_react_agent(self.executor_llm, self.tools)
+
+        # Imported here to avoid a cycle (graph → nodes → runtime)
+        from backend.agent_v2.graph import create_graph
+        self.graph = create_graph()
+
+    def warm_up(self) -> None:
+        """
+        Open the HTTP connection pools up front.
+
+        ChatAnthropic builds its async client lazily on the first call, which
+        costs a few hundred ms (SSL context, connection pool). Touching it here
+        moves that cost to startup.
+        """
+        for llm in (self.executor_llm, self.scope_llm, self.synthesizer_llm):
+            llm._async_client  # noqa: B018 - cached_property, built on access
+
+
+# Module-level singleton (one per worker process)
+_runtime: AgentRuntime | None = None
+
+
+def init_runtime() -> AgentRuntime:
+    """Build and warm the runtime. Called from the FastAPI lifespan."""
+    global _runtime
+    _runtime = AgentRuntime()
+    _runtime.warm_up()
+    return _runtime
+
+
+def get_runtime() -> AgentRuntime:
+    """Get the process runtime, building it on first use."""
+    global _runtime
+    if _runtime is None:
+        _runtime = AgentRuntime()
+    return _runtime
+
+
+def reset_runtime() -> None:
+    """Drop the process runtime (used on shutdown)."""
+    global _runtime
+    _runtime = None
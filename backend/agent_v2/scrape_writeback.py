@@ -0,0 +1,282 @@
+"""
+Write-through persistence for live-scraped parts.
+
+scrape_part_live returns the part with its compatible models, Q&A, repair
+stories and reviews attached. Without write-back that data lives for one
+answer, and the next customer asking about the part pays for another 10-30s
+browser scrape.
+
+ScrapeWriteback.submit() hands a successful scrape to a background thread,
+off the request path, which:
+1. upserts the parts row and its model_compatibility rows, then drops cached
+   tool results and answers for the part - the next get_part hits the database
+2. encodes the part, Q&A, story and review texts in one batch and upserts
+   parts.embedding and the three embeddings tables
+3. updates the in-process parts catalog and local vector index, when enabled
+
+Rows are shaped the way database/load_data.py builds them from the CSVs.
+
+MissingPartsCache remembers PS numbers PartSelect's search confirmed don't
+exist, for SCRAPE_MISSING_TTL_SECONDS, so repeat misses return instantly
+instead of opening a browser.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from backend.config import get_settings
+from backend.db import get_parts_catalog, get_supabase_client, get_vector_store
+from backend.db.vector_store import COLLECTIONS
+from backend.agent_v2.answer_cache import get_answer_cache
+from backend.agent_v2.tools.registry import registry
+
+logger = logging.getLogger(__name__)
+
+# parts columns written by database/load_data.py (plus embedding)
+PART_FIELDS = (
+    "ps_number", "part_name", "part_type", "manufacturer_part_number", "part_manufacturer",
+    "part_price", "part_description", "install_difficulty", "install_time", "install_video_url",
+    "part_url", "average_rating", "num_reviews", "appliance_type", "brand", "manufactured_for",
+    "availability", "replaces_parts",
+)
+
+# Collection -> (key in the scrape result, extra columns written to its table)
+_SCRAPED_COLLECTIONS = {
+    "qna": ("_qna_data", ("asker", "date", "model_number", "helpful_count")),
+    "repair_stories": ("_repair_stories", ("author", "repair_time", "helpful_count", "vote_count")),
+    "reviews": ("_reviews_data", ("date",)),
+}
+
+_INT_FIELDS = {"num_reviews", "helpful_count", "vote_count", "rating"}
+
+
+def _clean_decimal(value) -> float | None:
+    """"129.99", "$129.99" or "4.5%" → float; empty or unparseable → None."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(str(value).replace("%", "").replace("$", "").replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def _clean_int(value) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def build_part_row(part: dict) -> dict:
+    """parts row for a scraped part (no embedding)."""
+    row = {field: part.get(field) for field in PART_FIELDS}
+    row["part_price"] = _clean_decimal(row["part_price"])
+    row["average_rating"] = _clean_decimal(row["average_rating"])
+    row["num_reviews"] = _clean_int(row["num_reviews"])
+    return row
+
+
+def part_embedding_text(part: dict) -> str:
+    return f"{part.get('part_name') or ''} {part.get('part_type') or ''} {part.get('part_description') or ''}".strip()
+
+
+def build_compatibility_rows(ps_number: str, models: list[dict]) -> list[dict]:
+    """model_compatibility rows, one per model number (last wins, as in the loader)."""
+    rows = {}
+    for model in models:
+        if model.get("model_number"):
+            rows[model["model_number"]] = {
+                "part_id": ps_number,
+                "model_number": model["model_number"],
+                "brand": model.get("brand"),
+                "description": model.get("description"),
+            }
+    return list(rows.values())
+
+
+def build_embedding_rows(name: str, ps_number: str, items: list[dict]) -> list[dict]:
+    """Rows for one embeddings table, without the embedding. Items without text are skipped."""
+    collection = COLLECTIONS[name]
+    _, extra = _SCRAPED_COLLECTIONS[name]
+    columns = dict.fromkeys((*collection.columns, *extra))
+    rows = {}
+    for item in items:
+        key = item.get(collection.key)
+        text = " ".join(str(item.get(c) or "") for c in collection.text_columns).strip()
+        if not key or not text:
+            continue
+        row = {c: item.get(c) for c in columns}
+        row["ps_number"] = ps_number
+        for c in _INT_FIELDS & columns.keys():
+            row[c] = _clean_int(row[c])
+        if "verified_purchase" in row and not isinstance(row["verified_purchase"], bool):
+            row["verified_purchase"] = str(row["verified_purchase"] or "").lower() in ("true", "1", "yes")
+        row["embedding_text"] = text
+        rows[key] = row
+    return list(rows.values())
+
+
+# =============================================================================
+# Negative cache
+# =============================================================================
+
+class MissingPartsCache:
+    """TTL'd set of PS numbers PartSelect's search didn't resolve to a part page."""
+
+    def __init__(self, ttl_seconds: float = 3600, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._expires: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def add(self, ps_number: str) -> None:
+        key = ps_number.strip().upper()
+        with self._lock:
+            self._expires[key] = time.monotonic() + self.ttl_seconds
+            self._expires.move_to_end(key)
+            while len(self._expires) > self.max_entries:
+                self._expires.popitem(last=False)
+
+    def __contains__(self, ps_number: str) -> bool:
+        key = ps_number.strip().upper()
+        with self._lock:
+            expires_at = self._expires.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._expires[key]
+                return False
+            self.hits += 1
+            return True
+
+    def discard(self, ps_number: str) -> None:
+        with self._lock:
+            self._expires.pop(ps_number.strip().upper(), None)
+
+    def stats(self) -> dict:
+        return {"entries": len(self._expires), "hits": self.hits}
+
+
+@lru_cache()
+def get_missing_parts_cache() -> MissingPartsCache:
+    """Get the process-wide negative cache of PS numbers not on PartSelect."""
+    settings = get_settings()
+    return MissingPartsCache(
+        ttl_seconds=settings.SCRAPE_MISSING_TTL_SECONDS,
+        max_entries=settings.SCRAPE_MISSING_MAX_ENTRIES,
+    )
+
+
+# =============================================================================
+# Write-back
+# =============================================================================
+
+class ScrapeWriteback:
+    """Persists live scrapes on one background thread."""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrape-writeback")
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self.written = 0
+        self.failed = 0
+
+    def submit(self, part: dict) -> Future | None:
+        """Queue a successful scrape_part_live result. None if it's already queued."""
+        ps_number = part.get("ps_number")
+        if not ps_number:
+            return None
+        with self._lock:
+            if ps_number in self._pending:
+                return None
+            self._pending.add(ps_number)
+        return self._executor.submit(self._persist, part)
+
+    def close(self) -> None:
+        """Finish queued writes, then stop the worker."""
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        return {"pending": len(self._pending), "written": self.written, "failed": self.failed}
+
+    def _persist(self, part: dict) -> None:
+        ps_number = part["ps_number"]
+        start = time.perf_counter()
+        try:
+            self._write(ps_number, part)
+            self.written += 1
+            logger.info("Persisted live scrape of %s in %.1fs", ps_number, time.perf_counter() - start)
+        except Exception as e:
+            self.failed += 1
+            logger.warning("Could not persist live scrape of %s: %s", ps_number, e)
+        finally:
+            with self._lock:
+                self._pending.discard(ps_number)
+
+    def _write(self, ps_number: str, part: dict) -> None:
+        from backend.agent_v2.tools.vector_tools import _encode_texts
+
+        db = get_supabase_client()
+        catalog = get_parts_catalog()
+
+        # 1. The part and its models - enough for get_part / check_compatibility
+        part_row = build_part_row(part)
+        db.upsert("parts", [part_row], on_conflict="ps_number")
+        db.upsert(
+            "model_compatibility",
+            build_compatibility_rows(ps_number, part.get("_compatible_models") or []),
+            on_conflict="part_id,model_number",
+        )
+        if catalog is not None:
+            catalog.upsert([part_row])
+        get_missing_parts_cache().discard(ps_number)
+        self._invalidate(ps_number)
+
+        # 2. Embeddings, encoded in one batch
+        tables = {
+            name: build_embedding_rows(name, ps_number, part.get(source) or [])
+            for name, (source, _) in _SCRAPED_COLLECTIONS.items()
+        }
+        texts = [part_embedding_text(part)] + [row["embedding_text"] for rows in tables.values() for row in rows]
+        vectors = _encode_texts(texts)
+
+        db.upsert("parts", [{**part_row, "embedding": vectors[0].tolist()}], on_conflict="ps_number")
+        position = 1
+        for name, rows in tables.items():
+            embeddings = vectors[position:position + len(rows)]
+            position += len(rows)
+            if not rows:
+                continue
+            collection = COLLECTIONS[name]
+            db.upsert(
+                collection.table,
+                [{**row, "embedding": vector.tolist()} for row, vector in zip(rows, embeddings)],
+                on_conflict=f"ps_number,{collection.key}",
+            )
+            store = get_vector_store(name)
+            if store is not None:
+                store.add_part(ps_number, rows, embeddings)
+
+        # Searches that ran before the embeddings landed may have cached empty results
+        self._invalidate(ps_number)
+
+    @staticmethod
+    def _invalidate(ps_number: str) -> None:
+        registry.invalidate_cache([ps_number])
+        get_answer_cache().invalidate_parts([ps_number])
+
+
+@lru_cache()
+def get_scrape_writeback() -> ScrapeWriteback:
+    """Get the process-wide write-back worker."""
+    return ScrapeWriteback()
+
+
+def close_scrape_writeback() -> None:
+    """Finish pending write-backs (call on shutdown). No-op if nothing was ever queued."""
+    if get_scrape_writeback.cache_info().currsize:
+        get_scrape_writeback().close()
+        get_scrape_writeback.cache_clear()
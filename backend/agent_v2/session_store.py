@@ -0,0 +1,232 @@
+"""
+Session storage for agent_v2.
+
+Sessions are kept behind a small SessionStore interface so the API can run
+with a bounded in-process store (single worker) or a shared Redis-protocol
+store (multiple uvicorn workers / hosts).
+
+Both stores hold sessions in a compact encoding rather than model_dump() JSON:
+    [version, all_discussed_parts, [[role, content], ...]]
+with role shortened to "u"/"a", serialized without whitespace and
+zlib-compressed when that makes it smaller.
+"""
+import asyncio
+import json
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from backend.config import get_settings
+from backend.agent_v2.state import SessionState, Message
+
+
+# =============================================================================
+# Compact encoding
+# =============================================================================
+
+_ENCODING_VERSION = 1
+_ROLE_TO_CODE = {"user": "u", "assistant": "a"}
+_CODE_TO_ROLE = {v: k for k, v in _ROLE_TO_CODE.items()}
+
+# Leading byte marks whether the payload is compressed
+_RAW = b"r"
+_ZLIB = b"z"
+
+# Below this size compression rarely pays for itself
+_COMPRESS_MIN_BYTES = 256
+
+
+def encode_session(session: SessionState) -> bytes:
+    """Encode a session into compact bytes."""
+    payload = [
+        _ENCODING_VERSION,
+        session.all_discussed_parts,
+        [[_ROLE_TO_CODE[m.role], m.content] for m in session.conversation_history],
+    ]
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    if len(raw) >= _COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return _ZLIB + compressed
+    return _RAW + raw
+
+
+def decode_session(data: bytes) -> SessionState:
+    """Decode bytes produced by encode_session()."""
+    marker, body = data[:1], data[1:]
+    if marker == _ZLIB:
+        body = zlib.decompress(body)
+    elif marker != _RAW:
+        raise ValueError(f"Unknown session encoding marker: {marker!r}")
+
+    version, parts, history = json.loads(body)
+    if version != _ENCODING_VERSION:
+        raise ValueError(f"Unsupported session encoding version: {version}")
+
+    return SessionState(
+        all_discussed_parts=parts,
+        conversation_history=[
+            Message(role=_CODE_TO_ROLE[code], content=content)
+            for code, content in history
+        ],
+    )
+
+
+# =============================================================================
+# Store interface
+# =============================================================================
+
+class SessionStore(ABC):
+    """Key-value store for SessionState keyed by session id."""
+
+    @abstractmethod
+    def get(self, session_id: str) -> SessionState | None:
+        """Get a session, or None if missing/expired. Refreshes its TTL."""
+
+    @abstractmethod
+    def set(self, session_id: str, session: SessionState) -> None:
+        """Store (or replace) a session."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove a session if present."""
+
+    async def aget(self, session_id: str) -> SessionState | None:
+        """get() for async callers; stores that do network I/O keep it off the event loop."""
+        return self.get(session_id)
+
+    async def aset(self, session_id: str, session: SessionState) -> None:
+        """set() for async callers."""
+        self.set(session_id, session)
+
+    def close(self) -> None:
+        """Release resources on shutdown."""
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Bounded in-process store with LRU + TTL eviction.
+
+    Entries expire `ttl_seconds` after their last access. When the store is
+    full, the least recently used session is evicted.
+    """
+
+    def __init__(self, max_sessions: int = 10_000, ttl_seconds: int = 86_400):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        # session_id -> (expires_at, encoded session)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> SessionState | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= now:
+                del self._entries[session_id]
+                return None
+            # Sliding expiry + mark as most recently used
+            self._entries[session_id] = (now + self.ttl_seconds, data)
+            self._entries.move_to_end(session_id)
+        return decode_session(data)
+
+    def set(self, session_id: str, session: SessionState) -> None:
+        data = encode_session(session)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[session_id] = (now + self.ttl_seconds, data)
+            self._entries.move_to_end(session_id)
+            self._evict(now)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries from the LRU end, then enforce the size cap."""
+        while self._entries:
+            oldest_id, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_sessions:
+                break
+            del self._entries[oldest_id]
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Shared store over the Redis protocol.
+
+    Works with Redis, Valkey, KeyDB or any RESP server that supports
+    GET/SET EX/EXPIRE/DEL. TTL is handled server-side; size is bounded by the
+    server's maxmemory policy (use allkeys-lru).
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = 86_400, key_prefix: str = "session:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "RedisSessionStore requires the 'redis' package: pip install redis"
+            ) from e
+
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        # redis-py keeps a connection pool per client. RESP2 is spoken by every
+        # Redis-compatible server (and by backend/dev/resp_server.py).
+        self.client = redis.Redis.from_url(url, protocol=2)
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    def get(self, session_id: str) -> SessionState | None:
+        key = self._key(session_id)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.expire(key, self.ttl_seconds)
+        data, _ = pipe.execute()
+        if data is None:
+            return None
+        return decode_session(data)
+
+    def set(self, session_id: str, session: SessionState) -> None:
+        self.client.set(self._key(session_id), encode_session(session), ex=self.ttl_seconds)
+
+    def delete(self, session_id: str) -> None:
+        self.client.delete(self._key(session_id))
+
+    # redis-py's client is blocking; its connection pool is shared across threads
+    async def aget(self, session_id: str) -> SessionState | None:
+        return await asyncio.to_thread(self.get, session_id)
+
+    async def aset(self, session_id: str, session: SessionState) -> None:
+        await asyncio.to_thread(self.set, session_id, session)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def create_session_store() -> SessionStore:
+    """Create the session store selected by SESSION_STORE ("memory" or "redis")."""
+    settings = get_settings()
+
+    if settings.SESSION_STORE == "redis":
+        return RedisSessionStore(
+            url=settings.REDIS_URL,
+            ttl_seconds=settings.SESSION_TTL_SECONDS,
+        )
+
+    return InMemorySessionStore(
+        max_sessions=settings.SESSION_MAX_ENTRIES,
+        ttl_seconds=settings.SESSION_TTL_SECONDS,
+    )
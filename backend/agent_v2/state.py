@@ -46,6 +46,10 @@ class AgentState(BaseModel):
     is_in_scope: bool = True
     scope_rejection_message: str | None = None
 
+    # Fast-path router result (None = no template matched, ReAct executor runs)
+    intent: str | None = None
+    fast_path: bool = False
+
     # Secondary scope check results
     has_out_of_scope_parts: bool = False
     out_of_scope_parts: list[dict] = Field(default_factory=list)
@@ -0,0 +1,286 @@
+"""
+Template synthesis for agent_v2.
+
+For fast-path intents (see nodes/router.py) the tool results are small and
+well-structured - a compatibility yes/no, one part, a symptom list - so the
+answer can be rendered directly instead of sending a JSON dump to Sonnet.
+
+Templates follow the synthesizer prompt's rules: every part mentioned gets its
+PS number (so extract_mentioned_ps_numbers still selects part cards), links
+use the 🔗 / 🎥 prefixes, and no next steps are suggested.
+
+A renderer returns None when the results don't have the expected shape
+(tool errors, scraped fallbacks, empty data); the synthesizer then falls
+back to the LLM. Which intents are rendered is controlled by
+TEMPLATE_SYNTHESIS_INTENTS.
+"""
+import logging
+import json
+import re
+from collections import Counter
+from typing import Callable
+from backend.config import get_settings
+from backend.agent_v2.state import AgentState
+
+logger = logging.getLogger(__name__)
+
+# Lists longer than this are summarized (synthesizer prompt rule 16)
+MAX_LISTED_MODELS = 20
+
+
+# =============================================================================
+# Tool result access
+# =============================================================================
+
+def collect_tool_results(state: AgentState) -> dict[str, tuple[dict, object]]:
+    """Map tool name → (call args, parsed result) from the executor messages."""
+    if not state.executor_result or not isinstance(state.executor_result, dict):
+        return {}
+
+    messages = state.executor_result.get("messages", [])
+    call_args = {}
+    for msg in messages:
+        for tc in getattr(msg, "tool_calls", None) or []:
+            call_args[tc.get("id", "")] = tc.get("args", {})
+
+    results = {}
+    for msg in messages:
+        if getattr(msg, "type", None) != "tool":
+            continue
+        content = msg.content
+        if isinstance(content, str):
+            try:
+                content = json.loads(content)
+            except json.JSONDecodeError:
+                continue
+        results[msg.name] = (call_args.get(msg.tool_call_id, {}), content)
+    return results
+
+
+def _valid_part(data) -> bool:
+    return isinstance(data, dict) and not data.get("error") and bool(data.get("ps_number")) and bool(data.get("part_name"))
+
+
+def _not_found(data) -> bool:
+    return isinstance(data, dict) and "not found" in str(data.get("error", "")).lower()
+
+
+# =============================================================================
+# Formatting helpers
+# =============================================================================
+
+def _price(part: dict) -> str | None:
+    price = part.get("part_price")
+    if price in (None, ""):
+        return None
+    try:
+        return f"${float(price):.2f}"
+    except (TypeError, ValueError):
+        return None
+
+
+def _rating(part: dict) -> str | None:
+    rating = part.get("average_rating")
+    if rating in (None, ""):
+        return None
+    reviews = part.get("num_reviews")
+    text = f"{float(rating):.1f}★"
+    if reviews:
+        text += f" ({reviews} reviews)"
+    return text
+
+
+def _part_name(part: dict) -> str:
+    """'Door Shelf Bin WPW10321304 (PS11752778)' - the PS number drives the part card."""
+    name = part["part_name"]
+    mpn = part.get("manufacturer_part_number")
+    if mpn and mpn.upper() not in name.upper():
+        name = f"{name} {mpn}"
+    return f"**{name}** ({part['ps_number']})"
+
+
+def _price_line(part: dict) -> str:
+    """'$39.95 · In Stock · 4.8★ (120 reviews)' with missing fields skipped."""
+    fields = [_price(part), part.get("availability"), _rating(part)]
+    return " · ".join(f for f in fields if f)
+
+
+def _not_found_message(results: dict, ps_number: str) -> str | None:
+    """Not-found answer, or None when the live-scrape fallback found the part."""
+    if "scrape_part_live" in results:
+        return None
+    return f"I couldn't find part {ps_number} in our catalog."
+
+
+# =============================================================================
+# Renderers
+# =============================================================================
+
+def render_part_lookup(results: dict) -> str | None:
+    """Part card summary for a single part."""
+    args, part = results.get("get_part", ({}, None))
+    if _not_found(part):
+        return _not_found_message(results, args.get("ps_number", part.get("ps_number", "")))
+    if not _valid_part(part):
+        return None
+
+    lines = [_part_name(part)]
+    price_line = _price_line(part)
+    if price_line:
+        lines.append(price_line)
+
+    details = []
+    if part.get("brand"):
+        details.append(f"**Brand:** {part['brand']}")
+    if part.get("appliance_type"):
+        details.append(f"**Fits:** {part['appliance_type']}s")
+    if part.get("install_difficulty"):
+        install = part["install_difficulty"]
+        if part.get("install_time"):
+            install += f", {part['install_time']}"
+        details.append(f"**Installation:** {install}")
+    if details:
+        lines.append("\n".join(details))
+
+    if part.get("part_description"):
+        lines.append(part["part_description"].strip())
+    if part.get("install_video_url"):
+        lines.append(f"🎥 [Watch installation video]({part['install_video_url']})")
+    return "\n\n".join(lines)
+
+
+def render_price_availability(results: dict) -> str | None:
+    """Price and stock status for a single part."""
+    args, part = results.get("get_part", ({}, None))
+    if _not_found(part):
+        return _not_found_message(results, args.get("ps_number", part.get("ps_number", "")))
+    if not _valid_part(part):
+        return None
+
+    price = _price(part)
+    availability = part.get("availability")
+    if not price and not availability:
+        return None
+
+    sentence = _part_name(part)
+    if price:
+        sentence += f" is **{price}**"
+    if availability:
+        sentence += f"{' and' if price else ' is'} currently **{availability}**"
+    sentence += "."
+
+    rating = _rating(part)
+    if rating:
+        sentence += f" Customers rate it {rating}."
+    return sentence
+
+
+def render_compatibility(results: dict) -> str | None:
+    """Clear yes/no for one part and one model."""
+    args, compat = results.get("check_compatibility", ({}, None))
+    _, part = results.get("get_part", ({}, None))
+    if not isinstance(compat, dict) or "compatible" not in compat or compat.get("error"):
+        return None
+
+    ps_number = args.get("ps_number", "")
+    model = args.get("model_number", "")
+    if _not_found(part):
+        return _not_found_message(results, ps_number)
+
+    name = _part_name(part) if _valid_part(part) else f"Part {ps_number}"
+    if compat["compatible"]:
+        model_details = " ".join(d for d in (compat.get("brand"), compat.get("description")) if d)
+        text = f"✅ **Yes** - {name} is compatible with model **{model}**"
+        text += f" ({model_details})." if model_details else "."
+    else:
+        text = f"❌ **No** - {name} is not listed as compatible with model **{model}**."
+
+    if _valid_part(part):
+        price_line = _price_line(part)
+        if price_line and compat["compatible"]:
+            text += f"\n\n{price_line}"
+    return text
+
+
+def render_compatible_models(results: dict) -> str | None:
+    """Models a part fits - listed when few, grouped by brand when many."""
+    args, data = results.get("get_compatible_models", ({}, None))
+    _, part = results.get("get_part", ({}, None))
+    if not isinstance(data, dict) or "models" not in data:
+        return None
+
+    ps_number = args.get("ps_number", "")
+    if _not_found(part):
+        return _not_found_message(results, ps_number)
+    name = _part_name(part) if _valid_part(part) else f"Part {ps_number}"
+
+    models = data["models"]
+    if not models:
+        return f"I don't have any compatible models on record for {name}."
+
+    count = len(models)
+    if count <= MAX_LISTED_MODELS:
+        lines = [f"{name} fits **{count}** model{'s' if count != 1 else ''}:\n"]
+        for model in models:
+            details = " ".join(d for d in (model.get("brand"), model.get("description")) if d)
+            lines.append(f"- {model.get('model_number')}" + (f" ({details})" if details else ""))
+        return "\n".join(lines)
+
+    brands = Counter(model.get("brand") or "Other" for model in models)
+    top = [f"{brand} ({n:,} models)" for brand, n in brands.most_common(5)]
+    rest = " and others" if len(brands) > 5 else ""
+    return f"{name} fits **{count:,}** models, including {', '.join(top)}{rest}."
+
+
+def render_symptom_list(results: dict) -> str | None:
+    """Common symptoms for an appliance type with frequency and description."""
+    args, symptoms = results.get("get_symptoms", ({}, None))
+    if not isinstance(symptoms, list) or not symptoms:
+        return None
+    if not all(isinstance(s, dict) and s.get("symptom") for s in symptoms):
+        return None
+
+    appliance = args.get("appliance_type", "appliance")
+    lines = [f"Here are the most common {appliance} problems:\n"]
+    for i, s in enumerate(symptoms, 1):
+        line = f"{i}. **{s['symptom']}**"
+        if s.get("percentage") is not None:
+            line += f" - {float(s['percentage']):g}% of repairs"
+        if s.get("symptom_description"):
+            line += f"\n   {s['symptom_description'].strip()}"
+        if s.get("symptom_url"):
+            line += f"\n   🔗 [Troubleshooting guide]({s['symptom_url']})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+TEMPLATES: dict[str, Callable[[dict], str | None]] = {
+    "part_lookup": render_part_lookup,
+    "price_availability": render_price_availability,
+    "compatibility": render_compatibility,
+    "compatible_models": render_compatible_models,
+    "symptom_list": render_symptom_list,
+}
+
+
+def render_template(state: AgentState) -> str | None:
+    """
+    Render the answer for a fast-path intent, or None to use the LLM.
+
+    Only intents listed in TEMPLATE_SYNTHESIS_INTENTS are rendered.
+    """
+    if not state.fast_path or state.intent not in get_settings().TEMPLATE_SYNTHESIS_INTENTS:
+        return None
+    renderer = TEMPLATES.get(state.intent)
+    if renderer is None:
+        return None
+    try:
+        return renderer(collect_tool_results(state))
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        logger.warning("Template %s failed (%s) → LLM", state.intent, e)
+        return None
+
+
+def stream_chunks(text: str) -> list[str]:
+    """Split text (a rendered template or a cached answer) into line chunks for the token stream."""
+    return re.findall(r"[^\n]*\n|[^\n]+", text)
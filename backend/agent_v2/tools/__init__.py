@@ -9,8 +9,12 @@ from backend.agent_v2.tools import vector_tools  # noqa: F401
 from backend.agent_v2.tools import scrape_tools  # noqa: F401
 
 # Export registry functions
+from backend.config import get_settings
 from backend.agent_v2.tools.registry import registry
 
+registry.cache_enabled = get_settings().TOOL_CACHE_ENABLED
+registry.async_enabled = get_settings().ASYNC_DB_ENABLED
+
 
 def get_all_tools() -> list:
     """Get all registered tools."""
@@ -25,3 +29,16 @@ def get_tool_map() -> dict:
 def get_tool_docs() -> str:
     """Get auto-generated tool documentation for prompts."""
     return registry.generate_tool_docs()
+
+
+def invalidate_tool_cache(
+    identifiers: list[str] | set[str] | None = None,
+    tool_names: list[str] | None = None,
+) -> int:
+    """Invalidate cached tool results (all, or those involving the given identifiers)."""
+    return registry.invalidate_cache(identifiers, tool_names)
+
+
+def get_tool_cache_stats() -> dict[str, dict]:
+    """Per-tool cache hit/miss counters."""
+    return registry.cache_stats()
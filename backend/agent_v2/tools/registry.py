@@ -3,11 +3,260 @@ Tool Registry for agent_v2.
 
 Single source of truth for tool registration. Tools use @registry.register()
 decorator to automatically register themselves with metadata.
+
+Tools that do I/O can attach an async implementation with
+@registry.register_async(name) so the executor awaits them on the event loop.
+
+Tools can also opt into a shared result cache by passing a CachePolicy.
+Cached results are shared across requests until they expire or are
+invalidated (e.g. when the loader or live scraper writes new part data).
+
+On top of that, a request can bind a RequestToolCache holding results (or
+in-flight tasks) started ahead of time - see prefetch.py. Async tool calls
+read it before anything else.
 """
+import asyncio
+import copy
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Any, Callable
 from langchain_core.tools import tool as langchain_tool
+from backend.metrics import timed
+
+
+# =============================================================================
+# Argument normalizers (used by CachePolicy.normalize)
+# =============================================================================
+
+def upper_strip(value: Any) -> Any:
+    """Normalize identifiers: " ps11752778 " → "PS11752778"."""
+    return value.strip().upper() if isinstance(value, str) else value
+
 
+def lower_strip(value: Any) -> Any:
+    """Normalize enum-like values: " Refrigerator " → "refrigerator"."""
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+def normalize_text(value: Any) -> Any:
+    """Normalize free text: lowercase and collapse whitespace."""
+    return " ".join(value.lower().split()) if isinstance(value, str) else value
+
+
+# =============================================================================
+# Result cache
+# =============================================================================
+
+@dataclass
+class CachePolicy:
+    """
+    Per-tool cache settings.
+
+    Args:
+        ttl_seconds: How long a result stays valid
+        max_entries: LRU size cap for this tool
+        normalize: arg name -> normalizer. Normalized args are used both as the
+                   cache key and for the actual call.
+    """
+    ttl_seconds: float = 3600
+    max_entries: int = 1000
+    normalize: dict[str, Callable[[Any], Any]] = field(default_factory=dict)
+
+
+@dataclass
+class _CacheEntry:
+    result: Any
+    expires_at: float
+    # Upper-cased string arg values, for invalidation by identifier
+    arg_values: frozenset[str]
+
+
+class ToolCache:
+    """LRU + TTL cache for one tool's results, with hit/miss counters."""
+
+    def __init__(self, policy: CachePolicy):
+        self.policy = policy
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (found, result). Results are deep-copied so callers can't mutate the cache."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, copy.deepcopy(entry.result)
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        return False, None
+
+    def put(self, key: str, result: Any, arg_values: frozenset[str]) -> None:
+        with self._lock:
+            self._entries[key] = _CacheEntry(
+                result=copy.deepcopy(result),
+                expires_at=time.monotonic() + self.policy.ttl_seconds,
+                arg_values=arg_values,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.policy.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, values: set[str] | None = None) -> int:
+        """
+        Drop entries whose args include any of `values` (upper-cased),
+        or everything if `values` is None. Returns the number removed.
+        """
+        with self._lock:
+            if values is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            stale = [k for k, e in self._entries.items() if e.arg_values & values]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def _is_cacheable(result: Any) -> bool:
+    """Don't cache errors - they may be transient or fixed by a live scrape."""
+    return not (isinstance(result, dict) and result.get("error"))
+
+
+def _cache_call(
+    signature: inspect.Signature,
+    normalizers: dict[str, Callable[[Any], Any]],
+    args,
+    kwargs,
+) -> tuple[str, dict]:
+    """Bind and normalize call args. Returns (cache key, normalized kwargs)."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    call_args = {
+        name: normalizers[name](value) if name in normalizers else value
+        for name, value in bound.arguments.items()
+    }
+    return json.dumps(call_args, sort_keys=True, default=str), call_args
+
+
+def _store(cache: ToolCache, key: str, call_args: dict, result: Any) -> None:
+    if _is_cacheable(result):
+        arg_values = frozenset(
+            v.strip().upper() for v in call_args.values() if isinstance(v, str)
+        )
+        cache.put(key, result, arg_values)
+
+
+def _memoize(func: Callable, cache: ToolCache) -> Callable:
+    """Wrap a tool function with the cache, keeping its signature for langchain."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key, call_args = _cache_call(signature, cache.policy.normalize, args, kwargs)
+        found, result = cache.get(key)
+        if found:
+            return result
+
+        result = func(**call_args)
+        _store(cache, key, call_args, result)
+        return result
+
+    return wrapper
+
+
+def _memoize_async(func: Callable, cache: ToolCache) -> Callable:
+    """Async counterpart of _memoize. Shares the cache with the sync tool."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        key, call_args = _cache_call(signature, cache.policy.normalize, args, kwargs)
+        found, result = cache.get(key)
+        if found:
+            return result
+
+        result = await func(**call_args)
+        _store(cache, key, call_args, result)
+        return result
+
+    return wrapper
+
+
+# =============================================================================
+# Request-scoped results
+# =============================================================================
+
+class RequestToolCache:
+    """
+    Tool results for a single request, keyed like ToolCache.
+
+    Values are tasks that may still be running - a tool call that finds one
+    awaits it instead of issuing the same lookup again.
+    """
+
+    def __init__(self):
+        self._tasks: dict[tuple[str, str], asyncio.Task] = {}
+        self.hits = 0
+
+    def __contains__(self, item: tuple[str, str]) -> bool:
+        return item in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def add(self, name: str, key: str, task: asyncio.Task) -> None:
+        # Failed lookups just fall through to a normal call - don't warn about them
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._tasks[(name, key)] = task
+
+    async def get(self, name: str, key: str) -> tuple[bool, Any]:
+        """Return (found, result), waiting for the task if it's still running."""
+        task = self._tasks.get((name, key))
+        if task is None or task.cancelled():
+            return False, None
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return False, None
+            raise
+        except Exception:
+            return False, None
+        self.hits += 1
+        return True, copy.deepcopy(result)
+
+    def cancel(self) -> None:
+        """Cancel lookups nobody waited for."""
+        for task in self._tasks.values():
+            task.cancel()
+
+
+_request_cache: ContextVar[RequestToolCache | None] = ContextVar("tool_request_cache", default=None)
+
+
+# =============================================================================
+# Registry
+# =============================================================================
 
 @dataclass
 class ToolMetadata:
@@ -26,6 +275,15 @@ class ToolRegistry:
         def get_part(ps_number: str) -> dict:
             '''Get part details.'''
             ...
+
+        @registry.register(category="part", cache=CachePolicy(
+            ttl_seconds=3600, normalize={"ps_number": upper_strip}))
+        def get_part(ps_number: str) -> dict:
+            ...
+
+        @registry.register_async("get_part")
+        async def aget_part(ps_number: str) -> dict:
+            ...
     """
     _tools: dict[str, Callable] = field(default_factory=dict)
     _metadata: dict[str, ToolMetadata] = field(default_factory=dict)
@@ -33,17 +291,37 @@ class ToolRegistry:
     def __init__(self):
         self._tools = {}
         self._metadata = {}
+        self._caches: dict[str, ToolCache] = {}
+        self._signatures: dict[str, inspect.Signature] = {}
+        # name -> coroutine that bypasses the request cache (used for prefetch)
+        self._async_impls: dict[str, Callable] = {}
+        self.cache_enabled = True
+        # When False, async callers run the sync tool in a worker thread instead
+        self.async_enabled = True
 
-    def register(self, category: str = "part"):
+    def register(self, category: str = "part", cache: CachePolicy | None = None):
         """
         Decorator to register a tool with the registry.
 
         Args:
             category: Tool category for documentation grouping
+            cache: Optional cache policy - results are memoized across requests
         """
         def decorator(func):
-            # Wrap with langchain @tool decorator
-            lc_tool = langchain_tool(func)
+            target = func
+            if cache is not None:
+                tool_cache = ToolCache(cache)
+                self._caches[func.__name__] = tool_cache
+                memoized = _memoize(func, tool_cache)
+
+                @functools.wraps(func)
+                def target(*args, **kwargs):
+                    if self.cache_enabled:
+                        return memoized(*args, **kwargs)
+                    return func(*args, **kwargs)
+
+            # Wrap with langchain @tool decorator (timed, including cache hits)
+            lc_tool = langchain_tool(timed("tool", func.__name__)(target))
 
             # Extract first non-empty line of docstring as description
             description = ""
@@ -56,6 +334,7 @@ class ToolRegistry:
 
             # Store in registry
             self._tools[func.__name__] = lc_tool
+            self._signatures[func.__name__] = inspect.signature(func)
             self._metadata[func.__name__] = ToolMetadata(
                 name=func.__name__,
                 description=description,
@@ -65,6 +344,80 @@ class ToolRegistry:
             return lc_tool
         return decorator
 
+    def register_async(self, name: str):
+        """
+        Decorator to attach an async implementation to an already registered tool.
+
+        The ReAct ToolNode awaits tools via ainvoke(), which uses the coroutine
+        when one is set. Without it, langchain runs the sync function in the
+        default thread pool. The async version shares the sync tool's cache.
+
+        Args:
+            name: Name of the registered sync tool
+        """
+        def decorator(func):
+            lc_tool = self._tools[name]
+            sync_func = lc_tool.func
+            target = func
+            if name in self._caches:
+                memoized = _memoize_async(func, self._caches[name])
+
+                @functools.wraps(func)
+                async def target(*args, **kwargs):
+                    if self.cache_enabled:
+                        return await memoized(*args, **kwargs)
+                    return await func(*args, **kwargs)
+
+            @functools.wraps(func)
+            async def impl(*args, **kwargs):
+                if self.async_enabled:
+                    return await target(*args, **kwargs)
+                return await asyncio.to_thread(sync_func, *args, **kwargs)
+
+            @timed("tool", name)
+            @functools.wraps(func)
+            async def coroutine(*args, **kwargs):
+                request_cache = _request_cache.get()
+                if request_cache is not None:
+                    found, result = await request_cache.get(name, self._key(name, args, kwargs))
+                    if found:
+                        return result
+                return await impl(*args, **kwargs)
+
+            self._async_impls[name] = impl
+            lc_tool.coroutine = coroutine
+            return func
+        return decorator
+
+    def _key(self, name: str, args: tuple = (), kwargs: dict | None = None) -> str:
+        cache = self._caches.get(name)
+        normalizers = cache.policy.normalize if cache is not None else {}
+        key, _ = _cache_call(self._signatures[name], normalizers, args, kwargs or {})
+        return key
+
+    def bind_request_cache(self, request_cache: RequestToolCache | None) -> Token:
+        """Make async tool calls in the current context read `request_cache` first."""
+        return _request_cache.set(request_cache)
+
+    def reset_request_cache(self, token: Token) -> None:
+        _request_cache.reset(token)
+
+    def prefetch(self, request_cache: RequestToolCache, name: str, **kwargs) -> bool:
+        """
+        Start an async tool call now and park the task in `request_cache`.
+
+        Must be called from a running event loop. Returns False if the tool has
+        no async implementation or the same call is already in flight.
+        """
+        impl = self._async_impls.get(name)
+        if impl is None:
+            return False
+        key = self._key(name, kwargs=kwargs)
+        if (name, key) in request_cache:
+            return False
+        request_cache.add(name, key, asyncio.create_task(impl(**kwargs)))
+        return True
+
     def get_all_tools(self) -> list:
         """Get all registered tools as a list."""
         return list(self._tools.values())
@@ -73,6 +426,35 @@ class ToolRegistry:
         """Get tool name -> tool function mapping."""
         return self._tools.copy()
 
+    def invalidate_cache(
+        self,
+        identifiers: list[str] | set[str] | None = None,
+        tool_names: list[str] | None = None,
+    ) -> int:
+        """
+        Invalidate cached tool results.
+
+        Call this after the loader or live scraper writes new data.
+
+        Args:
+            identifiers: Drop only results whose args include one of these values
+                         (PS numbers, model numbers - case-insensitive). None = all.
+            tool_names: Limit to these tools. None = every cached tool.
+
+        Returns:
+            Number of cached results removed
+        """
+        values = {i.strip().upper() for i in identifiers} if identifiers is not None else None
+        names = tool_names if tool_names is not None else list(self._caches)
+        return sum(
+            self._caches[name].invalidate(values)
+            for name in names if name in self._caches
+        )
+
+    def cache_stats(self) -> dict[str, dict]:
+        """Per-tool cache hit/miss counters."""
+        return {name: cache.stats() for name, cache in self._caches.items()}
+
     def generate_tool_docs(self) -> str:
         """
         Auto-generate tool documentation for prompts.
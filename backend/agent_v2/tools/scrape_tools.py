@@ -4,19 +4,32 @@ Live scraping tools for parts not in database.
 This module provides real-time scraping capability as a fallback when parts
 are not found in the database. It uses the existing scraper infrastructure
 to fetch data directly from PartSelect.
+
+Part pages are first fetched over HTTP and parsed without a browser (see
+scrapers/part_parser.py). Only when that fails - the search needs JavaScript,
+or the page has no product data in its HTML - is a browser used.
+
+Browsers come from the shared pool (see agent_v2/browser_pool.py) instead of
+being started per call. The async twin runs the scrape on the pool's threads,
+so the executor's automatic fallback doesn't block the event loop.
+
+Successful scrapes are written back to the database in the background, and
+PS numbers PartSelect has no page for are remembered for a while (see
+agent_v2/scrape_writeback.py), so neither kind of miss repeats the scrape.
+
+Selenium and the scrapers package are imported on the first scrape, not at
+import time - registering the tool must stay cheap for API startup.
 """
+import asyncio
+import logging
 import json
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
 
-from langchain_anthropic import ChatAnthropic
 from backend.config import get_settings
+from backend.agent_v2.browser_pool import BrowserPoolTimeout, get_browser_pool
+from backend.agent_v2.scrape_writeback import get_missing_parts_cache, get_scrape_writeback
 from backend.agent_v2.tools.registry import registry
-from scrapers.utils import setup_driver
-from scrapers.part_scraper import scrape_part_page
+
+logger = logging.getLogger(__name__)
 
 
 def classify_appliance_type_with_llm(part_data: dict) -> str:
@@ -82,6 +95,8 @@ If you cannot determine the appliance type, respond with "unknown".
 
 Appliance type:"""
 
+    from langchain_anthropic import ChatAnthropic
+
     try:
         llm = ChatAnthropic(
             model=settings.HAIKU_MODEL,
@@ -92,21 +107,240 @@ Appliance type:"""
         response = llm.invoke(prompt)
         appliance_type = response.content.strip().lower()
 
-        print(f"  [SCRAPE_LIVE] LLM classified appliance type: {appliance_type}")
+        logger.debug("LLM classified appliance type: %s", appliance_type)
         return appliance_type
 
     except Exception as e:
-        print(f"  [SCRAPE_LIVE] Error classifying appliance type: {e}")
+        logger.warning("Error classifying appliance type: %s", e)
         return "unknown"
 
 
+def _validate_ps_number(ps_number: str) -> tuple[str, dict | None]:
+    """Return (cleaned PS number, error dict or None)."""
+    if not ps_number or not isinstance(ps_number, str):
+        return ps_number, {
+            "error": f"Invalid input: {ps_number}",
+            "ps_number": ps_number
+        }
+
+    ps_number_clean = ps_number.strip()
+    if not ps_number_clean.startswith("PS"):
+        return ps_number_clean, {
+            "error": f"Invalid PS number format: {ps_number}. Must start with 'PS'",
+            "ps_number": ps_number
+        }
+    return ps_number_clean, None
+
+
+def _not_found_error(ps_number_clean: str) -> dict:
+    return {
+        "error": f"Part {ps_number_clean} not found on PartSelect. The search did not return a valid part page.",
+        "ps_number": ps_number_clean
+    }
+
+
+# Text PartSelect shows when a search has no hits or the page doesn't exist
+NOT_FOUND_MARKERS = ("no results", "0 results", "page not found", "couldn't find", "could not find")
+
+
+def _search_found_nothing(driver) -> bool:
+    """True if the browser is on a loaded PartSelect page that says the search found nothing."""
+    from selenium.webdriver.common.by import By
+
+    try:
+        if "partselect.com" not in driver.current_url:
+            return False
+        if driver.execute_script("return document.readyState") != "complete":
+            return False
+        title = driver.title.lower()
+        text = f"{title}\n{driver.find_element(By.TAG_NAME, 'body').text}".lower()
+    except Exception:
+        return False
+    if "access denied" in text:
+        return False
+    return "404" in title or any(marker in text for marker in NOT_FOUND_MARKERS)
+
+
+def _scrape_with_driver(driver, ps_number_clean: str) -> dict:
+    """Search PartSelect for the part with a pooled driver and scrape its page."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    from scrapers.part_scraper import scrape_part_page
+
+    logger.debug("Navigating to PartSelect homepage")
+    driver.get("https://www.partselect.com/")
+
+    # Find search input (class: js-headerNavSearch)
+    logger.debug("Finding search input")
+    search_input = WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "input.js-headerNavSearch"))
+    )
+
+    # Enter PS number and submit
+    logger.debug("Searching for %s", ps_number_clean)
+    search_input.clear()
+    search_input.send_keys(ps_number_clean)
+    search_input.send_keys(Keys.RETURN)
+
+    # Wait for page load and get final URL
+    # The search should redirect to the part page
+    logger.debug("Waiting for redirect to part page")
+    try:
+        WebDriverWait(driver, 15).until(
+            EC.url_contains("partselect.com/PS")
+        )
+    except TimeoutException:
+        # Only remember the miss if PartSelect said so - a slow page proves nothing
+        if _search_found_nothing(driver):
+            logger.info("PartSelect search has no part page for %s", ps_number_clean)
+            get_missing_parts_cache().add(ps_number_clean)
+            return _not_found_error(ps_number_clean)
+        logger.warning("Timed out waiting for the part page for %s - not caching as missing", ps_number_clean)
+        return {
+            "error": f"Timed out loading the PartSelect page for {ps_number_clean}. Try again later.",
+            "ps_number": ps_number_clean
+        }
+
+    final_url = driver.current_url
+    logger.debug("Redirected to: %s", final_url)
+
+    # Call existing scraper with final URL
+    logger.debug("Extracting part data")
+    scraped = scrape_part_page(
+        driver=driver,
+        part_name="",  # Will be extracted from page
+        product_url=final_url,
+        appliance_type="",  # Will be detected from page
+        extract_embeddings=True  # Get Q&A, stories, reviews
+    )
+    return _scrape_result(ps_number_clean, final_url, scraped, engine="selenium")
+
+
+def _scrape_static(ps_number_clean: str) -> dict | None:
+    """
+    Search PartSelect and parse the part page over HTTP, without a browser.
+
+    Returns None when the browser is needed: the search didn't land on a part
+    page with product data (which doesn't prove the part is missing) or the
+    request failed.
+    """
+    from scrapers.part_parser import parse_part_page, resolve_part_page
+
+    try:
+        resolved = resolve_part_page(ps_number_clean)
+    except Exception as e:
+        logger.warning("Static fetch of %s failed: %s", ps_number_clean, e)
+        return None
+    if resolved is None:
+        logger.debug("Static fetch of %s found no part page, using browser", ps_number_clean)
+        return None
+
+    final_url, root = resolved
+    logger.debug("Parsing %s without a browser", final_url)
+    scraped = parse_part_page(root, part_name="", product_url=final_url, appliance_type="", extract_embeddings=True)
+    part_data = _scrape_result(ps_number_clean, final_url, scraped, engine="http")
+    return None if part_data.get("error") else part_data
+
+
+def _scrape_result(ps_number_clean: str, final_url: str, scraped: tuple, engine: str) -> dict:
+    """Turn a scrape_part_page / parse_part_page tuple into the tool's result dict."""
+    part_data, model_compat, qna, stories, reviews = scraped
+
+    # Validate scrape success
+    if not part_data.get("ps_number"):
+        logger.warning("Failed to extract part data from %s", final_url)
+        return {
+            "error": f"Failed to scrape {ps_number_clean}. Could not extract part data from page.",
+            "ps_number": ps_number_clean
+        }
+
+    # Verify we got the correct part
+    scraped_ps = part_data.get("ps_number", "")
+    if scraped_ps != ps_number_clean:
+        logger.warning("Scraped wrong part. Expected %s, got %s", ps_number_clean, scraped_ps)
+        # Still return the data, but include a warning
+        part_data["_scrape_warning"] = f"Requested {ps_number_clean} but got {scraped_ps}"
+
+    # Add metadata and include all scraped data
+    part_data["_scraped_live"] = True
+    part_data["_scrape_engine"] = engine
+    part_data["_model_compatibility_count"] = len(model_compat)
+    part_data["_qna_count"] = len(qna)
+    part_data["_stories_count"] = len(stories)
+    part_data["_reviews_count"] = len(reviews)
+
+    # Include the actual data (not just counts) so agent can use it
+    part_data["_compatible_models"] = model_compat
+    part_data["_qna_data"] = qna
+    part_data["_repair_stories"] = stories
+    part_data["_reviews_data"] = reviews
+
+    logger.info(
+        "Scraped %s via %s: %s (%d models, %d Q&A, %d stories, %d reviews)",
+        ps_number_clean, engine, part_data.get("part_name", "Unknown"),
+        len(model_compat), len(qna), len(stories), len(reviews),
+    )
+    return part_data
+
+
+def _finish_scrape(part_data: dict) -> dict:
+    """Fill in appliance_type with the LLM when the page didn't give one, then queue the write-back."""
+    current_appliance_type = part_data.get("appliance_type", "")
+    if not current_appliance_type or current_appliance_type.strip() == "":
+        logger.debug("Appliance type unknown, using LLM to classify")
+        part_data["appliance_type"] = classify_appliance_type_with_llm(part_data)
+        part_data["_appliance_type_source"] = "llm_classified"
+    else:
+        part_data["_appliance_type_source"] = "scraped"
+
+    if get_settings().SCRAPE_WRITEBACK_ENABLED:
+        get_scrape_writeback().submit(dict(part_data))
+    return part_data
+
+
+def _scrape_error(ps_number_clean: str, e: Exception) -> dict:
+    """Error dict for a scrape that raised."""
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+
+    if isinstance(e, BrowserPoolTimeout):
+        logger.warning("No browser free to scrape %s: %s", ps_number_clean, e)
+        return {
+            "error": f"Live scraping is busy right now, could not look up {ps_number_clean}. Try again shortly.",
+            "ps_number": ps_number_clean
+        }
+
+    if isinstance(e, TimeoutException):
+        logger.warning("Timeout scraping %s: %s", ps_number_clean, e)
+        return {
+            "error": f"Timeout while scraping {ps_number_clean}. PartSelect may be slow or the part doesn't exist.",
+            "ps_number": ps_number_clean
+        }
+
+    if isinstance(e, WebDriverException):
+        logger.warning("WebDriver error scraping %s: %s", ps_number_clean, e)
+        return {
+            "error": f"Browser error while scraping {ps_number_clean}: {str(e)[:100]}",
+            "ps_number": ps_number_clean
+        }
+
+    logger.error("Unexpected error scraping %s", ps_number_clean, exc_info=e)
+    return {
+        "error": f"Failed to scrape {ps_number_clean}: {str(e)[:100]}",
+        "ps_number": ps_number_clean
+    }
+
+
 @registry.register(category="scrape")
 def scrape_part_live(ps_number: str) -> dict:
     """
     Live scrape a part from PartSelect when not in database.
 
-    WARNING: This is a SLOW operation (5-30 seconds). Only use when
-    the part is not available in the database.
+    WARNING: This is a SLOW operation (1-2 seconds over HTTP, 5-30 seconds
+    when a browser is needed). Only use when the part is not available in
+    the database.
 
     Args:
         ps_number: The PS number to scrape (e.g., "PS11752778")
@@ -130,149 +364,46 @@ def scrape_part_live(ps_number: str) -> dict:
             ...
         }
     """
-    # 1. Validate PS number format
-    if not ps_number or not isinstance(ps_number, str):
-        return {
-            "error": f"Invalid input: {ps_number}",
-            "ps_number": ps_number
-        }
+    ps_number_clean, error = _validate_ps_number(ps_number)
+    if error:
+        return error
+    if ps_number_clean in get_missing_parts_cache():
+        return _not_found_error(ps_number_clean)
 
-    ps_number_clean = ps_number.strip()
-    if not ps_number_clean.startswith("PS"):
-        return {
-            "error": f"Invalid PS number format: {ps_number}. Must start with 'PS'",
-            "ps_number": ps_number
-        }
+    logger.info("Starting live scrape for %s", ps_number_clean)
+    part_data = _scrape_static(ps_number_clean)
+    if part_data is not None:
+        return _finish_scrape(part_data)
 
-    driver = None
     try:
-        print(f"  [SCRAPE_LIVE] Starting live scrape for {ps_number_clean}...")
-
-        # 2. Setup headless Chrome with optimizations
-        driver = setup_driver(
-            headless=True,
-            use_proxy=False,
-            rotate_user_agent=True,
-            disable_images=True  # Faster page loads
-        )
-
-        print(f"  [SCRAPE_LIVE] Navigating to PartSelect homepage...")
-
-        # 3. Navigate to homepage
-        driver.get("https://www.partselect.com/")
-
-        # 4. Find search input (class: js-headerNavSearch)
-        print(f"  [SCRAPE_LIVE] Finding search input...")
-        search_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input.js-headerNavSearch"))
-        )
-
-        # 5. Enter PS number and submit
-        print(f"  [SCRAPE_LIVE] Searching for {ps_number_clean}...")
-        search_input.clear()
-        search_input.send_keys(ps_number_clean)
-        search_input.send_keys(Keys.RETURN)
-
-        # 6. Wait for page load and get final URL
-        # The search should redirect to the part page
-        print(f"  [SCRAPE_LIVE] Waiting for redirect to part page...")
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.url_contains("partselect.com/PS")
-            )
-        except TimeoutException:
-            # Part might not exist or search failed
-            print(f"  [SCRAPE_LIVE] No redirect to part page - part may not exist")
-            return {
-                "error": f"Part {ps_number_clean} not found on PartSelect. The search did not return a valid part page.",
-                "ps_number": ps_number_clean
-            }
-
-        final_url = driver.current_url
-        print(f"  [SCRAPE_LIVE] Redirected to: {final_url}")
-
-        # 7. Call existing scraper with final URL
-        print(f"  [SCRAPE_LIVE] Extracting part data...")
-        part_data, model_compat, qna, stories, reviews = scrape_part_page(
-            driver=driver,
-            part_name="",  # Will be extracted from page
-            product_url=final_url,
-            appliance_type="",  # Will be detected from page
-            extract_embeddings=True  # Get Q&A, stories, reviews
-        )
-
-        # 8. Validate scrape success
-        if not part_data.get("ps_number"):
-            print(f"  [SCRAPE_LIVE] Failed to extract part data from page")
-            return {
-                "error": f"Failed to scrape {ps_number_clean}. Could not extract part data from page.",
-                "ps_number": ps_number_clean
-            }
-
-        # 9. Verify we got the correct part
-        scraped_ps = part_data.get("ps_number", "")
-        if scraped_ps != ps_number_clean:
-            print(f"  [SCRAPE_LIVE] WARNING: Scraped wrong part. Expected {ps_number_clean}, got {scraped_ps}")
-            # Still return the data, but include a warning
-            part_data["_scrape_warning"] = f"Requested {ps_number_clean} but got {scraped_ps}"
-
-        # 10. Add metadata and include all scraped data
-        part_data["_scraped_live"] = True
-        part_data["_model_compatibility_count"] = len(model_compat)
-        part_data["_qna_count"] = len(qna)
-        part_data["_stories_count"] = len(stories)
-        part_data["_reviews_count"] = len(reviews)
-
-        # Include the actual data (not just counts) so agent can use it
-        part_data["_compatible_models"] = model_compat
-        part_data["_qna_data"] = qna
-        part_data["_repair_stories"] = stories
-        part_data["_reviews_data"] = reviews
-
-        print(f"  [SCRAPE_LIVE] ✓ Success! Scraped: {part_data.get('part_name', 'Unknown')}")
-        print(f"  [SCRAPE_LIVE]   - {len(model_compat)} compatible models")
-        print(f"  [SCRAPE_LIVE]   - {len(qna)} Q&A entries")
-        print(f"  [SCRAPE_LIVE]   - {len(stories)} repair stories")
-        print(f"  [SCRAPE_LIVE]   - {len(reviews)} reviews")
-
-        # If appliance_type is empty/unknown, use LLM to classify it
-        current_appliance_type = part_data.get("appliance_type", "")
-        if not current_appliance_type or current_appliance_type.strip() == "":
-            print(f"  [SCRAPE_LIVE] Appliance type unknown, using LLM to classify...")
-            classified_type = classify_appliance_type_with_llm(part_data)
-            part_data["appliance_type"] = classified_type
-            part_data["_appliance_type_source"] = "llm_classified"
-        else:
-            part_data["_appliance_type_source"] = "scraped"
+        part_data = get_browser_pool().run(_scrape_with_driver, ps_number_clean)
+    except Exception as e:
+        return _scrape_error(ps_number_clean, e)
 
+    if part_data.get("error"):
         return part_data
+    return _finish_scrape(part_data)
 
-    except TimeoutException as e:
-        print(f"  [SCRAPE_LIVE] ✗ Timeout: {str(e)}")
-        return {
-            "error": f"Timeout while scraping {ps_number_clean}. PartSelect may be slow or the part doesn't exist.",
-            "ps_number": ps_number_clean
-        }
 
-    except WebDriverException as e:
-        print(f"  [SCRAPE_LIVE] ✗ WebDriver error: {str(e)}")
-        return {
-            "error": f"Browser error while scraping {ps_number_clean}: {str(e)[:100]}",
-            "ps_number": ps_number_clean
-        }
+@registry.register_async("scrape_part_live")
+async def ascrape_part_live(ps_number: str) -> dict:
+    """Async version of scrape_part_live (scrapes on a pool thread)."""
+    ps_number_clean, error = _validate_ps_number(ps_number)
+    if error:
+        return error
+    if ps_number_clean in get_missing_parts_cache():
+        return _not_found_error(ps_number_clean)
+
+    logger.info("Starting live scrape for %s", ps_number_clean)
+    part_data = await asyncio.to_thread(_scrape_static, ps_number_clean)
+    if part_data is not None:
+        return await asyncio.to_thread(_finish_scrape, part_data)
 
+    try:
+        part_data = await get_browser_pool().arun(_scrape_with_driver, ps_number_clean)
     except Exception as e:
-        print(f"  [SCRAPE_LIVE] ✗ Unexpected error: {str(e)}")
-        return {
-            "error": f"Failed to scrape {ps_number_clean}: {str(e)[:100]}",
-            "ps_number": ps_number_clean
-        }
+        return _scrape_error(ps_number_clean, e)
 
-    finally:
-        # CRITICAL: Always cleanup WebDriver to prevent memory leaks
-        if driver:
-            try:
-                driver.quit()
-                print(f"  [SCRAPE_LIVE] WebDriver cleaned up")
-            except Exception as e:
-                print(f"  [SCRAPE_LIVE] Warning: Error during cleanup: {e}")
+    if part_data.get("error"):
+        return part_data
+    return await asyncio.to_thread(_finish_scrape, part_data)
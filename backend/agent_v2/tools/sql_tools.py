@@ -7,47 +7,71 @@ These tools query the PostgreSQL database for structured data:
 - Repair symptoms and instructions
 
 Copied from backend/tools/sql_tools.py with registry decorators.
+
+Each tool also has an async twin (registered with @registry.register_async)
+that the executor awaits, so database round trips don't block the event loop.
+Tools that do more than one lookup are written once, as plans that yield
+database calls (see backend/db/queries.py): _run performs the calls on the
+sync client, _arun awaits them on the async one.
 """
 import re
-from backend.db import get_supabase_client
-from backend.agent_v2.tools.registry import registry
+from operator import methodcaller
+from backend.db import get_supabase_client, get_async_supabase_client
+from backend.db.queries import Plan, run_async, run_sync
+from backend.agent_v2.tools.registry import (
+    registry,
+    CachePolicy,
+    upper_strip,
+    lower_strip,
+    normalize_text,
+)
+
+# Catalog data only changes when the loader or live scraper writes new rows
+# (call registry.invalidate_cache() after writing), so results can be shared
+# across requests for a long time.
+CATALOG_TTL = 3600
+REPAIR_TTL = 24 * 3600
+
+# Identifier patterns used by resolve_part (also used by prefetch.py)
+PARTSELECT_URL_PATTERN = re.compile(r'partselect\.com/PS(\d+)', re.IGNORECASE)
+PS_NUMBER_PATTERN = re.compile(r'PS(\d+)', re.IGNORECASE)
+MANUFACTURER_NUMBER_PATTERN = re.compile(r'^[A-Z0-9\-]+$', re.IGNORECASE)
+MIN_MANUFACTURER_NUMBER_LENGTH = 5
+
+SUPPORTED_APPLIANCE_TYPES = ["refrigerator", "dishwasher"]
+
+
+def _run(plan: Plan):
+    """Run a tool plan against the sync client."""
+    db = get_supabase_client()
+    return run_sync(plan, lambda call: call(db))
 
 
-# =============================================================================
-# Resolution Tools - Parse messy input → clean identifiers
-# =============================================================================
+async def _arun(plan: Plan):
+    """Run a tool plan against the async client."""
+    db = await get_async_supabase_client()
+    return await run_async(plan, lambda call: call(db))
 
-@registry.register(category="resolution")
-def resolve_part(
-    input: str,
-    session_context: dict | None = None
-) -> dict:
-    """
-    Parse any part reference and return structured identifiers.
 
-    Handles multiple input types:
-    - PS number: "PS11752778" → exact match
-    - Manufacturer #: "WPW10321304" → lookup and return PS number
-    - PartSelect URL: "partselect.com/PS11752778..." → extract PS number
-    - Session reference: "this part" with session context → resolve from context
-    - Text search: "ice maker" → return search candidates
+def _out_of_scope_error(ps_number: str, part: dict) -> dict | None:
+    """Error for a part that isn't for a supported appliance type, else None."""
+    appliance_type = part.get("appliance_type", "").lower() if part.get("appliance_type") else ""
+    if appliance_type and appliance_type not in SUPPORTED_APPLIANCE_TYPES:
+        return {
+            "error": f"Part {ps_number} is for a {appliance_type}, not a refrigerator or dishwasher.",
+            "ps_number": ps_number,
+            "appliance_type": appliance_type,
+            "out_of_scope": True
+        }
+    return None
 
-    Args:
-        input: The user's part reference (PS#, manufacturer#, URL, text, or "this part")
-        session_context: Optional dict with current_part, current_model, appliance_type
 
-    Returns:
-        Dictionary with:
-        - resolved: bool - whether we found a specific part
-        - ps_number: str | None - the resolved PS number
-        - manufacturer_part_number: str | None - if matched via manufacturer #
-        - url: str | None - if extracted from URL
-        - confidence: "exact" | "matched" | "session" | "search" | "not_found"
-        - candidates: list - if multiple matches (for search or partial match)
-        - part_name: str | None - name of resolved part
-        - appliance_type: str | None - appliance type of resolved part
-    """
-    db = get_supabase_client()
+# =============================================================================
+# Plans shared by the sync and async tools
+# =============================================================================
+
+def _resolve_part(input: str, session_context: dict | None) -> Plan:
+    """resolve_part's lookups, as a plan (see _run / _arun)."""
     input_clean = input.strip()
 
     # 1. Check for session reference ("this part", "the part", etc.)
@@ -56,7 +80,7 @@ def resolve_part(
         current_part = session_context.get("current_part")
         if current_part:
             # Validate the session part still exists
-            result = db.validate_part(current_part)
+            result = (yield methodcaller("validate_part", current_part))
             if result.get("found"):
                 return {
                     "resolved": True,
@@ -68,14 +92,14 @@ def resolve_part(
 
     # 2. Check for PartSelect URL
     url_patterns = [
-        r'partselect\.com/PS(\d+)',  # partselect.com/PS11752778
-        r'PS(\d+)',  # Just PS number in a URL or text
+        PARTSELECT_URL_PATTERN,  # partselect.com/PS11752778
+        PS_NUMBER_PATTERN,  # Just PS number in a URL or text
     ]
     for pattern in url_patterns:
-        match = re.search(pattern, input_clean, re.IGNORECASE)
+        match = pattern.search(input_clean)
         if match:
             ps_number = f"PS{match.group(1)}"
-            result = db.validate_part(ps_number)
+            result = (yield methodcaller("validate_part", ps_number))
             if result.get("found"):
                 return {
                     "resolved": True,
@@ -90,7 +114,7 @@ def resolve_part(
     ps_match = re.match(r'^PS\d+$', input_clean, re.IGNORECASE)
     if ps_match:
         ps_number = input_clean.upper()
-        result = db.validate_part(ps_number)
+        result = (yield methodcaller("validate_part", ps_number))
         if result.get("found"):
             return {
                 "resolved": True,
@@ -109,9 +133,9 @@ def resolve_part(
 
     # 4. Check for manufacturer part number (alphanumeric, often starts with letter)
     # Common patterns: WPW10321304, W10321304, 8194001, etc.
-    if re.match(r'^[A-Z0-9\-]+$', input_clean, re.IGNORECASE) and len(input_clean) >= 5:
+    if MANUFACTURER_NUMBER_PATTERN.match(input_clean) and len(input_clean) >= MIN_MANUFACTURER_NUMBER_LENGTH:
         # Try exact manufacturer number match
-        part = db.find_by_manufacturer_number(input_clean.upper())
+        part = (yield methodcaller("find_by_manufacturer_number", input_clean.upper()))
         if part:
             return {
                 "resolved": True,
@@ -124,7 +148,7 @@ def resolve_part(
             }
 
         # Try partial match
-        candidates = db.find_by_manufacturer_number_partial(input_clean.upper())
+        candidates = (yield methodcaller("find_by_manufacturer_number_partial", input_clean.upper()))
         if candidates:
             if len(candidates) == 1:
                 return {
@@ -144,7 +168,7 @@ def resolve_part(
             }
 
     # 5. Fall back to text search
-    search_result = db.search_parts(query=input_clean, limit=5)
+    search_result = (yield methodcaller("search_parts", query=input_clean, limit=5))
     if search_result:
         if len(search_result) == 1:
             return {
@@ -170,32 +194,12 @@ def resolve_part(
     }
 
 
-@registry.register(category="resolution")
-def resolve_model(input: str) -> dict:
-    """
-    Parse a model number reference with fuzzy matching.
-
-    Matching strategy (in order):
-    1. Exact match (case-insensitive)
-    2. Partial match (ILIKE %input%)
-
-    Args:
-        input: The user's model reference (e.g., "WDT780SAEM1", "WDT780")
-
-    Returns:
-        Dictionary with:
-        - resolved: bool - whether we found a specific model
-        - model_number: str | None - the resolved model number
-        - brand: str | None - brand of the model
-        - description: str | None - model description
-        - confidence: "exact" | "partial" | "not_found"
-        - candidates: list - other matches if partial
-    """
-    db = get_supabase_client()
+def _resolve_model(input: str) -> Plan:
+    """resolve_model's lookups, as a plan."""
     input_clean = input.strip().upper()
 
     # Try exact match first
-    result = db.validate_model(input_clean)
+    result = (yield methodcaller("validate_model", input_clean))
     if result.get("found"):
         return {
             "resolved": True,
@@ -207,7 +211,7 @@ def resolve_model(input: str) -> dict:
         }
 
     # Try fuzzy matching
-    candidates = db.find_model_fuzzy(input_clean)
+    candidates = (yield methodcaller("find_model_fuzzy", input_clean))
     if candidates:
         if len(candidates) == 1:
             return {
@@ -232,13 +236,121 @@ def resolve_model(input: str) -> dict:
         "candidates": []
     }
 
+def _get_part(ps_number: str) -> Plan:
+    result = yield methodcaller("get_part_by_ps_number", ps_number)
+    if not result:
+        return {"error": f"Part {ps_number} not found in database", "ps_number": ps_number}
+
+    # Check if part is for a supported appliance type
+    return _out_of_scope_error(ps_number, result) or result
+
+
+def _check_compatibility(ps_number: str, model_number: str) -> Plan:
+    # First check if the part is for a supported appliance type
+    part_info = yield methodcaller("get_part_by_ps_number", ps_number)
+    error = _out_of_scope_error(ps_number, part_info) if part_info else None
+    if error:
+        return error
+
+    return (yield methodcaller("check_compatibility", ps_number, model_number))
+
+
+def _get_compatible_models(ps_number: str, brand: str | None) -> Plan:
+    results = yield methodcaller("get_compatible_models", ps_number, brand)
+
+    if not results:
+        return {"message": f"No compatible models found for part {ps_number}", "models": []}
+
+    return {
+        "part_number": ps_number,
+        "compatible_model_count": len(results),
+        "models": results
+    }
+
+
+def _get_repair_instructions(appliance_type: str, symptom: str, part_type: str | None) -> Plan:
+    result = yield methodcaller("get_repair_instructions", appliance_type, symptom, part_type)
+    if not result:
+        return {"error": f"No repair instructions found for symptom '{symptom}' on {appliance_type}"}
+    return result
+
+
+# =============================================================================
+# Resolution Tools - Parse messy input → clean identifiers
+# =============================================================================
+
+@registry.register(category="resolution", cache=CachePolicy(
+    ttl_seconds=CATALOG_TTL, max_entries=2000,
+))
+def resolve_part(
+    input: str,
+    session_context: dict | None = None
+) -> dict:
+    """
+    Parse any part reference and return structured identifiers.
+
+    Handles multiple input types:
+    - PS number: "PS11752778" → exact match
+    - Manufacturer #: "WPW10321304" → lookup and return PS number
+    - PartSelect URL: "partselect.com/PS11752778..." → extract PS number
+    - Session reference: "this part" with session context → resolve from context
+    - Text search: "ice maker" → return search candidates
+
+    Args:
+        input: The user's part reference (PS#, manufacturer#, URL, text, or "this part")
+        session_context: Optional dict with current_part, current_model, appliance_type
+
+    Returns:
+        Dictionary with:
+        - resolved: bool - whether we found a specific part
+        - ps_number: str | None - the resolved PS number
+        - manufacturer_part_number: str | None - if matched via manufacturer #
+        - url: str | None - if extracted from URL
+        - confidence: "exact" | "matched" | "session" | "search" | "not_found"
+        - candidates: list - if multiple matches (for search or partial match)
+        - part_name: str | None - name of resolved part
+        - appliance_type: str | None - appliance type of resolved part
+    """
+    return _run(_resolve_part(input, session_context))
+
+
+@registry.register(category="resolution", cache=CachePolicy(
+    ttl_seconds=CATALOG_TTL, max_entries=2000,
+    normalize={"input": upper_strip},
+))
+def resolve_model(input: str) -> dict:
+    """
+    Parse a model number reference with fuzzy matching.
+
+    Matching strategy (in order):
+    1. Exact match (case-insensitive)
+    2. Partial match (ILIKE %input%)
+
+    Args:
+        input: The user's model reference (e.g., "WDT780SAEM1", "WDT780")
+
+    Returns:
+        Dictionary with:
+        - resolved: bool - whether we found a specific model
+        - model_number: str | None - the resolved model number
+        - brand: str | None - brand of the model
+        - description: str | None - model description
+        - confidence: "exact" | "partial" | "not_found"
+        - candidates: list - other matches if partial
+    """
+    return _run(_resolve_model(input))
+
 
 # =============================================================================
 # Atomic Data Tools - Clean identifiers → data
 # =============================================================================
 
 
-@registry.register(category="search")
+@registry.register(category="search", cache=CachePolicy(
+    ttl_seconds=CATALOG_TTL, max_entries=1000,
+    normalize={"query": normalize_text, "appliance_type": lower_strip,
+               "part_type": normalize_text, "brand": normalize_text},
+))
 def search_parts(
     query: str | None = None,
     appliance_type: str | None = None,
@@ -276,7 +388,10 @@ def search_parts(
     )
 
 
-@registry.register(category="part")
+@registry.register(category="part", cache=CachePolicy(
+    ttl_seconds=CATALOG_TTL, max_entries=5000,
+    normalize={"ps_number": upper_strip},
+))
 def get_part(ps_number: str) -> dict:
     """
     Get full details for a part by its PS number.
@@ -299,27 +414,15 @@ def get_part(ps_number: str) -> dict:
         Full part details or error message if not found
     """
     try:
-        db = get_supabase_client()
-        result = db.get_part_by_ps_number(ps_number)
-        if not result:
-            return {"error": f"Part {ps_number} not found in database", "ps_number": ps_number}
-
-        # Check if part is for a supported appliance type
-        appliance_type = result.get("appliance_type", "").lower() if result.get("appliance_type") else ""
-        if appliance_type and appliance_type not in ["refrigerator", "dishwasher"]:
-            return {
-                "error": f"Part {ps_number} is for a {appliance_type}, not a refrigerator or dishwasher.",
-                "ps_number": ps_number,
-                "appliance_type": appliance_type,
-                "out_of_scope": True
-            }
-
-        return result
+        return _run(_get_part(ps_number))
     except Exception as e:
         return {"error": f"Database error looking up {ps_number}: {str(e)}", "ps_number": ps_number}
 
 
-@registry.register(category="part")
+@registry.register(category="part", cache=CachePolicy(
+    ttl_seconds=CATALOG_TTL, max_entries=5000,
+    normalize={"ps_number": upper_strip, "model_number": upper_strip},
+))
 def check_compatibility(ps_number: str, model_number: str) -> dict:
     """
     Check if a specific part is compatible with an appliance model.
@@ -334,23 +437,13 @@ def check_compatibility(ps_number: str, model_number: str) -> dict:
     Returns:
         Dictionary with 'compatible' boolean and model details if compatible
     """
-    db = get_supabase_client()
-
-    # First check if the part is for a supported appliance type
-    part_info = db.get_part_by_ps_number(ps_number)
-    if part_info:
-        appliance_type = part_info.get("appliance_type", "").lower() if part_info.get("appliance_type") else ""
-        if appliance_type and appliance_type not in ["refrigerator", "dishwasher"]:
-            return {
-                "error": f"Part {ps_number} is for a {appliance_type}, not a refrigerator or dishwasher.",
-                "appliance_type": appliance_type,
-                "out_of_scope": True
-            }
-
-    return db.check_compatibility(ps_number, model_number)
+    return _run(_check_compatibility(ps_number, model_number))
 
 
-@registry.register(category="part")
+@registry.register(category="part", cache=CachePolicy(
+    ttl_seconds=CATALOG_TTL, max_entries=500,
+    normalize={"model_number": upper_strip, "part_type": normalize_text, "brand": normalize_text},
+))
 def get_compatible_parts(
     model_number: str,
     part_type: str | None = None,
@@ -373,7 +466,10 @@ def get_compatible_parts(
     return db.get_compatible_parts(model_number, part_type, brand)
 
 
-@registry.register(category="part")
+@registry.register(category="part", cache=CachePolicy(
+    ttl_seconds=CATALOG_TTL, max_entries=200,  # results can be thousands of rows
+    normalize={"ps_number": upper_strip, "brand": normalize_text},
+))
 def get_compatible_models(
     ps_number: str,
     brand: str | None = None
@@ -391,20 +487,13 @@ def get_compatible_models(
     Returns:
         List of compatible models with model_number, brand, and description
     """
-    db = get_supabase_client()
-    results = db.get_compatible_models(ps_number, brand)
+    return _run(_get_compatible_models(ps_number, brand))
 
-    if not results:
-        return {"message": f"No compatible models found for part {ps_number}", "models": []}
 
-    return {
-        "part_number": ps_number,
-        "compatible_model_count": len(results),
-        "models": results
-    }
-
-
-@registry.register(category="symptom")
+@registry.register(category="symptom", cache=CachePolicy(
+    ttl_seconds=REPAIR_TTL, max_entries=500,
+    normalize={"appliance_type": lower_strip, "symptom": normalize_text},
+))
 def get_symptoms(appliance_type: str, symptom: str | None = None) -> list[dict]:
     """
     Get symptom info for an appliance type.
@@ -429,7 +518,10 @@ def get_symptoms(appliance_type: str, symptom: str | None = None) -> list[dict]:
     return db.get_symptoms(appliance_type, symptom)
 
 
-@registry.register(category="symptom")
+@registry.register(category="symptom", cache=CachePolicy(
+    ttl_seconds=REPAIR_TTL, max_entries=500,
+    normalize={"appliance_type": lower_strip, "symptom": normalize_text, "part_type": normalize_text},
+))
 def get_repair_instructions(
     appliance_type: str,
     symptom: str,
@@ -459,10 +551,101 @@ def get_repair_instructions(
         - difficulty: Overall difficulty level
     """
     try:
-        db = get_supabase_client()
-        result = db.get_repair_instructions(appliance_type, symptom, part_type)
-        if not result:
-            return {"error": f"No repair instructions found for symptom '{symptom}' on {appliance_type}"}
-        return result
+        return _run(_get_repair_instructions(appliance_type, symptom, part_type))
+    except Exception as e:
+        return {"error": f"Error getting repair instructions: {str(e)}"}
+
+
+# =============================================================================
+# Async implementations - awaited by the executor's ToolNode
+# =============================================================================
+
+@registry.register_async("resolve_part")
+async def aresolve_part(
+    input: str,
+    session_context: dict | None = None
+) -> dict:
+    """Async version of resolve_part."""
+    return await _arun(_resolve_part(input, session_context))
+
+
+@registry.register_async("resolve_model")
+async def aresolve_model(input: str) -> dict:
+    """Async version of resolve_model."""
+    return await _arun(_resolve_model(input))
+
+
+@registry.register_async("search_parts")
+async def asearch_parts(
+    query: str | None = None,
+    appliance_type: str | None = None,
+    part_type: str | None = None,
+    brand: str | None = None,
+    max_price: float | None = None,
+    in_stock_only: bool = False
+) -> list[dict]:
+    """Async version of search_parts."""
+    db = await get_async_supabase_client()
+    return await db.search_parts(
+        query=query,
+        appliance_type=appliance_type,
+        part_type=part_type,
+        brand=brand,
+        max_price=max_price,
+        in_stock_only=in_stock_only
+    )
+
+
+@registry.register_async("get_part")
+async def aget_part(ps_number: str) -> dict:
+    """Async version of get_part."""
+    try:
+        return await _arun(_get_part(ps_number))
+    except Exception as e:
+        return {"error": f"Database error looking up {ps_number}: {str(e)}", "ps_number": ps_number}
+
+
+@registry.register_async("check_compatibility")
+async def acheck_compatibility(ps_number: str, model_number: str) -> dict:
+    """Async version of check_compatibility."""
+    return await _arun(_check_compatibility(ps_number, model_number))
+
+
+@registry.register_async("get_compatible_parts")
+async def aget_compatible_parts(
+    model_number: str,
+    part_type: str | None = None,
+    brand: str | None = None
+) -> list[dict]:
+    """Async version of get_compatible_parts."""
+    db = await get_async_supabase_client()
+    return await db.get_compatible_parts(model_number, part_type, brand)
+
+
+@registry.register_async("get_compatible_models")
+async def aget_compatible_models(
+    ps_number: str,
+    brand: str | None = None
+) -> list[dict]:
+    """Async version of get_compatible_models."""
+    return await _arun(_get_compatible_models(ps_number, brand))
+
+
+@registry.register_async("get_symptoms")
+async def aget_symptoms(appliance_type: str, symptom: str | None = None) -> list[dict]:
+    """Async version of get_symptoms."""
+    db = await get_async_supabase_client()
+    return await db.get_symptoms(appliance_type, symptom)
+
+
+@registry.register_async("get_repair_instructions")
+async def aget_repair_instructions(
+    appliance_type: str,
+    symptom: str,
+    part_type: str | None = None
+) -> dict:
+    """Async version of get_repair_instructions."""
+    try:
+        return await _arun(_get_repair_instructions(appliance_type, symptom, part_type))
     except Exception as e:
         return {"error": f"Error getting repair instructions: {str(e)}"}
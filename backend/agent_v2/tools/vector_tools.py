@@ -6,44 +6,168 @@ These tools use embeddings to find semantically similar content:
 - Repair stories from user experiences
 
 Copied from backend/tools/vector_tools.py with registry decorators.
+
+sentence_transformers (and torch) are imported when the model is first
+loaded - at startup warm-up, or on the first search if warm-up is off.
+
+Each tool also has an async twin: the RPC is awaited and the (CPU-bound)
+embedding runs in a worker thread. Query embeddings are memoized (see
+embedding_cache.py), so repeated queries skip the model entirely, and misses
+from concurrent chats are encoded together (see embedding_batcher.py).
 """
-from sentence_transformers import SentenceTransformer
+import logging
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from backend.config import get_settings
-from backend.db import get_supabase_client
-from backend.agent_v2.tools.registry import registry
+from backend.db import get_supabase_client, get_async_supabase_client
+from backend.metrics import timed
+from backend.agent_v2.embedding_batcher import EmbeddingBatcher
+from backend.agent_v2.embedding_cache import get_embedding_cache, normalize_embedding_text
+from backend.agent_v2.tools.registry import (
+    registry,
+    CachePolicy,
+    upper_strip,
+    lower_strip,
+    normalize_text,
+)
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+# Embeddings tables only change when the loader or live scraper writes new rows
+# (call registry.invalidate_cache() after writing)
+VECTOR_TTL = 3600
 
 # Module-level model cache (more robust than lru_cache for ML models)
 _embedding_model = None
+_model_lock = threading.Lock()
+# Set once warm_up_embedding_model() has loaded the model and run it
+_model_ready = threading.Event()
+
+# Inference that doesn't go through the batcher runs here, never on the event loop
+_inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
 
+# Dummy batch sizes encoded at startup (first-call allocation and kernel setup)
+_WARMUP_BATCH_SIZES = (1, 8, 32)
 
-def get_embedding_model() -> SentenceTransformer:
+
+def get_embedding_model() -> "SentenceTransformer":
     """Get cached embedding model instance with error recovery."""
     global _embedding_model
     if _embedding_model is None:
-        settings = get_settings()
-        _embedding_model = SentenceTransformer(settings.EMBEDDING_MODEL)
+        with _model_lock:
+            if _embedding_model is None:
+                # Imported here so torch loads with the model, not with the API
+                from sentence_transformers import SentenceTransformer
+                settings = get_settings()
+                _embedding_model = SentenceTransformer(settings.EMBEDDING_MODEL)
     return _embedding_model
 
 
-def generate_embedding(text: str) -> list[float]:
-    """Generate embedding vector for text."""
+def _reload_embedding_model(broken: "SentenceTransformer") -> "SentenceTransformer":
+    """Replace a corrupted model - once, however many callers hit the error."""
     global _embedding_model
+    with _model_lock:
+        if _embedding_model is broken:
+            _embedding_model = None
+    return get_embedding_model()
+
+
+def _encode_texts(texts: str | list[str]):
+    """Encode one text or a batch with the embedding model (no cache)."""
+    model = get_embedding_model()
     try:
-        model = get_embedding_model()
-        embedding = model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return model.encode(texts, convert_to_numpy=True)
     except RuntimeError as e:
         # Handle meta tensor or corrupted model state - recreate model
         if "meta tensor" in str(e) or "no data" in str(e):
-            print(f"  [WARN] Embedding model corrupted, recreating: {e}")
-            _embedding_model = None
-            model = get_embedding_model()
-            embedding = model.encode(text, convert_to_numpy=True)
-            return embedding.tolist()
+            logger.warning("Embedding model corrupted, recreating: %s", e)
+            return _reload_embedding_model(model).encode(texts, convert_to_numpy=True)
         raise
 
 
-@registry.register(category="vector")
+def warm_up_embedding_model() -> float:
+    """Load the model and encode a few dummy batches. Returns the seconds taken."""
+    start = time.perf_counter()
+    for size in _WARMUP_BATCH_SIZES:
+        _encode_texts(["is this part easy to install"] * size)
+    _model_ready.set()
+    return time.perf_counter() - start
+
+
+async def awarm_up_embedding_model() -> None:
+    """Warm the model on the inference executor (started from the FastAPI lifespan)."""
+    loop = asyncio.get_running_loop()
+    try:
+        seconds = await loop.run_in_executor(_inference_executor, warm_up_embedding_model)
+        logger.info("Embedding model warmed up in %.1fs", seconds)
+    except Exception:
+        logger.exception("Embedding model warm-up failed")
+
+
+def embedding_model_ready() -> bool:
+    """True once the model has been loaded and warmed up."""
+    return _model_ready.is_set()
+
+
+@lru_cache()
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Get the process-wide micro-batcher in front of the embedding model."""
+    settings = get_settings()
+    return EmbeddingBatcher(
+        _encode_texts,
+        max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+        window_ms=settings.EMBEDDING_BATCH_WINDOW_MS,
+    )
+
+
+@timed("embedding", "encode")
+def _encode(text: str):
+    """Encode one text, batched with concurrent callers when enabled."""
+    if get_settings().EMBEDDING_BATCH_ENABLED:
+        return get_embedding_batcher().encode(text)
+    return _encode_texts(text)
+
+
+@timed("embedding", "encode")
+async def _aencode(text: str):
+    """Async _encode - waits for the batch (or the inference executor) off the event loop."""
+    if get_settings().EMBEDDING_BATCH_ENABLED:
+        return await get_embedding_batcher().aencode(text)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_inference_executor, _encode_texts, text)
+
+
+def generate_embedding(text: str) -> list[float]:
+    """Generate embedding vector for text, memoized on the normalized text."""
+    cache = get_embedding_cache()
+    key = normalize_embedding_text(text)
+    vector = cache.get(key)
+    if vector is None:
+        vector = cache.put(key, _encode(key))
+    return vector.tolist()
+
+
+async def agenerate_embedding(text: str) -> list[float]:
+    """Generate an embedding without blocking the event loop (cache hits stay on it)."""
+    cache = get_embedding_cache()
+    key = normalize_embedding_text(text)
+    vector = cache.get(key)
+    if vector is None:
+        vector = cache.put(key, await _aencode(key))
+    return vector.tolist()
+
+
+@registry.register(category="vector", cache=CachePolicy(
+    ttl_seconds=VECTOR_TTL, max_entries=2000,
+    normalize={"query": normalize_text, "ps_number": upper_strip},
+))
 def search_qna(
     query: str,
     ps_number: str,
@@ -89,7 +213,10 @@ def search_qna(
     return results
 
 
-@registry.register(category="vector")
+@registry.register(category="vector", cache=CachePolicy(
+    ttl_seconds=VECTOR_TTL, max_entries=2000,
+    normalize={"query": normalize_text, "ps_number": upper_strip},
+))
 def search_repair_stories(
     query: str,
     ps_number: str,
@@ -136,7 +263,10 @@ def search_repair_stories(
     return results
 
 
-@registry.register(category="search")
+@registry.register(category="search", cache=CachePolicy(
+    ttl_seconds=VECTOR_TTL, max_entries=1000,
+    normalize={"query": normalize_text, "appliance_type": lower_strip},
+))
 def search_parts_semantic(
     query: str,
     appliance_type: str | None = None,
@@ -171,7 +301,7 @@ def search_parts_semantic(
     try:
         query_embedding = generate_embedding(query)
     except Exception as e:
-        print(f"  [WARN] Failed to generate embedding for query: {e}")
+        logger.warning("Failed to generate embedding for query: %s", e)
         return []
 
     results = db.search_parts_semantic(
@@ -189,7 +319,10 @@ def search_parts_semantic(
     return results
 
 
-@registry.register(category="vector")
+@registry.register(category="vector", cache=CachePolicy(
+    ttl_seconds=VECTOR_TTL, max_entries=2000,
+    normalize={"query": normalize_text, "ps_number": upper_strip},
+))
 def search_reviews(
     query: str,
     ps_number: str,
@@ -231,7 +364,7 @@ def search_reviews(
         try:
             query_embedding = generate_embedding(query)
         except Exception as e:
-            print(f"  [WARN] Failed to generate embedding for query: {e}")
+            logger.warning("Failed to generate embedding for query: %s", e)
             return []
 
         results = db.search_reviews(
@@ -242,3 +375,110 @@ def search_reviews(
         )
 
     return results
+
+
+# =============================================================================
+# Async implementations - awaited by the executor's ToolNode
+# =============================================================================
+
+@registry.register_async("search_qna")
+async def asearch_qna(
+    query: str,
+    ps_number: str,
+    limit: int = 5
+) -> list[dict]:
+    """Async version of search_qna."""
+    if not ps_number:
+        return []
+
+    db = await get_async_supabase_client()
+
+    if not query or query.strip() == "":
+        return await db.get_qna_by_ps_number(ps_number, limit=limit)
+
+    query_embedding = await agenerate_embedding(query)
+    return await db.search_qna(
+        query_embedding=query_embedding,
+        ps_number=ps_number,
+        match_threshold=0.2,
+        limit=limit
+    )
+
+
+@registry.register_async("search_repair_stories")
+async def asearch_repair_stories(
+    query: str,
+    ps_number: str,
+    limit: int = 5
+) -> list[dict]:
+    """Async version of search_repair_stories."""
+    if not ps_number:
+        return []
+
+    db = await get_async_supabase_client()
+
+    if not query or query.strip() == "":
+        return await db.get_repair_stories_by_ps_number(ps_number, limit=limit)
+
+    query_embedding = await agenerate_embedding(query)
+    return await db.search_repair_stories(
+        query_embedding=query_embedding,
+        ps_number=ps_number,
+        match_threshold=0.2,
+        limit=limit
+    )
+
+
+@registry.register_async("search_parts_semantic")
+async def asearch_parts_semantic(
+    query: str,
+    appliance_type: str | None = None,
+    limit: int = 10
+) -> list[dict]:
+    """Async version of search_parts_semantic."""
+    if not query or query.strip() == "":
+        return []
+
+    db = await get_async_supabase_client()
+
+    try:
+        query_embedding = await agenerate_embedding(query)
+    except Exception as e:
+        logger.warning("Failed to generate embedding for query: %s", e)
+        return []
+
+    return await db.search_parts_semantic(
+        query_embedding=query_embedding,
+        appliance_type=appliance_type,
+        match_threshold=0.4,
+        limit=limit
+    )
+
+
+@registry.register_async("search_reviews")
+async def asearch_reviews(
+    query: str,
+    ps_number: str,
+    limit: int = 5
+) -> list[dict]:
+    """Async version of search_reviews."""
+    if not ps_number:
+        return []
+
+    db = await get_async_supabase_client()
+
+    if not query or query.strip() == "":
+        return await db.get_reviews_by_ps_number(ps_number, limit=limit)
+
+    try:
+        query_embedding = await agenerate_embedding(query)
+    except Exception as e:
+        logger.warning("Failed to generate embedding for query: %s", e)
+        return []
+
+    return await db.search_reviews(
+        query_embedding=query_embedding,
+        ps_number=ps_number,
+        match_threshold=0.2,
+        limit=limit
+    )
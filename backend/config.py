@@ -25,6 +25,78 @@ class Settings:
     # Embedding model (local, matches database schema)
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
     EMBEDDING_DIM: int = 384
+    # Query embedding cache (see agent_v2/embedding_cache.py); PATH persists it across restarts
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000"))
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", "")
+    # Micro-batching of concurrent encodes (see agent_v2/embedding_batcher.py)
+    EMBEDDING_BATCH_ENABLED: bool = os.getenv("EMBEDDING_BATCH_ENABLED", "true").lower() == "true"
+    EMBEDDING_BATCH_MAX_SIZE: int = int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "32"))
+    EMBEDDING_BATCH_WINDOW_MS: float = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+    # Load and warm the model at startup; /health reports not ready until done
+    EMBEDDING_WARMUP_ENABLED: bool = os.getenv("EMBEDDING_WARMUP_ENABLED", "true").lower() == "true"
+
+    # Per-part Q&A/review/story search: "supabase" (RPC) or "local" (see db/vector_store.py)
+    VECTOR_STORE_BACKEND: str = os.getenv("VECTOR_STORE_BACKEND", "supabase")
+    VECTOR_STORE_DIR: str = os.getenv("VECTOR_STORE_DIR", "vector_index")
+
+    # Pooled headless Chrome for live scraping (see agent_v2/browser_pool.py)
+    BROWSER_POOL_SIZE: int = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+    BROWSER_POOL_CHECKOUT_TIMEOUT: float = float(os.getenv("BROWSER_POOL_CHECKOUT_TIMEOUT", "30"))
+    # Recycle a browser after this many scrapes, or once it uses more memory (0 disables)
+    BROWSER_POOL_MAX_PAGES: int = int(os.getenv("BROWSER_POOL_MAX_PAGES", "50"))
+    BROWSER_POOL_MAX_RSS_MB: float = float(os.getenv("BROWSER_POOL_MAX_RSS_MB", "1024"))
+
+    # Persist live scrapes to the database in the background (see agent_v2/scrape_writeback.py)
+    SCRAPE_WRITEBACK_ENABLED: bool = os.getenv("SCRAPE_WRITEBACK_ENABLED", "true").lower() == "true"
+    # PS numbers PartSelect has no page for are answered from memory this long
+    SCRAPE_MISSING_TTL_SECONDS: float = float(os.getenv("SCRAPE_MISSING_TTL_SECONDS", "3600"))
+    SCRAPE_MISSING_MAX_ENTRIES: int = int(os.getenv("SCRAPE_MISSING_MAX_ENTRIES", "10000"))
+
+    # Session storage: "memory" (single worker) or "redis" (shared across workers)
+    SESSION_STORE: str = os.getenv("SESSION_STORE", "memory")
+    SESSION_MAX_ENTRIES: int = int(os.getenv("SESSION_MAX_ENTRIES", "10000"))
+    SESSION_TTL_SECONDS: int = int(os.getenv("SESSION_TTL_SECONDS", "86400"))
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # Answer cache (repeated questions skip the agent entirely)
+    ANSWER_CACHE_ENABLED: bool = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+    ANSWER_CACHE_MAX_ENTRIES: int = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "2000"))
+    ANSWER_CACHE_TTL_SECONDS: int = int(os.getenv("ANSWER_CACHE_TTL_SECONDS", "3600"))
+    ANSWER_CACHE_SIMILARITY: float = float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.92"))
+
+    # Tool result cache (shared across requests, see tools/registry.py)
+    TOOL_CACHE_ENABLED: bool = os.getenv("TOOL_CACHE_ENABLED", "true").lower() == "true"
+
+    # Async database access (tools await a pooled keep-alive HTTP client)
+    ASYNC_DB_ENABLED: bool = os.getenv("ASYNC_DB_ENABLED", "true").lower() == "true"
+    DB_POOL_MAX_CONNECTIONS: int = int(os.getenv("DB_POOL_MAX_CONNECTIONS", "100"))
+    DB_POOL_MAX_KEEPALIVE: int = int(os.getenv("DB_POOL_MAX_KEEPALIVE", "20"))
+    DB_TIMEOUT_SECONDS: float = float(os.getenv("DB_TIMEOUT_SECONDS", "30"))
+
+    # In-process parts catalog (part lookups and searches skip Supabase, see db/parts_catalog.py)
+    PARTS_CATALOG_ENABLED: bool = os.getenv("PARTS_CATALOG_ENABLED", "false").lower() == "true"
+    # parts.csv to load instead of the database (e.g. data/parts.csv)
+    PARTS_CATALOG_SNAPSHOT: str = os.getenv("PARTS_CATALOG_SNAPSHOT", "")
+    PARTS_CATALOG_REFRESH_SECONDS: float = float(os.getenv("PARTS_CATALOG_REFRESH_SECONDS", "900"))
+
+    # Entity prefetch (identifier lookups start as soon as the answer cache misses)
+    PREFETCH_ENABLED: bool = os.getenv("PREFETCH_ENABLED", "true").lower() == "true"
+    PREFETCH_MAX_LOOKUPS: int = int(os.getenv("PREFETCH_MAX_LOOKUPS", "12"))
+
+    # Fast-path router (canonical intents skip the ReAct executor)
+    FAST_PATH_ENABLED: bool = os.getenv("FAST_PATH_ENABLED", "true").lower() == "true"
+    # Fast-path intents answered from a template instead of the synthesizer LLM
+    TEMPLATE_SYNTHESIS_INTENTS: list[str] = [
+        intent.strip() for intent in os.getenv(
+            "TEMPLATE_SYNTHESIS_INTENTS",
+            "part_lookup,price_availability,compatibility,compatible_models,symptom_list",
+        ).split(",") if intent.strip()
+    ]
+
+    # Logging (see logging_config.py) - debug output is off unless enabled here
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")
 
     # API settings
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
@@ -1,4 +1,29 @@
 """Database client and utilities."""
 from .supabase_client import get_supabase_client, SupabaseClient
+from .async_supabase_client import (
+    get_async_supabase_client,
+    close_async_supabase_client,
+    AsyncSupabaseClient,
+)
+from .parts_catalog import (
+    init_parts_catalog,
+    get_parts_catalog,
+    close_parts_catalog,
+    PartsCatalog,
+)
+from .vector_store import get_vector_store, init_vector_stores, LocalVectorStore
 
-__all__ = ["get_supabase_client", "SupabaseClient"]
+__all__ = [
+    "get_supabase_client",
+    "SupabaseClient",
+    "get_async_supabase_client",
+    "close_async_supabase_client",
+    "AsyncSupabaseClient",
+    "init_parts_catalog",
+    "get_parts_catalog",
+    "close_parts_catalog",
+    "PartsCatalog",
+    "get_vector_store",
+    "init_vector_stores",
+    "LocalVectorStore",
+]
@@ -0,0 +1,287 @@
+"""
+Async Supabase client for database operations.
+
+Runs the same queries as SupabaseClient (queries.py), but every request is
+awaited over one shared keep-alive HTTP connection pool, so concurrent chats
+don't block the event loop (or queue up behind the default thread pool) on
+database round trips.
+"""
+import logging
+import asyncio
+import httpx
+from supabase import acreate_client, AsyncClient, AsyncClientOptions
+from backend.config import get_settings
+from backend.db import queries
+from backend.metrics import timed, timed_methods
+
+logger = logging.getLogger(__name__)
+
+
+@timed_methods("db")
+class AsyncSupabaseClient:
+    """Async wrapper around Supabase client with typed query methods."""
+
+    def __init__(self, client: AsyncClient, http_client: httpx.AsyncClient | None = None):
+        self.client = client
+        # Pooled HTTP client shared by all PostgREST/RPC requests
+        self.http_client = http_client
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+    async def _run(self, plan: queries.Plan):
+        return await queries.run_async(plan, self._perform)
+
+    async def _perform(self, request):
+        if isinstance(request, queries.SymptomMatch):
+            return await self._llm_match_symptom(request)
+        if isinstance(request, queries.CatalogUpsert):
+            # Rebuilds the catalog's indexes - keep it off the event loop
+            return await asyncio.to_thread(request.run)
+        return await request.execute()
+
+    @timed("llm", "symptom_match")
+    async def _llm_match_symptom(self, request: queries.SymptomMatch) -> str | None:
+        """Use LLM to find the best matching symptom from available options."""
+        settings = get_settings()
+        try:
+            client = _get_anthropic_client(settings.ANTHROPIC_API_KEY)
+            response = await client.messages.create(
+                model=settings.HAIKU_MODEL,
+                max_tokens=100,
+                messages=[{"role": "user", "content": queries.symptom_match_prompt(request)}]
+            )
+            return queries.parse_symptom_match(request, response.content[0].text)
+        except Exception as e:
+            logger.warning("LLM symptom matching failed: %s", e)
+            return None
+
+    # =========================================================================
+    # Parts queries
+    # =========================================================================
+
+    async def get_part_by_ps_number(self, ps_number: str) -> dict | None:
+        """Get a part by its PS number."""
+        return await self._run(queries.get_part_by_ps_number(self.client, ps_number))
+
+    async def find_part(
+        self,
+        query: str | None = None,
+        appliance_type: str | None = None,
+        part_type: str | None = None,
+        brand: str | None = None,
+        max_price: float | None = None,
+        in_stock_only: bool = False,
+        limit: int = 10
+    ) -> dict:
+        """Search for parts by manufacturer number, text, or filters (see queries.find_part)."""
+        return await self._run(queries.find_part(
+            self.client, query, appliance_type, part_type, brand, max_price, in_stock_only, limit
+        ))
+
+    async def search_parts(
+        self,
+        query: str | None = None,
+        appliance_type: str | None = None,
+        part_type: str | None = None,
+        brand: str | None = None,
+        max_price: float | None = None,
+        in_stock_only: bool = False,
+        limit: int = 10
+    ) -> list[dict]:
+        """Search parts with various filters."""
+        return await self._run(queries.search_parts(
+            self.client, query, appliance_type, part_type, brand, max_price, in_stock_only, limit
+        ))
+
+    async def validate_part(self, ps_number: str) -> dict:
+        """Check if a PS number exists in the database."""
+        return await self._run(queries.validate_part(self.client, ps_number))
+
+    async def find_by_manufacturer_number(self, manufacturer_number: str) -> dict | None:
+        """Find a part by its manufacturer part number."""
+        return await self._run(queries.find_by_manufacturer_number(self.client, manufacturer_number))
+
+    async def find_by_manufacturer_number_partial(self, manufacturer_number: str, limit: int = 5) -> list[dict]:
+        """Find parts by partial manufacturer part number match."""
+        return await self._run(queries.find_by_manufacturer_number_partial(self.client, manufacturer_number, limit))
+
+    # =========================================================================
+    # Model compatibility queries
+    # =========================================================================
+
+    async def check_compatibility(self, ps_number: str, model_number: str) -> dict:
+        """Check if a part is compatible with a model."""
+        return await self._run(queries.check_compatibility(self.client, ps_number, model_number))
+
+    async def get_compatible_parts(
+        self,
+        model_number: str,
+        part_type: str | None = None,
+        brand: str | None = None,
+        limit: int = 200
+    ) -> list[dict]:
+        """Get all parts compatible with a model."""
+        return await self._run(queries.get_compatible_parts(self.client, model_number, part_type, brand, limit))
+
+    async def validate_model(self, model_number: str) -> dict:
+        """Check if a model exists in our compatibility data."""
+        return await self._run(queries.validate_model(self.client, model_number))
+
+    async def find_model_fuzzy(self, model_input: str, limit: int = 5) -> list[dict]:
+        """Find models with fuzzy/partial matching."""
+        return await self._run(queries.find_model_fuzzy(self.client, model_input, limit))
+
+    async def get_compatible_models(
+        self,
+        ps_number: str,
+        brand: str | None = None,
+        limit: int = 5000
+    ) -> list[dict]:
+        """Get all models compatible with a specific part (paged past Supabase's row limit)."""
+        return await self._run(queries.get_compatible_models(self.client, ps_number, brand, limit))
+
+    # =========================================================================
+    # Repair symptoms and instructions queries
+    # =========================================================================
+
+    async def get_symptoms(self, appliance_type: str, symptom: str | None = None) -> list[dict]:
+        """Get symptoms for an appliance type, or the one best matching `symptom`."""
+        return await self._run(queries.get_symptoms(self.client, appliance_type, symptom))
+
+    async def get_repair_instructions(
+        self,
+        appliance_type: str,
+        symptom: str,
+        part_type: str | None = None
+    ) -> dict:
+        """Get repair instructions for a symptom using LLM-based matching."""
+        return await self._run(queries.get_repair_instructions(self.client, appliance_type, symptom, part_type))
+
+    # =========================================================================
+    # Vector search queries (semantic)
+    # =========================================================================
+
+    async def search_qna(
+        self,
+        query_embedding: list[float],
+        ps_number: str | None = None,
+        match_threshold: float = 0.5,
+        limit: int = 5
+    ) -> list[dict]:
+        """Search Q&A by semantic similarity, optionally filtered by part number."""
+        return await self._run(queries.search_qna(self.client, query_embedding, ps_number, match_threshold, limit))
+
+    async def search_repair_stories(
+        self,
+        query_embedding: list[float],
+        ps_number: str | None = None,
+        match_threshold: float = 0.5,
+        limit: int = 5
+    ) -> list[dict]:
+        """Search repair stories by semantic similarity, optionally filtered by part number."""
+        return await self._run(queries.search_repair_stories(self.client, query_embedding, ps_number, match_threshold, limit))
+
+    async def search_parts_semantic(
+        self,
+        query_embedding: list[float],
+        appliance_type: str | None = None,
+        match_threshold: float = 0.5,
+        limit: int = 10
+    ) -> list[dict]:
+        """Search parts by semantic similarity."""
+        return await self._run(queries.search_parts_semantic(self.client, query_embedding, appliance_type, match_threshold, limit))
+
+    async def get_qna_by_ps_number(self, ps_number: str, limit: int = 10) -> list[dict]:
+        """Get all Q&A for a specific part without semantic search."""
+        return await self._run(queries.get_qna_by_ps_number(self.client, ps_number, limit))
+
+    async def get_repair_stories_by_ps_number(self, ps_number: str, limit: int = 10) -> list[dict]:
+        """Get all repair stories for a specific part without semantic search."""
+        return await self._run(queries.get_repair_stories_by_ps_number(self.client, ps_number, limit))
+
+    async def search_reviews(
+        self,
+        query_embedding: list[float],
+        ps_number: str | None = None,
+        match_threshold: float = 0.5,
+        limit: int = 5
+    ) -> list[dict]:
+        """Search reviews by semantic similarity."""
+        return await self._run(queries.search_reviews(self.client, query_embedding, ps_number, match_threshold, limit))
+
+    async def get_reviews_by_ps_number(self, ps_number: str, limit: int = 10) -> list[dict]:
+        """Get all reviews for a specific part without semantic search."""
+        return await self._run(queries.get_reviews_by_ps_number(self.client, ps_number, limit))
+
+
+# =============================================================================
+# Process-wide instance
+# =============================================================================
+
+# Pooled connections belong to the event loop that opened them, so the
+# clients are cached per loop (one loop per server process in practice)
+_async_client: AsyncSupabaseClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+_anthropic_client = None
+_anthropic_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_anthropic_client(api_key: str):
+    """Shared AsyncAnthropic client for the running loop (keeps its own connection pool)."""
+    global _anthropic_client, _anthropic_client_loop
+    loop = asyncio.get_running_loop()
+    if _anthropic_client is None or _anthropic_client_loop is not loop:
+        import anthropic
+        _anthropic_client = anthropic.AsyncAnthropic(api_key=api_key)
+        _anthropic_client_loop = loop
+    return _anthropic_client
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Keep-alive connection pool shared by all PostgREST/RPC requests."""
+    settings = get_settings()
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.DB_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.DB_POOL_MAX_KEEPALIVE,
+        ),
+        timeout=settings.DB_TIMEOUT_SECONDS,
+        follow_redirects=True,
+    )
+
+
+async def get_async_supabase_client() -> AsyncSupabaseClient:
+    """Get cached async Supabase client instance."""
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is not None and _async_client_loop is loop:
+        return _async_client
+
+    settings = get_settings()
+    http_client = _create_http_client()
+    client = await acreate_client(
+        settings.SUPABASE_URL,
+        settings.SUPABASE_KEY,
+        options=AsyncClientOptions(httpx_client=http_client),
+    )
+
+    # Another task may have finished creating the client while we awaited
+    if _async_client is not None and _async_client_loop is loop:
+        await http_client.aclose()
+        return _async_client
+
+    _async_client = AsyncSupabaseClient(client, http_client)
+    _async_client_loop = loop
+    return _async_client
+
+
+async def close_async_supabase_client() -> None:
+    """Close the pooled connections (call on shutdown)."""
+    global _async_client, _async_client_loop
+    client, loop = _async_client, _async_client_loop
+    _async_client, _async_client_loop = None, None
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
@@ -0,0 +1,496 @@
+"""
+In-process parts catalog.
+
+The whole `parts` table (~7k rows scraped, ~100k at full catalog scale) fits
+comfortably in memory, so part lookups can skip the Supabase round trip.
+When enabled, SupabaseClient and AsyncSupabaseClient answer these from here:
+
+- get_part_by_ps_number / validate_part   → hash index on ps_number
+- find_by_manufacturer_number              → hash index on the normalized
+                                             manufacturer number ("WPW-10321304" → "WPW10321304")
+- find_by_manufacturer_number_partial      → substring scan over that index's keys
+- search_parts / find_part                 → inverted indexes on appliance_type,
+                                             part_type and brand, plus a token
+                                             index over part_name/part_description
+
+Filters keep PostgREST semantics (eq on appliance_type/availability, ilike
+substring on part_type/brand/text, lte on price), and results come back with
+the same columns the remote queries select.
+
+The catalog loads at startup from the database (paged) or from a parts.csv
+snapshot, and a daemon thread reloads it every PARTS_CATALOG_REFRESH_SECONDS.
+A reload builds new indexes and swaps them in one assignment, so readers never
+see a half-built catalog. upsert() applies single-row writes in between, and
+reloads keep them until the source returns the same values (a parts.csv
+snapshot never does, so live-scraped parts survive its refreshes).
+When a reload changes any rows, init_parts_catalog's on_change callback gets
+their PS numbers, so the API can drop answers and tool results built from the
+old rows.
+"""
+import csv
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from backend.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Columns returned by each remote query (SupabaseClient select lists)
+PART_COLUMNS = (
+    "ps_number", "part_name", "part_type", "manufacturer_part_number", "part_manufacturer",
+    "part_price", "part_description", "install_difficulty", "install_time", "install_video_url",
+    "part_url", "average_rating", "num_reviews", "appliance_type", "brand", "manufactured_for",
+    "availability", "replaces_parts",
+)
+FIND_PART_COLUMNS = (
+    "ps_number", "part_name", "part_type", "manufacturer_part_number",
+    "part_price", "average_rating", "availability", "brand", "appliance_type",
+)
+SEARCH_COLUMNS = (
+    "ps_number", "part_name", "part_type", "part_price", "average_rating", "num_reviews",
+    "availability", "brand", "appliance_type", "part_url", "manufacturer_part_number",
+)
+MANUFACTURER_COLUMNS = (
+    "ps_number", "part_name", "manufacturer_part_number", "availability", "appliance_type",
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_MANUFACTURER_NOISE = re.compile(r"[\s\-./]")
+
+# Supabase caps a select at 1000 rows
+_PAGE_SIZE = 1000
+
+# Memoized substring lookups per catalog generation
+_SUBSTRING_CACHE_SIZE = 4096
+
+
+def normalize_manufacturer_number(value: str | None) -> str:
+    """Upper-case and drop separators: " wpw-10321304 " → "WPW10321304"."""
+    return _MANUFACTURER_NOISE.sub("", value).upper() if value else ""
+
+
+def _tokens(text: str | None) -> set[str]:
+    return set(_TOKEN_PATTERN.findall(text.lower())) if text else set()
+
+
+def _project(row: dict, columns: tuple[str, ...]) -> dict:
+    return {c: row.get(c) for c in columns}
+
+
+@dataclass
+class _Indexes:
+    """One immutable generation of the catalog. Row ids are positions in `rows`."""
+    rows: list[dict] = field(default_factory=list)
+    by_ps_number: dict[str, int] = field(default_factory=dict)
+    by_manufacturer: dict[str, list[int]] = field(default_factory=dict)
+    by_appliance_type: dict[str, list[int]] = field(default_factory=dict)
+    by_part_type: dict[str, list[int]] = field(default_factory=dict)
+    by_brand: dict[str, list[int]] = field(default_factory=dict)
+    by_token: dict[str, list[int]] = field(default_factory=dict)
+    # Lower-cased part_name + part_description, for the final substring check
+    text: list[str] = field(default_factory=list)
+    # (index name, needle) -> row ids whose key contains needle; reset per generation
+    substring_cache: dict[tuple[str, str], frozenset[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, rows: list[dict]) -> "_Indexes":
+        # Last row wins on duplicate ps_numbers, as in the loader's upsert
+        unique: dict[str, dict] = {}
+        for row in rows:
+            if row.get("ps_number"):
+                unique[row["ps_number"]] = _project(row, PART_COLUMNS)
+
+        indexes = cls(rows=list(unique.values()))
+        manufacturer, appliance, part_type, brand, token = (defaultdict(list) for _ in range(5))
+        for i, row in enumerate(indexes.rows):
+            indexes.by_ps_number[row["ps_number"]] = i
+            key = normalize_manufacturer_number(row.get("manufacturer_part_number"))
+            if key:
+                manufacturer[key].append(i)
+            appliance[(row.get("appliance_type") or "").lower()].append(i)
+            part_type[(row.get("part_type") or "").lower()].append(i)
+            brand[(row.get("brand") or "").lower()].append(i)
+            text = f"{row.get('part_name') or ''}\n{row.get('part_description') or ''}".lower()
+            indexes.text.append(text)
+            for t in _tokens(text):
+                token[t].append(i)
+
+        indexes.by_manufacturer = dict(manufacturer)
+        indexes.by_appliance_type = dict(appliance)
+        indexes.by_part_type = dict(part_type)
+        indexes.by_brand = dict(brand)
+        indexes.by_token = dict(token)
+        return indexes
+
+
+class PartsCatalog:
+    """Hash- and inverted-indexed copy of the parts table."""
+
+    def __init__(self, rows: list[dict] | None = None):
+        self._indexes = _Indexes.build(rows or [])
+        self._write_lock = threading.Lock()
+        # ps_number -> upserted columns the loaded rows don't reflect yet
+        self._upserts: dict[str, dict] = {}
+        self.loaded_at = time.time() if rows is not None else None
+
+    def __len__(self) -> int:
+        return len(self._indexes.rows)
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    def replace(self, rows: list[dict]) -> None:
+        """Rebuild every index from `rows` plus pending upserts and swap the new generation in."""
+        with self._write_lock:
+            self._indexes = _Indexes.build(self._apply_upserts(rows))
+            self.loaded_at = time.time()
+
+    def _apply_upserts(self, rows: list[dict]) -> list[dict]:
+        """Overlay upserts onto freshly loaded rows, forgetting those the source has caught up with."""
+        if not self._upserts:
+            return rows
+        merged = {row["ps_number"]: row for row in rows if row.get("ps_number")}
+        for ps_number, columns in list(self._upserts.items()):
+            loaded = merged.get(ps_number)
+            if loaded is not None and all(loaded.get(c) == v for c, v in columns.items()):
+                del self._upserts[ps_number]
+            else:
+                merged[ps_number] = {**(loaded or {}), **columns}
+        return list(merged.values())
+
+    def upsert(self, rows: list[dict]) -> None:
+        """
+        Insert or update a few rows (e.g. after a live scrape is written back).
+
+        Rebuilds the indexes from a copy, so it is meant for occasional writes;
+        bulk changes should go through replace(). The rows are reapplied on
+        top of later reloads until the source has the same values.
+        """
+        with self._write_lock:
+            merged = {r["ps_number"]: r for r in self._indexes.rows}
+            for row in rows:
+                if row.get("ps_number"):
+                    merged[row["ps_number"]] = {**merged.get(row["ps_number"], {}), **row}
+                    columns = {c: v for c, v in row.items() if c in PART_COLUMNS}
+                    self._upserts[row["ps_number"]] = {**self._upserts.get(row["ps_number"], {}), **columns}
+            self._indexes = _Indexes.build(list(merged.values()))
+
+    def load_from_db(self, client) -> int:
+        """Page the parts table in from Supabase. Returns the row count."""
+        rows = []
+        offset = 0
+        while True:
+            result = (
+                client.table("parts")
+                .select(", ".join(PART_COLUMNS))
+                .order("ps_number")
+                .range(offset, offset + _PAGE_SIZE - 1)
+                .execute()
+            )
+            batch = result.data or []
+            rows.extend(batch)
+            if len(batch) < _PAGE_SIZE:
+                break
+            offset += _PAGE_SIZE
+        self.replace(rows)
+        return len(self)
+
+    def load_from_snapshot(self, path: str | Path) -> int:
+        """Load a parts.csv snapshot, cleaned the way database/load_data.py cleans it."""
+        from database.load_data import clean_decimal
+
+        with open(path, encoding="utf-8") as f:
+            rows = [
+                {
+                    **{c: row.get(c) or None for c in PART_COLUMNS},
+                    "part_price": clean_decimal(row.get("part_price")),
+                    "average_rating": clean_decimal(row.get("average_rating")),
+                    "num_reviews": int(row.get("num_reviews") or 0),
+                }
+                for row in csv.DictReader(f)
+            ]
+        self.replace(rows)
+        return len(self)
+
+    # =========================================================================
+    # Lookups (same return shapes as SupabaseClient)
+    # =========================================================================
+
+    def get_part_by_ps_number(self, ps_number: str) -> dict | None:
+        indexes = self._indexes
+        i = indexes.by_ps_number.get(ps_number)
+        return dict(indexes.rows[i]) if i is not None else None
+
+    def validate_part(self, ps_number: str) -> dict:
+        indexes = self._indexes
+        i = indexes.by_ps_number.get(ps_number)
+        if i is None:
+            return {"found": False}
+        row = indexes.rows[i]
+        return {"found": True, "part_name": row.get("part_name"), "availability": row.get("availability")}
+
+    def find_by_manufacturer_number(self, manufacturer_number: str) -> dict | None:
+        indexes = self._indexes
+        ids = indexes.by_manufacturer.get(normalize_manufacturer_number(manufacturer_number))
+        return _project(indexes.rows[ids[0]], MANUFACTURER_COLUMNS) if ids else None
+
+    def find_by_manufacturer_number_partial(self, manufacturer_number: str, limit: int = 5) -> list[dict]:
+        indexes = self._indexes
+        return [
+            _project(indexes.rows[i], MANUFACTURER_COLUMNS)
+            for i in self._manufacturer_substring(indexes, manufacturer_number, limit)
+        ]
+
+    def search_parts(
+        self,
+        query: str | None = None,
+        appliance_type: str | None = None,
+        part_type: str | None = None,
+        brand: str | None = None,
+        max_price: float | None = None,
+        in_stock_only: bool = False,
+        limit: int = 10
+    ) -> list[dict]:
+        indexes = self._indexes
+        ids = self._filter(indexes, query, appliance_type, part_type, brand, max_price, in_stock_only, limit)
+        return [_project(indexes.rows[i], SEARCH_COLUMNS) for i in ids]
+
+    def find_part(
+        self,
+        query: str | None = None,
+        appliance_type: str | None = None,
+        part_type: str | None = None,
+        brand: str | None = None,
+        max_price: float | None = None,
+        in_stock_only: bool = False,
+        limit: int = 10
+    ) -> dict:
+        if not query and not any([appliance_type, part_type, brand]):
+            return {"found": False, "message": "Please provide a search query or filters"}
+
+        indexes = self._indexes
+        if query:
+            ids = indexes.by_manufacturer.get(normalize_manufacturer_number(query))
+            if ids:
+                return {
+                    "found": True,
+                    "match_type": "exact_manufacturer_number",
+                    "count": 1,
+                    "parts": [_project(indexes.rows[ids[0]], FIND_PART_COLUMNS)],
+                }
+            ids = self._manufacturer_substring(indexes, query, 5)
+            if ids:
+                return {
+                    "found": True,
+                    "match_type": "partial_manufacturer_number",
+                    "count": len(ids),
+                    "parts": [_project(indexes.rows[i], FIND_PART_COLUMNS) for i in ids],
+                }
+
+        ids = self._filter(indexes, query, appliance_type, part_type, brand, max_price, in_stock_only, limit)
+        if ids:
+            return {
+                "found": True,
+                "match_type": "search",
+                "count": len(ids),
+                "parts": [_project(indexes.rows[i], FIND_PART_COLUMNS) for i in ids],
+            }
+        return {"found": False, "message": "No parts found matching your criteria"}
+
+    def stats(self) -> dict:
+        indexes = self._indexes
+        return {
+            "parts": len(indexes.rows),
+            "manufacturer_numbers": len(indexes.by_manufacturer),
+            "tokens": len(indexes.by_token),
+            "loaded_at": self.loaded_at,
+        }
+
+    # =========================================================================
+    # Index helpers
+    # =========================================================================
+
+    @staticmethod
+    def _manufacturer_substring(indexes: _Indexes, value: str, limit: int) -> list[int]:
+        needle = normalize_manufacturer_number(value)
+        if not needle:
+            return []
+        ids = []
+        for key, key_ids in indexes.by_manufacturer.items():
+            if needle in key:
+                ids.extend(key_ids)
+                if len(ids) >= limit:
+                    break
+        return sorted(ids)[:limit]
+
+    @staticmethod
+    def _substring_postings(indexes: _Indexes, name: str, needle: str) -> frozenset[int]:
+        """Row ids whose `name` index key contains `needle` (ilike '%needle%'), memoized."""
+        cached = indexes.substring_cache.get((name, needle))
+        if cached is not None:
+            return cached
+        ids = set()
+        for key, key_ids in getattr(indexes, name).items():
+            if needle in key:
+                ids.update(key_ids)
+        cached = frozenset(ids)
+        if len(indexes.substring_cache) >= _SUBSTRING_CACHE_SIZE:
+            indexes.substring_cache.clear()
+        indexes.substring_cache[(name, needle)] = cached
+        return cached
+
+    def _filter(
+        self,
+        indexes: _Indexes,
+        query: str | None,
+        appliance_type: str | None,
+        part_type: str | None,
+        brand: str | None,
+        max_price: float | None,
+        in_stock_only: bool,
+        limit: int,
+    ) -> list[int]:
+        candidates: set[int] | None = None
+
+        def narrow(ids) -> None:
+            nonlocal candidates
+            candidates = set(ids) if candidates is None else candidates.intersection(ids)
+
+        if appliance_type:
+            narrow(indexes.by_appliance_type.get(appliance_type.lower(), ()))
+        if part_type:
+            narrow(self._substring_postings(indexes, "by_part_type", part_type.lower()))
+        if brand:
+            narrow(self._substring_postings(indexes, "by_brand", brand.lower()))
+
+        needle = query.lower() if query else None
+        if needle:
+            # Every alphanumeric run of the query lies inside one token of a
+            # matching row, so the token index narrows without losing matches;
+            # the substring check below makes it exact
+            for word in _TOKEN_PATTERN.findall(needle):
+                if candidates is not None and not candidates:
+                    break
+                narrow(self._substring_postings(indexes, "by_token", word))
+
+        ids = sorted(candidates) if candidates is not None else range(len(indexes.rows))
+        matches = []
+        for i in ids:
+            row = indexes.rows[i]
+            if max_price and (row.get("part_price") is None or row["part_price"] > max_price):
+                continue
+            if in_stock_only and row.get("availability") != "In Stock":
+                continue
+            if needle and needle not in indexes.text[i]:
+                continue
+            matches.append(i)
+            if len(matches) >= limit:
+                break
+        return matches
+
+
+# =============================================================================
+# Process-wide catalog
+# =============================================================================
+
+_catalog: PartsCatalog | None = None
+_refresh_stop: threading.Event | None = None
+
+
+def _changed_ps_numbers(old: _Indexes, new: _Indexes) -> set[str]:
+    """PS numbers added, removed or changed between two catalog generations."""
+    changed = set(old.by_ps_number.keys() ^ new.by_ps_number.keys())
+    for ps_number, i in new.by_ps_number.items():
+        j = old.by_ps_number.get(ps_number)
+        if j is not None and old.rows[j] != new.rows[i]:
+            changed.add(ps_number)
+    return changed
+
+
+def _load(catalog: PartsCatalog) -> int:
+    settings = get_settings()
+    if settings.PARTS_CATALOG_SNAPSHOT:
+        return catalog.load_from_snapshot(settings.PARTS_CATALOG_SNAPSHOT)
+    from backend.db.supabase_client import get_supabase_client
+    return catalog.load_from_db(get_supabase_client().client)
+
+
+def _refresh_loop(
+    catalog: PartsCatalog,
+    interval: float,
+    stop: threading.Event,
+    on_change: Callable[[set[str]], None] | None,
+) -> None:
+    while not stop.wait(interval):
+        previous = catalog._indexes
+        try:
+            count = _load(catalog)
+        except Exception as e:
+            # Keep serving the previous generation
+            logger.warning("Parts catalog refresh failed: %s", e)
+            continue
+        changed = _changed_ps_numbers(previous, catalog._indexes)
+        logger.info("Parts catalog refreshed: %d parts (%d changed)", count, len(changed))
+        if changed and on_change is not None:
+            try:
+                on_change(changed)
+            except Exception as e:
+                logger.warning("Parts catalog change callback failed: %s", e)
+
+
+def init_parts_catalog(on_change: Callable[[set[str]], None] | None = None) -> PartsCatalog | None:
+    """
+    Load the catalog and start its refresh thread (call once at startup).
+
+    Args:
+        on_change: Called from the refresh thread with the PS numbers a reload
+                   added, removed or changed (not called when nothing changed)
+
+    Returns None if PARTS_CATALOG_ENABLED is off or the initial load fails,
+    in which case the clients keep querying Supabase.
+    """
+    global _catalog, _refresh_stop
+    settings = get_settings()
+    if not settings.PARTS_CATALOG_ENABLED:
+        return None
+    if _catalog is not None:
+        return _catalog
+
+    catalog = PartsCatalog()
+    start = time.perf_counter()
+    try:
+        count = _load(catalog)
+    except Exception as e:
+        logger.warning("Parts catalog load failed, using remote queries: %s", e)
+        return None
+    logger.info("Parts catalog loaded: %d parts in %.2fs", count, time.perf_counter() - start)
+
+    _catalog = catalog
+    if settings.PARTS_CATALOG_REFRESH_SECONDS > 0:
+        _refresh_stop = threading.Event()
+        threading.Thread(
+            target=_refresh_loop,
+            args=(catalog, settings.PARTS_CATALOG_REFRESH_SECONDS, _refresh_stop, on_change),
+            name="parts-catalog-refresh",
+            daemon=True,
+        ).start()
+    return catalog
+
+
+def get_parts_catalog() -> PartsCatalog | None:
+    """The loaded catalog, or None if it is disabled or not loaded yet."""
+    return _catalog
+
+
+def close_parts_catalog() -> None:
+    """Stop the refresh thread and drop the catalog (call on shutdown)."""
+    global _catalog, _refresh_stop
+    if _refresh_stop is not None:
+        _refresh_stop.set()
+    _catalog, _refresh_stop = None, None
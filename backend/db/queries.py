@@ -0,0 +1,688 @@
+"""
+Database queries shared by SupabaseClient and AsyncSupabaseClient.
+
+Each query is written once, as a plan: a generator that yields the requests
+it needs and is sent back their results.
+
+    def validate_model(client, model_number):
+        result = yield client.table("model_compatibility").select(...).eq(...)
+        return {"found": bool(result.data), ...}
+
+A request is a PostgREST request builder (anything with .execute()), a
+SymptomMatch for the LLM or a CatalogUpsert for the in-process catalog. SupabaseClient runs plans with run_sync and
+AsyncSupabaseClient with run_async, so the clients differ only in how a
+request is executed - the filters, fallbacks and result shaping can't drift
+apart. An exception raised by a request is thrown into the plan at its
+yield, so plans handle errors with an ordinary try/except.
+
+The agent's SQL tools drive their resolution logic the same way (see
+agent_v2/tools/sql_tools.py).
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generator
+from backend.db.parts_catalog import (
+    MANUFACTURER_COLUMNS,
+    PART_COLUMNS,
+    PartsCatalog,
+    get_parts_catalog,
+)
+from backend.db.vector_store import get_vector_store
+
+logger = logging.getLogger(__name__)
+
+Plan = Generator[Any, Any, Any]
+
+# Supabase returns at most this many rows per request
+PAGE_SIZE = 1000
+
+
+# =============================================================================
+# Running plans
+# =============================================================================
+
+def run_sync(plan: Plan, perform: Callable[[Any], Any]) -> Any:
+    """Run a plan, executing each request it yields with perform(request)."""
+    send, value = plan.send, None
+    while True:
+        try:
+            request = send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, send = perform(request), plan.send
+        except Exception as e:
+            value, send = e, plan.throw
+
+
+async def run_async(plan: Plan, perform: Callable[[Any], Awaitable[Any]]) -> Any:
+    """run_sync, awaiting perform(request)."""
+    send, value = plan.send, None
+    while True:
+        try:
+            request = send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, send = await perform(request), plan.send
+        except Exception as e:
+            value, send = e, plan.throw
+
+
+# =============================================================================
+# LLM symptom matching
+# =============================================================================
+
+@dataclass
+class SymptomMatch:
+    """Request: ask the LLM which of `options` best matches `user_symptom` (result: str | None)."""
+    user_symptom: str
+    options: list[str]
+
+
+def symptom_match_prompt(request: SymptomMatch) -> str:
+    options = "\n".join(f"- {s}" for s in request.options)
+    return f"""Given the user's problem description, select the BEST matching symptom from the available options.
+
+User's problem: "{request.user_symptom}"
+
+Available symptom options:
+{options}
+
+Respond with ONLY the exact symptom text that best matches, or "NONE" if no option is relevant.
+Your response must be exactly one of the options listed above (copy it exactly) or "NONE"."""
+
+
+def parse_symptom_match(request: SymptomMatch, response_text: str) -> str | None:
+    """The option the LLM picked, or None."""
+    result = response_text.strip()
+
+    # Validate the response is one of the options
+    if result in request.options:
+        return result
+    if result == "NONE":
+        return None
+    # Try to find a close match (LLM might have slightly altered it)
+    result_lower = result.lower()
+    for s in request.options:
+        if s.lower() == result_lower:
+            return s
+    return None
+
+
+# =============================================================================
+# Parts catalog misses
+# =============================================================================
+
+@dataclass
+class CatalogUpsert:
+    """Request: add rows found in the database to the parts catalog (result: None)."""
+    catalog: PartsCatalog
+    rows: list[dict]
+
+    def run(self) -> None:
+        self.catalog.upsert(self.rows)
+
+
+def _catalog_miss(catalog: PartsCatalog, request, columns: tuple[str, ...]) -> Plan:
+    """
+    Rows for an exact lookup the catalog missed, fetched with `request` and added to the catalog.
+
+    The catalog is reloaded every PARTS_CATALOG_REFRESH_SECONDS, so a miss may
+    be a part added since then or written back by another worker process.
+    """
+    try:
+        rows = (yield request).data or []
+    except Exception as e:
+        # The catalog's answer stands
+        logger.warning("Database lookup after a parts catalog miss failed: %s", e)
+        return []
+    if rows:
+        yield CatalogUpsert(catalog, rows)
+    return [{c: row.get(c) for c in columns} for row in rows]
+
+
+# =============================================================================
+# Parts queries
+# =============================================================================
+
+def _first(result) -> dict | None:
+    return result.data[0] if result.data else None
+
+
+def _select_part(client, column: str, value: str):
+    return client.table("parts").select("*").eq(column, value).limit(1)
+
+
+def _filter_parts(q, appliance_type, part_type, brand, max_price, in_stock_only, query):
+    if appliance_type:
+        q = q.eq("appliance_type", appliance_type.lower())
+    if part_type:
+        q = q.ilike("part_type", f"%{part_type}%")
+    if brand:
+        q = q.ilike("brand", f"%{brand}%")
+    if max_price:
+        q = q.lte("part_price", max_price)
+    if in_stock_only:
+        q = q.eq("availability", "In Stock")
+    if query:
+        # Search in part_name and part_description
+        q = q.or_(f"part_name.ilike.%{query}%,part_description.ilike.%{query}%")
+    return q
+
+
+def get_part_by_ps_number(client, ps_number: str) -> Plan:
+    """Get a part by its PS number."""
+    catalog = get_parts_catalog()
+    if catalog is not None:
+        part = catalog.get_part_by_ps_number(ps_number)
+        if part is not None:
+            return part
+        rows = yield from _catalog_miss(catalog, _select_part(client, "ps_number", ps_number), PART_COLUMNS)
+        return rows[0] if rows else None
+
+    return _first((yield _select_part(client, "ps_number", ps_number)))
+
+
+def find_part(client, query, appliance_type, part_type, brand, max_price, in_stock_only, limit) -> Plan:
+    """
+    Search for parts by manufacturer number, text, or filters.
+    Returns PS numbers that can be used with get_part_by_ps_number().
+
+    Search priority:
+    1. Exact manufacturer part number match
+    2. Partial manufacturer part number match
+    3. Text search in part_name/description with filters
+    """
+    catalog = get_parts_catalog()
+    if catalog is not None:
+        return catalog.find_part(query, appliance_type, part_type, brand, max_price, in_stock_only, limit)
+
+    if not query and not any([appliance_type, part_type, brand]):
+        return {"found": False, "message": "Please provide a search query or filters"}
+
+    select_fields = (
+        "ps_number, part_name, part_type, manufacturer_part_number, "
+        "part_price, average_rating, availability, brand, appliance_type"
+    )
+
+    # Try manufacturer part number matches first (if query provided)
+    if query:
+        # Try exact manufacturer part number match
+        result = yield (
+            client.table("parts")
+            .select(select_fields)
+            .eq("manufacturer_part_number", query)
+            .limit(1)
+        )
+        if result.data:
+            return {
+                "found": True,
+                "match_type": "exact_manufacturer_number",
+                "count": 1,
+                "parts": result.data
+            }
+
+        # Try partial manufacturer part number match
+        result = yield (
+            client.table("parts")
+            .select(select_fields)
+            .ilike("manufacturer_part_number", f"%{query}%")
+            .limit(5)
+        )
+        if result.data:
+            return {
+                "found": True,
+                "match_type": "partial_manufacturer_number",
+                "count": len(result.data),
+                "parts": result.data
+            }
+
+    # Fall back to filtered text search
+    q = _filter_parts(
+        client.table("parts").select(select_fields),
+        appliance_type, part_type, brand, max_price, in_stock_only, query,
+    )
+    result = yield q.limit(limit)
+
+    if result.data:
+        return {
+            "found": True,
+            "match_type": "search",
+            "count": len(result.data),
+            "parts": result.data
+        }
+
+    return {"found": False, "message": "No parts found matching your criteria"}
+
+
+def search_parts(client, query, appliance_type, part_type, brand, max_price, in_stock_only, limit) -> Plan:
+    """Search parts with various filters."""
+    catalog = get_parts_catalog()
+    if catalog is not None:
+        return catalog.search_parts(query, appliance_type, part_type, brand, max_price, in_stock_only, limit)
+
+    q = _filter_parts(
+        client.table("parts").select(
+            "ps_number, part_name, part_type, part_price, "
+            "average_rating, num_reviews, availability, brand, appliance_type, "
+            "part_url, manufacturer_part_number"
+        ),
+        appliance_type, part_type, brand, max_price, in_stock_only, query,
+    )
+    result = yield q.limit(limit)
+    return result.data or []
+
+
+def validate_part(client, ps_number: str) -> Plan:
+    """Check if a PS number exists in the database."""
+    catalog = get_parts_catalog()
+    if catalog is not None:
+        result = catalog.validate_part(ps_number)
+        if result["found"]:
+            return result
+        rows = yield from _catalog_miss(catalog, _select_part(client, "ps_number", ps_number), PART_COLUMNS)
+        part = rows[0] if rows else None
+    else:
+        part = _first((yield (
+            client.table("parts")
+            .select("ps_number, part_name, availability")
+            .eq("ps_number", ps_number)
+            .limit(1)
+        )))
+    if part:
+        return {
+            "found": True,
+            "part_name": part.get("part_name"),
+            "availability": part.get("availability")
+        }
+    return {"found": False}
+
+
+def find_by_manufacturer_number(client, manufacturer_number: str) -> Plan:
+    """Find a part by its manufacturer part number."""
+    catalog = get_parts_catalog()
+    if catalog is not None:
+        part = catalog.find_by_manufacturer_number(manufacturer_number)
+        if part is not None:
+            return part
+        rows = yield from _catalog_miss(
+            catalog, _select_part(client, "manufacturer_part_number", manufacturer_number), MANUFACTURER_COLUMNS
+        )
+        return rows[0] if rows else None
+
+    result = yield (
+        client.table("parts")
+        .select("ps_number, part_name, manufacturer_part_number, availability, appliance_type")
+        .eq("manufacturer_part_number", manufacturer_number)
+        .limit(1)
+    )
+    return _first(result)
+
+
+def find_by_manufacturer_number_partial(client, manufacturer_number: str, limit: int) -> Plan:
+    """Find parts by partial manufacturer part number match."""
+    catalog = get_parts_catalog()
+    if catalog is not None:
+        parts = catalog.find_by_manufacturer_number_partial(manufacturer_number, limit)
+        if parts:
+            return parts
+        return (yield from _catalog_miss(
+            catalog,
+            client.table("parts").select("*").ilike("manufacturer_part_number", f"%{manufacturer_number}%").limit(limit),
+            MANUFACTURER_COLUMNS,
+        ))
+
+    result = yield (
+        client.table("parts")
+        .select("ps_number, part_name, manufacturer_part_number, availability, appliance_type")
+        .ilike("manufacturer_part_number", f"%{manufacturer_number}%")
+        .limit(limit)
+    )
+    return result.data or []
+
+
+# =============================================================================
+# Model compatibility queries
+# =============================================================================
+
+def check_compatibility(client, ps_number: str, model_number: str) -> Plan:
+    """Check if a part is compatible with a model."""
+    row = _first((yield (
+        client.table("model_compatibility")
+        .select("*")
+        .eq("part_id", ps_number)
+        .eq("model_number", model_number)
+        .limit(1)
+    )))
+    if row:
+        return {
+            "compatible": True,
+            "brand": row.get("brand"),
+            "description": row.get("description")
+        }
+    return {"compatible": False}
+
+
+def get_compatible_parts(client, model_number: str, part_type, brand, limit: int) -> Plan:
+    """Get all parts compatible with a model."""
+    # First get compatible part IDs
+    compat_result = yield (
+        client.table("model_compatibility")
+        .select("part_id")
+        .eq("model_number", model_number)
+    )
+    if not compat_result.data:
+        return []
+
+    part_ids = [r["part_id"] for r in compat_result.data]
+
+    # Then get part details
+    q = (
+        client.table("parts")
+        .select("ps_number, part_name, part_type, part_price, average_rating, availability, part_url, manufacturer_part_number, num_reviews, brand")
+        .in_("ps_number", part_ids)
+    )
+    if part_type:
+        q = q.ilike("part_type", f"%{part_type}%")
+    if brand:
+        q = q.ilike("brand", f"%{brand}%")
+
+    result = yield q.limit(limit)
+    return result.data or []
+
+
+def validate_model(client, model_number: str) -> Plan:
+    """Check if a model exists in our compatibility data."""
+    row = _first((yield (
+        client.table("model_compatibility")
+        .select("model_number, brand, description")
+        .eq("model_number", model_number)
+        .limit(1)
+    )))
+    if row:
+        return {
+            "found": True,
+            "brand": row.get("brand"),
+            "description": row.get("description")
+        }
+    return {"found": False}
+
+
+def find_model_fuzzy(client, model_input: str, limit: int) -> Plan:
+    """Find models with fuzzy/partial matching."""
+    # First try exact match (case-insensitive via ilike)
+    result = yield (
+        client.table("model_compatibility")
+        .select("model_number, brand, description")
+        .ilike("model_number", model_input)
+        .limit(1)
+    )
+    if result.data:
+        return result.data
+
+    # Fall back to partial match
+    result = yield (
+        client.table("model_compatibility")
+        .select("model_number, brand, description")
+        .ilike("model_number", f"%{model_input}%")
+        .limit(limit)
+    )
+    return result.data or []
+
+
+def get_compatible_models(client, ps_number: str, brand, limit: int) -> Plan:
+    """Get all models compatible with a specific part.
+
+    Pages through the results, since Supabase returns at most 1000 rows per request.
+    """
+    logger.debug("get_compatible_models called with limit=%d for part %s", limit, ps_number)
+
+    all_results = []
+    offset = 0
+
+    while len(all_results) < limit:
+        q = (
+            client.table("model_compatibility")
+            .select("model_number, brand, description")
+            .eq("part_id", ps_number)
+        )
+        if brand:
+            q = q.ilike("brand", f"%{brand}%")
+
+        result = yield q.range(offset, offset + PAGE_SIZE - 1)
+        batch = result.data or []
+        if not batch:
+            break  # No more results
+
+        all_results.extend(batch)
+        logger.debug("Fetched batch: offset=%d, got %d models, total so far: %d", offset, len(batch), len(all_results))
+
+        # A short page is the last one
+        if len(batch) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
+
+    final_results = all_results[:limit]
+    logger.debug("Database returned %d models for %s (after pagination)", len(final_results), ps_number)
+    return final_results
+
+
+# =============================================================================
+# Repair symptoms and instructions queries
+# =============================================================================
+
+def get_symptoms(client, appliance_type: str, symptom: str | None) -> Plan:
+    """Get symptoms for an appliance type.
+
+    If symptom is provided, uses LLM matching to find the best match.
+    """
+    result = yield (
+        client.table("repair_symptoms")
+        .select("symptom, symptom_description, percentage, video_url, symptom_url, parts, difficulty")
+        .eq("appliance_type", appliance_type.lower())
+        .order("percentage", desc=True)
+    )
+    all_symptoms = result.data or []
+
+    if not symptom or not all_symptoms:
+        return all_symptoms
+
+    # Try exact substring match first
+    for s in all_symptoms:
+        if symptom.lower() in s["symptom"].lower():
+            return [s]
+
+    # Use LLM to find best match
+    matched = yield SymptomMatch(symptom, [s["symptom"] for s in all_symptoms])
+    if matched:
+        for s in all_symptoms:
+            if s["symptom"] == matched:
+                return [s]
+
+    # No match found, return empty
+    return []
+
+
+def get_repair_instructions(client, appliance_type: str, symptom: str, part_type: str | None) -> Plan:
+    """Get repair instructions for a symptom using LLM-based matching.
+
+    Uses a multi-stage approach:
+    1. Try exact substring match
+    2. Use LLM to find best matching symptom from available options
+    """
+    appliance_lower = appliance_type.lower()
+
+    # First, try exact substring match
+    symptom_info = _first((yield (
+        client.table("repair_symptoms")
+        .select("symptom, video_url, symptom_url, difficulty")
+        .eq("appliance_type", appliance_lower)
+        .ilike("symptom", f"%{symptom}%")
+        .limit(1)
+    )))
+
+    if not symptom_info:
+        # Get all symptoms and use LLM to find best match
+        all_symptoms = (yield (
+            client.table("repair_symptoms")
+            .select("symptom, video_url, symptom_url, difficulty")
+            .eq("appliance_type", appliance_lower)
+        )).data
+        if all_symptoms:
+            matched = yield SymptomMatch(symptom, [s["symptom"] for s in all_symptoms])
+            if matched:
+                # Find the full symptom record
+                symptom_info = next((s for s in all_symptoms if s["symptom"] == matched), None)
+
+    if not symptom_info:
+        return {
+            "instructions": [],
+            "video_url": None,
+            "symptom_url": None,
+            "difficulty": None,
+            "matched_symptom": None
+        }
+
+    matched_symptom = symptom_info["symptom"]
+
+    # Now get the instructions using the matched symptom
+    q = (
+        client.table("repair_instructions")
+        .select("part_type, instructions, part_category_url")
+        .eq("appliance_type", appliance_lower)
+        .ilike("symptom", f"%{matched_symptom}%")
+    )
+    if part_type:
+        q = q.ilike("part_type", f"%{part_type}%")
+
+    result = yield q
+
+    return {
+        "instructions": result.data or [],
+        "video_url": symptom_info.get("video_url"),
+        "symptom_url": symptom_info.get("symptom_url"),
+        "difficulty": symptom_info.get("difficulty"),
+        "matched_symptom": matched_symptom
+    }
+
+
+# =============================================================================
+# Vector search queries (semantic)
+# =============================================================================
+
+def _search_by_part(client, rpc: str, store_name: str, query_embedding, ps_number, match_threshold, limit) -> Plan:
+    """Semantic search RPC filtered by part, answered by the local vector store when it has the part."""
+    store = get_vector_store(store_name) if ps_number else None
+    if store is not None:
+        matches = store.search(query_embedding, ps_number, match_threshold, limit)
+        if matches is not None:
+            return matches
+
+    try:
+        logger.debug(
+            "%s called: embedding length=%d, ps_number=%s, match_threshold=%s, limit=%d",
+            rpc, len(query_embedding), ps_number, match_threshold, limit,
+        )
+        # filter_ps_number filters in the database BEFORE applying limit
+        result = yield client.rpc(
+            rpc,
+            {
+                "query_embedding": query_embedding,
+                "match_threshold": match_threshold,
+                "match_count": limit,
+                "filter_ps_number": ps_number
+            }
+        )
+        logger.debug("%s results: %d", rpc, len(result.data or []))
+        return result.data or []
+    except Exception as e:
+        logger.warning("%s failed (table/RPC may not exist): %s", rpc, e)
+        return []
+
+
+def search_qna(client, query_embedding, ps_number, match_threshold, limit) -> Plan:
+    """Search Q&A by semantic similarity, optionally filtered by part number."""
+    return (yield from _search_by_part(client, "search_qna", "qna", query_embedding, ps_number, match_threshold, limit))
+
+
+def search_repair_stories(client, query_embedding, ps_number, match_threshold, limit) -> Plan:
+    """Search repair stories by semantic similarity, optionally filtered by part number."""
+    return (yield from _search_by_part(
+        client, "search_repair_stories", "repair_stories", query_embedding, ps_number, match_threshold, limit
+    ))
+
+
+def search_reviews(client, query_embedding, ps_number, match_threshold, limit) -> Plan:
+    """Search reviews by semantic similarity.
+
+    Use for questions like "is this part easy to install?" or "any quality issues?"
+    """
+    return (yield from _search_by_part(
+        client, "search_reviews", "reviews", query_embedding, ps_number, match_threshold, limit
+    ))
+
+
+def search_parts_semantic(client, query_embedding, appliance_type, match_threshold, limit) -> Plan:
+    """Search parts by semantic similarity.
+
+    Use for natural language queries like "refrigerator bins" which would
+    semantically match parts with part_type "Drawer or Glides".
+    """
+    try:
+        result = yield client.rpc(
+            "search_parts_semantic",
+            {
+                "query_embedding": query_embedding,
+                "match_threshold": match_threshold,
+                "match_count": limit,
+                "filter_appliance_type": appliance_type.lower() if appliance_type else None
+            }
+        )
+        return result.data or []
+    except Exception as e:
+        logger.warning("search_parts_semantic failed (table/RPC may not exist): %s", e)
+        return []
+
+
+def _rows_for_part(client, table: str, columns: str, order_by: str, ps_number: str, limit: int) -> Plan:
+    """Rows of an embeddings table for one part, best first, without semantic search."""
+    try:
+        result = yield (
+            client.table(table)
+            .select(columns)
+            .eq("ps_number", ps_number)
+            .order(order_by, desc=True)
+            .limit(limit)
+        )
+        return result.data or []
+    except Exception as e:
+        logger.warning("Reading %s for %s failed (table may not exist): %s", table, ps_number, e)
+        return []
+
+
+def get_qna_by_ps_number(client, ps_number: str, limit: int) -> Plan:
+    """Get all Q&A for a specific part without semantic search."""
+    return (yield from _rows_for_part(
+        client, "qna_embeddings",
+        "question_id, question, answer, asker, date, model_number, helpful_count",
+        "helpful_count", ps_number, limit,
+    ))
+
+
+def get_repair_stories_by_ps_number(client, ps_number: str, limit: int) -> Plan:
+    """Get all repair stories for a specific part without semantic search."""
+    return (yield from _rows_for_part(
+        client, "repair_stories_embeddings",
+        "story_id, title, instruction, author, difficulty, repair_time, helpful_count, vote_count",
+        "helpful_count", ps_number, limit,
+    ))
+
+
+def get_reviews_by_ps_number(client, ps_number: str, limit: int) -> Plan:
+    """Get all reviews for a specific part without semantic search."""
+    return (yield from _rows_for_part(
+        client, "reviews_embeddings",
+        "review_id, rating, title, content, author, date, verified_purchase",
+        "rating", ps_number, limit,
+    ))
@@ -0,0 +1,217 @@
+"""
+Local per-part vector index for Q&A, reviews and repair stories.
+
+search_qna / search_reviews / search_repair_stories always filter on one
+ps_number, but the Supabase RPCs run an ivfflat scan over the whole table and
+filter afterwards - slow, and rows for the part can be missed entirely when
+they sit outside the probed lists. A part has a few dozen rows at most, so an
+exact search over just those rows is both faster and complete.
+
+Each collection is stored as two files in VECTOR_STORE_DIR:
+- {name}.npy   normalized embeddings (float16 or float32), rows grouped by
+               ps_number so each part's rows are one contiguous slice
+- {name}.json  {"offsets": {ps_number: [start, end]}, "rows": [metadata...]}
+
+The matrix is memory-mapped, so several workers share one copy in the page
+cache. Search is one matrix-vector dot over the part's slice. Parts written
+after the build (live scrapes) are added in memory with add_part(); a part the
+index has never seen (e.g. written by another process) is searched with the RPC.
+
+Build the files with `python -m database.build_vector_index`. With
+VECTOR_STORE_BACKEND=local, SupabaseClient and AsyncSupabaseClient answer
+per-part searches from here; searches without a ps_number still use the RPCs.
+"""
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+from backend.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Collection:
+    """
+    One embeddings table.
+
+    Args:
+        table: Supabase embeddings table
+        csv_file: Scraped CSV the table is loaded from
+        key: Natural key within a part
+        columns: Metadata returned with each match (the RPC's columns)
+        text_columns: Joined with a space to form the embedding text, as in load_data.py
+    """
+    table: str
+    csv_file: str
+    key: str
+    columns: tuple[str, ...]
+    text_columns: tuple[str, ...]
+
+
+COLLECTIONS = {
+    "qna": Collection(
+        table="qna_embeddings",
+        csv_file="qna.csv",
+        key="question_id",
+        columns=("ps_number", "question_id", "question", "answer"),
+        text_columns=("question", "answer"),
+    ),
+    "repair_stories": Collection(
+        table="repair_stories_embeddings",
+        csv_file="repair_stories.csv",
+        key="story_id",
+        columns=("ps_number", "story_id", "title", "instruction", "difficulty"),
+        text_columns=("title", "instruction"),
+    ),
+    "reviews": Collection(
+        table="reviews_embeddings",
+        csv_file="reviews.csv",
+        key="review_id",
+        columns=("ps_number", "review_id", "rating", "title", "content", "author", "verified_purchase"),
+        text_columns=("title", "content"),
+    ),
+}
+
+
+class LocalVectorStore:
+    """Embeddings for one collection, partitioned by ps_number."""
+
+    def __init__(self, name: str, matrix: np.ndarray, offsets: dict[str, tuple[int, int]], rows: list[dict]):
+        self.name = name
+        self.matrix = matrix
+        self.offsets = offsets
+        self.rows = rows
+        # ps_number -> (normalized float32 embeddings, rows) added since the build
+        self._added: dict[str, tuple[np.ndarray, list[dict]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def build(
+        cls,
+        name: str,
+        rows: list[dict],
+        embeddings: np.ndarray,
+        dtype: str = "float16",
+    ) -> "LocalVectorStore":
+        """
+        Group `rows` (and their embeddings, same order) by ps_number.
+
+        Embeddings are normalized so a dot product is the cosine similarity.
+        """
+        collection = COLLECTIONS[name]
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.where(norms == 0, 1, norms)
+
+        order = sorted(range(len(rows)), key=lambda i: rows[i]["ps_number"])
+        offsets: dict[str, tuple[int, int]] = {}
+        for position, i in enumerate(order):
+            ps_number = rows[i]["ps_number"]
+            start = offsets[ps_number][0] if ps_number in offsets else position
+            offsets[ps_number] = (start, position + 1)
+
+        return cls(
+            name,
+            embeddings[order].astype(dtype),
+            offsets,
+            [{c: rows[i].get(c) for c in collection.columns} for i in order],
+        )
+
+    def save(self, directory: str | Path) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / f"{self.name}.npy", self.matrix)
+        with open(directory / f"{self.name}.json", "w", encoding="utf-8") as f:
+            json.dump({"offsets": self.offsets, "rows": self.rows}, f)
+
+    @classmethod
+    def load(cls, name: str, directory: str | Path) -> "LocalVectorStore":
+        """Memory-map a saved collection."""
+        directory = Path(directory)
+        matrix = np.load(directory / f"{name}.npy", mmap_mode="r")
+        with open(directory / f"{name}.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        offsets = {ps: (start, end) for ps, (start, end) in meta["offsets"].items()}
+        return cls(name, matrix, offsets, meta["rows"])
+
+    def add_part(self, ps_number: str, rows: list[dict], embeddings) -> None:
+        """Replace one part's rows in memory (e.g. after a live scrape is written back)."""
+        columns = COLLECTIONS[self.name].columns
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(len(rows), -1)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        self._added[ps_number] = (
+            embeddings / np.where(norms == 0, 1, norms),
+            [{c: row.get(c) for c in columns} for row in rows],
+        )
+
+    def search(
+        self,
+        query_embedding: list[float],
+        ps_number: str,
+        match_threshold: float = 0.5,
+        limit: int = 5,
+    ) -> list[dict] | None:
+        """
+        Exact cosine search over one part's rows. Same result shape as the RPCs.
+
+        Returns None when the part isn't in the index, so the caller can ask
+        the database instead.
+        """
+        if ps_number in self._added:
+            matrix, rows = self._added[ps_number]
+        else:
+            span = self.offsets.get(ps_number)
+            if span is None:
+                return None
+            start, end = span
+            matrix, rows = self.matrix[start:end], self.rows[start:end]
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        scores = np.asarray(matrix, dtype=np.float32) @ query
+
+        ranked = np.argsort(-scores, kind="stable")
+        return [
+            {**rows[i], "similarity": float(scores[i])}
+            for i in ranked[:limit] if scores[i] > match_threshold
+        ]
+
+    def stats(self) -> dict:
+        return {
+            "rows": len(self.rows),
+            "parts": len(self.offsets),
+            "added_parts": len(self._added),
+            "dtype": str(self.matrix.dtype),
+        }
+
+
+@lru_cache()
+def get_vector_store(name: str) -> LocalVectorStore | None:
+    """
+    The local index for a collection, or None to use the Supabase RPCs.
+
+    None when VECTOR_STORE_BACKEND isn't "local" or the files haven't been built.
+    """
+    settings = get_settings()
+    if settings.VECTOR_STORE_BACKEND != "local":
+        return None
+    try:
+        store = LocalVectorStore.load(name, settings.VECTOR_STORE_DIR)
+    except FileNotFoundError:
+        logger.warning("No local %s index in %s, using Supabase RPC", name, settings.VECTOR_STORE_DIR)
+        return None
+    logger.info("Loaded local %s index: %d rows over %d parts", name, len(store), len(store.offsets))
+    return store
+
+
+def init_vector_stores() -> None:
+    """Load every local index up front so the first search doesn't pay for it."""
+    for name in COLLECTIONS:
+        get_vector_store(name)
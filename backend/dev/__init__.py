@@ -0,0 +1 @@
+# Development and benchmarking utilities for the backend
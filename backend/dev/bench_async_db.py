@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark tool throughput with the sync vs async database clients.
+
+Runs the real agent tools against a local PostgREST stand-in (in a separate
+process) that adds a fixed latency per request (see postgrest_server.py), at
+several concurrency levels. Each simulated chat turn awaits get_part →
+check_compatibility like the executor's ToolNode does - 3 database round trips.
+
+Modes:
+- blocking: sync tool called directly on the event loop (the old executor
+  scrape fallback did this) - every chat waits for every other chat
+- threads:  sync tool in a worker thread (langchain's default for sync tools,
+  capped by the default thread pool size)
+- async:    async tool over the pooled keep-alive client
+
+The tool result cache is disabled so every call hits the stand-in.
+
+Usage:
+    python -m backend.dev.bench_async_db
+    python -m backend.dev.bench_async_db --latency-ms 50 --concurrency 1 16 64 256
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from backend.config import get_settings
+from backend.dev.postgrest_server import start_server_process
+
+
+async def run_turn(tools: dict, mode: str, ps_number: str) -> None:
+    """One chat turn's worth of tool calls."""
+    calls = [
+        ("get_part", {"ps_number": ps_number}),
+        ("check_compatibility", {"ps_number": ps_number, "model_number": "WDT780SAEM1"}),
+    ]
+    for name, args in calls:
+        if mode == "blocking":
+            result = tools[name].invoke(args)
+        else:
+            result = await tools[name].ainvoke(args)
+        if isinstance(result, dict) and result.get("error"):
+            raise RuntimeError(f"{name} failed: {result['error']}")
+
+
+async def run_level(tools: dict, mode: str, concurrency: int, turns: int) -> dict:
+    """Run `turns` chat turns with at most `concurrency` in flight."""
+    from backend.agent_v2.tools.registry import registry
+
+    registry.async_enabled = mode == "async"
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await run_turn(tools, mode, f"PS1175{i % 100:04d}")
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(turns)))
+    elapsed = time.perf_counter() - start
+
+    ms = sorted(t * 1000 for t in latencies)
+    return {
+        "throughput": turns / elapsed,
+        "p50": statistics.median(ms),
+        "p95": ms[int(len(ms) * 0.95) - 1],
+    }
+
+
+async def run_benchmark(concurrency_levels: list[int], turns_per_level: int, modes: list[str]) -> None:
+    from backend.agent_v2.tools import get_tool_map
+    from backend.agent_v2.tools.registry import registry
+    from backend.db import close_async_supabase_client
+
+    registry.cache_enabled = False
+    tools = get_tool_map()
+
+    # Warm both clients' connection pools
+    for mode in ("threads", "async"):
+        await run_level(tools, mode, concurrency=4, turns=8)
+
+    print(f"\n  {'mode':<9} {'conc':>5} {'turns/s':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    results = {}
+    for concurrency in concurrency_levels:
+        turns = max(turns_per_level, concurrency * 2)
+        for mode in modes:
+            # Blocking mode serializes everything - keep its runs short
+            n = min(turns, 40) if mode == "blocking" else turns
+            stats = await run_level(tools, mode, concurrency, n)
+            results[(mode, concurrency)] = stats
+            print(f"  {mode:<9} {concurrency:>5} {stats['throughput']:>9.1f} "
+                  f"{stats['p50']:>9.1f} {stats['p95']:>9.1f}")
+        print()
+
+    if "threads" in modes and "async" in modes:
+        print("  Speedup (async vs threads):")
+        for concurrency in concurrency_levels:
+            ratio = results[("async", concurrency)]["throughput"] / results[("threads", concurrency)]["throughput"]
+            print(f"    concurrency {concurrency:>4}: {ratio:5.1f}x")
+
+    await close_async_supabase_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async database tools")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stand-in latency per request")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--turns", type=int, default=64, help="Chat turns per level (min 2x concurrency)")
+    parser.add_argument("--modes", nargs="+", default=["blocking", "threads", "async"],
+                        choices=["blocking", "threads", "async"])
+    parser.add_argument("--url", help="Use an existing PostgREST-compatible server instead of the stand-in")
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        url = args.url
+    else:
+        url, process = start_server_process(latency_ms=args.latency_ms)
+
+    # Clients are created lazily, so pointing settings at the stand-in is enough
+    settings = get_settings()
+    settings.SUPABASE_URL = url
+    settings.SUPABASE_KEY = settings.SUPABASE_KEY if args.url else "bench-anon-key"
+
+    print("=" * 60)
+    print(f"Database tool throughput against {url}")
+    if not args.url:
+        print(f"Stand-in latency: {args.latency_ms:.0f}ms per request, 3 requests per turn")
+    print("=" * 60)
+
+    try:
+        asyncio.run(run_benchmark(args.concurrency, args.turns, args.modes))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
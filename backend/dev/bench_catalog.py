@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark part lookups through the in-process catalog vs the remote path.
+
+Loads data/parts.csv into a PartsCatalog, and serves the same CSV from the
+PostgREST stand-in (in a separate process, see postgrest_server.py) for the
+remote path. Each operation is run against a spread of catalog parts through
+SupabaseClient, with the catalog detached (remote) and attached (catalog).
+
+The stand-in ignores ilike/or filters, so remote search timings are a lower
+bound on what Supabase would take for the same query.
+
+Usage:
+    python -m backend.dev.bench_catalog
+    python -m backend.dev.bench_catalog --latency-ms 20 --iterations 500
+"""
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from backend.config import get_settings
+from backend.dev.postgrest_server import start_server_process
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+def operations(parts: list[dict]) -> dict:
+    """name -> callable(db, i) issuing one lookup for the i-th sample part."""
+    with_mfr = [p for p in parts if p.get("manufacturer_part_number")] or parts
+    return {
+        "get_part_by_ps_number": lambda db, i: db.get_part_by_ps_number(parts[i % len(parts)]["ps_number"]),
+        "validate_part": lambda db, i: db.validate_part(parts[i % len(parts)]["ps_number"]),
+        "find_by_manufacturer_number": lambda db, i: db.find_by_manufacturer_number(
+            with_mfr[i % len(with_mfr)]["manufacturer_part_number"]),
+        "search_parts": lambda db, i: db.search_parts(
+            query="shelf", appliance_type=("refrigerator", "dishwasher")[i % 2], limit=10),
+    }
+
+
+def time_operation(db, op, iterations: int) -> list[float]:
+    timings = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        op(db, i)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the in-process parts catalog")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stand-in latency per request")
+    parser.add_argument("--iterations", type=int, default=200, help="Remote lookups per operation")
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    args = parser.parse_args()
+
+    import backend.db.parts_catalog as parts_catalog
+    from backend.db.parts_catalog import PartsCatalog
+    from backend.db.supabase_client import get_supabase_client
+
+    catalog = PartsCatalog()
+    start = time.perf_counter()
+    count = catalog.load_from_snapshot(Path(args.data_dir) / "parts.csv")
+    load_seconds = time.perf_counter() - start
+    parts = catalog.search_parts(limit=count)[::37]
+
+    url, process = start_server_process(latency_ms=args.latency_ms, data_dir=args.data_dir)
+    settings = get_settings()
+    settings.SUPABASE_URL = url
+    settings.SUPABASE_KEY = "bench-anon-key"
+    db = get_supabase_client()
+
+    print("=" * 60)
+    print(f"Parts catalog: {count} parts loaded and indexed in {load_seconds * 1000:.0f}ms")
+    print(f"Remote: PostgREST stand-in, {args.latency_ms:.0f}ms per request")
+    print("=" * 60)
+    print(f"\n  {'operation':<29} {'remote p50':>11} {'catalog p50':>12} {'catalog p95':>12} {'speedup':>9}")
+
+    try:
+        for name, op in operations(parts).items():
+            parts_catalog._catalog = None
+            remote = time_operation(db, op, args.iterations)
+            parts_catalog._catalog = catalog
+            local = sorted(time_operation(db, op, args.iterations * 10))
+            remote_p50, local_p50 = statistics.median(remote), statistics.median(local)
+            print(f"  {name:<29} {remote_p50:>9.0f}us {local_p50:>10.1f}us "
+                  f"{local[int(len(local) * 0.95) - 1]:>10.1f}us {remote_p50 / local_p50:>8.0f}x")
+    finally:
+        parts_catalog._catalog = None
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
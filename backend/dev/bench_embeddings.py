@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark query embedding throughput with and without micro-batching.
+
+N concurrent callers each await embeddings for distinct texts (so the query
+embedding cache never hits), at several concurrency levels:
+- direct:  one model.encode per text in a worker thread (the old path)
+- batched: through EmbeddingBatcher - concurrent texts share one encode
+
+Loads the real all-MiniLM-L6-v2 model; no network calls once it is cached.
+
+Usage:
+    python -m backend.dev.bench_embeddings
+    python -m backend.dev.bench_embeddings --concurrency 1 8 64 --window-ms 2 --max-batch 64
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+
+from backend.agent_v2.embedding_batcher import EmbeddingBatcher
+
+TEMPLATES = [
+    "is part {i} easy to install",
+    "my ice maker makes a clicking noise, case {i}",
+    "how long does the water filter {i} last",
+    "dishwasher {i} is not draining after a cycle",
+]
+
+
+async def run_level(encode, concurrency: int, texts_per_caller: int, counter) -> dict:
+    """`concurrency` callers each awaiting `texts_per_caller` embeddings one after another."""
+    latencies = []
+
+    async def caller() -> None:
+        for _ in range(texts_per_caller):
+            text = TEMPLATES[next(counter) % len(TEMPLATES)].format(i=next(counter))
+            start = time.perf_counter()
+            await encode(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ms = sorted(latencies)
+    return {
+        "throughput": len(ms) / elapsed,
+        "p50": statistics.median(ms),
+        "p95": ms[int(len(ms) * 0.95) - 1],
+    }
+
+
+async def run_benchmark(args) -> None:
+    from backend.agent_v2.tools.vector_tools import _encode_texts
+
+    batcher = EmbeddingBatcher(_encode_texts, max_batch_size=args.max_batch, window_ms=args.window_ms)
+    modes = {
+        "direct": lambda text: asyncio.to_thread(_encode_texts, text),
+        "batched": batcher.aencode,
+    }
+    counter = itertools.count()
+
+    # Load the model and warm both paths
+    _encode_texts("warm up")
+    for encode in modes.values():
+        await run_level(encode, 4, 2, counter)
+
+    print(f"\n  {'mode':<8} {'conc':>5} {'texts/s':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    results = {}
+    for concurrency in args.concurrency:
+        per_caller = max(2, args.texts // concurrency)
+        for mode, encode in modes.items():
+            before = batcher.stats()
+            stats = await run_level(encode, concurrency, per_caller, counter)
+            results[(mode, concurrency)] = stats
+            extra = ""
+            if mode == "batched":
+                after = batcher.stats()
+                batches = after["batches"] - before["batches"]
+                if batches:
+                    extra = f"   avg batch {(after['requests'] - before['requests']) / batches:.1f}"
+            print(f"  {mode:<8} {concurrency:>5} {stats['throughput']:>9.1f} "
+                  f"{stats['p50']:>9.1f} {stats['p95']:>9.1f}{extra}")
+        print()
+
+    print("  Speedup (batched vs direct):")
+    for concurrency in args.concurrency:
+        ratio = results[("batched", concurrency)]["throughput"] / results[("direct", concurrency)]["throughput"]
+        print(f"    concurrency {concurrency:>4}: {ratio:5.1f}x")
+    batcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark micro-batched query embeddings")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--texts", type=int, default=256, help="Texts per level (min 2 per caller)")
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=32)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Query embedding throughput (window {args.window_ms:.0f}ms, max batch {args.max_batch})")
+    print("=" * 60)
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
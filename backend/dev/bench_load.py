@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Offline load test for /chat and /chat/stream.
+
+Serves the real FastAPI app (backend.main) with uvicorn in this process, with
+scripted LLMs (see scripted_llm.py) and the PostgREST stand-in serving the
+scraped catalog from data/*.csv in a separate process (see
+postgrest_server.py). A concurrent httpx client then drives both endpoints at
+several concurrency levels. No Anthropic or Supabase calls are made.
+
+Each level replays a mix of queries over catalog parts:
+- fast path: part lookup, price and symptom-list questions (router + template)
+- executor:  "Is PS... compatible with ..., and is it easy to install?" - two
+             scripted executor turns, then a streamed synthesizer answer
+
+Reports requests/sec and p50/p95/p99 latency per endpoint and level, and
+time to first token for /chat/stream. With --max-p95-ms the run exits 1 if
+any level is slower than that or any request fails, so it can gate CI.
+
+The answer cache is off by default so every request runs the pipeline.
+
+Usage:
+    python -m backend.dev.bench_load
+    python -m backend.dev.bench_load --concurrency 1 16 64 --requests 128
+    python -m backend.dev.bench_load --llm-ms 50 --synth-ms 50 --max-p95-ms 2000 --json load.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+from langchain_core.messages import AIMessage
+
+from backend.config import get_settings
+from backend.dev.postgrest_server import csv_fixture, start_server_process, free_port
+from backend.dev.scripted_llm import install_scripted_llms
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+EXECUTOR_QUERY = "Is {ps} compatible with {model}, and is it easy to install?"
+# Picks the part and model out of EXECUTOR_QUERY for the scripted replies
+EXECUTOR_QUERY_PATTERN = r"Is (?P<ps_number>PS\d+) compatible with (?P<model_number>\w+), and"
+
+FAST_PATH_QUERIES = [
+    "Tell me about {ps}",
+    "How much is {ps}?",
+    "What are common {appliance} problems?",
+]
+
+# Scripted replies - {ps_number}/{model_number} are filled from the query
+EXECUTOR_SCRIPT = [
+    AIMessage(content="", tool_calls=[
+        {"name": "get_part", "args": {"ps_number": "{ps_number}"}, "id": "call_1"},
+        {"name": "check_compatibility",
+         "args": {"ps_number": "{ps_number}", "model_number": "{model_number}"}, "id": "call_2"},
+    ]),
+    AIMessage(content="Looked up {ps_number} and its compatibility with {model_number}."),
+]
+SYNTHESIZER_SCRIPT = [
+    AIMessage(content="Here is what I found for part {ps_number} and model {model_number}. It is "
+                      "rated an easy install: remove the old part, fit the new one in the same "
+                      "position and restore power or water before testing."),
+]
+
+
+# =============================================================================
+# Workload
+# =============================================================================
+
+def build_queries(fixture: dict[str, list[dict]], count: int, executor_share: float) -> list[str]:
+    """`count` queries over catalog parts, `executor_share` of them taking the executor path."""
+    parts = [p for p in fixture["parts"] if p.get("appliance_type") in ("refrigerator", "dishwasher")]
+    models = [m["model_number"] for m in fixture["model_compatibility"]] or ["WDT780SAEM1", "WRS325SDHZ"]
+    if not parts:
+        raise RuntimeError("No refrigerator/dishwasher parts in the catalog")
+
+    executor_every = round(1 / executor_share) if executor_share > 0 else 0
+    fast = itertools.cycle(FAST_PATH_QUERIES)
+    queries = []
+    for i in range(count):
+        part = parts[(i * 37) % len(parts)]  # spread over the catalog, deterministic
+        fields = {"ps": part["ps_number"], "model": models[i % len(models)],
+                  "appliance": part["appliance_type"]}
+        template = EXECUTOR_QUERY if executor_every and i % executor_every == 0 else next(fast)
+        queries.append(template.format(**fields))
+    return queries
+
+
+def percentile(sorted_ms: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_ms:
+        return float("nan")
+    return sorted_ms[max(0, math.ceil(len(sorted_ms) * p) - 1)]
+
+
+def summarize(latencies: list[float], ttft: list[float], errors: int, elapsed: float) -> dict:
+    ms = sorted(latencies)
+    first = sorted(ttft)
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(ms, 0.50),
+        "p95": percentile(ms, 0.95),
+        "p99": percentile(ms, 0.99),
+        "ttft_p50": percentile(first, 0.50),
+        "ttft_p95": percentile(first, 0.95),
+    }
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+async def chat_once(client: httpx.AsyncClient, query: str) -> tuple[float, float | None]:
+    """POST /chat. Returns (latency ms, None)."""
+    start = time.perf_counter()
+    response = await client.post("/chat", json={"message": query})
+    response.raise_for_status()
+    return (time.perf_counter() - start) * 1000, None
+
+
+async def stream_once(client: httpx.AsyncClient, query: str) -> tuple[float, float | None]:
+    """POST /chat/stream. Returns (latency ms, ms to first token event)."""
+    start = time.perf_counter()
+    first_token = None
+    event = None
+    async with client.stream("POST", "/chat/stream", json={"message": query}) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line.startswith("event:"):
+                event = line[6:].strip()
+                if event == "token" and first_token is None:
+                    first_token = (time.perf_counter() - start) * 1000
+                elif event == "error":
+                    raise RuntimeError(f"error event for {query!r}")
+    if event != "done":
+        raise RuntimeError(f"stream for {query!r} ended without done")
+    return (time.perf_counter() - start) * 1000, first_token
+
+
+async def run_level(base_url: str, endpoint: str, queries: list[str], concurrency: int) -> dict:
+    """Send `queries` with at most `concurrency` in flight."""
+    send = chat_once if endpoint == "/chat" else stream_once
+    latencies, ttft = [], []
+    errors = 0
+    pending = iter(queries)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        for query in pending:
+            try:
+                latency, first = await send(client, query)
+            except (httpx.HTTPError, RuntimeError) as e:
+                errors += 1
+                if errors <= 3:
+                    print(f"    ! {endpoint}: {e}")
+                continue
+            latencies.append(latency)
+            if first is not None:
+                ttft.append(first)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return summarize(latencies, ttft, errors, elapsed)
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+def start_app(host: str = "127.0.0.1") -> tuple[str, uvicorn.Server]:
+    """Serve backend.main in a daemon thread (lifespan included). Returns (URL, server)."""
+    from backend.main import app
+
+    port = free_port(host)
+    server = uvicorn.Server(uvicorn.Config(
+        app, host=host, port=port, log_level="warning", access_log=False,
+        backlog=4096, limit_concurrency=None,
+    ))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 60
+    while not server.started:
+        if time.monotonic() > deadline or not thread.is_alive():
+            raise RuntimeError("App failed to start")
+        time.sleep(0.05)
+    return f"http://{host}:{port}", server
+
+
+async def run_benchmark(
+    base_url: str, queries: list[str], requests: int, levels: list[int], endpoints: list[str],
+) -> dict:
+    # Warm connection pools, tool registry and the stand-in's indexes
+    for endpoint in endpoints:
+        await run_level(base_url, endpoint, queries[:4], concurrency=2)
+
+    results = {}
+    print(f"\n  {'endpoint':<13} {'conc':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'ttft p50':>9} {'ttft p95':>9} {'errors':>7}")
+    for concurrency in levels:
+        level_queries = queries[:max(requests, concurrency * 2)]
+        for endpoint in endpoints:
+            stats = await run_level(base_url, endpoint, level_queries, concurrency)
+            results[f"{endpoint} c={concurrency}"] = {"endpoint": endpoint, "concurrency": concurrency, **stats}
+            ttft = (f"{stats['ttft_p50']:>9.0f} {stats['ttft_p95']:>9.0f}"
+                    if endpoint == "/chat/stream" else f"{'-':>9} {'-':>9}")
+            print(f"  {endpoint:<13} {concurrency:>5} {stats['rps']:>8.1f} {stats['p50']:>8.0f} "
+                  f"{stats['p95']:>8.0f} {stats['p99']:>8.0f} {ttft} {stats['errors']:>7}")
+        print()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for /chat and /chat/stream")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=64, help="Requests per level (min 2x concurrency)")
+    parser.add_argument("--endpoints", nargs="+", default=["/chat", "/chat/stream"],
+                        choices=["/chat", "/chat/stream"])
+    parser.add_argument("--executor-share", type=float, default=0.25,
+                        help="Fraction of queries that take the ReAct executor path")
+    parser.add_argument("--llm-ms", type=float, default=300.0, help="Scripted executor LLM latency per turn")
+    parser.add_argument("--synth-ms", type=float, default=300.0, help="Scripted synthesizer time to first token")
+    parser.add_argument("--db-ms", type=float, default=20.0, help="Stand-in latency per request")
+    parser.add_argument("--data-dir", default=str(DATA_DIR), help="Catalog CSVs for the stand-in")
+    parser.add_argument("--answer-cache", action="store_true", help="Leave the answer cache on")
+    parser.add_argument("--max-p95-ms", type=float, help="Exit 1 if any level's p95 exceeds this")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    db_url, db_process = start_server_process(latency_ms=args.db_ms, data_dir=args.data_dir)
+
+    settings = get_settings()
+    settings.SUPABASE_URL = db_url
+    settings.SUPABASE_KEY = "bench-anon-key"
+    settings.ANSWER_CACHE_ENABLED = args.answer_cache
+    settings.LOG_LEVEL = "WARNING"
+    # No vector tools in the workload - skip loading the embedding model
+    settings.EMBEDDING_WARMUP_ENABLED = False
+
+    count = max(args.requests, 2 * max(args.concurrency))
+    queries = build_queries(csv_fixture(args.data_dir), count, args.executor_share)
+
+    print("=" * 60)
+    print(f"Load test: {', '.join(args.endpoints)} at concurrency {args.concurrency}")
+    print(f"{args.requests} requests/level, {args.executor_share:.0%} via executor. "
+          f"LLM {args.llm_ms:.0f}ms/turn, synthesizer {args.synth_ms:.0f}ms, DB {args.db_ms:.0f}ms")
+    print("=" * 60)
+
+    try:
+        base_url, server = start_app()
+        # The lifespan builds the runtime; swap its LLMs afterwards
+        install_scripted_llms(
+            executor=EXECUTOR_SCRIPT,
+            synthesizer=SYNTHESIZER_SCRIPT,
+            delay=args.llm_ms / 1000,
+            synth_delay=args.synth_ms / 1000,
+            query_pattern=EXECUTOR_QUERY_PATTERN,
+        )
+        results = asyncio.run(run_benchmark(
+            base_url, queries, args.requests, args.concurrency, args.endpoints,
+        ))
+        server.should_exit = True
+    finally:
+        db_process.terminate()
+        db_process.wait()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+    if args.max_p95_ms is not None:
+        failed = [name for name, stats in results.items()
+                  if stats["errors"] or stats["p95"] > args.max_p95_ms]
+        if failed:
+            print(f"FAIL: p95 over {args.max_p95_ms:.0f}ms or errors in {failed}")
+            sys.exit(1)
+        print(f"OK: all levels under p95 {args.max_p95_ms:.0f}ms with no errors")
+
+
+if __name__ == "__main__":
+    main()
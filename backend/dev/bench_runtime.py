@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-request setup cost removed by the process-level runtime.
+
+Compares:
+- Cold: what every request used to pay (compile the graph, build three
+  ChatAnthropic clients and their HTTP pools, bind tools to a new ReAct agent)
+- Warm: fetching the already-built objects from get_runtime()
+
+No API calls are made - only object construction is timed.
+
+Usage:
+    python -m backend.dev.bench_runtime
+    python -m backend.dev.bench_runtime --iterations 50
+"""
+import argparse
+import statistics
+import time
+
+from backend.agent_v2.runtime import AgentRuntime, get_runtime
+
+
+def time_cold(iterations: int) -> list[float]:
+    """Build a fresh runtime each iteration (old per-request behaviour)."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        runtime = AgentRuntime()
+        runtime.warm_up()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def time_warm(iterations: int) -> list[float]:
+    """Reuse the process runtime each iteration."""
+    runtime = get_runtime()
+    runtime.warm_up()
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        runtime = get_runtime()
+        _ = (runtime.graph, runtime.react_agent, runtime.synthesizer_llm, runtime.scope_llm)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(label: str, timings: list[float]) -> None:
+    """Print mean/p50/max in milliseconds."""
+    ms = sorted(t * 1000 for t in timings)
+    print(f"  {label:<6} mean={statistics.mean(ms):9.3f}ms  "
+          f"p50={statistics.median(ms):9.3f}ms  max={ms[-1]:9.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark agent runtime setup cost")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Agent runtime setup ({args.iterations} iterations)")
+    print("=" * 60)
+
+    cold = time_cold(args.iterations)
+    warm = time_warm(args.iterations)
+
+    summarize("cold", cold)
+    summarize("warm", warm)
+    saved = statistics.mean(cold) - statistics.mean(warm)
+    print(f"\n  Per-request setup removed: {saved * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Measure time to first byte of a streamed chat turn, with and without tool
+progress events.
+
+Runs run_agent_streaming end to end (scope check → router → ReAct executor →
+synthesizer) with scripted stand-in LLMs (see scripted_llm.py) that sleep
+like the real ones, and tools hitting the local PostgREST stand-in. Reports
+when the first item reaches the client (the first SSE event), when the first
+answer token does, and when the first part card does (early `part` event vs
+the final `done`).
+
+Usage:
+    python -m backend.dev.bench_ttfb
+    python -m backend.dev.bench_ttfb --llm-ms 800 --synth-ms 1200 --runs 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from langchain_core.messages import AIMessage
+
+from backend.config import get_settings
+from backend.dev.postgrest_server import start_background_server
+from backend.dev.scripted_llm import install_scripted_llms
+
+# Not a fast-path query, so the ReAct executor runs
+QUERY = "Is PS11750003 compatible with WDT780SAEM1, and is it easy to install?"
+
+
+def install_bench_llms(llm_seconds: float, synth_seconds: float) -> None:
+    """Swap the runtime's LLMs for scripted ones."""
+    install_scripted_llms(
+        executor=[
+            AIMessage(content="", tool_calls=[
+                {"name": "get_part", "args": {"ps_number": "PS11750003"}, "id": "call_1"},
+                {"name": "check_compatibility",
+                 "args": {"ps_number": "PS11750003", "model_number": "WDT780SAEM1"}, "id": "call_2"},
+            ]),
+            AIMessage(content="PS11750003 fits WDT780SAEM1."),
+        ],
+        synthesizer=[
+            AIMessage(content="Yes - Door Shelf Bin 3 (PS11750003) fits your WDT780SAEM1 and is an easy install. "
+                              "It clips into the door with no tools: pull the old bin up and out, then press "
+                              "the new one down until it seats."),
+        ],
+        delay=llm_seconds,
+        synth_delay=synth_seconds,
+    )
+
+
+async def measure(emit_events: bool) -> tuple[float, float, float, list[str]]:
+    """One turn. Returns (ms to first item, first token, first part card, event names)."""
+    from backend.agent_v2.graph import run_agent_streaming
+
+    start = time.perf_counter()
+    first_item = first_token = first_part = None
+    events = []
+    async for item in run_agent_streaming(QUERY, emit_events=emit_events):
+        now = (time.perf_counter() - start) * 1000
+        if first_item is None:
+            first_item = now
+        if isinstance(item, dict):
+            events.append(f"{item['event']}:{item['data'].get('tool') or item['data'].get('ps_number')}")
+            if item["event"] == "part" and first_part is None:
+                first_part = now
+        elif first_token is None:
+            first_token = now
+    # Without events, part cards only arrive with the final `done` event
+    done = (time.perf_counter() - start) * 1000
+    return first_item, first_token, first_part or done, events
+
+
+async def run_benchmark(runs: int) -> None:
+    from backend.db import close_async_supabase_client
+
+    results = {}
+    for emit_events in (False, True):
+        samples = [await measure(emit_events) for _ in range(runs)]
+        results[emit_events] = samples
+        label = "with tool events" if emit_events else "tokens only"
+        print(f"\n  {label}:")
+        print(f"    first byte:  {statistics.median(s[0] for s in samples):7.0f}ms (median)")
+        print(f"    first token: {statistics.median(s[1] for s in samples):7.0f}ms (median)")
+        print(f"    first card:  {statistics.median(s[2] for s in samples):7.0f}ms (median)")
+        if emit_events:
+            print(f"    events: {samples[-1][3]}")
+
+    before = statistics.median(s[0] for s in results[False])
+    after = statistics.median(s[0] for s in results[True])
+    print(f"\n  Time to first byte: {before:.0f}ms → {after:.0f}ms ({before / after:.1f}x sooner)")
+    await close_async_supabase_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure streamed time to first byte")
+    parser.add_argument("--llm-ms", type=float, default=600.0, help="Executor LLM latency per turn")
+    parser.add_argument("--synth-ms", type=float, default=800.0, help="Synthesizer time to first token")
+    parser.add_argument("--db-ms", type=float, default=50.0, help="Stand-in latency per request")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.SUPABASE_URL = start_background_server(latency_ms=args.db_ms)
+    settings.SUPABASE_KEY = "bench-anon-key"
+    # Every turn should run the full pipeline
+    settings.ANSWER_CACHE_ENABLED = False
+    settings.PREFETCH_ENABLED = False
+
+    print("=" * 60)
+    print(f"Streaming TTFB: {QUERY}")
+    print(f"Executor LLM {args.llm_ms:.0f}ms/turn, synthesizer {args.synth_ms:.0f}ms, "
+          f"DB {args.db_ms:.0f}ms")
+    print("=" * 60)
+
+    install_bench_llms(args.llm_ms / 1000, args.synth_ms / 1000)
+    asyncio.run(run_benchmark(args.runs))
+
+
+if __name__ == "__main__":
+    main()
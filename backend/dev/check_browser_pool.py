@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Manual check for the browser pool's checkout timeout.
+
+Uses stand-in drivers (no Chrome), so it only exercises the pool itself:
+1. With every browser busy on a slow job, arun(timeout=0.5) fails in about
+   0.5s instead of waiting for the running jobs to finish
+2. A caller cancelled while waiting for a browser doesn't leak it
+3. The sync run() path times out the same way
+
+Usage:
+    python -m backend.dev.check_browser_pool
+"""
+import asyncio
+import threading
+import time
+
+from backend.agent_v2.browser_pool import BrowserPool, BrowserPoolTimeout
+
+SLOW_JOB_SECONDS = 2.0
+TIMEOUT = 0.5
+
+
+class FakeDriver:
+    """Answers the calls BrowserPool makes on a WebDriver."""
+
+    current_url = "about:blank"
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+
+    def quit(self) -> None:
+        pass
+
+
+def slow_job(driver: FakeDriver) -> str:
+    time.sleep(SLOW_JOB_SECONDS)
+    return "done"
+
+
+async def check_async_timeout() -> None:
+    pool = BrowserPool(FakeDriver, size=2, max_rss_mb=0)
+    busy = [asyncio.create_task(pool.arun(slow_job)) for _ in range(pool.size)]
+    await asyncio.sleep(0.1)
+
+    start = time.perf_counter()
+    try:
+        await pool.arun(slow_job, timeout=TIMEOUT)
+        raise AssertionError("third arun should have timed out")
+    except BrowserPoolTimeout:
+        elapsed = time.perf_counter() - start
+    assert elapsed < TIMEOUT + 0.3, f"timed out after {elapsed:.2f}s, expected ~{TIMEOUT}s"
+    assert await asyncio.gather(*busy) == ["done"] * pool.size
+    print(f"  async: pool full, arun(timeout={TIMEOUT}) failed after {elapsed:.2f}s")
+
+    # A caller cancelled while waiting must not keep the browser it was about to get
+    busy = [asyncio.create_task(pool.arun(slow_job)) for _ in range(pool.size)]
+    await asyncio.sleep(0.1)
+    waiting = asyncio.create_task(pool.arun(slow_job, timeout=SLOW_JOB_SECONDS * 2))
+    await asyncio.sleep(0.1)
+    waiting.cancel()
+    await asyncio.gather(*busy)
+    await asyncio.sleep(0.2)
+    stats = pool.stats()
+    assert stats["idle"] == pool.size, f"browser leaked after cancel: {stats}"
+    print("  async: cancelled waiter returned its browser")
+    pool.close()
+
+
+def check_sync_timeout() -> None:
+    pool = BrowserPool(FakeDriver, size=1, max_rss_mb=0)
+    busy = threading.Thread(target=pool.run, args=(slow_job,))
+    busy.start()
+    time.sleep(0.1)
+
+    start = time.perf_counter()
+    try:
+        pool.run(slow_job, timeout=TIMEOUT)
+        raise AssertionError("second run should have timed out")
+    except BrowserPoolTimeout:
+        elapsed = time.perf_counter() - start
+    assert elapsed < TIMEOUT + 0.3, f"timed out after {elapsed:.2f}s, expected ~{TIMEOUT}s"
+    busy.join()
+    pool.close()
+    print(f"  sync: pool full, run(timeout={TIMEOUT}) failed after {elapsed:.2f}s")
+
+
+def main():
+    print("=" * 60)
+    print("Browser pool checks")
+    print("=" * 60)
+
+    asyncio.run(check_async_timeout())
+    check_sync_timeout()
+
+    print("\nAll checks passed")
+
+
+if __name__ == "__main__":
+    main()
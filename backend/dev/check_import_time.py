@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for the API.
+
+Imports backend.main in a fresh interpreter under `python -X importtime` and
+fails (exit 1) if:
+- the total import time exceeds --budget-ms, or
+- a heavy backend that should load on first use got imported: torch and
+  sentence_transformers (vector tools), selenium and scrapers (live scrape)
+
+Prints the slowest top-level packages so a regression points at its cause.
+Runs several times and keeps the fastest, since a cold disk cache inflates the
+first import.
+
+Usage:
+    python -m backend.dev.check_import_time
+    python -m backend.dev.check_import_time --budget-ms 3000 --runs 5
+"""
+import argparse
+import subprocess
+import sys
+
+# Must not be imported just to serve the API
+LAZY_MODULES = ("torch", "sentence_transformers", "selenium", "scrapers")
+
+
+def import_profile(module: str) -> dict[str, tuple[int, int]]:
+    """Import `module` in a new interpreter. Returns name -> (self us, cumulative us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        # "import time:       123 |        456 |     package.module"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (field.strip() for field in line[len("import time:"):].split("|"))
+        if self_us.isdigit():
+            profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the API's import time and lazy imports")
+    parser.add_argument("--module", default="backend.main")
+    parser.add_argument("--budget-ms", type=float, default=4000.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=12, help="Slowest top-level packages to show")
+    args = parser.parse_args()
+
+    runs = [import_profile(args.module) for _ in range(args.runs)]
+    profile = min(runs, key=lambda p: p[args.module][1])
+    total_ms = profile[args.module][1] / 1000
+
+    print("=" * 60)
+    print(f"import {args.module}: {total_ms:.0f}ms (best of {args.runs}), budget {args.budget_ms:.0f}ms")
+    print("=" * 60)
+
+    # Self time summed per top-level package
+    packages: dict[str, int] = {}
+    for name, (self_us, _) in profile.items():
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0) + self_us
+    print(f"\n  {'package':<28} {'self ms':>9}")
+    for name, us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<28} {us / 1000:>9.1f}")
+
+    failures = []
+    eager = sorted({name.split(".")[0] for name in profile} & set(LAZY_MODULES))
+    if eager:
+        failures.append(f"imported eagerly: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"{total_ms:.0f}ms over the {args.budget_ms:.0f}ms budget")
+
+    print()
+    if failures:
+        print(f"FAIL: {'; '.join(failures)}")
+        sys.exit(1)
+    print("OK: within budget, heavy backends load on first use")
+
+
+if __name__ == "__main__":
+    main()
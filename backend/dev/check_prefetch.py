@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Manual check for entity prefetch.
+
+Runs against the local PostgREST stand-in (fixed latency per request):
+1. Identifier extraction on typical queries
+2. A simulated turn - prefetch starts, the "scope check" sleeps, then the
+   executor's tool calls run - with and without prefetch
+3. Prefetched results are not visible outside the request context
+
+No LLM calls are made.
+
+Usage:
+    python -m backend.dev.check_prefetch
+    python -m backend.dev.check_prefetch --latency-ms 80 --scope-ms 400
+"""
+import argparse
+import asyncio
+import time
+
+from backend.config import get_settings
+from backend.dev.postgrest_server import start_background_server
+
+
+QUERIES = [
+    "Is PS11750003 compatible with my WDT780SAEM1?",
+    "I need part WPW10320007 for my fridge",
+    "https://www.partselect.com/PS11750012-Whirlpool-Door-Shelf-Bin.htm",
+    "my ice maker is not working",
+]
+
+
+def check_extraction() -> None:
+    from backend.agent_v2.prefetch import extract_entities, plan_lookups
+
+    print("\nExtraction:")
+    for query in QUERIES:
+        entities = extract_entities(query)
+        calls = [name for name, _ in plan_lookups(entities)]
+        print(f"  {query[:55]:<55} ps={entities.ps_numbers} ids={entities.identifiers}")
+        print(f"  {'':<55} lookups={calls}")
+
+
+async def simulated_turn(query: str, use_prefetch: bool, scope_seconds: float) -> float:
+    """Prefetch (optional) → scope check → executor tool calls. Returns tool time in ms."""
+    from backend.agent_v2.prefetch import start_prefetch, RequestPrefetch
+    from backend.agent_v2.tools import get_tool_map
+
+    tools = get_tool_map()
+    prefetch = start_prefetch(query) if use_prefetch else RequestPrefetch()
+    try:
+        await asyncio.sleep(scope_seconds)  # scope check + first executor LLM turn
+
+        start = time.perf_counter()
+        part = await tools["get_part"].ainvoke({"ps_number": "PS11750003"})
+        compat = await tools["check_compatibility"].ainvoke(
+            {"ps_number": "PS11750003", "model_number": "WDT780SAEM1"}
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        assert part["ps_number"] == "PS11750003", part
+        assert compat["compatible"] is True, compat
+        return elapsed
+    finally:
+        prefetch.close()
+
+
+async def check_isolation() -> None:
+    """Results bound in one task's context must not leak into another."""
+    from backend.agent_v2.prefetch import start_prefetch
+    from backend.agent_v2.tools.registry import _request_cache
+
+    async def request_a():
+        prefetch = start_prefetch("PS11750003")
+        await asyncio.sleep(0.05)
+        assert _request_cache.get() is not None
+        prefetch.close()
+        assert _request_cache.get() is None
+
+    async def request_b():
+        await asyncio.sleep(0.02)
+        assert _request_cache.get() is None
+
+    await asyncio.gather(asyncio.create_task(request_a()), asyncio.create_task(request_b()))
+    print("\nIsolation: request cache is context-local ✓")
+
+
+async def run_checks(scope_seconds: float) -> None:
+    from backend.agent_v2.tools.registry import registry
+    from backend.db import close_async_supabase_client
+
+    # Tool result cache off so every lookup goes to the stand-in
+    registry.cache_enabled = False
+    query = QUERIES[0]
+
+    await simulated_turn(query, False, 0)  # warm the connection pool
+
+    without = await simulated_turn(query, False, scope_seconds)
+    with_prefetch = await simulated_turn(query, True, scope_seconds)
+
+    print(f"\nExecutor tool time for: {query}")
+    print(f"  without prefetch: {without:7.1f}ms")
+    print(f"  with prefetch:    {with_prefetch:7.1f}ms")
+
+    await check_isolation()
+    await close_async_supabase_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check entity prefetch")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Stand-in latency per request")
+    parser.add_argument("--scope-ms", type=float, default=300.0, help="Simulated scope check + LLM turn")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.SUPABASE_URL = start_background_server(latency_ms=args.latency_ms)
+    settings.SUPABASE_KEY = "check-anon-key"
+
+    print("=" * 60)
+    print("Entity prefetch")
+    print("=" * 60)
+
+    check_extraction()
+    asyncio.run(run_checks(args.scope_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
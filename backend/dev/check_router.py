@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Manual check for the fast-path intent router.
+
+1. Template matching on canonical and non-canonical queries
+2. router_node on matched queries against the local PostgREST stand-in -
+   tool messages, session update and time (no LLM calls)
+3. Per-intent hit rates
+
+Usage:
+    python -m backend.dev.check_router
+    python -m backend.dev.check_router --latency-ms 80
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from backend.config import get_settings
+from backend.dev.postgrest_server import start_background_server
+
+
+QUERIES = [
+    # Fast path
+    ("PS11750003", "part_lookup"),
+    ("Tell me about PS11750003", "part_lookup"),
+    ("How much is PS11750003?", "price_availability"),
+    ("Is PS11750003 in stock?", "price_availability"),
+    ("Does PS11750003 fit my WDT780SAEM1?", "compatibility"),
+    ("Is PS11750003 compatible with model WDT780SAEM1?", "compatibility"),
+    ("What models does PS11750003 fit?", "compatible_models"),
+    ("What are common dishwasher problems?", "symptom_list"),
+    # ReAct executor
+    ("Does it fit my model?", None),
+    ("Is PS11750003 compatible with my fridge?", None),
+    ("Tell me about PS11750003 and how to install it", None),
+    ("Compare PS11750003 and PS11750004", None),
+    ("my ice maker is not working", None),
+]
+
+
+def check_matching() -> None:
+    from backend.agent_v2.nodes.router import match_intent
+
+    print("\nMatching:")
+    for query, expected in QUERIES:
+        matched = match_intent(query)
+        name = matched[0].name if matched else None
+        mark = "✓" if name == expected else "✗"
+        groups = matched[1] if matched else {}
+        print(f"  {mark} {query:<50} → {name or 'executor'} {groups or ''}")
+        assert name == expected, (query, name, expected)
+
+
+async def check_node() -> None:
+    from backend.agent_v2.nodes.router import router_node, ROUTER_STATS
+    from backend.agent_v2.state import AgentState
+    from backend.db import close_async_supabase_client
+
+    ROUTER_STATS.reset()
+    print("\nrouter_node:")
+    for query, expected in QUERIES:
+        state = AgentState(user_query=query, is_in_scope=True)
+        start = time.perf_counter()
+        result = await router_node(state)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        assert result["fast_path"] == (expected is not None), (query, result)
+        if not result["fast_path"]:
+            continue
+
+        messages = result["executor_result"]["messages"]
+        tools = [m.name for m in messages[1:]]
+        first = json.loads(messages[1].content)
+        if result["intent"] == "symptom_list":
+            assert first and first[0]["symptom"], first
+        else:
+            assert first["ps_number"] == "PS11750003", first
+            assert result["session"].all_discussed_parts == ["PS11750003"], result["session"]
+        print(f"  {query:<50} {elapsed:6.1f}ms {tools}")
+
+    await close_async_supabase_client()
+
+    stats = ROUTER_STATS.stats()
+    print(f"\nHit rate: {stats['fast_path_hits']}/{stats['routed_queries']} "
+          f"({stats['fast_path_hit_rate']:.0%})")
+    for name, intent in stats["intents"].items():
+        print(f"  {name:<20} hits={intent['hits']} failures={intent['failures']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the fast-path intent router")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Stand-in latency per request")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.SUPABASE_URL = start_background_server(latency_ms=args.latency_ms)
+    settings.SUPABASE_KEY = "check-anon-key"
+    settings.PREFETCH_ENABLED = False
+
+    print("=" * 60)
+    print("Fast-path router")
+    print("=" * 60)
+
+    check_matching()
+    asyncio.run(check_node())
+
+
+if __name__ == "__main__":
+    main()
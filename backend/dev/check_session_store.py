@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Manual check for the session stores and compact session encoding.
+
+Exercises InMemorySessionStore (LRU cap + TTL expiry) and RedisSessionStore
+against the local RESP stand-in, and compares encoded size with model_dump() JSON.
+
+Usage:
+    python -m backend.dev.check_session_store
+    python -m backend.dev.check_session_store --redis-url redis://localhost:6379/0
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from backend.agent_v2.state import SessionState, Message
+from backend.agent_v2.session_store import (
+    InMemorySessionStore,
+    RedisSessionStore,
+    encode_session,
+    decode_session,
+)
+from backend.dev.resp_server import start_background_server
+
+
+def sample_session() -> SessionState:
+    """Build a session shaped like a real 5-exchange conversation."""
+    session = SessionState(all_discussed_parts=["PS11752778", "PS11722135"])
+    for i in range(5):
+        session.conversation_history.append(
+            Message(role="user", content=f"Is PS11752778 compatible with WDT780SAEM{i}?")
+        )
+        session.conversation_history.append(
+            Message(role="assistant", content="Yes, the **Door Shelf Bin (PS11752778)** fits that model. " * 6)
+        )
+    return session
+
+
+def check_encoding() -> None:
+    session = sample_session()
+    encoded = encode_session(session)
+    dumped = json.dumps(session.model_dump()).encode("utf-8")
+
+    assert decode_session(encoded) == session, "round trip mismatch"
+    print(f"  encoding: {len(encoded)} bytes (model_dump JSON: {len(dumped)} bytes)")
+
+
+def check_memory_store() -> None:
+    store = InMemorySessionStore(max_sessions=3, ttl_seconds=1)
+    for i in range(4):
+        store.set(f"s{i}", sample_session())
+
+    assert store.get("s0") is None, "LRU entry should have been evicted"
+    assert len(store) == 3
+    assert store.get("s3") is not None
+
+    time.sleep(1.1)
+    assert store.get("s3") is None, "entry should have expired"
+    print("  memory store: LRU cap and TTL OK")
+
+
+def check_redis_store(url: str) -> None:
+    store = RedisSessionStore(url=url, ttl_seconds=1, key_prefix="check:")
+    store.set("a", sample_session())
+    assert store.get("a") == sample_session()
+
+    # Simulate a second worker sharing the same backend
+    other_worker = RedisSessionStore(url=url, ttl_seconds=1, key_prefix="check:")
+    assert other_worker.get("a") is not None, "session not shared across clients"
+
+    store.delete("a")
+    assert other_worker.get("a") is None
+
+    # What the API handlers use - the blocking client runs in a worker thread
+    asyncio.run(store.aset("c", sample_session()))
+    assert asyncio.run(other_worker.aget("c")) == sample_session()
+
+    store.set("b", sample_session())
+    time.sleep(1.1)
+    assert store.get("b") is None, "entry should have expired"
+    store.close()
+    other_worker.close()
+    print(f"  redis store ({url}): shared access, async access, delete and TTL OK")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check session stores")
+    parser.add_argument("--redis-url", default=None, help="Use a real Redis instead of the stand-in")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Session store checks")
+    print("=" * 60)
+
+    check_encoding()
+    check_memory_store()
+    check_redis_store(args.redis_url or start_background_server())
+
+    print("\nAll checks passed")
+
+
+if __name__ == "__main__":
+    main()
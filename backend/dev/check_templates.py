@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Manual check for template synthesis.
+
+Runs router_node → synthesizer_node_streaming for each fast-path intent
+against the local PostgREST stand-in and prints the rendered answer, the
+time to first chunk, and the part cards that extract_mentioned_ps_numbers
+selects. No LLM calls are made - the check fails if a template falls back.
+
+Also checks that a part missing from the catalog but found by the live-scrape
+fallback is left to the LLM rather than answered "not found".
+
+Usage:
+    python -m backend.dev.check_templates
+"""
+import argparse
+import asyncio
+import time
+
+from backend.config import get_settings
+from backend.dev.postgrest_server import start_background_server
+
+
+QUERIES = [
+    ("Tell me about PS11750003", ["PS11750003"]),
+    ("How much is PS11750003?", ["PS11750003"]),
+    ("Does PS11750003 fit my WDT780SAEM1?", ["PS11750003"]),
+    ("Is PS11750050 compatible with WDT780SAEM1?", ["PS11750050"]),
+    ("What models does PS11750003 fit?", ["PS11750003"]),
+    ("What are common dishwasher problems?", []),
+    ("Tell me about PS99999999", []),  # not found
+]
+
+
+async def run_query(query: str) -> tuple[str, float, list[str]]:
+    """Returns (response, ms to first chunk after routing, part card PS numbers)."""
+    from backend.agent_v2.nodes import router_node, synthesizer_node_streaming
+    from backend.agent_v2.nodes.synthesizer import extract_parts, extract_mentioned_ps_numbers
+    from backend.agent_v2.state import AgentState
+
+    state = AgentState(user_query=query, is_in_scope=True)
+    state = AgentState(**{**state.model_dump(), **await router_node(state)})
+    assert state.fast_path, query
+
+    start = time.perf_counter()
+    first_chunk = None
+    response = ""
+    async for chunk in synthesizer_node_streaming(state):
+        if first_chunk is None:
+            first_chunk = (time.perf_counter() - start) * 1000
+        response += chunk
+
+    mentioned = extract_mentioned_ps_numbers(response)
+    cards = [p["ps_number"] for p in extract_parts(state) if p["ps_number"] in mentioned]
+    return response, first_chunk, cards
+
+
+def check_scraped_fallback() -> None:
+    """get_part not found + successful scrape_part_live → no template, for every part intent."""
+    import json
+    from langchain_core.messages import AIMessage, ToolMessage
+    from backend.agent_v2.state import AgentState
+    from backend.agent_v2.templates import render_template
+
+    ps_number = "PS99999999"
+    plans = {
+        "part_lookup": {"get_part": {"ps_number": ps_number}},
+        "price_availability": {"get_part": {"ps_number": ps_number}},
+        "compatibility": {
+            "get_part": {"ps_number": ps_number},
+            "check_compatibility": {"ps_number": ps_number, "model_number": "WDT780SAEM1"},
+        },
+        "compatible_models": {
+            "get_part": {"ps_number": ps_number},
+            "get_compatible_models": {"ps_number": ps_number},
+        },
+    }
+    results = {
+        "get_part": {"error": f"Part {ps_number} not found", "ps_number": ps_number},
+        "check_compatibility": {"compatible": False},
+        "get_compatible_models": {"models": []},
+    }
+    scraped = {"ps_number": ps_number, "part_name": "Door Shelf Bin", "part_price": "39.95"}
+
+    for intent, plan in plans.items():
+        calls = [{"name": name, "args": args, "id": f"fast_{name}", "type": "tool_call"} for name, args in plan.items()]
+        messages = [AIMessage(content="", tool_calls=calls)]
+        messages += [ToolMessage(content=json.dumps(results[c["name"]]), tool_call_id=c["id"], name=c["name"]) for c in calls]
+
+        state = AgentState(user_query=ps_number, is_in_scope=True, fast_path=True, intent=intent,
+                           executor_result={"messages": messages})
+        assert "couldn't find" in render_template(state), intent
+
+        messages.append(ToolMessage(content=json.dumps(scraped), tool_call_id=f"scrape_{ps_number}",
+                                    name="scrape_part_live"))
+        state.executor_result = {"messages": messages}
+        assert render_template(state) is None, intent
+    print(f"\n--- not found + live scrape: left to the LLM for {', '.join(plans)}")
+
+
+async def run_checks() -> None:
+    from backend.db import close_async_supabase_client
+
+    for query, expected_cards in QUERIES:
+        response, first_chunk, cards = await run_query(query)
+        print(f"\n--- {query}  (first chunk {first_chunk:.2f}ms, cards {cards})")
+        print(response)
+        assert cards == expected_cards, (query, cards)
+
+    await close_async_supabase_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check template synthesis")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stand-in latency per request")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.SUPABASE_URL = start_background_server(latency_ms=args.latency_ms)
+    settings.SUPABASE_KEY = "check-anon-key"
+    # An empty key makes any LLM fallback fail loudly instead of calling the API
+    settings.ANTHROPIC_API_KEY = ""
+
+    print("=" * 60)
+    print("Template synthesis")
+    print("=" * 60)
+
+    check_scraped_fallback()
+    asyncio.run(run_checks())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Minimal PostgREST stand-in for local benchmarks.
+
+Serves just enough of the Supabase REST surface for the agent tools:
+- GET  /rest/v1/{table}      → rows from an in-memory fixture, filtered on eq.* params
+- POST /rest/v1/rpc/{name}   → empty result set
+
+The fixture is either a handful of synthetic rows (default_fixture) or the
+scraped catalog in data/*.csv (csv_fixture), cleaned the way
+database/load_data.py cleans it before upserting.
+
+Every request sleeps for a fixed latency to model the network + query time of
+a hosted database. Not a real PostgREST - ilike/or/order/range are ignored.
+
+Usage:
+    python -m backend.dev.postgrest_server --port 54321 --latency-ms 20
+    python -m backend.dev.postgrest_server --data-dir data
+
+    from backend.dev.postgrest_server import start_background_server, start_server_process
+    url = start_background_server(latency_ms=20)   # e.g. "http://127.0.0.1:40123"
+    url, proc = start_server_process(latency_ms=20)  # separate process (own GIL/CPU)
+    url, proc = start_server_process(data_dir="data")  # real catalog from CSV
+"""
+import argparse
+import asyncio
+import csv
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+def default_fixture() -> dict[str, list[dict]]:
+    """A handful of rows shaped like the real tables."""
+    parts = [
+        {
+            "ps_number": f"PS1175{i:04d}",
+            "part_name": f"Door Shelf Bin {i}",
+            "part_type": "Door Shelf",
+            "manufacturer_part_number": f"WPW1032{i:04d}",
+            "part_price": 39.95,
+            "average_rating": 4.8,
+            "num_reviews": 120,
+            "availability": "In Stock",
+            "brand": "Whirlpool",
+            "appliance_type": "refrigerator",
+            "part_url": f"https://www.partselect.com/PS1175{i:04d}.htm",
+        }
+        for i in range(100)
+    ]
+    compatibility = [
+        {"part_id": p["ps_number"], "model_number": "WDT780SAEM1",
+         "brand": "Whirlpool", "description": "Dishwasher"}
+        for p in parts[:20]
+    ]
+    symptoms = [
+        {"appliance_type": appliance, "symptom": symptom, "percentage": pct,
+         "symptom_description": f"{symptom} on a {appliance}", "parts": "Water Inlet Valve, Ice Maker",
+         "difficulty": "EASY", "video_url": None,
+         "symptom_url": f"https://www.partselect.com/Repair/{appliance.title()}/"}
+        for appliance in ("refrigerator", "dishwasher")
+        for symptom, pct in (("Noisy", 29.0), ("Leaking", 27.0), ("Not draining", 12.0))
+    ]
+    return {"parts": parts, "model_compatibility": compatibility, "repair_symptoms": symptoms}
+
+
+# Column → converter for the CSV catalog (everything else stays a string)
+_CSV_TABLES = {
+    "parts": {"part_price": "decimal", "average_rating": "decimal", "num_reviews": "int"},
+    "model_compatibility": {},
+    "repair_symptoms": {"percentage": "decimal"},
+    "repair_instructions": {},
+    "repair_stories": {"helpful_count": "int", "vote_count": "int"},
+    "reviews": {"rating": "int", "verified_purchase": "bool"},
+    "qna": {},
+}
+
+# Natural keys, deduplicated keeping the last row (as load_data.py does)
+_CSV_KEYS = {
+    "parts": ("ps_number",),
+    "repair_stories": ("ps_number", "story_id"),
+    "reviews": ("ps_number", "review_id"),
+}
+
+
+def _convert(value: str, kind: str):
+    from database.load_data import clean_decimal
+
+    if kind == "decimal":
+        return clean_decimal(value)
+    if kind == "int":
+        return int(clean_decimal(value) or 0)
+    if kind == "bool":
+        return value.strip().lower() == "true"
+    return value
+
+
+def csv_fixture(data_dir: str | Path = "data") -> dict[str, list[dict]]:
+    """Load the scraped catalog from data/*.csv. Missing files give empty tables."""
+    data_dir = Path(data_dir)
+    tables = {}
+    for table, columns in _CSV_TABLES.items():
+        path = data_dir / f"{table}.csv"
+        if not path.exists():
+            tables[table] = []
+            continue
+        with open(path, encoding="utf-8") as f:
+            rows = [
+                {k: _convert(v, columns[k]) if k in columns else (v or None) for k, v in row.items()}
+                for row in csv.DictReader(f)
+            ]
+        keys = _CSV_KEYS.get(table)
+        if keys:
+            rows = list({tuple(r[k] for k in keys): r for r in rows if all(r.get(k) for k in keys)}.values())
+        tables[table] = rows
+    return tables
+
+
+def create_app(latency_ms: float = 20.0, fixture: dict[str, list[dict]] | None = None) -> Starlette:
+    """Build the stand-in ASGI app."""
+    tables = fixture if fixture is not None else default_fixture()
+    latency = latency_ms / 1000
+    # (table, column) → value → rows, built on first filter so CSV-sized tables stay cheap
+    indexes: dict[tuple[str, str], dict[str, list[dict]]] = {}
+
+    def lookup(table: str, column: str, value: str) -> list[dict]:
+        index = indexes.get((table, column))
+        if index is None:
+            index = defaultdict(list)
+            for row in tables.get(table, []):
+                index[str(row.get(column))].append(row)
+            indexes[(table, column)] = index
+        return index.get(value, [])
+
+    async def select(request: Request) -> JSONResponse:
+        await asyncio.sleep(latency)
+        table = request.path_params["table"]
+        rows = None
+
+        # Only eq.* filters are applied; everything else is ignored
+        for column, value in request.query_params.items():
+            if value.startswith("eq."):
+                if rows is None:
+                    rows = lookup(table, column, value[3:])
+                else:
+                    rows = [r for r in rows if str(r.get(column)) == value[3:]]
+        if rows is None:
+            rows = tables.get(table, [])
+
+        limit = request.query_params.get("limit")
+        if limit is not None:
+            rows = rows[:int(limit)]
+        return JSONResponse(rows)
+
+    async def rpc(request: Request) -> JSONResponse:
+        await asyncio.sleep(latency)
+        return JSONResponse([])
+
+    return Starlette(routes=[
+        Route("/rest/v1/rpc/{name}", rpc, methods=["POST"]),
+        Route("/rest/v1/{table}", select, methods=["GET"]),
+    ])
+
+
+def free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def start_background_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency_ms: float = 20.0,
+    fixture: dict[str, list[dict]] | None = None,
+) -> str:
+    """Start the stand-in in a daemon thread. Returns its base URL."""
+    port = port or free_port(host)
+    config = uvicorn.Config(
+        create_app(latency_ms, fixture),
+        host=host,
+        port=port,
+        log_level="warning",
+        access_log=False,
+        # The benchmark client opens many keep-alive connections
+        backlog=4096,
+        limit_concurrency=None,
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("PostgREST stand-in failed to start")
+        time.sleep(0.01)
+    return f"http://{host}:{port}"
+
+
+def start_server_process(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency_ms: float = 20.0,
+    data_dir: str | Path | None = None,
+) -> tuple[str, subprocess.Popen]:
+    """
+    Start the stand-in in a child process. Returns (base URL, process).
+
+    Use this for throughput benchmarks so the server doesn't compete with the
+    client for the GIL. With `data_dir` it serves the CSV catalog instead of
+    the synthetic fixture. Call process.terminate() when done.
+    """
+    port = port or free_port(host)
+    command = [sys.executable, "-m", "backend.dev.postgrest_server",
+               "--host", host, "--port", str(port), "--latency-ms", str(latency_ms)]
+    if data_dir is not None:
+        command += ["--data-dir", str(data_dir)]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            break
+        except OSError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError("PostgREST stand-in failed to start")
+            time.sleep(0.05)
+    return f"http://{host}:{port}", process
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Minimal PostgREST stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--data-dir", help="Serve the CSV catalog from this directory (e.g. data)")
+    args = parser.parse_args()
+
+    fixture = csv_fixture(args.data_dir) if args.data_dir else None
+    print(f"PostgREST stand-in on http://{args.host}:{args.port} "
+          f"(latency {args.latency_ms:.0f}ms)")
+    uvicorn.run(
+        create_app(args.latency_ms, fixture),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+        access_log=False,
+        backlog=4096,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Minimal in-process Redis-protocol (RESP2) server for local development.
+
+Implements just enough of Redis for the session store and caches:
+PING, GET, SET (EX/PX), DEL, EXISTS, EXPIRE, TTL, FLUSHDB, DBSIZE, plus HELLO
+(RESP2 only) and a no-op CLIENT/SELECT so redis-py can connect.
+Not for production use.
+
+Usage:
+    python -m backend.dev.resp_server --port 6390
+
+    # Or from code (runs in a background thread):
+    from backend.dev.resp_server import start_background_server
+    url = start_background_server()   # "redis://127.0.0.1:<port>/0"
+"""
+import argparse
+import asyncio
+import threading
+import time
+
+
+class RespStore:
+    """Key-value data with per-key expiry (monotonic seconds)."""
+
+    def __init__(self):
+        self.data: dict[bytes, bytes] = {}
+        self.expires: dict[bytes, float] = {}
+
+    def _alive(self, key: bytes) -> bool:
+        exp = self.expires.get(key)
+        if exp is not None and exp <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+            return False
+        return key in self.data
+
+    def execute(self, args: list[bytes]) -> bytes:
+        """Run one command and return the RESP-encoded reply."""
+        cmd = args[0].upper()
+
+        if cmd == b"PING":
+            return b"+PONG\r\n"
+        if cmd in (b"CLIENT", b"SELECT"):
+            return b"+OK\r\n"
+        if cmd == b"HELLO":
+            if len(args) > 1 and args[1] != b"2":
+                return b"-NOPROTO this server only speaks RESP2\r\n"
+            fields = [b"server", b"redis", b"version", b"7.0.0", b"proto", b"2", b"mode", b"standalone"]
+            return b"*%d\r\n" % len(fields) + b"".join(b"$%d\r\n%s\r\n" % (len(f), f) for f in fields)
+        if cmd == b"GET":
+            key = args[1]
+            if not self._alive(key):
+                return b"$-1\r\n"
+            value = self.data[key]
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if cmd == b"SET":
+            key, value = args[1], args[2]
+            self.data[key] = value
+            self.expires.pop(key, None)
+            opts = [a.upper() for a in args[3:]]
+            if b"EX" in opts:
+                self.expires[key] = time.monotonic() + int(args[3 + opts.index(b"EX") + 1])
+            elif b"PX" in opts:
+                self.expires[key] = time.monotonic() + int(args[3 + opts.index(b"PX") + 1]) / 1000
+            return b"+OK\r\n"
+        if cmd == b"DEL":
+            removed = 0
+            for key in args[1:]:
+                if self._alive(key):
+                    removed += 1
+                    self.data.pop(key, None)
+                    self.expires.pop(key, None)
+            return b":%d\r\n" % removed
+        if cmd == b"EXISTS":
+            return b":%d\r\n" % sum(1 for key in args[1:] if self._alive(key))
+        if cmd == b"EXPIRE":
+            key = args[1]
+            if not self._alive(key):
+                return b":0\r\n"
+            self.expires[key] = time.monotonic() + int(args[2])
+            return b":1\r\n"
+        if cmd == b"TTL":
+            key = args[1]
+            if not self._alive(key):
+                return b":-2\r\n"
+            exp = self.expires.get(key)
+            return b":%d\r\n" % (-1 if exp is None else int(exp - time.monotonic()))
+        if cmd == b"FLUSHDB":
+            self.data.clear()
+            self.expires.clear()
+            return b"+OK\r\n"
+        if cmd == b"DBSIZE":
+            return b":%d\r\n" % sum(1 for key in list(self.data) if self._alive(key))
+
+        return b"-ERR unknown command '%s'\r\n" % args[0]
+
+
+async def _read_command(reader: asyncio.StreamReader) -> list[bytes] | None:
+    """Read one RESP array command (or inline command)."""
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        return line.strip().split()
+
+    count = int(line[1:])
+    args = []
+    for _ in range(count):
+        header = await reader.readline()
+        length = int(header[1:])
+        payload = await reader.readexactly(length + 2)
+        args.append(payload[:-2])
+    return args
+
+
+def _make_handler(store: RespStore):
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                args = await _read_command(reader)
+                if args is None:
+                    break
+                if not args:
+                    continue
+                writer.write(store.execute(args))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    return handle
+
+
+async def serve(host: str = "127.0.0.1", port: int = 6390, ready: threading.Event | None = None,
+                bound: dict | None = None):
+    """Run the server until cancelled."""
+    store = RespStore()
+    server = await asyncio.start_server(_make_handler(store), host, port)
+    if bound is not None:
+        bound["port"] = server.sockets[0].getsockname()[1]
+    if ready is not None:
+        ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+def start_background_server(host: str = "127.0.0.1", port: int = 0) -> str:
+    """Start the server on a daemon thread and return its redis:// URL."""
+    ready = threading.Event()
+    bound: dict = {}
+
+    thread = threading.Thread(
+        target=lambda: asyncio.run(serve(host, port, ready, bound)),
+        daemon=True,
+    )
+    thread.start()
+    ready.wait(timeout=5)
+    return f"redis://{host}:{bound['port']}/0"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Minimal Redis-protocol server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6390)
+    args = parser.parse_args()
+
+    print(f"RESP server listening on redis://{args.host}:{args.port}/0")
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Scripted stand-in chat model for local benchmarks.
+
+Replays a fixed sequence of messages - tool calls, then an answer - with a
+configurable latency, so the agent plumbing (graph, ReAct loop, tools,
+streaming) runs end to end without calling Anthropic.
+
+The reply is picked by how many AI turns the conversation already has, not by
+a call counter, so one model can serve many concurrent chats: the ReAct agent
+gets responses[0] (tool calls) on its first turn and responses[1] (answer)
+after the tool results come back.
+
+`query_pattern` makes the script follow the query: its named groups, matched
+against the conversation, fill "{name}" placeholders in the reply text and
+tool-call args.
+
+Usage:
+    from backend.dev.scripted_llm import ScriptedChatModel, install_scripted_llms
+
+    install_scripted_llms(executor=[...], synthesizer=[...], delay=0.6)
+"""
+import asyncio
+import json
+import re
+import time
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Returns scripted messages by conversation turn, sleeping `delay` seconds first."""
+
+    responses: list[AIMessage]
+    delay: float = 0.0
+    # Gap between streamed words
+    token_delay: float = 0.01
+    query_pattern: str | None = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _fields(self, messages: list[BaseMessage]) -> dict[str, str]:
+        if not self.query_pattern:
+            return {}
+        text = "\n".join(str(m.content) for m in messages if m.type == "human")
+        match = re.search(self.query_pattern, text)
+        return match.groupdict() if match else {}
+
+    def _next(self, messages: list[BaseMessage]) -> AIMessage:
+        turn = sum(1 for m in messages if m.type == "ai")
+        message = self.responses[turn % len(self.responses)]
+        fields = self._fields(messages)
+        if not fields:
+            return message
+
+        def fill(value):
+            return value.format(**fields) if isinstance(value, str) else value
+
+        return AIMessage(
+            content=fill(message.content),
+            tool_calls=[
+                {**tc, "args": {k: fill(v) for k, v in tc["args"].items()}}
+                for tc in message.tool_calls
+            ],
+        )
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=self._next(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=self._next(messages))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        # astream_events streams the executor model too
+        await asyncio.sleep(self.delay)
+        message = self._next(messages)
+        if message.tool_calls:
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[
+                {"name": tc["name"], "args": json.dumps(tc["args"]), "id": tc["id"], "index": i}
+                for i, tc in enumerate(message.tool_calls)
+            ]))
+            return
+        for word in message.content.split(" "):
+            await asyncio.sleep(self.token_delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word + " "))
+
+
+def install_scripted_llms(
+    executor: list[AIMessage],
+    synthesizer: list[AIMessage],
+    delay: float,
+    synth_delay: float | None = None,
+    query_pattern: str | None = None,
+) -> None:
+    """Swap the process runtime's LLMs for scripted ones and rebuild the ReAct agent."""
+    from langgraph.prebuilt import create_react_agent
+    from backend.agent_v2.runtime import get_runtime
+
+    runtime = get_runtime()
+    runtime.executor_llm = ScriptedChatModel(
+        responses=executor, delay=delay, query_pattern=query_pattern,
+    )
+    runtime.react_agent = create_react_agent(runtime.executor_llm, runtime.tools)
+    runtime.scope_llm = ScriptedChatModel(responses=[AIMessage(content="IN_SCOPE")], delay=delay)
+    runtime.synthesizer_llm = ScriptedChatModel(
+        responses=synthesizer,
+        delay=delay if synth_delay is None else synth_delay,
+        query_pattern=query_pattern,
+    )
@@ -0,0 +1,178 @@
+"""
+Logging setup for the backend.
+
+All backend modules log through `logging.getLogger(__name__)`. setup_logging()
+(called from the FastAPI lifespan) routes the "backend" logger through a
+QueueHandler: request handlers only enqueue records, and a QueueListener
+thread formats and writes them, so logging never blocks the event loop on
+stdout.
+
+Every record carries the current request ID (see bind_request_id), so lines
+from concurrent chats can be told apart.
+
+Environment:
+    LOG_LEVEL   default level for backend.* loggers (INFO - debug output is off)
+    LOG_LEVELS  per-module overrides, e.g. "backend.db=DEBUG,backend.agent_v2.nodes.executor=DEBUG"
+    LOG_FORMAT  "text" (default) or "json" (one object per line)
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import re
+import sys
+import uuid
+from contextvars import ContextVar, Token
+from backend.config import get_settings
+
+
+# =============================================================================
+# Request ID correlation
+# =============================================================================
+
+_request_id: ContextVar[str] = ContextVar("request_id", default="-")
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def bind_request_id(request_id: str) -> Token:
+    """Tag log records from the current context (and tasks created from it)."""
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    _request_id.reset(token)
+
+
+def current_request_id() -> str:
+    return _request_id.get()
+
+
+# Client-supplied IDs are echoed only if they look like IDs
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]{1,64}")
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware binding a request ID for the whole request, including
+    streamed response bodies (their tasks inherit the context). Uses the
+    client's X-Request-ID if valid and echoes the ID back in that header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        supplied = dict(scope["headers"]).get(b"x-request-id", b"").decode("latin-1")
+        request_id = supplied if _VALID_REQUEST_ID.fullmatch(supplied) else new_request_id()
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"x-request-id", request_id.encode())]
+            await send(message)
+
+        token = bind_request_id(request_id)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            reset_request_id(token)
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp the request ID on records before they cross to the listener thread."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        return True
+
+
+# =============================================================================
+# Formatters
+# =============================================================================
+
+# LogRecord attributes that aren't user-supplied `extra` fields
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; `extra={...}` fields become top-level keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+TEXT_FORMAT = "%(asctime)s %(levelname)-7s [%(request_id)s] %(name)s: %(message)s"
+
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def parse_levels(spec: str) -> dict[str, str]:
+    """'backend.db=DEBUG, backend.agent_v2=WARNING' → {"backend.db": "DEBUG", ...}"""
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging() -> None:
+    """Route backend.* logging through a background queue listener. Idempotent."""
+    global _listener
+    if _listener is not None:
+        return
+
+    settings = get_settings()
+    handler = logging.StreamHandler(sys.stdout)
+    if settings.LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+
+    backend_logger = logging.getLogger("backend")
+    backend_logger.handlers = [queue_handler]
+    backend_logger.setLevel(settings.LOG_LEVEL.upper())
+    backend_logger.propagate = False
+    for name, level in parse_levels(settings.LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
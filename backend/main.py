@@ -5,27 +5,69 @@ Endpoints:
 - POST /chat - Non-streaming chat endpoint
 - POST /chat/stream - SSE streaming endpoint
 - GET /health - Health check
+- GET /stats - Fast-path router and cache hit rates
+- GET /metrics - Prometheus latency histograms and LLM token counters
 """
+import asyncio
 import json
+import logging
 import uuid
 from typing import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, PlainTextResponse
 from pydantic import BaseModel, Field
 from sse_starlette.sse import EventSourceResponse
 
 from backend.config import get_settings
+from backend.db import (
+    close_async_supabase_client,
+    close_parts_catalog,
+    get_parts_catalog,
+    init_parts_catalog,
+    init_vector_stores,
+)
+from backend.logging_config import (
+    RequestIdMiddleware,
+    current_request_id,
+    setup_logging,
+    shutdown_logging,
+)
+from backend.metrics import (
+    REQUEST_SECONDS,
+    RequestTimings,
+    bind_request_timings,
+    reset_request_timings,
+    render_prometheus,
+)
 
 # V2 Agent - simplified architecture
 from backend.agent_v2 import run_agent, run_agent_streaming, SessionState, Message
+from backend.agent_v2.runtime import init_runtime, reset_runtime
+from backend.agent_v2.session_store import create_session_store
+from backend.agent_v2.nodes.router import get_router_stats
+from backend.agent_v2.answer_cache import get_answer_cache
+from backend.agent_v2.browser_pool import close_browser_pool, get_browser_pool
+from backend.agent_v2.embedding_cache import get_embedding_cache, save_embedding_cache
+from backend.agent_v2.scrape_writeback import (
+    close_scrape_writeback,
+    get_missing_parts_cache,
+    get_scrape_writeback,
+)
+from backend.agent_v2.tools import get_tool_cache_stats, invalidate_tool_cache
+from backend.agent_v2.tools.vector_tools import (
+    awarm_up_embedding_model,
+    embedding_model_ready,
+    get_embedding_batcher,
+)
 
 # To switch back to V1, comment above and uncomment below:
 # from backend.agent import run_agent, run_agent_streaming, SessionState
 # from backend.agent.state import Message
 
+logger = logging.getLogger(__name__)
 
 
 # Request/Response models
@@ -58,47 +100,87 @@ class ChatResponse(BaseModel):
     parts: list[PartCard] = []
 
 
-# In-memory session storage (replace with Redis/DB for production)
-sessions: dict[str, SessionState] = {}
+# Session storage - bounded in-memory by default, Redis when SESSION_STORE=redis
+session_store = create_session_store()
 
 
-def get_or_create_session(session_id: str | None, session_state: dict | None) -> tuple[str, SessionState]:
+async def get_or_create_session(session_id: str | None, session_state: dict | None) -> tuple[str, SessionState]:
     """Get existing session or create new one."""
-    if session_id and session_id in sessions:
-        return session_id, sessions[session_id]
+    if session_id:
+        existing = await session_store.aget(session_id)
+        if existing is not None:
+            return session_id, existing
 
     if session_state:
         # Restore from provided state
         try:
             session = SessionState(**session_state)
             new_id = session_id or str(uuid.uuid4())
-            sessions[new_id] = session
+            await session_store.aset(new_id, session)
             return new_id, session
         except Exception:
             pass
 
     # Create new session
     new_id = session_id or str(uuid.uuid4())
-    sessions[new_id] = SessionState()
-    return new_id, sessions[new_id]
+    session = SessionState()
+    await session_store.aset(new_id, session)
+    return new_id, session
+
+
+def on_catalog_change(ps_numbers: set[str]) -> None:
+    """
+    Drop cached answers and tool results after a parts-catalog reload changed rows.
+
+    Searches may now match added parts, so everything goes rather than only
+    the entries that mention the changed PS numbers.
+    """
+    invalidate_tool_cache()
+    get_answer_cache().clear()
+    logger.info("Parts catalog changed (%d parts) - answer and tool caches cleared", len(ps_numbers))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
+    setup_logging()
     settings = get_settings()
     missing = settings.validate()
     if missing:
-        print(f"WARNING: Missing environment variables: {missing}")
-        print("The agent will not function properly without these.")
+        logger.warning("Missing environment variables: %s", missing)
+        logger.warning("The agent will not function properly without these.")
     else:
-        print("Configuration validated successfully")
+        logger.info("Configuration validated successfully")
+
+    # Build the compiled graph, ReAct agent and LLM clients once per process
+    init_runtime()
+    logger.info("Agent runtime initialized")
+
+    # Load the in-process parts catalog (no-op unless PARTS_CATALOG_ENABLED)
+    await asyncio.to_thread(init_parts_catalog, on_catalog_change)
+    # Memory-map the local per-part vector index (no-op unless VECTOR_STORE_BACKEND=local)
+    await asyncio.to_thread(init_vector_stores)
+    # Load persisted query embeddings (EMBEDDING_CACHE_PATH)
+    await asyncio.to_thread(get_embedding_cache)
+    # Load and warm the embedding model in the background (/health is 503 until done)
+    warmup = asyncio.create_task(awarm_up_embedding_model()) if settings.EMBEDDING_WARMUP_ENABLED else None
 
     yield
 
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
+
     # Shutdown
-    sessions.clear()
+    session_store.close()
+    await close_async_supabase_client()
+    close_parts_catalog()
+    await asyncio.to_thread(close_browser_pool)
+    # Let queued scrape write-backs finish
+    await asyncio.to_thread(close_scrape_writeback)
+    save_embedding_cache()
+    reset_runtime()
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -119,28 +201,61 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Tag every log line with the request it belongs to (X-Request-ID header)
+app.add_middleware(RequestIdMiddleware)
+
 
 @app.get("/health")
-async def health_check():
-    """Health check endpoint."""
+async def health_check(response: Response):
+    """Health check endpoint. 503 until the embedding model has warmed up."""
     settings = get_settings()
     missing = settings.validate()
 
+    if settings.EMBEDDING_WARMUP_ENABLED and not embedding_model_ready():
+        response.status_code = 503
+        return {"status": "starting", "missing_config": missing}
+
     return {
         "status": "healthy" if not missing else "degraded",
         "missing_config": missing,
     }
 
 
+@app.get("/stats")
+async def stats():
+    """Router hit rates per intent, answer/tool/embedding cache stats, embedding batch sizes, parts catalog size, live scraping."""
+    catalog = get_parts_catalog()
+    return {
+        "router": get_router_stats(),
+        "answer_cache": get_answer_cache().stats(),
+        "tool_cache": get_tool_cache_stats(),
+        "embedding_cache": get_embedding_cache().stats(),
+        "embedding_batcher": get_embedding_batcher().stats(),
+        "parts_catalog": catalog.stats() if catalog is not None else None,
+        "browser_pool": get_browser_pool().stats(),
+        "scrape_writeback": get_scrape_writeback().stats(),
+        "missing_parts": get_missing_parts_cache().stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics: node, tool, DB, embedding and LLM latency histograms."""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, http_response: Response):
     """
     Non-streaming chat endpoint.
 
-    Returns complete response after all processing is done.
+    Returns complete response after all processing is done, with a
+    Server-Timing header breaking down where the time went.
     """
+    timings = RequestTimings()
+    timings_token = bind_request_timings(timings)
     try:
-        session_id, session = get_or_create_session(
+        session_id, session = await get_or_create_session(
             request.session_id,
             request.session_state
         )
@@ -161,11 +276,12 @@ async def chat(request: ChatRequest):
         updated_session.conversation_history = updated_session.conversation_history[-10:]
 
         # Update stored session
-        sessions[session_id] = updated_session
+        await session_store.aset(session_id, updated_session)
 
         # Convert parts dicts to PartCard models
         part_cards = [PartCard(**p) for p in parts] if parts else []
 
+        http_response.headers["Server-Timing"] = timings.server_timing()
         return ChatResponse(
             message=response,
             session_id=session_id,
@@ -174,7 +290,11 @@ async def chat(request: ChatRequest):
         )
 
     except Exception as e:
+        logger.exception("Chat request failed")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        reset_request_timings(timings_token)
+        REQUEST_SECONDS.observe(timings.elapsed(), "chat")
 
 
 async def generate_sse_events(
@@ -183,6 +303,8 @@ async def generate_sse_events(
     session_id: str
 ) -> AsyncGenerator[dict, None]:
     """Generate SSE events for streaming response."""
+    timings = RequestTimings()
+    timings_token = bind_request_timings(timings)
     try:
         full_response = ""
         # Container to receive updated session from streaming
@@ -191,8 +313,17 @@ async def generate_sse_events(
         async for token in run_agent_streaming(
             query=query,
             session=session,
-            session_container=session_container
+            session_container=session_container,
+            emit_events=True,
         ):
+            # Tool progress while the executor runs, part cards while text streams
+            if isinstance(token, dict):
+                yield {
+                    "event": token["event"],
+                    "data": json.dumps(token["data"], default=str)
+                }
+                continue
+
             full_response += token
             yield {
                 "event": "token",
@@ -214,7 +345,7 @@ async def generate_sse_events(
         updated_session.conversation_history = updated_session.conversation_history[-10:]
 
         # Update stored session
-        sessions[session_id] = updated_session
+        await session_store.aset(session_id, updated_session)
 
         # Send completion event with full response and updated session
         yield {
@@ -223,15 +354,25 @@ async def generate_sse_events(
                 "message": full_response,
                 "session_id": session_id,
                 "session_state": updated_session.model_dump(),
-                "parts": parts
+                "parts": parts,
+                "server_timing": timings.server_timing(),
+                "request_id": current_request_id(),
             })
         }
 
     except Exception as e:
+        logger.exception("Chat stream failed")
         yield {
             "event": "error",
             "data": json.dumps({"error": str(e)})
         }
+    finally:
+        try:
+            reset_request_timings(timings_token)
+        except ValueError:
+            # Generator finalized from a different context
+            pass
+        REQUEST_SECONDS.observe(timings.elapsed(), "chat_stream")
 
 
 @app.post("/chat/stream")
@@ -242,11 +383,17 @@ async def chat_stream(request: ChatRequest):
     Streams tokens as they're generated, then sends completion event.
 
     Events:
+    - tool_start: {"tool": "...", "args": {...}}
+    - tool_end: {"tool": "...", "summary": "..."}
     - token: {"token": "..."}
-    - done: {"message": "...", "session_id": "...", "session_state": {...}}
+    - part: {"ps_number": "...", "part_name": "...", ...} - a part card, sent as
+      soon as the response mentions its PS number (also included in done)
+    - done: {"message": "...", "session_id": "...", "session_state": {...},
+             "parts": [...], "server_timing": "node.scope_check;dur=1.2, ...",
+             "request_id": "..."}
     - error: {"error": "..."}
     """
-    session_id, session = get_or_create_session(
+    session_id, session = await get_or_create_session(
         request.session_id,
         request.session_state
     )
@@ -264,9 +411,11 @@ async def chat_stream_simple(request: ChatRequest):
     Simple streaming endpoint using chunked transfer.
 
     Streams tokens as plain text, separated by newlines.
+    Tool progress is sent before the text as "---TOOL_START---" /
+    "---TOOL_END---" lines, each followed by a JSON line.
     Final line is JSON with session info.
     """
-    session_id, session = get_or_create_session(
+    session_id, session = await get_or_create_session(
         request.session_id,
         request.session_state
     )
@@ -274,12 +423,22 @@ async def chat_stream_simple(request: ChatRequest):
     async def generate():
         full_response = ""
         session_container = {}
+        timings = RequestTimings()
+        timings_token = bind_request_timings(timings)
         try:
             async for token in run_agent_streaming(
                 query=request.message,
                 session=session,
-                session_container=session_container
+                session_container=session_container,
+                emit_events=True,
             ):
+                if isinstance(token, dict):
+                    # Part cards would split the text; this endpoint has none
+                    if token["event"] == "part":
+                        continue
+                    yield f"---{token['event'].upper()}---\n{json.dumps(token['data'], default=str)}\n"
+                    continue
+
                 full_response += token
                 yield token
 
@@ -296,13 +455,26 @@ async def chat_stream_simple(request: ChatRequest):
             # Keep last 10 messages (5 exchanges)
             updated_session.conversation_history = updated_session.conversation_history[-10:]
 
-            sessions[session_id] = updated_session
+            await session_store.aset(session_id, updated_session)
 
             # Final metadata as JSON on last line
-            yield f"\n\n---METADATA---\n{json.dumps({'session_id': session_id, 'session_state': updated_session.model_dump()})}"
+            metadata = {
+                "session_id": session_id,
+                "session_state": updated_session.model_dump(),
+                "server_timing": timings.server_timing(),
+                "request_id": current_request_id(),
+            }
+            yield f"\n\n---METADATA---\n{json.dumps(metadata)}"
 
         except Exception as e:
+            logger.exception("Chat stream failed")
             yield f"\n\n---ERROR---\n{str(e)}"
+        finally:
+            try:
+                reset_request_timings(timings_token)
+            except ValueError:
+                pass
+            REQUEST_SECONDS.observe(timings.elapsed(), "chat_stream_simple")
 
     return StreamingResponse(
         generate(),
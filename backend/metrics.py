@@ -0,0 +1,312 @@
+"""
+Latency metrics for the backend.
+
+Span-based timing around graph nodes, tool calls, database calls, embedding
+calls and LLM calls. Every span feeds a Prometheus histogram (served on
+/metrics) and, when a request has bound a RequestTimings, that request's
+Server-Timing breakdown.
+
+Usage:
+    with span("db", "get_part_by_ps_number"):
+        ...
+
+    @timed("node", "executor")          # sync, async or async generator
+    async def executor_node(state): ...
+
+    @timed_methods("db")                 # every public method of a class
+    class SupabaseClient: ...
+
+No external dependency - the text exposition format is written directly.
+"""
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Iterator
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+# =============================================================================
+# Prometheus primitives
+# =============================================================================
+
+# Seconds - from cache hits (sub-ms) up to slow Sonnet answers
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # label values -> [bucket counts..., sum, count]
+        self._series: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, *labelvalues) -> None:
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def collect(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelvalues, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    labels = _format_labels(self.labelnames, labelvalues, f'le="{bound}"')
+                    lines.append(f"{self.name}_bucket{labels} {count}")
+                labels = _format_labels(self.labelnames, labelvalues, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+                labels = _format_labels(self.labelnames, labelvalues)
+                lines.append(f"{self.name}_sum{labels} {series[-2]}")
+                lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float, *labelvalues) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def collect(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labelvalues, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {value}")
+        return lines
+
+
+SPAN_SECONDS = Histogram(
+    "partselect_span_duration_seconds",
+    "Duration of graph nodes, tool calls, database, embedding and LLM calls.",
+    ("kind", "name"),
+)
+REQUEST_SECONDS = Histogram(
+    "partselect_request_duration_seconds",
+    "End-to-end chat request duration.",
+    ("endpoint",),
+)
+LLM_TOKENS = Counter(
+    "partselect_llm_tokens_total",
+    "LLM tokens used, by model role and direction.",
+    ("role", "model", "direction"),
+)
+
+EMBEDDING_CACHE_LOOKUPS = Counter(
+    "partselect_embedding_cache_lookups_total",
+    "Query embedding cache lookups, by result (hit or miss).",
+    ("result",),
+)
+
+_METRICS = [SPAN_SECONDS, REQUEST_SECONDS, LLM_TOKENS, EMBEDDING_CACHE_LOOKUPS]
+
+
+def render_prometheus() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    for metric in _METRICS:
+        lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# Per-request timings (Server-Timing)
+# =============================================================================
+
+class RequestTimings:
+    """
+    Total time per span for one request.
+
+    Spans that run concurrently (parallel tool calls) are each counted in full,
+    so entries can add up to more than the wall-clock time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start = time.perf_counter()
+        # "kind.name" -> [total seconds, count]
+        self.spans: dict[str, list[float]] = {}
+        self.tokens: dict[str, int] = {"input": 0, "output": 0}
+
+    def add(self, kind: str, name: str, seconds: float) -> None:
+        key = f"{kind}.{name}"
+        with self._lock:
+            entry = self.spans.setdefault(key, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def add_tokens(self, input_tokens: int, output_tokens: int) -> None:
+        with self._lock:
+            self.tokens["input"] += input_tokens
+            self.tokens["output"] += output_tokens
+
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.start
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. 'node.executor;dur=812.4, ..., total;dur=1530.2'."""
+        with self._lock:
+            entries = [
+                f'{key};dur={seconds * 1000:.1f}' + (f';desc="x{count}"' if count > 1 else "")
+                for key, (seconds, count) in self.spans.items()
+            ]
+        entries.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def bind_request_timings(timings: RequestTimings | None) -> Token:
+    """Record spans in the current context (and tasks created from it) into `timings`."""
+    return _request_timings.set(timings)
+
+
+def reset_request_timings(token: Token) -> None:
+    _request_timings.reset(token)
+
+
+def current_request_timings() -> RequestTimings | None:
+    return _request_timings.get()
+
+
+# =============================================================================
+# Spans
+# =============================================================================
+
+def record_span(kind: str, name: str, seconds: float) -> None:
+    """Record a finished span in the histogram and the current request's timings."""
+    SPAN_SECONDS.observe(seconds, kind, name)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(kind, name, seconds)
+
+
+@contextmanager
+def span(kind: str, name: str) -> Iterator[None]:
+    """Time a block. Works in sync and async code."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(kind, name, time.perf_counter() - start)
+
+
+def timed(kind: str, name: str | None = None) -> Callable:
+    """Decorator form of span() for functions, coroutines and async generators."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with span(kind, span_name):
+                    async for item in func(*args, **kwargs):
+                        yield item
+        elif inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with span(kind, span_name):
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with span(kind, span_name):
+                    return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def timed_methods(kind: str) -> Callable:
+    """Class decorator - time every public method under its own name."""
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, timed(kind, attr)(value))
+        return cls
+    return decorator
+
+
+# =============================================================================
+# LLM calls
+# =============================================================================
+
+class LLMMetricsHandler(BaseCallbackHandler):
+    """
+    LangChain callback that times each LLM call and counts its tokens.
+
+    Attach one per model role (executor, scope, synthesizer). run_inline keeps
+    the callback on the calling task so it sees the request's timings.
+    """
+
+    run_inline = True
+
+    def __init__(self, role: str, model: str):
+        self.role = role
+        self.model = model
+        self._starts: dict[UUID, float] = {}
+
+    def on_chat_model_start(self, serialized: dict, messages: list, *, run_id: UUID, **kwargs: Any) -> None:
+        self._starts[run_id] = time.perf_counter()
+
+    def on_llm_start(self, serialized: dict, prompts: list, *, run_id: UUID, **kwargs: Any) -> None:
+        self._starts[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs: Any) -> None:
+        start = self._starts.pop(run_id, None)
+        if start is not None:
+            record_span("llm", self.role, time.perf_counter() - start)
+
+        input_tokens = output_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                input_tokens += usage.get("input_tokens", 0)
+                output_tokens += usage.get("output_tokens", 0)
+        if input_tokens or output_tokens:
+            LLM_TOKENS.inc(input_tokens, self.role, self.model, "input")
+            LLM_TOKENS.inc(output_tokens, self.role, self.model, "output")
+            timings = _request_timings.get()
+            if timings is not None:
+                timings.add_tokens(input_tokens, output_tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        start = self._starts.pop(run_id, None)
+        if start is not None:
+            record_span("llm", self.role, time.perf_counter() - start)
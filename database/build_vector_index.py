@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Build the local per-part vector index (see backend/db/vector_store.py).
+
+Sources:
+- db:  page the Q&A, repair story and review embeddings tables out of Supabase
+       (reuses the stored embeddings, no model needed)
+- csv: embed data/qna.csv, repair_stories.csv and reviews.csv locally, with the
+       same text and cleaning as load_data.py
+
+Usage:
+    python -m database.build_vector_index                 # from Supabase
+    python -m database.build_vector_index --source csv    # from the CSVs
+    python -m database.build_vector_index --out vector_index --dtype float32
+
+Then run the backend with VECTOR_STORE_BACKEND=local (and VECTOR_STORE_DIR
+if --out was changed).
+"""
+import argparse
+import json
+import time
+
+from database.load_data import (
+    read_csv,
+    get_supabase_client,
+    get_embedding_model,
+    EMBEDDING_MODEL,
+)
+
+PAGE_SIZE = 1000
+
+
+def clean_row(name: str, row: dict) -> dict:
+    """Type the CSV columns the way load_data.py does before upserting."""
+    row = dict(row)
+    if name == "reviews":
+        row["rating"] = int(row.get("rating", 0) or 0)
+        row["verified_purchase"] = row.get("verified_purchase", "").lower() in ("true", "1", "yes")
+    return row
+
+
+def rows_from_csv(name: str, collection, model) -> tuple[list[dict], list]:
+    """Deduplicated CSV rows and their embeddings."""
+    seen = {}
+    for row in read_csv(collection.csv_file):
+        ps_number, key = row.get("ps_number"), row.get(collection.key)
+        if ps_number and key:
+            seen[(ps_number, key)] = row
+
+    rows, texts = [], []
+    for row in seen.values():
+        text = " ".join(row.get(c, "") or "" for c in collection.text_columns).strip()
+        if text:
+            rows.append(clean_row(name, row))
+            texts.append(text)
+    if not rows:
+        return [], []
+
+    print(f"  Embedding {len(texts)} rows...")
+    return rows, model.encode(texts, batch_size=64, convert_to_numpy=True, show_progress_bar=False)
+
+
+def rows_from_db(collection, supabase) -> tuple[list[dict], list]:
+    """All rows of an embeddings table with their stored embeddings."""
+    columns = ", ".join(dict.fromkeys(collection.columns + (collection.key, "embedding")))
+    rows, embeddings = [], []
+    offset = 0
+    while True:
+        result = (
+            supabase.table(collection.table)
+            .select(columns)
+            .order("id")
+            .range(offset, offset + PAGE_SIZE - 1)
+            .execute()
+        )
+        batch = result.data or []
+        for row in batch:
+            embedding = row.pop("embedding")
+            if embedding is None:
+                continue
+            # PostgREST returns vector columns as "[0.1,0.2,...]"
+            embeddings.append(json.loads(embedding) if isinstance(embedding, str) else embedding)
+            rows.append(row)
+        print(f"  Fetched {offset + len(batch)} rows...")
+        if len(batch) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
+    return rows, embeddings
+
+
+def main():
+    from backend.db.vector_store import COLLECTIONS, LocalVectorStore
+
+    parser = argparse.ArgumentParser(description="Build the local per-part vector index")
+    parser.add_argument("--source", choices=["db", "csv"], default="db")
+    parser.add_argument("--out", default="vector_index", help="Output directory")
+    parser.add_argument("--dtype", choices=["float16", "float32"], default="float16")
+    parser.add_argument("--only", nargs="+", choices=list(COLLECTIONS), help="Build only these collections")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Building local vector index from {args.source} into {args.out}/ ({args.dtype})")
+    print("=" * 60)
+
+    supabase = get_supabase_client() if args.source == "db" else None
+    model = get_embedding_model() if args.source == "csv" else None
+    if model is not None:
+        print(f"Loaded embedding model: {EMBEDDING_MODEL}")
+
+    totals = {}
+    for name in args.only or COLLECTIONS:
+        collection = COLLECTIONS[name]
+        print(f"\n{name}:")
+        start = time.perf_counter()
+        if args.source == "db":
+            rows, embeddings = rows_from_db(collection, supabase)
+        else:
+            rows, embeddings = rows_from_csv(name, collection, model)
+        if not rows:
+            print("  No rows, skipping")
+            continue
+
+        store = LocalVectorStore.build(name, rows, embeddings, dtype=args.dtype)
+        store.save(args.out)
+        totals[name] = store.stats()
+        print(f"  {len(store)} rows over {len(store.offsets)} parts in {time.perf_counter() - start:.1f}s")
+
+    print("\n" + "=" * 60)
+    print("Vector index built!")
+    print("=" * 60)
+    for name, stats in totals.items():
+        print(f"  {name}: {stats['rows']} rows, {stats['parts']} parts")
+
+
+if __name__ == "__main__":
+    main()
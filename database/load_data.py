@@ -13,6 +13,12 @@ Requires:
 Environment variables (in .env):
     SUPABASE_URL=https://your-project.supabase.co
     SUPABASE_KEY=your-anon-key
+
+A running API keeps serving cached answers and tool results after a reload.
+With PARTS_CATALOG_ENABLED, its next catalog refresh (every
+PARTS_CATALOG_REFRESH_SECONDS) sees the changed parts and clears both caches.
+Otherwise entries age out after ANSWER_CACHE_TTL_SECONDS and the tool cache
+TTLs; restart the API to serve reloaded data immediately.
 """
 
 import os
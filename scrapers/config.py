@@ -35,6 +35,15 @@ SCRAPER_SETTINGS = {
     "delay_between_brands": (1, 2),     # Random delay between brands (reduced from 8-12 to 1-2)
     "delay_before_navigate": (0.3, 0.7),  # Random delay before navigation (reduced from 1-3 to 0.3-0.7)
     "stagger_start_delay": (1, 2),      # Stagger parallel worker starts (reduced from 5-10 to 1-2)
+    "engine": "http",           # "http" (asyncio crawl of served HTML, browser fallback) or "selenium"
+    "http_timeout": 20,         # Seconds per static page fetch
+    "http_max_connections": 20, # Keep-alive pool shared by all workers
+    # http engine pacing - replaces the delays above
+    "requests_per_second": 2.0, # Target request rate per host (token bucket)
+    "burst": 4,                 # Requests allowed back to back after a quiet spell
+    "concurrency": 8,           # Requests in flight at once
+    "jitter": 0.5,              # Random extra wait, as a fraction of 1/requests_per_second
+    "progress_interval": 30,    # Seconds between crawl-rate reports (0 = off)
 }
 
 # Output directory for scraped data
@@ -0,0 +1,231 @@
+"""
+Asyncio crawl engine for pages whose data is in the served HTML.
+
+AsyncCrawler fetches pages over one keep-alive httpx.AsyncClient:
+- a shared per-host token bucket (utils/rate_limit.py) sets the pace, at
+  SCRAPER_SETTINGS["requests_per_second"] with jittered waits
+- at most SCRAPER_SETTINGS["concurrency"] requests are in flight at once
+- 429 and 5xx responses are retried, after slowing the whole host down
+  (Retry-After, else exponential backoff) rather than just the one request
+
+CrawlStats keeps the crawl-rate metrics: requests, achieved requests/sec
+(overall and over the last minute), retries, failures, bytes and time spent
+waiting on the rate limiter. The crawler prints them every
+SCRAPER_SETTINGS["progress_interval"] seconds and when it closes.
+
+Frontier remembers what a crawl has already queued (parts, category pages),
+so a page linked from many places is fetched once.
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter, deque
+
+import httpx
+
+from .config import SCRAPER_SETTINGS
+from .utils.html_utils import parse_html
+from .utils.http_utils import client_options
+from .utils.rate_limit import HostRateLimiter
+
+
+class CrawlStats:
+    """Crawl-rate metrics for one crawl."""
+
+    def __init__(self, window=60):
+        self.window = window
+        self.started = time.monotonic()
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.bytes = 0
+        self.status_counts = Counter()
+        self.throttled_seconds = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._recent = deque()
+
+    def request_started(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def request_finished(self, status=None, size=0):
+        """Record a finished request (status None for a network error)."""
+        now = time.monotonic()
+        self.in_flight -= 1
+        self.requests += 1
+        self.bytes += size
+        self.status_counts[status or "error"] += 1
+        self._recent.append(now)
+        while self._recent and self._recent[0] < now - self.window:
+            self._recent.popleft()
+
+    def rate(self):
+        """Requests per second since the crawl started."""
+        elapsed = time.monotonic() - self.started
+        return self.requests / elapsed if elapsed > 0 else 0.0
+
+    def recent_rate(self):
+        """Requests per second over the last `window` seconds."""
+        now = time.monotonic()
+        while self._recent and self._recent[0] < now - self.window:
+            self._recent.popleft()
+        span = min(self.window, now - self.started)
+        return len(self._recent) / span if span > 0 else 0.0
+
+    def summary(self):
+        return {
+            "elapsed_seconds": round(time.monotonic() - self.started, 1),
+            "requests": self.requests,
+            "requests_per_second": round(self.rate(), 2),
+            "recent_requests_per_second": round(self.recent_rate(), 2),
+            "retries": self.retries,
+            "failures": self.failures,
+            "bytes": self.bytes,
+            "status_counts": {str(k): v for k, v in self.status_counts.items()},
+            "throttled_seconds": round(self.throttled_seconds, 1),
+            "max_in_flight": self.max_in_flight,
+        }
+
+    def format(self):
+        s = self.summary()
+        return (
+            f"{s['requests']} requests in {s['elapsed_seconds']:.0f}s "
+            f"({s['requests_per_second']:.2f} req/s, last {self.window}s: {s['recent_requests_per_second']:.2f} req/s), "
+            f"{s['retries']} retries, {s['failures']} failed, {s['bytes'] / 1e6:.1f} MB, "
+            f"{s['throttled_seconds']:.0f}s waiting on rate limit"
+        )
+
+
+class Frontier:
+    """
+    Keys of work already handed out in a crawl, so each item is processed once (thread-safe).
+
+    Args:
+        done: Keys to treat as already processed (e.g. parts from a resumed run)
+    """
+
+    def __init__(self, done=()):
+        self._seen = set(done)
+        self._lock = threading.Lock()
+        self.added = 0
+        self.duplicates = 0
+
+    def add(self, key):
+        """True the first time `key` is seen - the caller should queue the work."""
+        with self._lock:
+            if key in self._seen:
+                self.duplicates += 1
+                return False
+            self._seen.add(key)
+            self.added += 1
+            return True
+
+
+class AsyncCrawler:
+    """
+    Rate-limited, concurrency-limited page fetching.
+
+    Usage:
+        async with AsyncCrawler() as crawler:
+            fetched = await crawler.fetch(url)
+    """
+
+    def __init__(self, requests_per_second=None, burst=None, concurrency=None, jitter=None,
+                 max_retries=None, progress_interval=None, client=None):
+        """Arguments default to the matching SCRAPER_SETTINGS entries."""
+        self.requests_per_second = requests_per_second or SCRAPER_SETTINGS.get("requests_per_second", 2.0)
+        self.concurrency = concurrency or SCRAPER_SETTINGS.get("concurrency", 8)
+        self.max_retries = max_retries or SCRAPER_SETTINGS["max_retries"]
+        if progress_interval is None:
+            progress_interval = SCRAPER_SETTINGS.get("progress_interval", 30)
+        self.progress_interval = progress_interval
+        self.limiter = HostRateLimiter(
+            self.requests_per_second,
+            burst=burst or SCRAPER_SETTINGS.get("burst", 1),
+            jitter=SCRAPER_SETTINGS.get("jitter", 0.0) if jitter is None else jitter,
+        )
+        self.stats = CrawlStats()
+        self._client = client
+        self._owns_client = client is None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._progress_task = None
+
+    async def __aenter__(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(**client_options())
+        if self.progress_interval:
+            self._progress_task = asyncio.create_task(self._report_progress())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._progress_task:
+            self._progress_task.cancel()
+        if self._owns_client:
+            await self._client.aclose()
+        print(f"Crawl stats: {self.stats.format()}")
+
+    async def fetch(self, url):
+        """
+        GET a page, retrying transient failures.
+
+        Returns:
+            tuple: (final URL after redirects, HTML) or None if the page couldn't be fetched
+        """
+        for attempt in range(self.max_retries):
+            if attempt:
+                self.stats.retries += 1
+
+            async with self._semaphore:
+                self.stats.throttled_seconds += await self.limiter.acquire(url)
+                self.stats.request_started()
+                try:
+                    response = await self._client.get(url)
+                except httpx.HTTPError as e:
+                    self.stats.request_finished()
+                    print(f"Fetch error (attempt {attempt+1}/{self.max_retries}) for {url}: {e}")
+                    self.limiter.penalize(url, 2 ** attempt)
+                    continue
+                self.stats.request_finished(response.status_code, len(response.content))
+
+            if response.status_code == 404:
+                return None
+            # Rate limited or server error - back off the whole host, then retry
+            if response.status_code == 429 or response.status_code >= 500:
+                backoff = _retry_after(response)
+                if backoff is None:
+                    backoff = 2 ** attempt
+                print(f"HTTP {response.status_code} (attempt {attempt+1}/{self.max_retries}) for {url} - "
+                      f"slowing {httpx.URL(url).host} down {backoff:.0f}s")
+                self.limiter.penalize(url, backoff)
+                continue
+            if response.is_error:
+                print(f"HTTP {response.status_code} for {url}")
+                self.stats.failures += 1
+                return None
+            return str(response.url), response.text
+
+        self.stats.failures += 1
+        return None
+
+    async def fetch_page(self, url):
+        """fetch() and parse off the event loop. Returns (final URL, tree) or None."""
+        fetched = await self.fetch(url)
+        if fetched is None:
+            return None
+        final_url, html = fetched
+        return final_url, await asyncio.to_thread(parse_html, html)
+
+    async def _report_progress(self):
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            print(f"[Crawl] {self.stats.format()}")
+
+
+def _retry_after(response):
+    """Seconds from a Retry-After header, if it's a number."""
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the page extractors on the saved pages in examplehtmls/.
+
+Each page is served locally (see fixtures.py) and run through both scrapers:
+- browser: headless Chrome + the Selenium extractors. Every WebDriver command
+  is a round trip to chromedriver, so round trips are counted as well as timed.
+- static: lxml + the parse_* twins (part_parser.py, repair_parser.py).
+
+Timings are the median of --repeat runs. scrape_part_page and
+extract_symptom_details load the page themselves, so their numbers include
+navigation; the other browser extractors run on the already loaded page.
+
+Usage:
+    python -m scrapers.dev.benchmark_parsers                  # both engines, 3 runs each
+    python -m scrapers.dev.benchmark_parsers --repeat 10
+    python -m scrapers.dev.benchmark_parsers --static-only    # skip Chrome
+    python -m scrapers.dev.benchmark_parsers --json out.json  # save results to compare later
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+from ..config import SCRAPER_SETTINGS
+from ..utils.html_utils import parse_html
+from ..part_parser import parse_model_compatibility, parse_part_page
+from ..repair_parser import parse_symptom_details, parse_symptoms
+from ..extractors import parse_qna, parse_repair_stories, parse_reviews
+from .fixtures import (
+    PART_PAGES,
+    REPAIR_HELP_PAGE,
+    SYMPTOM_LIST_PAGE,
+    SYMPTOM_PAGE,
+    block_external_requests,
+    read_fixture,
+    serve_fixtures,
+)
+
+PS_NUMBERS = {path: path[1:].split("-", 1)[0] for path in PART_PAGES}
+
+
+class RoundTripCounter:
+    """Counts WebDriver commands sent by a driver (elements send theirs through it too)."""
+
+    def __init__(self, driver):
+        self.commands = Counter()
+        original_execute = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.commands[driver_command] += 1
+            return original_execute(driver_command, params)
+
+        driver.execute = counting_execute
+
+    def snapshot(self):
+        return Counter(self.commands)
+
+
+def measure(fn, repeat, counter=None, before=None):
+    """
+    Run fn() `repeat` times.
+
+    Returns:
+        dict: median/min milliseconds, records found, and WebDriver round trips of the last run
+    """
+    seconds = []
+    commands = Counter()
+    result = None
+    for _ in range(repeat):
+        if before:
+            before()
+        start_commands = counter.snapshot() if counter else None
+        start = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - start)
+        if counter:
+            commands = counter.snapshot() - start_commands
+    return {
+        "median_ms": statistics.median(seconds) * 1000,
+        "min_ms": min(seconds) * 1000,
+        "records": count_records(result),
+        "round_trips": sum(commands.values()) if counter else 0,
+        "commands": dict(commands.most_common(5)) if counter else {},
+    }
+
+
+def count_records(result):
+    """Records in an extractor result (a part tuple counts its part + lists)."""
+    if isinstance(result, tuple):
+        return sum(count_records(r) for r in result)
+    if isinstance(result, list):
+        return len(result)
+    return 0 if result is None else 1
+
+
+# =============================================================================
+# Benchmarks per page: field -> (browser fn(driver, url), static fn(root, url))
+# =============================================================================
+
+def browser_extractors():
+    """The Selenium scrapers, imported only for browser runs so --static-only works without selenium."""
+    from ..part_scraper import scrape_model_compatibility, scrape_part_page
+    from ..repair_scraper import extract_symptom_details, extract_symptoms_from_page
+    from ..extractors import extract_qna, extract_repair_stories, extract_reviews
+
+    return SimpleNamespace(
+        scrape_part_page=scrape_part_page,
+        scrape_model_compatibility=scrape_model_compatibility,
+        extract_qna=extract_qna,
+        extract_repair_stories=extract_repair_stories,
+        extract_reviews=extract_reviews,
+        extract_symptoms_from_page=extract_symptoms_from_page,
+        extract_symptom_details=extract_symptom_details,
+    )
+
+
+def part_page_fields(ps_number, browser):
+    return {
+        "scrape_part_page": (
+            lambda driver, url: browser.scrape_part_page(driver, "", url, "refrigerator"),
+            lambda root, url: parse_part_page(root, "", url, "refrigerator"),
+        ),
+        "model_compatibility": (
+            lambda driver, url: browser.scrape_model_compatibility(driver, ps_number),
+            lambda root, url: parse_model_compatibility(root, ps_number),
+        ),
+        "qna": (lambda driver, url: browser.extract_qna(driver), lambda root, url: parse_qna(root)),
+        "repair_stories": (
+            lambda driver, url: browser.extract_repair_stories(driver),
+            lambda root, url: parse_repair_stories(root),
+        ),
+        "reviews": (lambda driver, url: browser.extract_reviews(driver), lambda root, url: parse_reviews(root)),
+    }
+
+
+def page_benchmarks(browser=None):
+    """
+    (page path, fields) for every saved page.
+
+    `browser` is browser_extractors(), or None when only the static parsers run
+    (the browser functions are then never called).
+    """
+    pages = [(path, part_page_fields(PS_NUMBERS[path], browser)) for path in PART_PAGES]
+    # Landing page: load/parse cost only
+    pages.append((REPAIR_HELP_PAGE, {}))
+    pages.append((SYMPTOM_LIST_PAGE, {
+        "symptoms": (
+            lambda driver, url: browser.extract_symptoms_from_page(driver, "refrigerator"),
+            lambda root, url: parse_symptoms(root, "refrigerator"),
+        ),
+    }))
+    pages.append((SYMPTOM_PAGE, {
+        "symptom_details": (
+            lambda driver, url: browser.extract_symptom_details(driver, url, "refrigerator", "Not making ice"),
+            lambda root, url: parse_symptom_details(root, url, "refrigerator", "Not making ice"),
+        ),
+    }))
+    return pages
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+def run_benchmarks(repeat=3, static_only=False):
+    """Benchmark every saved page; returns {page: {field: {"browser": ..., "static": ...}}}."""
+    # Politeness delays would dominate the numbers and aren't needed locally
+    SCRAPER_SETTINGS["delay_before_navigate"] = (0, 0)
+    results = {}
+    driver = counter = browser = None
+
+    with serve_fixtures() as base_url:
+        if not static_only:
+            from ..utils import setup_driver
+
+            browser = browser_extractors()
+            driver = setup_driver(headless=True)
+            block_external_requests(driver)
+            counter = RoundTripCounter(driver)
+
+        try:
+            for path, fields in page_benchmarks(browser):
+                url = base_url + path
+                html = read_fixture(path)
+                page = results[path] = {"load": {"static": measure(lambda: parse_html(html), repeat)}}
+                if driver:
+                    page["load"]["browser"] = measure(lambda: driver.get(url), repeat, counter)
+
+                root = parse_html(html)
+                for field, (browser_fn, static_fn) in fields.items():
+                    page[field] = {"static": measure(lambda: static_fn(root, url), repeat)}
+                    if driver:
+                        page[field]["browser"] = measure(
+                            lambda: browser_fn(driver, url),
+                            repeat,
+                            counter,
+                            # Extractors read the current page - start each run on a fresh load
+                            before=lambda: driver.get(url),
+                        )
+        finally:
+            if driver:
+                driver.quit()
+
+    return results
+
+
+def print_results(results):
+    header = f"  {'field':<22}{'browser ms':>12}{'round trips':>13}{'static ms':>11}{'speedup':>9}{'records':>10}"
+    for path, page in results.items():
+        print(f"\n{path}")
+        print(header)
+        print("  " + "-" * (len(header) - 2))
+        for field, engines in page.items():
+            static = engines["static"]
+            browser = engines.get("browser")
+            if browser:
+                speedup = f"{browser['median_ms'] / static['median_ms']:.0f}x" if static["median_ms"] else "-"
+                records = f"{browser['records']}/{static['records']}"
+                print(
+                    f"  {field:<22}{browser['median_ms']:>12.1f}{browser['round_trips']:>13}"
+                    f"{static['median_ms']:>11.2f}{speedup:>9}{records:>10}"
+                )
+            else:
+                print(f"  {field:<22}{'-':>12}{'-':>13}{static['median_ms']:>11.2f}{'-':>9}{static['records']:>10}")
+
+    busiest = [
+        (engines["browser"]["round_trips"], path, field, engines["browser"]["commands"])
+        for path, page in results.items()
+        for field, engines in page.items()
+        if "browser" in engines
+    ]
+    if busiest:
+        print("\nMost WebDriver round trips:")
+        for round_trips, path, field, commands in sorted(busiest, reverse=True)[:5]:
+            top = ", ".join(f"{name}={count}" for name, count in commands.items())
+            print(f"  {round_trips:>5}  {field} on {path[:40]}  ({top})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extractors on the saved example pages")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (median is reported)")
+    parser.add_argument("--static-only", action="store_true", help="Only time the static parsers")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results to a JSON file")
+    args = parser.parse_args()
+
+    results = run_benchmarks(repeat=args.repeat, static_only=args.static_only)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
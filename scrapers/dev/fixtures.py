@@ -0,0 +1,117 @@
+"""
+Serve the saved pages in examplehtmls/ from a local web server.
+
+The browser scrapers decide how to wait for a page from its URL (safe_navigate
+looks for "/PS" in product URLs), so each saved page is served at the path it
+had on PartSelect. Assets the pages reference on the real site are https URLs;
+block_external_requests() stops a browser fetching them, keeping runs offline.
+
+MockSite is the server underneath; it also takes made-up pages and can
+answer with errors, for testing the crawler.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+EXAMPLE_DIR = Path(__file__).resolve().parents[2] / "examplehtmls"
+
+# Path on the fixture server -> saved page
+PART_PAGES = {
+    "/PS11722135-Whirlpool-EDR6D1-Whirlpool-EveryDrop6-Refrigerator-Water-Filter.htm":
+        "view-source_https___www.partselect.com_PS11722135-Whirlpool-EDR6D1-Whirlpool-EveryDrop6-Refrigerator-Water-Filter.htm_SourceCode=18.html",
+    "/PS11752778-Whirlpool-WPW10321304-Refrigerator-Door-Shelf-Bin.htm": "withvid.html",
+}
+REPAIR_HELP_PAGE = "/Repair/"
+SYMPTOM_LIST_PAGE = "/Repair/Refrigerator/"
+SYMPTOM_PAGE = "/Repair/Refrigerator/Not-Making-Ice/"
+REPAIR_PAGES = {
+    REPAIR_HELP_PAGE: "repairhelp.html",
+    SYMPTOM_LIST_PAGE: "fridgeproblempage.html",
+    SYMPTOM_PAGE: "specificproblempage.html",
+}
+PAGES = PART_PAGES | REPAIR_PAGES
+
+
+def read_fixture(path):
+    """Saved HTML for a fixture server path."""
+    return (EXAMPLE_DIR / PAGES[path]).read_text(encoding="utf-8")
+
+
+class MockSite:
+    """
+    Local web server for saved or made-up pages that records its traffic.
+
+    Args:
+        pages: URL path -> HTML
+        delay: Seconds each response takes (to observe concurrency)
+    """
+
+    def __init__(self, pages, delay=0.0):
+        self.pages = dict(pages)
+        self.delay = delay
+        # URL path -> status codes to answer with before serving the page (e.g. [429])
+        self.failures = {}
+        self.requests = []          # (time.monotonic(), path) per request
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.base_url = None
+        self._lock = threading.Lock()
+        self._server = None
+
+    def __enter__(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("localhost", 0), Handler)
+        self.base_url = f"http://localhost:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handle(self, handler):
+        path = handler.path.split("?", 1)[0].split("#", 1)[0]
+        with self._lock:
+            self.requests.append((time.monotonic(), path))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            pending = self.failures.get(path)
+            status = pending.pop(0) if pending else (200 if path in self.pages else 404)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            body = self.pages[path].encode("utf-8") if status == 200 else b""
+            handler.send_response(status)
+            if status == 429:
+                handler.send_header("Retry-After", "1")
+            handler.send_header("Content-Type", "text/html; charset=utf-8")
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@contextmanager
+def serve_fixtures():
+    """Serve the saved pages on a free port; yields the base URL."""
+    with MockSite({path: read_fixture(path) for path in PAGES}) as site:
+        yield site.base_url
+
+
+def block_external_requests(driver):
+    """Stop Chrome loading the live site's scripts, fonts and trackers (all https)."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": ["https://*"]})
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test the asyncio crawler against a local mock site (no network, no browser).
+
+Checks the per-host token bucket holds the target rate, the concurrency limit
+holds, 429s are retried after Retry-After, 404s aren't retried, and a full
+crawl_appliance_parts run over a mock catalog writes the saved part pages,
+fetching each part page once however many category pages list it.
+
+Usage:
+    python -m scrapers.dev.test_crawler
+"""
+
+import asyncio
+import csv
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from ..config import OUTPUT_FILES
+from ..crawler import AsyncCrawler
+from ..part_crawler import crawl_appliance_parts
+from ..utils.rate_limit import TokenBucket
+from .fixtures import PART_PAGES, MockSite, read_fixture
+
+
+def _pages(count):
+    return {f"/page/{i}": f"<html><body><p>Page {i}</p></body></html>" for i in range(count)}
+
+
+async def _fetch_all(crawler, urls):
+    async with crawler:
+        return await asyncio.gather(*(crawler.fetch(url) for url in urls))
+
+
+def _request_rate(site):
+    times = sorted(t for t, _ in site.requests)
+    return (len(times) - 1) / (times[-1] - times[0])
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=3)
+    waits = [bucket.reserve() for _ in range(5)]
+    # Three banked tokens, then one every 0.1s
+    assert waits[:3] == [0.0, 0.0, 0.0], waits
+    assert abs(waits[3] - 0.1) < 0.01 and abs(waits[4] - 0.2) < 0.01, waits
+    bucket.penalize(1.0)
+    assert bucket.reserve() > 1.0
+
+
+def test_rate_limit():
+    with MockSite(_pages(21)) as site:
+        crawler = AsyncCrawler(requests_per_second=10, burst=1, concurrency=21, jitter=0, progress_interval=0)
+        results = asyncio.run(_fetch_all(crawler, [site.base_url + path for path in site.pages]))
+
+    assert all(results), "every page should be fetched"
+    rate = _request_rate(site)
+    assert rate <= 10 * 1.1, f"{rate:.1f} req/s exceeds the 10 req/s target"
+    assert rate >= 10 * 0.8, f"{rate:.1f} req/s is well under the 10 req/s target"
+    assert crawler.stats.requests == 21
+    print(f"    server saw {rate:.2f} req/s (target 10), crawler reported {crawler.stats.rate():.2f} req/s")
+
+
+def test_jitter():
+    with MockSite(_pages(21)) as site:
+        crawler = AsyncCrawler(requests_per_second=10, burst=1, concurrency=21, jitter=1.0, progress_interval=0)
+        asyncio.run(_fetch_all(crawler, [site.base_url + path for path in site.pages]))
+
+    times = sorted(t for t, _ in site.requests)
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert statistics.pstdev(gaps) > 0.01, "jittered requests shouldn't be evenly spaced"
+    assert _request_rate(site) <= 10 * 1.1, "jitter must not push the rate over the target"
+
+
+def test_concurrency_limit():
+    with MockSite(_pages(12), delay=0.3) as site:
+        crawler = AsyncCrawler(requests_per_second=1000, burst=1000, concurrency=3, jitter=0, progress_interval=0)
+        asyncio.run(_fetch_all(crawler, [site.base_url + path for path in site.pages]))
+
+    assert site.max_in_flight == 3, f"{site.max_in_flight} requests in flight, limit is 3"
+    assert crawler.stats.max_in_flight == 3
+
+
+def test_retry_after_429():
+    with MockSite(_pages(1)) as site:
+        site.failures["/page/0"] = [429]
+        crawler = AsyncCrawler(requests_per_second=100, burst=1, jitter=0, max_retries=3, progress_interval=0)
+        [result] = asyncio.run(_fetch_all(crawler, [site.base_url + "/page/0"]))
+
+    assert result is not None and "Page 0" in result[1]
+    assert crawler.stats.retries == 1
+    assert crawler.stats.status_counts[429] == 1
+    first, second = sorted(t for t, _ in site.requests)
+    assert second - first >= 0.95, f"retried {second - first:.2f}s after a 429 with Retry-After: 1"
+
+
+def test_404_not_retried():
+    with MockSite({}) as site:
+        crawler = AsyncCrawler(requests_per_second=100, burst=1, max_retries=3, progress_interval=0)
+        [result] = asyncio.run(_fetch_all(crawler, [site.base_url + "/missing"]))
+
+    assert result is None
+    assert len(site.requests) == 1
+
+
+def _catalog_pages():
+    """Main page -> 2 brands -> 2 related categories each (one shared), all listing the saved part pages."""
+    part_links = "".join(
+        f'<div class="nf__part mb-3"><a class="nf__part__detail__title" href="{path}"><span>Part {i}</span></a></div>'
+        for i, path in enumerate(PART_PAGES)
+    )
+    pages = {
+        "/Refrigerator-Parts.htm": (
+            '<html><body><ul class="nf__links">'
+            '<li><a href="/Whirlpool-Refrigerator-Parts.htm">Whirlpool</a></li>'
+            '<li><a href="/GE-Refrigerator-Parts.htm">GE</a></li>'
+            "</ul></body></html>"
+        ),
+    }
+    for brand in ("Whirlpool", "GE"):
+        pages[f"/{brand}-Refrigerator-Parts.htm"] = (
+            f"<html><body>{part_links}"
+            f'<h2 class="section-title">Related {brand} Refrigerator Parts</h2>'
+            f'<ul class="nf__links"><li><a href="/{brand}-Refrigerator-Shelves.htm">Shelves</a></li>'
+            f'<li><a href="/Refrigerator-Water-Filters.htm">Water Filters</a></li></ul>'
+            "</body></html>"
+        )
+        pages[f"/{brand}-Refrigerator-Shelves.htm"] = f"<html><body>{part_links}</body></html>"
+    pages["/Refrigerator-Water-Filters.htm"] = f"<html><body>{part_links}</body></html>"
+    pages.update({path: read_fixture(path) for path in PART_PAGES})
+    return pages
+
+
+def test_crawl_appliance_parts():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as output_root, MockSite(_catalog_pages()) as site:
+        os.chdir(output_root)
+        try:
+            crawler = AsyncCrawler(requests_per_second=50, burst=5, concurrency=4, progress_interval=0)
+            totals = asyncio.run(crawl_appliance_parts(
+                "refrigerator", base_url=site.base_url + "/Refrigerator-Parts.htm", crawler=crawler
+            ))
+            with open(os.path.join("data", OUTPUT_FILES["parts"]), encoding="utf-8") as f:
+                ps_numbers = {row["ps_number"] for row in csv.DictReader(f)}
+        finally:
+            os.chdir(cwd)
+
+    requested = [path for _, path in site.requests]
+    assert ps_numbers == {"PS11722135", "PS11752778"}, ps_numbers
+    assert all(requested.count(path) == 1 for path in PART_PAGES), requested
+    assert requested.count("/Refrigerator-Water-Filters.htm") == 1, requested
+    assert totals["parts"] == 2 and totals["compatibility"] >= 60 and totals["reviews"] >= 20, totals
+    assert crawler.stats.failures == 0
+    print(f"    {len(site.requests)} requests for {totals['parts']} parts")
+
+
+TESTS = [
+    test_token_bucket,
+    test_rate_limit,
+    test_jitter,
+    test_concurrency_limit,
+    test_retry_after_429,
+    test_404_not_retried,
+    test_crawl_appliance_parts,
+]
+
+
+def main():
+    failed = 0
+    for test in TESTS:
+        start = time.perf_counter()
+        try:
+            test()
+            print(f"PASS  {test.__name__} ({time.perf_counter() - start:.1f}s)")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL  {test.__name__}: {e}")
+    print(f"\n{len(TESTS) - failed}/{len(TESTS)} passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
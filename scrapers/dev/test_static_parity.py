@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Check that the browser-free part parser matches the Selenium scraper.
+
+Loads each page into headless Chrome (scrape_part_page) and parses the same
+HTML with lxml (parse_part_page), then prints every field that differs. Saved
+pages are served locally (see fixtures.py), so only --live hits PartSelect.
+
+Usage:
+    python -m scrapers.dev.test_static_parity            # saved pages in examplehtmls/
+    python -m scrapers.dev.test_static_parity --live     # also the live TEST_URL
+"""
+
+import sys
+
+from ..utils import setup_driver
+from ..utils.http_utils import fetch_html
+from ..part_scraper import scrape_part_page
+from ..part_parser import parse_part_page
+from ..config import SCRAPER_SETTINGS
+from .fixtures import PART_PAGES, block_external_requests, read_fixture, serve_fixtures
+
+TEST_URL = "https://www.partselect.com/PS11752778-Whirlpool-WPW10321304-Refrigerator-Door-Shelf-Bin.htm"
+
+SECTIONS = ["part_data", "model_compatibility", "qna", "repair_stories", "reviews"]
+
+
+def diff_results(selenium_result, static_result):
+    """Human-readable differences between two scrape_part_page tuples."""
+    diffs = []
+    for section, expected, actual in zip(SECTIONS, selenium_result, static_result):
+        if isinstance(expected, dict):
+            for key in expected.keys() | actual.keys():
+                if expected.get(key) != actual.get(key):
+                    diffs.append(f"{section}.{key}: selenium={expected.get(key)!r} static={actual.get(key)!r}")
+            continue
+        if len(expected) != len(actual):
+            diffs.append(f"{section}: selenium has {len(expected)} records, static has {len(actual)}")
+        for i, (exp_record, act_record) in enumerate(zip(expected, actual)):
+            for key in exp_record.keys() | act_record.keys():
+                if exp_record.get(key) != act_record.get(key):
+                    diffs.append(
+                        f"{section}[{i}].{key}: selenium={str(exp_record.get(key))[:80]!r} "
+                        f"static={str(act_record.get(key))[:80]!r}"
+                    )
+    return diffs
+
+
+def compare(driver, url, html):
+    """Scrape `url` in the browser and parse `html` statically; print the differences."""
+    selenium_result = scrape_part_page(driver, "", url, "refrigerator")
+    static_result = parse_part_page(html, "", url, "refrigerator")
+
+    counts = ", ".join(f"{name}={len(r) if isinstance(r, list) else 1}" for name, r in zip(SECTIONS, static_result))
+    diffs = diff_results(selenium_result, static_result)
+    status = "MATCH" if not diffs else f"{len(diffs)} DIFFERENCES"
+    print(f"{status}  ({counts})")
+    for line in diffs:
+        print(f"  {line}")
+    return not diffs
+
+
+def test_static_parity():
+    """Compare both scrapers on every saved part page (and the live page with --live)."""
+    # Politeness delays aren't needed for a local server
+    SCRAPER_SETTINGS["delay_before_navigate"] = (0, 0)
+    driver = setup_driver(headless=True)
+    all_match = True
+
+    try:
+        with serve_fixtures() as base_url:
+            block_external_requests(driver)
+            for path in PART_PAGES:
+                print(f"\n{path[:70]}")
+                all_match &= compare(driver, base_url + path, read_fixture(path))
+
+        if "--live" in sys.argv:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            print(f"\n{TEST_URL}")
+            fetched = fetch_html(TEST_URL)
+            if fetched is None:
+                print("  Could not fetch page over HTTP")
+                all_match = False
+            else:
+                final_url, html = fetched
+                all_match &= compare(driver, final_url, html)
+    finally:
+        driver.quit()
+
+    assert all_match, "static parser differs from Selenium - see above"
+
+
+def main():
+    try:
+        test_static_parity()
+    except AssertionError as e:
+        print(f"\nFAIL  {e}")
+        return False
+    print("\nAll pages match.")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -8,8 +8,14 @@ indicate the most useful content for embeddings.
 """
 
 import re
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+try:
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+except ImportError:
+    # Only the extract_* functions need selenium; parse_* work without it
+    By = NoSuchElementException = None
+
+from ..utils.html_utils import class_xpath, element_text, select, select_one
 
 
 def extract_qna(driver):
@@ -113,6 +119,48 @@ def extract_qna(driver):
     return qna_list
 
 
+def parse_qna(root):
+    """
+    Extract Q&A from a parsed product page (no browser).
+
+    Args:
+        root: lxml element tree of the page (see utils.html_utils.parse_html)
+
+    Returns:
+        list[dict]: Same records as extract_qna
+    """
+    qna_list = []
+
+    for container in select(root, "div.qna__question.js-qnaResponse"):
+        qna = {}
+
+        qna["question_id"] = container.get("id") or ""
+        qna["asker"] = element_text(select_one(container, "div.title-md.bold"))
+        qna["date"] = element_text(select_one(container, "div.qna__question__date"))
+
+        # Question text - a direct child first, like extract_qna
+        question_els = container.xpath(f"./div[{class_xpath('js-searchKeys')}]") or select(container, "div.js-searchKeys")
+        qna["question"] = element_text(question_els[0]) if question_els else ""
+
+        model_els = container.xpath(".//div[contains(@class, 'bold') and contains(text(), 'model number')]")
+        match = re.search(r'model number\s+(.+)', element_text(model_els[0]), re.IGNORECASE) if model_els else None
+        qna["model_number"] = match.group(1).strip() if match else ""
+
+        qna["answer"] = element_text(select_one(container, "div.qna__ps-answer__msg div.js-searchKeys"))
+
+        helpful_el = select_one(container, "p.js-displayRating")
+        try:
+            helpful_count = helpful_el.get("data-found-helpful") if helpful_el is not None else None
+            qna["helpful_count"] = int(helpful_count) if helpful_count else 0
+        except ValueError:
+            qna["helpful_count"] = 0
+
+        if qna.get("question") or qna.get("answer"):
+            qna_list.append(qna)
+
+    return qna_list
+
+
 def format_for_embedding(qna, ps_number, part_name=None):
     """
     Format a Q&A into text suitable for vector embedding.
@@ -8,8 +8,14 @@ time estimates - valuable for helping users with their repairs.
 """
 
 import re
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+try:
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+except ImportError:
+    # Only the extract_* functions need selenium; parse_* work without it
+    By = NoSuchElementException = None
+
+from ..utils.html_utils import element_text, select, select_one
 
 
 def extract_repair_stories(driver):
@@ -125,6 +131,56 @@ def extract_repair_stories(driver):
     return stories
 
 
+def parse_repair_stories(root):
+    """
+    Extract customer repair stories from a parsed product page (no browser).
+
+    Args:
+        root: lxml element tree of the page (see utils.html_utils.parse_html)
+
+    Returns:
+        list[dict]: Same records as extract_repair_stories
+    """
+    stories = []
+
+    for container in select(root, "div.repair-story"):
+        story = {}
+
+        voting_el = select_one(container, "div.js-repairStoryVoting")
+        story["story_id"] = (voting_el.get("data-id") or "") if voting_el is not None else ""
+        story["title"] = element_text(select_one(container, "div.repair-story__title"))
+
+        text = element_text(select_one(container, "div.repair-story__instruction div.js-searchKeys"))
+        text = re.sub(r'\.\.\.\s*Read more', '', text)
+        text = re.sub(r'Read less', '', text)
+        story["instruction"] = text.strip()
+
+        story["author"] = element_text(select_one(container, "ul.repair-story__details li div.bold"))
+
+        details = [element_text(li) for li in select(container, "ul.repair-story__details li")]
+        story["difficulty"] = next(
+            (d.replace("Difficulty Level:", "").strip() for d in details if "Difficulty Level:" in d), ""
+        )
+        story["repair_time"] = next(
+            (d.replace("Total Repair Time:", "").strip() for d in details if "Total Repair Time:" in d), ""
+        )
+
+        rating_el = select_one(container, "div.js-displayRating")
+        try:
+            helpful = rating_el.get("data-found-helpful") if rating_el is not None else None
+            votes = rating_el.get("data-vote-count") if rating_el is not None else None
+            story["helpful_count"] = int(helpful) if helpful else 0
+            story["vote_count"] = int(votes) if votes else 0
+        except ValueError:
+            story["helpful_count"] = 0
+            story["vote_count"] = 0
+
+        if story.get("title") or story.get("instruction"):
+            stories.append(story)
+
+    return stories
+
+
 def format_for_embedding(story, ps_number, part_name=None):
     """
     Format a repair story into text suitable for vector embedding.
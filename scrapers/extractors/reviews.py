@@ -8,8 +8,14 @@ This captures representative reviews without pagination overhead.
 
 import re
 import hashlib
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+try:
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+except ImportError:
+    # Only the extract_* functions need selenium; parse_* work without it
+    By = NoSuchElementException = None
+
+from ..utils.html_utils import class_xpath, element_text, select, select_one
 
 
 def extract_reviews(driver):
@@ -119,6 +125,53 @@ def extract_reviews(driver):
     return reviews_list
 
 
+def parse_reviews(root):
+    """
+    Extract customer reviews from a parsed product page (no browser).
+
+    Args:
+        root: lxml element tree of the page (see utils.html_utils.parse_html)
+
+    Returns:
+        list[dict]: Same records as extract_reviews
+    """
+    reviews_list = []
+
+    for container in select(root, "div.pd__cust-review__submitted-review"):
+        review = {}
+
+        # Rating - star width percentage, 100% = 5 stars
+        star_el = select_one(container, "div.rating__stars__upper")
+        match = re.search(r'width:\s*(\d+)%', star_el.get("style") or "") if star_el is not None else None
+        review["rating"] = round(int(match.group(1)) / 20) if match else 0
+
+        # "Author Name - Date" header
+        header_el = select_one(container, "div.pd__cust-review__submitted-review__header")
+        author_el = select_one(header_el, "span.bold") if header_el is not None else None
+        if author_el is not None:
+            header_text = element_text(header_el)
+            review["author"] = element_text(author_el)
+            review["date"] = header_text.split(" - ", 1)[1].strip() if " - " in header_text else ""
+        else:
+            review["author"] = ""
+            review["date"] = ""
+
+        review["verified_purchase"] = bool(container.xpath(".//*[contains(text(), 'Verified Purchase')]"))
+
+        # Title - first bold div that is a direct child (not the header)
+        bold_divs = container.xpath(f"./div[{class_xpath('bold')}]")
+        review["title"] = element_text(bold_divs[0]) if bold_divs else ""
+        review["content"] = element_text(select_one(container, "div.js-searchKeys"))
+
+        id_string = f"{review.get('author', '')}{review.get('date', '')}{review.get('title', '')}"
+        review["review_id"] = hashlib.md5(id_string.encode()).hexdigest()[:16]
+
+        if review.get("title") or review.get("content"):
+            reviews_list.append(review)
+
+    return reviews_list
+
+
 def format_for_embedding(review, ps_number, part_name=None):
     """
     Format a review into text suitable for vector embedding.
@@ -0,0 +1,224 @@
+"""
+Asyncio parts crawl (SCRAPER_SETTINGS["engine"] == "http").
+
+Same pages as scrape_appliance_parts' Selenium engine and the same CSV
+output, but fetched by one AsyncCrawler (crawler.py) and parsed with lxml
+(part_parser.py). The shared per-host token bucket sets the pace instead of
+per-worker gentle_delay / random_delay / stagger sleeps, so throughput
+follows SCRAPER_SETTINGS["requests_per_second"] rather than the sleep time.
+
+The crawl is two stages joined by a queue:
+1. discovery walks main page -> brand pages -> related category pages and
+   queues each part URL the first time any page lists it (Frontier), so a
+   part listed under several brands and categories is fetched once
+2. extraction workers take part URLs off the queue, scrape the part pages
+   and hand the results to a PartDataWriter, which saves them in batches
+
+Extraction starts as soon as the first category page is parsed. Part pages
+without product data in their HTML are scraped with one shared headless
+browser (BrowserFallback), paced by the same rate limiter.
+"""
+
+import asyncio
+import threading
+
+from .config import APPLIANCE_CONFIGS, OUTPUT_FILES
+from .crawler import AsyncCrawler, Frontier
+from .part_parser import (
+    needs_javascript,
+    parse_brand_links,
+    parse_category_parts,
+    parse_part_page,
+    parse_related_links,
+    part_key,
+)
+from .utils.html_utils import parse_html
+from .utils.file_utils import PartDataWriter, get_scraped_part_ids
+
+
+class BrowserFallback:
+    """One lazily started headless browser for part pages that need JavaScript."""
+
+    def __init__(self):
+        self._driver = None
+        self._lock = threading.Lock()
+        self.pages = 0
+
+    def scrape(self, part_name, product_url, appliance_type):
+        """scrape_part_page with the shared browser (blocking - run it in a thread)."""
+        from .part_scraper import scrape_part_page
+        from .utils import setup_driver
+
+        with self._lock:
+            if self._driver is None:
+                self._driver = setup_driver()
+            self.pages += 1
+            return scrape_part_page(self._driver, part_name, product_url, appliance_type)
+
+    def close(self):
+        with self._lock:
+            if self._driver is not None:
+                self._driver.quit()
+                self._driver = None
+
+
+# =============================================================================
+# Discovery
+# =============================================================================
+
+async def queue_new_parts(category_url, root, frontier, work_queue):
+    """Queue the parts on a fetched category page that no earlier page listed."""
+    part_info = parse_category_parts(root, category_url)
+    new_parts = [(part_name, href) for part_name, href in part_info if frontier.add(part_key(href))]
+    for part in new_parts:
+        await work_queue.put(part)
+    print(f"Found {len(part_info)} parts on {category_url} ({len(new_parts)} new)")
+
+
+async def discover_brand(crawler, brand_url, related_pattern, max_categories, frontier, pages, work_queue):
+    """Queue the parts on a brand page and its related category pages."""
+    fetched = await crawler.fetch_page(brand_url)
+    if fetched is None:
+        print(f"Failed to fetch brand {brand_url}. Skipping.")
+        return
+    page_url, root = fetched
+
+    related_links = parse_related_links(root, page_url, related_pattern)
+    if max_categories:
+        related_links = related_links[:max_categories]
+    print(f"Processing brand page: {brand_url} ({len(related_links)} related pages)")
+
+    await queue_new_parts(page_url, root, frontier, work_queue)
+    for related_url in related_links:
+        # Category pages linked from several brands are only fetched once
+        if not pages.add(related_url):
+            continue
+        fetched = await crawler.fetch_page(related_url)
+        if fetched is not None:
+            await queue_new_parts(*fetched, frontier, work_queue)
+
+
+async def discover_parts(crawler, base_url, related_pattern, max_brands, max_categories, frontier, work_queue):
+    """Discovery stage: walk every brand concurrently, queueing part URLs."""
+    fetched = await crawler.fetch_page(base_url)
+    if fetched is None:
+        print("Failed to fetch main page. Exiting.")
+        return
+    page_url, root = fetched
+    brand_links = parse_brand_links(root, page_url)
+    if max_brands:
+        brand_links = brand_links[:max_brands]
+    print(f"Found {len(brand_links)} brand links")
+
+    pages = Frontier(done=brand_links)
+    await asyncio.gather(*(
+        discover_brand(crawler, brand_url, related_pattern, max_categories, frontier, pages, work_queue)
+        for brand_url in brand_links
+    ))
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+
+def _parse_part(html, part_name, product_url, appliance_type):
+    """parse_part_page, or None if the page needs the browser."""
+    root = parse_html(html)
+    if needs_javascript(root):
+        return None
+    return parse_part_page(root, part_name, product_url, appliance_type)
+
+
+async def scrape_part(crawler, browser, part_name, product_url, appliance_type):
+    """One part page: served HTML if possible, else the fallback browser."""
+    fetched = await crawler.fetch(product_url)
+    if fetched is not None:
+        final_url, html = fetched
+        result = await asyncio.to_thread(_parse_part, html, part_name, final_url, appliance_type)
+        if result is not None:
+            return result
+
+    print(f"  Static fetch failed for {product_url} - using browser")
+    crawler.stats.throttled_seconds += await crawler.limiter.acquire(product_url)
+    return await asyncio.to_thread(browser.scrape, part_name, product_url, appliance_type)
+
+
+async def extraction_worker(crawler, browser, work_queue, appliance_type, writer):
+    """Extraction stage: scrape queued part pages until a None arrives."""
+    while True:
+        item = await work_queue.get()
+        if item is None:
+            return
+        part_name, product_url = item
+        try:
+            writer.add(await scrape_part(crawler, browser, part_name, product_url, appliance_type))
+        except Exception as e:
+            print(f"Error scraping part {product_url}: {e}")
+
+
+async def crawl_appliance_parts(appliance_type, max_brands=None, max_categories=None, resume=False,
+                                base_url=None, crawler=None):
+    """
+    Asyncio version of scrape_appliance_parts (same arguments, output and return value).
+
+    Args:
+        base_url: Main parts page to start from (default: the appliance config's)
+        crawler: AsyncCrawler to use (default: one built from SCRAPER_SETTINGS)
+    """
+    if appliance_type not in APPLIANCE_CONFIGS:
+        raise ValueError(f"Unknown appliance type: {appliance_type}")
+
+    config = APPLIANCE_CONFIGS[appliance_type]
+    base_url = base_url or config["base_url"]
+    related_pattern = config["related_section_pattern"]
+
+    scraped_ids = get_scraped_part_ids(OUTPUT_FILES["parts"]) if resume else set()
+    frontier = Frontier(done=scraped_ids)
+    writer = PartDataWriter()
+
+    crawler = crawler or AsyncCrawler()
+    # The crawler caps requests in flight; one worker per slot keeps them busy
+    num_workers = crawler.concurrency
+    print(f"\n{'='*60}")
+    print(f"Starting {appliance_type} parts crawl "
+          f"({crawler.requests_per_second:g} req/s per host, {num_workers} extraction workers)")
+    if resume:
+        print(f"RESUME MODE: Skipping {len(scraped_ids)} already-scraped parts")
+    if max_brands or max_categories:
+        print(f"TEST MODE: max_brands={max_brands}, max_categories={max_categories}")
+    print(f"{'='*60}")
+
+    browser = BrowserFallback()
+    work_queue = asyncio.Queue()
+    try:
+        async with crawler:
+            workers = [
+                asyncio.create_task(extraction_worker(crawler, browser, work_queue, appliance_type, writer))
+                for _ in range(num_workers)
+            ]
+            try:
+                await discover_parts(
+                    crawler, base_url, related_pattern, max_brands, max_categories, frontier, work_queue
+                )
+                for _ in workers:
+                    await work_queue.put(None)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+    finally:
+        writer.flush()
+        await asyncio.to_thread(browser.close)
+
+    totals = writer.totals
+    print(f"\n{'='*60}")
+    print(f"Completed {appliance_type} crawl:")
+    print(f"  Parts: {totals['parts']} ({browser.pages} needed the browser, "
+          f"{frontier.duplicates} duplicate listings skipped)")
+    print(f"  Compatibility records: {totals['compatibility']}")
+    print(f"  Q&A entries: {totals['qna']}")
+    print(f"  Repair stories: {totals['stories']}")
+    print(f"  Reviews: {totals['reviews']}")
+    print(f"{'='*60}")
+
+    return totals
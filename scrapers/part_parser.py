@@ -0,0 +1,315 @@
+"""
+Browser-free part page scraping.
+
+Everything scrape_part_page reads - the itemprop spans, breadcrumb JSON,
+troubleshooting block, cross-reference rows, Q&A, repair stories and reviews -
+is in the HTML PartSelect serves. So a part page can be fetched over the
+shared keep-alive HTTP client and parsed with lxml: no Chrome start-up and no
+WebDriver round trip per field. parse_part_page returns exactly what
+scrape_part_page returns for the same page.
+
+Pages without product data in the served HTML (a bot check, a page that
+renders client-side) make scrape_part_page_http return None; callers then
+fall back to scrape_part_page with a Selenium driver.
+
+The brand and category page link lists are parsed the same way, for the
+asyncio crawl in part_crawler.py.
+"""
+
+import json
+from urllib.parse import urljoin
+
+from .config import PARTS_SCHEMA
+from .extractors import (
+    parse_qna,
+    parse_repair_stories,
+    parse_reviews,
+    format_qna_for_embedding,
+    format_story_for_embedding,
+    format_review_for_embedding,
+)
+from .utils.html_utils import element_text, parse_html, select, select_one, text_content
+from .utils.http_utils import fetch_html
+
+BASE_URL = "https://www.partselect.com"
+# What the header search box calls; redirects to the part page for a PS number
+SEARCH_URL = BASE_URL + "/api/search/?searchterm={query}"
+
+
+def create_empty_part_record(appliance_type):
+    """Create an empty part record with all schema fields."""
+    return {field: "" for field in PARTS_SCHEMA} | {"appliance_type": appliance_type}
+
+
+def add_embedding_fields(records, ps_number, part_name, formatter):
+    """Tag extracted Q&A / stories / reviews with their part and embedding text (in place)."""
+    for record in records:
+        record["ps_number"] = ps_number
+        record["embedding_text"] = formatter(record, ps_number, part_name)
+    return records
+
+
+def ps_number_from_url(url):
+    """PS number in a part URL (/PS12345678-...), or None."""
+    if "/PS" not in url:
+        return None
+    try:
+        ps_start = url.index("/PS") + 1
+        return url[ps_start:url.index("-", ps_start)]
+    except ValueError:
+        return None
+
+
+def part_key(url):
+    """Dedupe key for a part URL: its PS number (the same part is linked with different slugs)."""
+    return ps_number_from_url(url) or url.split("#", 1)[0]
+
+
+def _link_urls(elements, page_url):
+    """Absolute http(s) URLs of the first <a> in each element (like get_attribute("href"))."""
+    urls = []
+    for element in elements:
+        a_tag = select_one(element, "a")
+        href = urljoin(page_url, a_tag.get("href", "")) if a_tag is not None else ""
+        if href.startswith(("http://", "https://")):
+            urls.append(href)
+    return urls
+
+
+def parse_brand_links(root, page_url):
+    """Brand page links on an appliance's main parts page (same as get_brand_links)."""
+    ul_tags = select(root, "ul.nf__links")
+    if not ul_tags:
+        return []
+    return _link_urls(select(ul_tags[0], "li"), page_url)
+
+
+def parse_related_links(root, page_url, related_pattern):
+    """Related part category links on a brand/category page (same as get_related_links)."""
+    related_links = []
+    for title in select(root, ".section-title"):
+        title_text = element_text(title)
+        if "Related" in title_text and related_pattern in title_text:
+            related_ul = title.xpath("./following::ul[@class='nf__links'][1]")
+            if related_ul:
+                related_links.extend(_link_urls(select(related_ul[0], "li"), page_url))
+    return related_links
+
+
+def parse_category_parts(root, page_url):
+    """(part name, part URL) for each part listed on a brand/category page."""
+    part_info = []
+    for part_div in select(root, "div.nf__part.mb-3"):
+        a_tag = select_one(part_div, ".nf__part__detail__title")
+        span = select_one(a_tag, "span") if a_tag is not None else None
+        if span is None:
+            continue
+        href = urljoin(page_url, a_tag.get("href", ""))
+        if href.startswith(("http://", "https://")):
+            part_info.append((element_text(span), href))
+    return part_info
+
+
+def needs_javascript(root):
+    """True if the served HTML has no product data to parse."""
+    return select_one(root, "div.pd__wrap") is None or select_one(root, "span[itemprop='productID']") is None
+
+
+def parse_model_compatibility(root, part_id):
+    """Cross-reference rows of a parsed part page (same records as scrape_model_compatibility)."""
+    compatibility_data = []
+
+    container = select_one(root, "div.pd__crossref__list.js-dataContainer")
+    if container is None:
+        return compatibility_data
+
+    for row in select(container, "div.row"):
+        cols = select(row, "div.col-6, div.col, a.col-6, a.col")
+        if len(cols) >= 3:
+            brand = element_text(cols[0])
+            model_number = element_text(cols[1])
+            description = element_text(cols[2])
+
+            if model_number:
+                compatibility_data.append({
+                    "part_id": part_id,
+                    "brand": brand,
+                    "model_number": model_number,
+                    "description": description.strip(),
+                })
+
+    return compatibility_data
+
+
+def parse_part_page(html, part_name, product_url, appliance_type, extract_embeddings=True):
+    """
+    Extract everything scrape_part_page does from a part page's HTML.
+
+    Args:
+        html: Page source (str or bytes), or its tree from parse_html
+        part_name: Name of the part
+        product_url: URL of the product page
+        appliance_type: Type of appliance (refrigerator, dishwasher)
+        extract_embeddings: If True, also extract Q&A, repair stories, and reviews for embeddings
+
+    Returns:
+        tuple: (part_data dict, model_compatibility list, qna_data list, stories_data list, reviews_data list)
+    """
+    root = parse_html(html) if isinstance(html, (str, bytes)) else html
+
+    part_data = create_empty_part_record(appliance_type)
+    part_data["part_name"] = part_name
+    part_data["part_url"] = product_url
+    qna_data = []
+    stories_data = []
+    reviews_data = []
+
+    title_element = select_one(root, "h1[itemprop='name']")
+    if title_element is not None:
+        part_data["part_name"] = element_text(title_element)
+
+    ps_element = select_one(root, "span[itemprop='productID']")
+    if ps_element is not None:
+        part_data["ps_number"] = element_text(ps_element)
+
+    mpn_element = select_one(root, "span[itemprop='mpn']")
+    if mpn_element is not None:
+        part_data["manufacturer_part_number"] = element_text(mpn_element)
+
+    brand_element = select_one(root, "span[itemprop='brand'] span[itemprop='name']")
+    if brand_element is not None:
+        brand_name = element_text(brand_element)
+        part_data["part_manufacturer"] = brand_name
+        part_data["brand"] = brand_name  # Brand is same as manufacturer
+
+    # Manufactured For - "for Whirlpool, KitchenAid, ..." span next to the brand
+    brand_span = select_one(root, "span[itemprop='brand']")
+    if brand_span is not None and brand_span.getparent() is not None:
+        for span in brand_span.getparent().iterdescendants("span"):
+            span_text = element_text(span)
+            if span_text.lower().startswith("for "):
+                part_data["manufactured_for"] = span_text[4:].strip()
+                break
+
+    # Price - content attribute, or the displayed price
+    price_container = select_one(root, "span.price.pd__price")
+    if price_container is not None:
+        price_content = price_container.get("content")
+        if price_content:
+            part_data["part_price"] = price_content
+        else:
+            price_element = select_one(price_container, "span.js-partPrice")
+            if price_element is not None:
+                part_data["part_price"] = element_text(price_element)
+
+    availability_element = select_one(root, "span[itemprop='availability']")
+    if availability_element is not None:
+        part_data["availability"] = element_text(availability_element)
+
+    # Installation video - the #PartVideos section, else a RepairVideo media item
+    part_video = select_one(root, "#PartVideos ~ div div.yt-video[data-yt-init]")
+    if part_video is not None:
+        video_id = part_video.get("data-yt-init")
+        if video_id:
+            part_data["install_video_url"] = f"https://www.youtube.com/watch?v={video_id}"
+    else:
+        repair_video = select_one(root, "[data-part-media-type='RepairVideo'][data-source-id]")
+        if repair_video is not None:
+            video_id = repair_video.get("data-source-id")
+            if video_id:
+                part_data["install_video_url"] = f"https://www.youtube.com/watch?v={video_id}"
+
+    desc_element = select_one(root, "div[itemprop='description']")
+    if desc_element is not None:
+        part_data["part_description"] = element_text(desc_element)
+
+    rating_element = select_one(root, "meta[itemprop='ratingValue']")
+    if rating_element is not None:
+        part_data["average_rating"] = rating_element.get("content")
+
+    review_count_element = select_one(root, "meta[itemprop='reviewCount']")
+    if review_count_element is not None:
+        part_data["num_reviews"] = review_count_element.get("content")
+
+    # Part Type - second-to-last breadcrumb
+    breadcrumb_data = select_one(root, "div.js-breadcrumb-data")
+    if breadcrumb_data is not None:
+        try:
+            breadcrumbs = json.loads(text_content(breadcrumb_data))
+            if len(breadcrumbs) >= 3:
+                part_data["part_type"] = breadcrumbs[-2].get("name", "")
+        except Exception:
+            pass
+
+    # Troubleshooting block - only "replaces these:" is stored
+    for div in select(root, "div.pd__wrap.row div.col-md-6.mt-3"):
+        header = select_one(div, "div.bold.mb-1")
+        if header is None:
+            continue
+        if "replaces these:" in element_text(header):
+            replace_div = select_one(div, "div[data-collapse-container]")
+            if replace_div is not None:
+                part_data["replaces_parts"] = element_text(replace_div).strip()
+
+    # Install difficulty and time - the <p> next to the difficulty/duration icons
+    repair_rating = select_one(root, "div.pd__repair-rating__container")
+    if repair_rating is not None:
+        for icon, field in (("difficulty", "install_difficulty"), ("duration", "install_time")):
+            use = select_one(repair_rating, f"svg use[href*='{icon}']")
+            if use is None:
+                continue
+            parent_div = use.xpath("./ancestor::div[contains(@class, 'd-flex')][1]")
+            p_element = select_one(parent_div[0], "p") if parent_div else None
+            if p_element is not None:
+                part_data[field] = element_text(p_element).strip()
+
+    model_compatibility = parse_model_compatibility(root, part_data.get("ps_number", ""))
+
+    if extract_embeddings:
+        ps_number = part_data.get("ps_number", "")
+        part_name_clean = part_data.get("part_name", "")
+        qna_data = add_embedding_fields(parse_qna(root), ps_number, part_name_clean, format_qna_for_embedding)
+        stories_data = add_embedding_fields(
+            parse_repair_stories(root), ps_number, part_name_clean, format_story_for_embedding
+        )
+        reviews_data = add_embedding_fields(parse_reviews(root), ps_number, part_name_clean, format_review_for_embedding)
+
+    return part_data, model_compatibility, qna_data, stories_data, reviews_data
+
+
+def scrape_part_page_http(part_name, product_url, appliance_type, extract_embeddings=True, client=None):
+    """
+    Fetch a part page over HTTP and parse it.
+
+    Returns:
+        The scrape_part_page tuple, or None if the page couldn't be fetched or
+        needs JavaScript - fall back to scrape_part_page then.
+    """
+    fetched = fetch_html(product_url, client=client)
+    if fetched is None:
+        return None
+    final_url, html = fetched
+    root = parse_html(html)
+    if needs_javascript(root):
+        return None
+    return parse_part_page(root, part_name, final_url, appliance_type, extract_embeddings)
+
+
+def resolve_part_page(ps_number, client=None):
+    """
+    Look a PS number up through PartSelect's search.
+
+    Returns:
+        (part page URL, parsed page) if the search landed on a parseable part
+        page, else None - the part may not exist, or the search needs a browser.
+    """
+    fetched = fetch_html(SEARCH_URL.format(query=ps_number), client=client)
+    if fetched is None:
+        return None
+    final_url, html = fetched
+    if "partselect.com/PS" not in final_url:
+        return None
+    root = parse_html(html)
+    if needs_javascript(root):
+        return None
+    return final_url, root
@@ -3,15 +3,23 @@ Main scraper for PartSelect parts data.
 Follows the schema defined in ARCHITECTURE.md.
 """
 
+import asyncio
 import json
+import queue
+import threading
 import time
 import random
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from .config import APPLIANCE_CONFIGS, SCRAPER_SETTINGS, PARTS_SCHEMA, OUTPUT_FILES
+try:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import WebDriverException
+except ImportError:
+    # The package imports this module; static parsing works without selenium
+    By = WebDriverWait = EC = WebDriverException = None
+
+from .config import APPLIANCE_CONFIGS, SCRAPER_SETTINGS
+from .crawler import Frontier
 from .utils import (
     setup_driver,
     safe_navigate,
@@ -22,13 +30,7 @@ from .utils import (
     scroll_infinite_container,
 )
 from .utils.driver_utils import is_valid_url
-from .utils.file_utils import (
-    append_parts_data,
-    append_model_compatibility_data,
-    append_qna_data,
-    append_repair_stories_data,
-    append_reviews_data,
-)
+from .utils.file_utils import PartDataWriter
 from .extractors import (
     extract_qna,
     extract_repair_stories,
@@ -37,6 +39,7 @@ from .extractors import (
     format_story_for_embedding,
     format_review_for_embedding,
 )
+from .part_parser import add_embedding_fields, create_empty_part_record, part_key
 
 
 def gentle_delay(delay_setting):
@@ -55,11 +58,6 @@ def gentle_delay(delay_setting):
     return delay
 
 
-def create_empty_part_record(appliance_type):
-    """Create an empty part record with all schema fields."""
-    return {field: "" for field in PARTS_SCHEMA} | {"appliance_type": appliance_type}
-
-
 def scrape_part_page(driver, part_name, product_url, appliance_type, extract_embeddings=True):
     """
     Scrape all information from a single part page.
@@ -270,25 +268,17 @@ def scrape_part_page(driver, part_name, product_url, appliance_type, extract_emb
         part_name_clean = part_data.get("part_name", "")
 
         # Extract Q&A
-        raw_qna = extract_qna(driver)
-        for qna in raw_qna:
-            qna["ps_number"] = ps_number
-            qna["embedding_text"] = format_qna_for_embedding(qna, ps_number, part_name_clean)
-            qna_data.append(qna)
+        qna_data = add_embedding_fields(extract_qna(driver), ps_number, part_name_clean, format_qna_for_embedding)
 
         # Extract Repair Stories
-        raw_stories = extract_repair_stories(driver)
-        for story in raw_stories:
-            story["ps_number"] = ps_number
-            story["embedding_text"] = format_story_for_embedding(story, ps_number, part_name_clean)
-            stories_data.append(story)
+        stories_data = add_embedding_fields(
+            extract_repair_stories(driver), ps_number, part_name_clean, format_story_for_embedding
+        )
 
         # Extract Reviews
-        raw_reviews = extract_reviews(driver)
-        for review in raw_reviews:
-            review["ps_number"] = ps_number
-            review["embedding_text"] = format_review_for_embedding(review, ps_number, part_name_clean)
-            reviews_data.append(review)
+        reviews_data = add_embedding_fields(
+            extract_reviews(driver), ps_number, part_name_clean, format_review_for_embedding
+        )
 
     return part_data, model_compatibility, qna_data, stories_data, reviews_data
 
@@ -344,43 +334,29 @@ def scrape_model_compatibility(driver, part_id):
     return compatibility_data
 
 
-def process_category_page(driver, category_url, appliance_type, scraped_ids=None):
+def collect_category_parts(driver, category_url):
     """
-    Process a category page and scrape all parts within it.
+    Part links listed on a category page.
 
     Args:
         driver: Selenium WebDriver instance
         category_url: URL of the category page
-        appliance_type: Type of appliance
-        scraped_ids: Set of ps_number values to skip (for resume capability)
 
     Returns:
-        tuple: (parts_data, model_compatibility, qna_data, stories_data, reviews_data)
+        list: (part_name, product_url) tuples
     """
-    if scraped_ids is None:
-        scraped_ids = set()
-
-    parts_data = []
-    all_compatibility = []
-    all_qna = []
-    all_stories = []
-    all_reviews = []
-
     print(f"\nVisiting category: {category_url}")
 
     if not safe_navigate(driver, category_url):
         print(f"Failed to navigate to {category_url}. Skipping.")
-        return parts_data, all_compatibility, all_qna, all_stories, all_reviews
+        return []
 
     # Find all part divs
     part_divs = wait_and_find_elements(driver, By.CSS_SELECTOR, "div.nf__part.mb-3")
     if not part_divs:
         print(f"No parts found in {category_url}")
-        return parts_data, all_compatibility, all_qna, all_stories, all_reviews
-
-    print(f"Found {len(part_divs)} parts")
+        return []
 
-    # Collect part info to avoid stale element issues
     part_info = []
     for part_div in part_divs:
         try:
@@ -390,51 +366,11 @@ def process_category_page(driver, category_url, appliance_type, scraped_ids=None
             href = safe_get_attribute(a_tag, "href")
 
             if href and is_valid_url(href):
-                # Extract ps_number from URL to check if already scraped
-                # URL format: /PS12345678-...
-                ps_from_url = None
-                if '/PS' in href:
-                    try:
-                        ps_start = href.index('/PS') + 1
-                        ps_end = href.index('-', ps_start)
-                        ps_from_url = href[ps_start:ps_end]
-                    except ValueError:
-                        pass
-
-                # Skip if already scraped
-                if ps_from_url and ps_from_url in scraped_ids:
-                    print(f"  [SKIP] Already scraped: {ps_from_url}")
-                    continue
-
                 part_info.append((part_name, href))
         except Exception:
             continue
 
-    if not part_info:
-        print(f"All parts in this category already scraped or no valid parts found")
-        return parts_data, all_compatibility, all_qna, all_stories, all_reviews
-
-    print(f"Processing {len(part_info)} parts (after filtering already-scraped)")
-
-    # Process each part with gentle delays
-    for i, (part_name, product_url) in enumerate(part_info, 1):
-        print(f"  [{i}/{len(part_info)}] Processing: {part_name}")
-        part_data, compatibility, qna, stories, reviews = scrape_part_page(driver, part_name, product_url, appliance_type)
-        parts_data.append(part_data)
-        all_compatibility.extend(compatibility)
-        all_qna.extend(qna)
-        all_stories.extend(stories)
-        all_reviews.extend(reviews)
-
-        # Gentle delay before navigating back
-        gentle_delay(SCRAPER_SETTINGS["delay_between_pages"])
-
-        # Navigate back to category page
-        if not safe_navigate(driver, category_url):
-            print(f"Failed to return to category. Stopping.")
-            break
-
-    return parts_data, all_compatibility, all_qna, all_stories, all_reviews
+    return part_info
 
 
 def get_brand_links(driver, base_url):
@@ -495,127 +431,172 @@ def get_related_links(driver, related_pattern):
     return related_links
 
 
-def process_brand_with_retry(brand_url, appliance_type, related_pattern, max_retries=None,
-                             max_categories=None, output_files=None, scraped_ids=None):
+# =============================================================================
+# Discovery -> work queue -> extraction workers
+# =============================================================================
+
+def queue_new_parts(part_info, frontier, work_queue):
+    """Queue the parts that no earlier category page listed. Returns how many were new."""
+    new_parts = 0
+    for part_name, href in part_info:
+        if frontier.add(part_key(href)):
+            # (part name, URL, attempt) - see extract_parts_worker
+            work_queue.put((part_name, href, 1))
+            new_parts += 1
+    return new_parts
+
+
+def discover_brand(driver, brand_url, related_pattern, frontier, pages, work_queue, claimed, max_categories=None):
+    """
+    Queue the parts on a brand page and its related category pages.
+
+    `claimed` holds the category pages this brand took from `pages`, so a retry
+    revisits them instead of skipping them as already seen.
+    """
+    part_info = collect_category_parts(driver, brand_url)
+    new_parts = queue_new_parts(part_info, frontier, work_queue)
+    print(f"Found {len(part_info)} parts ({new_parts} new)")
+
+    # Still on the brand page
+    related_links = get_related_links(driver, related_pattern)
+    if max_categories:
+        related_links = related_links[:max_categories]
+    print(f"Found {len(related_links)} related pages")
+
+    for related_url in related_links:
+        # Category pages linked from several brands are only visited once
+        if related_url not in claimed:
+            if not pages.add(related_url):
+                continue
+            claimed.add(related_url)
+        gentle_delay(SCRAPER_SETTINGS["delay_between_pages"])
+        part_info = collect_category_parts(driver, related_url)
+        new_parts = queue_new_parts(part_info, frontier, work_queue)
+        print(f"Found {len(part_info)} parts ({new_parts} new)")
+
+
+def discover_parts(base_url, related_pattern, frontier, work_queue, max_brands=None, max_categories=None,
+                   max_retries=None):
     """
-    Process a brand page and its related pages with retry mechanism.
-    Writes data immediately after each category page for incremental progress saving.
+    Discovery stage: walk main page -> brand pages -> related category pages
+    with one browser, queueing each part URL the first time it is listed.
+
+    A brand that fails with a browser error is retried on a new browser, so a
+    crashed Chrome costs one brand's retry rather than every remaining brand.
 
     Args:
-        brand_url: URL of the brand page
-        appliance_type: Type of appliance
+        base_url: Main parts page for the appliance
         related_pattern: Pattern to match related sections
-        max_retries: Number of retry attempts
-        max_categories: Optional limit on category pages (for testing)
-        output_files: Dict of output file names for immediate writes
-        scraped_ids: Set of ps_number values to skip (for resume)
-
-    Returns:
-        dict: Counts of items scraped {parts, compatibility, qna, stories, reviews}
+        frontier: Frontier of part keys already queued (or scraped, when resuming)
+        work_queue: queue.Queue the extraction workers read from
+        max_brands: Optional limit on number of brands (for testing)
+        max_categories: Optional limit on category pages per brand (for testing)
+        max_retries: Attempts per brand (default: SCRAPER_SETTINGS["max_retries"])
     """
     if max_retries is None:
         max_retries = SCRAPER_SETTINGS["max_retries"]
-    if scraped_ids is None:
-        scraped_ids = set()
-
-    totals = {"parts": 0, "compatibility": 0, "qna": 0, "stories": 0, "reviews": 0}
-    driver = None
 
-    for attempt in range(max_retries):
-        try:
-            driver = setup_driver()
+    driver = setup_driver()
+    try:
+        brand_links = get_brand_links(driver, base_url)
+        if not brand_links:
+            print("No brand links found.")
+            return
+        if max_brands:
+            brand_links = brand_links[:max_brands]
+
+        pages = Frontier(done=brand_links)
+        for idx, brand_url in enumerate(brand_links, 1):
+            if idx > 1:
+                gentle_delay(SCRAPER_SETTINGS["delay_between_brands"])
+            print(f"\nBrand {idx}/{len(brand_links)}: {brand_url}")
+            claimed = set()
+            for attempt in range(max_retries):
+                try:
+                    discover_brand(driver, brand_url, related_pattern, frontier, pages, work_queue,
+                                   claimed, max_categories)
+                    break
+                except WebDriverException as e:
+                    print(f"Browser error on {brand_url} (attempt {attempt + 1}/{max_retries}): {e}")
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
+                    driver = setup_driver()
+                    if attempt + 1 < max_retries:
+                        time.sleep(5)
+                except Exception as e:
+                    print(f"Error discovering parts for {brand_url}: {e}")
+                    break
+            else:
+                print(f"Giving up on {brand_url} after {max_retries} attempts")
+    finally:
+        driver.quit()
 
-            if not safe_navigate(driver, brand_url):
-                print(f"Failed to navigate to brand {brand_url}. Retrying...")
-                driver.quit()
-                continue
 
-            # Process brand page
-            print(f"Processing brand page: {brand_url}")
-            parts, compatibility, qna, stories, reviews = process_category_page(
-                driver, brand_url, appliance_type, scraped_ids
-            )
+def extract_parts_worker(worker_id, work_queue, appliance_type, writer):
+    """
+    Extraction stage: scrape queued part pages until a None arrives.
 
-            # Write immediately after category page
-            if output_files and parts:
-                append_parts_data(parts, output_files["parts"])
-                append_model_compatibility_data(compatibility, output_files["compat"])
-                append_qna_data(qna, output_files["qna"])
-                append_repair_stories_data(stories, output_files["stories"])
-                append_reviews_data(reviews, output_files["reviews"])
-                # Add newly scraped IDs to the set so we don't re-scrape
-                for p in parts:
-                    if p.get("ps_number"):
-                        scraped_ids.add(p["ps_number"])
-                print(f"  >> Saved {len(parts)} parts to CSV")
-
-            totals["parts"] += len(parts)
-            totals["compatibility"] += len(compatibility)
-            totals["qna"] += len(qna)
-            totals["stories"] += len(stories)
-            totals["reviews"] += len(reviews)
-
-            # Get and process related pages
-            related_links = get_related_links(driver, related_pattern)
-
-            # Limit categories if in test mode
-            if max_categories:
-                related_links = related_links[:max_categories]
-
-            print(f"Found {len(related_links)} related pages")
-
-            for idx, related_url in enumerate(related_links, 1):
-                print(f"\nProcessing related page {idx}/{len(related_links)}")
-                if not safe_navigate(driver, related_url):
-                    continue
+    Each worker owns one browser, started on its first part and restarted
+    after an error. A part that fails is queued again for another worker, up
+    to SCRAPER_SETTINGS["max_retries"] attempts - the Frontier has already
+    claimed it, so nothing else would retry it.
+    """
+    max_attempts = SCRAPER_SETTINGS["max_retries"]
+    driver = None
+    try:
+        while True:
+            item = work_queue.get()
+            if item is None:
+                return
+            part_name, product_url, attempt = item
 
-                parts, compatibility, qna, stories, reviews = process_category_page(
-                    driver, related_url, appliance_type, scraped_ids
-                )
-
-                # Write immediately after each category page
-                if output_files and parts:
-                    append_parts_data(parts, output_files["parts"])
-                    append_model_compatibility_data(compatibility, output_files["compat"])
-                    append_qna_data(qna, output_files["qna"])
-                    append_repair_stories_data(stories, output_files["stories"])
-                    append_reviews_data(reviews, output_files["reviews"])
-                    # Add newly scraped IDs to the set
-                    for p in parts:
-                        if p.get("ps_number"):
-                            scraped_ids.add(p["ps_number"])
-                    print(f"  >> Saved {len(parts)} parts to CSV")
-
-                totals["parts"] += len(parts)
-                totals["compatibility"] += len(compatibility)
-                totals["qna"] += len(qna)
-                totals["stories"] += len(stories)
-                totals["reviews"] += len(reviews)
-
-                # Gentle delay between category pages
-                gentle_delay(SCRAPER_SETTINGS["delay_between_pages"])
+            try:
+                if driver is None:
+                    # Stagger start times to avoid hitting the site simultaneously
+                    if worker_id > 0:
+                        stagger_delay = SCRAPER_SETTINGS.get("stagger_start_delay", (1, 2))
+                        delay = random.uniform(stagger_delay[0], stagger_delay[1])
+                        print(f"[Worker {worker_id}] Staggering start by {delay:.1f}s...")
+                        time.sleep(delay)
+                    driver = setup_driver()
+
+                print(f"[Worker {worker_id}] Processing: {part_name}")
+                writer.add(scrape_part_page(driver, part_name, product_url, appliance_type))
+            except Exception as e:
+                print(f"[Worker {worker_id}] Error scraping {product_url} (attempt {attempt}/{max_attempts}): {e}")
+                if driver is not None:
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
+                    driver = None
+                if attempt < max_attempts:
+                    work_queue.put((part_name, product_url, attempt + 1))
+                else:
+                    print(f"[Worker {worker_id}] Giving up on {product_url}")
+                continue
+            finally:
+                # After any retry is queued, so work_queue.join() waits for it
+                work_queue.task_done()
 
+            gentle_delay(SCRAPER_SETTINGS["delay_between_pages"])
+    finally:
+        if driver:
             driver.quit()
-            return totals
-
-        except Exception as e:
-            print(f"Attempt {attempt + 1} failed for {brand_url}: {e}")
-            if driver:
-                driver.quit()
-            if attempt < max_retries - 1:
-                time.sleep(5)
-            else:
-                return totals
-
-    return totals
 
 
 def scrape_appliance_parts(appliance_type, max_brands=None, max_categories=None, resume=False):
     """
     Scrape all parts for a specific appliance type.
-    Writes data incrementally after each category page.
+    Writes data incrementally, in batches, as parts are scraped.
     Supports parallel processing and resume capability.
 
+    With SCRAPER_SETTINGS["engine"] == "http" this runs the asyncio crawl in
+    part_crawler.py; "selenium" uses one browser to discover part URLs and
+    max_workers browsers to scrape them.
+
     Args:
         appliance_type: Type of appliance (e.g., 'refrigerator', 'dishwasher')
         max_brands: Optional limit on number of brands to scrape (for testing)
@@ -630,28 +611,28 @@ def scrape_appliance_parts(appliance_type, max_brands=None, max_categories=None,
     if appliance_type not in APPLIANCE_CONFIGS:
         raise ValueError(f"Unknown appliance type: {appliance_type}")
 
+    if SCRAPER_SETTINGS.get("engine", "http") == "http":
+        from .part_crawler import crawl_appliance_parts
+        return asyncio.run(crawl_appliance_parts(appliance_type, max_brands, max_categories, resume))
+
     config = APPLIANCE_CONFIGS[appliance_type]
     base_url = config["base_url"]
     related_pattern = config["related_section_pattern"]
 
-    # Use unified output files (all appliance types go into same files)
-    output_files = {
-        "parts": OUTPUT_FILES["parts"],
-        "compat": OUTPUT_FILES["model_compatibility"],
-        "qna": OUTPUT_FILES["qna"],
-        "stories": OUTPUT_FILES["repair_stories"],
-        "reviews": OUTPUT_FILES["reviews"],
-    }
-
-    totals = {"parts": 0, "compatibility": 0, "qna": 0, "stories": 0, "reviews": 0}
+    # Unified output files (all appliance types go into same files)
+    writer = PartDataWriter()
+    output_files = writer.output_files
 
     # Load already-scraped part IDs if resuming
     scraped_ids = set()
     if resume:
         scraped_ids = get_scraped_part_ids(output_files["parts"])
+    frontier = Frontier(done=scraped_ids)
+
+    max_workers = max(1, SCRAPER_SETTINGS.get("max_workers", 1))
 
     print(f"\n{'='*60}")
-    print(f"Starting {appliance_type} parts scraping...")
+    print(f"Starting {appliance_type} parts scraping ({max_workers} extraction workers)...")
     if resume:
         print(f"RESUME MODE: Skipping {len(scraped_ids)} already-scraped parts")
     if max_brands or max_categories:
@@ -664,39 +645,30 @@ def scrape_appliance_parts(appliance_type, max_brands=None, max_categories=None,
     print(f"  Reviews (embeddings): {output_files['reviews']}")
     print(f"{'='*60}")
 
-    # Get all brand links
-    driver = setup_driver()
-    brand_links = get_brand_links(driver, base_url)
-    driver.quit()
-
-    if not brand_links:
-        print("No brand links found. Exiting.")
-        return totals
-
-    # Limit brands if in test mode
-    if max_brands:
-        brand_links = brand_links[:max_brands]
-
-    max_workers = SCRAPER_SETTINGS.get("max_workers", 1)
-
-    if max_workers <= 1:
-        # Sequential processing
-        print(f"\nProcessing {len(brand_links)} brands SEQUENTIALLY")
-        totals = _process_brands_sequential(
-            brand_links, appliance_type, related_pattern, max_categories,
-            output_files, scraped_ids
-        )
-    else:
-        # Parallel processing
-        print(f"\nProcessing {len(brand_links)} brands with {max_workers} PARALLEL workers")
-        totals = _process_brands_parallel(
-            brand_links, appliance_type, related_pattern, max_categories,
-            output_files, scraped_ids, max_workers
-        )
+    # Workers start scraping as soon as discovery queues the first part
+    work_queue = queue.Queue()
+    workers = [
+        threading.Thread(target=extract_parts_worker, args=(i, work_queue, appliance_type, writer), daemon=True)
+        for i in range(max_workers)
+    ]
+    for worker in workers:
+        worker.start()
 
+    try:
+        discover_parts(base_url, related_pattern, frontier, work_queue, max_brands, max_categories)
+        # Wait for every queued part, including retries, before stopping the workers
+        work_queue.join()
+    finally:
+        for _ in workers:
+            work_queue.put(None)
+        for worker in workers:
+            worker.join()
+        writer.flush()
+
+    totals = writer.totals
     print(f"\n{'='*60}")
     print(f"Completed {appliance_type} scraping:")
-    print(f"  Parts: {totals['parts']}")
+    print(f"  Parts: {totals['parts']} ({frontier.duplicates} duplicate listings skipped)")
     print(f"  Compatibility records: {totals['compatibility']}")
     print(f"  Q&A entries: {totals['qna']}")
     print(f"  Repair stories: {totals['stories']}")
@@ -704,90 +676,3 @@ def scrape_appliance_parts(appliance_type, max_brands=None, max_categories=None,
     print(f"{'='*60}")
 
     return totals
-
-
-def _process_brands_sequential(brand_links, appliance_type, related_pattern,
-                                max_categories, output_files, scraped_ids):
-    """Process brands sequentially (single worker)."""
-    totals = {"parts": 0, "compatibility": 0, "qna": 0, "stories": 0, "reviews": 0}
-
-    for idx, brand_url in enumerate(brand_links, 1):
-        print(f"\n{'='*40}")
-        print(f"Brand {idx}/{len(brand_links)}: {brand_url}")
-        print(f"{'='*40}")
-
-        try:
-            brand_totals = process_brand_with_retry(
-                brand_url, appliance_type, related_pattern,
-                max_categories=max_categories,
-                output_files=output_files,
-                scraped_ids=scraped_ids
-            )
-
-            # Accumulate totals
-            for key in totals:
-                totals[key] += brand_totals.get(key, 0)
-
-            print(f"\nCompleted {idx}/{len(brand_links)} brands")
-            print(f"  This brand: {brand_totals.get('parts', 0)} parts")
-
-            # Gentle delay between brands (unless it's the last one)
-            if idx < len(brand_links):
-                print(f"\nWaiting before next brand...")
-                gentle_delay(SCRAPER_SETTINGS["delay_between_brands"])
-
-        except Exception as e:
-            print(f"Error processing {brand_url}: {e}")
-
-    return totals
-
-
-def _process_brands_parallel(brand_links, appliance_type, related_pattern,
-                              max_categories, output_files, scraped_ids, max_workers):
-    """Process brands in parallel using ThreadPoolExecutor."""
-    totals = {"parts": 0, "compatibility": 0, "qna": 0, "stories": 0, "reviews": 0}
-    stagger_delay = SCRAPER_SETTINGS.get("stagger_start_delay", (5, 10))
-
-    def process_brand_worker(args):
-        idx, brand_url = args
-        # Stagger start times to avoid hitting the site simultaneously
-        if idx > 0:
-            delay = random.uniform(stagger_delay[0], stagger_delay[1])
-            print(f"[Worker {idx}] Staggering start by {delay:.1f}s...")
-            time.sleep(delay)
-
-        print(f"\n[Worker {idx}] Starting brand: {brand_url}")
-        try:
-            brand_totals = process_brand_with_retry(
-                brand_url, appliance_type, related_pattern,
-                max_categories=max_categories,
-                output_files=output_files,
-                scraped_ids=scraped_ids  # Note: shared set, but reads are fine
-            )
-            return (idx, brand_url, brand_totals, None)
-        except Exception as e:
-            return (idx, brand_url, {"parts": 0, "compatibility": 0, "qna": 0, "stories": 0, "reviews": 0}, str(e))
-
-    completed = 0
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all brands with their indices
-        futures = {
-            executor.submit(process_brand_worker, (idx, url)): url
-            for idx, url in enumerate(brand_links)
-        }
-
-        for future in as_completed(futures):
-            completed += 1
-            idx, url, brand_totals, error = future.result()
-
-            if error:
-                print(f"\n[{completed}/{len(brand_links)}] ERROR on {url}: {error}")
-            else:
-                print(f"\n[{completed}/{len(brand_links)}] Completed: {url}")
-                print(f"  Parts: {brand_totals.get('parts', 0)}")
-
-            # Accumulate totals (this is thread-safe since we're in the main thread)
-            for key in totals:
-                totals[key] += brand_totals.get(key, 0)
-
-    return totals
@@ -0,0 +1,97 @@
+"""
+Browser-free repair page parsing.
+
+Static twins of repair_scraper's extractors, for pages already fetched or
+saved (see part_parser.py for the part page equivalent). They return the same
+records as extract_symptoms_from_page / extract_symptom_details, minus the
+navigation - the caller supplies the parsed page.
+"""
+
+import re
+from html import unescape
+from urllib.parse import urljoin
+
+from .utils.html_utils import element_text, html_to_text, inner_html, select, select_one
+
+BASE_URL = "https://www.partselect.com"
+
+
+def parse_symptoms(root, appliance_type):
+    """
+    Symptoms listed on a parsed appliance repair page.
+
+    Returns:
+        list: List of symptom dicts with title, description, percentage, url
+    """
+    symptoms = []
+
+    for link in select(root, "div.symptom-list > a.row"):
+        symptom = {"appliance_type": appliance_type}
+
+        href = link.get("href", "")
+        symptom["symptom_url"] = href if href.startswith("http") else urljoin(BASE_URL, href)
+        symptom["symptom"] = element_text(select_one(link, "h3.title-md"))
+        symptom["symptom_description"] = element_text(select_one(link, "p"))
+
+        # "29% of customers" -> "29%"
+        percent_text = element_text(select_one(link, "div.symptom-list__reported-by span:last-child"))
+        match = re.search(r'(\d+%)', percent_text)
+        symptom["percentage"] = match.group(1) if match else percent_text
+
+        symptoms.append(symptom)
+
+    return symptoms
+
+
+def parse_symptom_details(root, symptom_url, appliance_type, symptom_title):
+    """
+    Video, difficulty, parts and per-part instructions of a parsed symptom page.
+
+    Returns:
+        tuple: (symptom_details dict, list of part_instructions dicts)
+    """
+    symptom_details = {
+        "video_url": "",
+        "difficulty": "",
+        "parts": "",
+    }
+    part_instructions = []
+
+    video_elem = select_one(root, "div[data-yt-init]")
+    if video_elem is not None and video_elem.get("data-yt-init"):
+        symptom_details["video_url"] = f"https://www.youtube.com/watch?v={video_elem.get('data-yt-init')}"
+
+    for li in select(root, "ul.list-disc li"):
+        text = element_text(li).upper()
+        if "EASY" in text:
+            symptom_details["difficulty"] = "EASY"
+            break
+        elif "MODERATE" in text:
+            symptom_details["difficulty"] = "MODERATE"
+            break
+        elif "DIFFICULT" in text or "HARD" in text:
+            symptom_details["difficulty"] = "DIFFICULT"
+            break
+
+    parts_list = [unescape(name) for name in map(element_text, select(root, "a.js-scrollTrigger.scroll-to")) if name]
+    symptom_details["parts"] = ", ".join(parts_list)
+
+    for section_header in select(root, "div.symptom-list h2.section-title[id]"):
+        part_info = {
+            "appliance_type": appliance_type,
+            "symptom": symptom_title,
+            "part_type": unescape(element_text(section_header)),
+            "instructions": "",
+            "part_category_url": f"{symptom_url}#{section_header.get('id')}",
+        }
+
+        desc_divs = section_header.xpath("following-sibling::div[contains(@class, 'symptom-list__desc')]")
+        if desc_divs:
+            instructions_div = select_one(desc_divs[0], "div.col-lg-6:first-child")
+            if instructions_div is not None:
+                part_info["instructions"] = html_to_text(inner_html(instructions_div))
+
+        if part_info["part_type"]:
+            part_instructions.append(part_info)
+
+    return symptom_details, part_instructions
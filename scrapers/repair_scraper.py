@@ -42,6 +42,7 @@ from .utils.driver_utils import (
     is_blocked_page,
 )
 from .utils.file_utils import append_to_csv, clear_output_file, ensure_output_dir
+from .utils.html_utils import html_to_text
 
 
 BASE_URL = "https://www.partselect.com"
@@ -284,7 +285,7 @@ def extract_symptom_details(driver, symptom_url, appliance_type, symptom_title):
                     # Extract all text including numbered steps
                     instructions_html = instructions_div.get_attribute("innerHTML")
                     # Convert HTML to clean text
-                    instructions_text = _html_to_text(instructions_html)
+                    instructions_text = html_to_text(instructions_html)
                     part_info["instructions"] = instructions_text
 
                 except Exception:
@@ -303,37 +304,6 @@ def extract_symptom_details(driver, symptom_url, appliance_type, symptom_title):
     return symptom_details, part_instructions
 
 
-def _html_to_text(html):
-    """Convert HTML to clean text, preserving numbered list structure."""
-    import re
-
-    # Remove script and style elements
-    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-
-    # Convert list items to numbered format
-    def replace_li(match):
-        return "\n- " + match.group(1).strip()
-    html = re.sub(r'<li[^>]*>(.*?)</li>', replace_li, html, flags=re.DOTALL | re.IGNORECASE)
-
-    # Convert paragraphs and breaks to newlines
-    html = re.sub(r'<br\s*/?>', '\n', html, flags=re.IGNORECASE)
-    html = re.sub(r'</p>', '\n', html, flags=re.IGNORECASE)
-    html = re.sub(r'</div>', '\n', html, flags=re.IGNORECASE)
-
-    # Remove all remaining HTML tags
-    html = re.sub(r'<[^>]+>', '', html)
-
-    # Decode HTML entities
-    html = unescape(html)
-
-    # Clean up whitespace
-    html = re.sub(r'\n\s*\n', '\n\n', html)
-    html = re.sub(r'[ \t]+', ' ', html)
-
-    return html.strip()
-
-
 def scrape_appliance_repairs(appliance_type, max_symptoms=None, clear_files=True):
     """
     Scrape all repair symptom data for a specific appliance type.
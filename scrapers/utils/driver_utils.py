@@ -2,16 +2,22 @@
 Selenium WebDriver utilities for safe navigation and element handling.
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import (
-    StaleElementReferenceException,
-    TimeoutException,
-    WebDriverException,
-)
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import (
+        StaleElementReferenceException,
+        TimeoutException,
+        WebDriverException,
+    )
+except ImportError:
+    # Static parsing imports scrapers.utils too; only the browser needs selenium
+    webdriver = None
+    By = WebDriverWait = EC = Options = None
+    StaleElementReferenceException = TimeoutException = WebDriverException = None
 import time
 import random
 import urllib.parse
@@ -83,6 +89,8 @@ def setup_driver(headless=True, use_proxy=False, rotate_user_agent=True, disable
     Returns:
         webdriver.Chrome: Configured Chrome driver
     """
+    if webdriver is None:
+        raise ImportError("setup_driver requires the 'selenium' package: pip install selenium")
     chrome_options = Options()
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--window-size=1920,1080")
@@ -159,6 +167,14 @@ def is_valid_url(url):
         return False
 
 
+def is_blocked_page(driver):
+    """Check if the current page is the bot-protection "Access Denied" page."""
+    try:
+        return "access denied" in driver.title.lower()
+    except WebDriverException:
+        return False
+
+
 def safe_navigate(driver, url, max_retries=None, add_delay=True):
     """
     Safely navigate to a URL with retries and ensure page is fully loaded.
@@ -7,7 +7,7 @@ import os
 import threading
 from pathlib import Path
 
-from ..config import OUTPUT_DIR, PARTS_SCHEMA, MODEL_COMPATIBILITY_SCHEMA, QNA_SCHEMA, REPAIR_STORIES_SCHEMA, REVIEWS_SCHEMA
+from ..config import OUTPUT_DIR, OUTPUT_FILES, PARTS_SCHEMA, MODEL_COMPATIBILITY_SCHEMA, QNA_SCHEMA, REPAIR_STORIES_SCHEMA, REVIEWS_SCHEMA
 
 # Thread lock for safe concurrent file writes
 _file_locks = {}
@@ -168,3 +168,62 @@ def append_repair_stories_data(stories_data, filename):
 def append_reviews_data(reviews_data, filename):
     """Append reviews data to CSV (thread-safe)."""
     return append_to_csv(reviews_data, filename, REVIEWS_SCHEMA)
+
+
+class PartDataWriter:
+    """
+    Buffers scraped part pages and appends them to the output CSVs in batches (thread-safe).
+
+    Extraction workers add() each scrape_part_page result as it finishes; every
+    `batch_size` parts are written, so progress is saved incrementally as before.
+    """
+
+    def __init__(self, output_files=None, batch_size=10):
+        self.output_files = output_files or {
+            "parts": OUTPUT_FILES["parts"],
+            "compat": OUTPUT_FILES["model_compatibility"],
+            "qna": OUTPUT_FILES["qna"],
+            "stories": OUTPUT_FILES["repair_stories"],
+            "reviews": OUTPUT_FILES["reviews"],
+        }
+        self.batch_size = batch_size
+        self.totals = {"parts": 0, "compatibility": 0, "qna": 0, "stories": 0, "reviews": 0}
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def add(self, scraped):
+        """Queue one (part_data, compatibility, qna, stories, reviews) result."""
+        with self._lock:
+            self._pending.append(scraped)
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        """Write whatever is buffered."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        parts, compatibility, qna, stories, reviews = ([] for _ in range(5))
+        for part_data, part_compat, part_qna, part_stories, part_reviews in self._pending:
+            parts.append(part_data)
+            compatibility.extend(part_compat)
+            qna.extend(part_qna)
+            stories.extend(part_stories)
+            reviews.extend(part_reviews)
+        self._pending = []
+
+        append_parts_data(parts, self.output_files["parts"])
+        append_model_compatibility_data(compatibility, self.output_files["compat"])
+        append_qna_data(qna, self.output_files["qna"])
+        append_repair_stories_data(stories, self.output_files["stories"])
+        append_reviews_data(reviews, self.output_files["reviews"])
+        print(f"  >> Saved {len(parts)} parts to CSV")
+
+        self.totals["parts"] += len(parts)
+        self.totals["compatibility"] += len(compatibility)
+        self.totals["qna"] += len(qna)
+        self.totals["stories"] += len(stories)
+        self.totals["reviews"] += len(reviews)
@@ -0,0 +1,133 @@
+"""
+lxml helpers for parsing served HTML without a browser.
+
+element_text() approximates Selenium's WebElement.text (the rendered text) so
+the static extractors return the same strings as the Selenium ones:
+- script/style content and elements hidden with the hidden attribute,
+  display:none or Bootstrap's d-none (unless a d-md-* / d-lg-* class shows
+  them at the 1920px window setup_driver uses) are skipped
+- block elements and <br> start new lines; other whitespace is collapsed
+"""
+
+import re
+from html import unescape
+
+import lxml.html
+
+# Elements that render on their own line
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tbody", "thead", "tfoot", "tr", "ul",
+}
+SKIPPED_TAGS = {"script", "style", "template", "noscript", "head"}
+
+_SHOWN_ON_DESKTOP = re.compile(r"^d-(sm|md|lg|xl)-(?!none)")
+_DISPLAY_NONE = re.compile(r"display\s*:\s*none")
+
+
+def parse_html(html):
+    """Parse a page into an lxml element tree."""
+    return lxml.html.fromstring(html)
+
+
+def select(element, selector):
+    """All elements matching a CSS selector, in document order."""
+    return element.cssselect(selector)
+
+
+def select_one(element, selector):
+    """First element matching a CSS selector, or None."""
+    found = element.cssselect(selector)
+    return found[0] if found else None
+
+
+def class_xpath(class_name):
+    """XPath predicate for an exact class token (like CSS .class_name)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def is_hidden(element):
+    """True if the element wouldn't render (see module docstring)."""
+    if element.get("hidden") is not None:
+        return True
+    if _DISPLAY_NONE.search(element.get("style", "")):
+        return True
+    classes = element.get("class", "").split()
+    return "d-none" in classes and not any(_SHOWN_ON_DESKTOP.match(c) for c in classes)
+
+
+def element_text(element):
+    """Rendered text of an element, stripped (like Selenium's element.text.strip())."""
+    if element is None or is_hidden(element):
+        return ""
+    chunks = []
+    _append_content(element, chunks)
+    lines = (" ".join(line.split()) for line in "".join(chunks).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def text_content(element):
+    """Raw text including hidden parts (like get_attribute("textContent"))."""
+    return element.text_content() if element is not None else ""
+
+
+def inner_html(element):
+    """Markup inside an element (like get_attribute("innerHTML"))."""
+    if element is None:
+        return ""
+    return (element.text or "") + "".join(lxml.html.tostring(child, encoding="unicode") for child in element)
+
+
+def html_to_text(html):
+    """Convert HTML to clean text, preserving numbered list structure."""
+    # Remove script and style elements
+    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+
+    # Convert list items to numbered format
+    def replace_li(match):
+        return "\n- " + match.group(1).strip()
+    html = re.sub(r'<li[^>]*>(.*?)</li>', replace_li, html, flags=re.DOTALL | re.IGNORECASE)
+
+    # Convert paragraphs and breaks to newlines
+    html = re.sub(r'<br\s*/?>', '\n', html, flags=re.IGNORECASE)
+    html = re.sub(r'</p>', '\n', html, flags=re.IGNORECASE)
+    html = re.sub(r'</div>', '\n', html, flags=re.IGNORECASE)
+
+    # Remove all remaining HTML tags
+    html = re.sub(r'<[^>]+>', '', html)
+
+    # Decode HTML entities
+    html = unescape(html)
+
+    # Clean up whitespace
+    html = re.sub(r'\n\s*\n', '\n\n', html)
+    html = re.sub(r'[ \t]+', ' ', html)
+
+    return html.strip()
+
+
+def _append_content(element, chunks):
+    # Newlines in the source are plain whitespace; only "\n" chunks break lines
+    if element.text:
+        chunks.append(element.text.replace("\n", " "))
+    for child in element:
+        _append_node(child, chunks)
+
+
+def _append_node(node, chunks):
+    # Comments and processing instructions have a non-string tag; keep their tail
+    tag = node.tag if isinstance(node.tag, str) else None
+    if tag is not None and tag not in SKIPPED_TAGS and not is_hidden(node):
+        if tag == "br":
+            chunks.append("\n")
+        elif tag in BLOCK_TAGS:
+            chunks.append("\n")
+            _append_content(node, chunks)
+            chunks.append("\n")
+        else:
+            _append_content(node, chunks)
+    if node.tail:
+        chunks.append(node.tail.replace("\n", " "))
@@ -0,0 +1,91 @@
+"""
+Pooled HTTP fetching for pages whose data is in the served HTML.
+
+One keep-alive httpx.Client is shared by every thread (it's thread-safe), so
+repeat requests to PartSelect reuse connections instead of opening a browser.
+"""
+
+import logging
+import threading
+import time
+
+import httpx
+
+from ..config import SCRAPER_SETTINGS
+from .driver_utils import get_random_user_agent
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def client_options():
+    """httpx client settings shared by the sync and async clients."""
+    max_connections = SCRAPER_SETTINGS.get("http_max_connections", 20)
+    return {
+        # Desktop user agent - mobile pages have different HTML
+        "headers": {
+            "User-Agent": get_random_user_agent(),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        },
+        "timeout": SCRAPER_SETTINGS.get("http_timeout", 20),
+        "limits": httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        "follow_redirects": True,
+    }
+
+
+def get_http_client():
+    """Shared keep-alive client (see client_options)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(**client_options())
+    return _client
+
+
+def close_http_client():
+    """Close the shared client's connections."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def fetch_html(url, client=None, max_retries=None):
+    """
+    GET a page, retrying transient failures with backoff (like safe_navigate).
+
+    Args:
+        url: URL to fetch
+        client: httpx.Client to use (default: the shared one)
+        max_retries: Attempts before giving up (default: SCRAPER_SETTINGS["max_retries"])
+
+    Returns:
+        tuple: (final URL after redirects, HTML) or None if the page couldn't be fetched
+    """
+    client = client or get_http_client()
+    if max_retries is None:
+        max_retries = SCRAPER_SETTINGS["max_retries"]
+
+    for attempt in range(max_retries):
+        try:
+            response = client.get(url)
+            if response.status_code == 404:
+                return None
+            # Rate limited or server error - worth another try
+            if response.status_code == 429 or response.status_code >= 500:
+                raise httpx.HTTPStatusError(
+                    f"HTTP {response.status_code}", request=response.request, response=response
+                )
+            response.raise_for_status()
+            return str(response.url), response.text
+        except httpx.HTTPError as e:
+            logger.warning("Fetch error (attempt %d/%d) for %s: %s", attempt + 1, max_retries, url, e)
+            if attempt < max_retries - 1:
+                time.sleep(2 ** attempt)
+
+    return None
@@ -0,0 +1,104 @@
+"""
+Per-host token-bucket rate limiting.
+
+Each host gets a bucket that refills at `rate` tokens per second and banks at
+most `burst` of them. A request takes a token; when none is left the caller
+waits its turn. So the crawl runs as fast as the target rate allows, instead
+of sleeping a fixed time per page per worker whatever the others are doing.
+
+Tokens are reserved under a lock and the wait happens outside it, so one
+limiter can pace both threads (wait) and coroutines (acquire).
+"""
+
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Hands out `rate` tokens per second, up to `burst` at once."""
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take a token.
+
+        Returns:
+            float: Seconds the caller must wait before using it. The balance can
+            go negative - each reservation queues behind the ones before it.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def penalize(self, seconds):
+        """Push every later reservation back by `seconds` (e.g. after a 429)."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, with jittered waits."""
+
+    def __init__(self, rate, burst=1, jitter=0.0):
+        """
+        Args:
+            rate: Requests per second per host
+            burst: Requests a host may get back to back after a quiet spell
+            jitter: Random extra wait, up to this fraction of 1/rate, so
+                requests don't land on an exact beat
+        """
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def reserve(self, url):
+        """Seconds to wait before requesting `url`."""
+        delay = self.bucket(url).reserve()
+        if self.jitter:
+            delay += random.uniform(0, self.jitter / self.rate)
+        return delay
+
+    def wait(self, url):
+        """Block until a request to `url` is allowed. Returns seconds waited."""
+        delay = self.reserve(url)
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire(self, url):
+        """Async wait(): sleep on the event loop until a request to `url` is allowed."""
+        delay = self.reserve(url)
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+    def penalize(self, url, seconds):
+        """Slow a host down - everyone's next request to it waits `seconds` longer."""
+        self.bucket(url).penalize(seconds)